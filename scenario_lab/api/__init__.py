@@ -5,10 +5,18 @@ from scenario_lab.api.settings import APISettings, get_settings, reset_settings
 from scenario_lab.api.auth import verify_api_key, optional_api_key
 from scenario_lab.api.rate_limit import (
     RateLimiter,
+    RateLimitStore,
+    MemoryRateLimitStore,
+    SQLiteRateLimitStore,
     get_rate_limiter,
     reset_rate_limiter,
     check_rate_limit,
 )
+from scenario_lab.api.execution import (
+    ExecutionService,
+    get_execution_service,
+    reset_execution_service,
+)
 
 __all__ = [
     "app",
@@ -18,7 +26,13 @@ __all__ = [
     "verify_api_key",
     "optional_api_key",
     "RateLimiter",
+    "RateLimitStore",
+    "MemoryRateLimitStore",
+    "SQLiteRateLimitStore",
     "get_rate_limiter",
     "reset_rate_limiter",
     "check_rate_limit",
+    "ExecutionService",
+    "get_execution_service",
+    "reset_execution_service",
 ]
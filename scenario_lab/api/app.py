@@ -9,6 +9,10 @@ Authentication and Rate Limiting:
     - Rate limiting with configurable requests/window
     - Development mode for local testing (bypasses auth and rate limits)
 
+Monitoring:
+    - /metrics serves Prometheus text-format metrics (no authentication,
+      like /api/health); see scenario_lab/api/metrics.py
+
 CORS Configuration:
     - By default, only localhost origins are allowed for security
     - Configure allowed origins via SCENARIO_LAB_CORS_ORIGINS for production
@@ -19,36 +23,73 @@ Environment Variables:
     SCENARIO_LAB_RATE_LIMIT_ENABLED: Enable/disable rate limiting
     SCENARIO_LAB_RATE_LIMIT_REQUESTS: Max requests per window (default: 100)
     SCENARIO_LAB_RATE_LIMIT_WINDOW: Time window in seconds (default: 60)
+    SCENARIO_LAB_RATE_LIMIT_BACKEND: Rate limit store, "memory" or "sqlite" (default: memory)
+    SCENARIO_LAB_RATE_LIMIT_DB: SQLite file shared by workers for the sqlite backend
     SCENARIO_LAB_DEV_MODE: Development mode (disables auth and rate limiting)
     SCENARIO_LAB_CORS_ORIGINS: Comma-separated list of allowed CORS origins
                                (default: localhost only for security)
+    SCENARIO_LAB_MAX_CONCURRENT_RUNS: Max scenarios executing at once (default: 4)
+    SCENARIO_LAB_MAX_QUEUED_RUNS: Max scenarios waiting for a slot (default: 100)
+    SCENARIO_LAB_RUNS_PER_API_KEY: Max queued + active runs per API key (default: 5)
+    SCENARIO_LAB_RUN_STATUS_TTL: Seconds to keep finished run status (default: 3600)
+    SCENARIO_LAB_DB_WORKERS: Max concurrent database queries (default: 4)
 """
 from __future__ import annotations
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 from datetime import datetime
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks, Depends, Request
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from scenario_lab import __version__
 from scenario_lab.runners import SyncRunner
-from scenario_lab.database import Database
+from scenario_lab.database import Database, AsyncDatabase
 from scenario_lab.core.events import Event, EventType
+from scenario_lab.utils.prometheus_metrics import CONTENT_TYPE, get_metrics_registry
 from scenario_lab.api.settings import get_settings
 from scenario_lab.api.auth import verify_api_key, optional_api_key
 from scenario_lab.api.rate_limit import check_rate_limit, get_rate_limiter
+from scenario_lab.api.metrics import instrument_database, render_metrics, track_runner
+from scenario_lab.api.execution import (
+    ExecutionService,
+    ExecutionRejectedError,
+    get_execution_service,
+)
 
 logger = logging.getLogger(__name__)
 
 # Global state
 running_scenarios: Dict[str, Dict[str, Any]] = {}
 database: Optional[Database] = None
+_async_database: Optional[AsyncDatabase] = None
+
+
+def get_executor() -> ExecutionService:
+    """Get the execution service managing running_scenarios"""
+    return get_execution_service(running_scenarios)
+
+
+def get_async_database() -> AsyncDatabase:
+    """
+    Get the async access layer for the configured database
+
+    Raises:
+        HTTPException: 503 if no database is configured
+    """
+    global _async_database
+    if not database:
+        raise HTTPException(status_code=503, detail="Database not configured")
+    if _async_database is None or _async_database.database is not database:
+        if _async_database is not None:
+            _async_database.close(wait=False)
+        _async_database = AsyncDatabase(database, max_workers=get_settings().db_max_workers)
+    return _async_database
 
 
 @asynccontextmanager
@@ -58,6 +99,7 @@ async def lifespan(app: FastAPI):
     # Startup
     try:
         database = Database("sqlite:///scenario-lab.db")
+        instrument_database(database)
         logger.info("Scenario Lab API started with database")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
@@ -76,17 +118,27 @@ async def lifespan(app: FastAPI):
 
         if settings.rate_limit_enabled:
             logger.info(
-                f"Rate limiting enabled: {settings.rate_limit_requests} requests per {settings.rate_limit_window}s"
+                f"Rate limiting enabled: {settings.rate_limit_requests} requests per "
+                f"{settings.rate_limit_window}s ({settings.rate_limit_backend} store)"
             )
         else:
             logger.warning("Rate limiting DISABLED")
 
+    logger.info(
+        f"Scenario execution: {settings.max_concurrent_runs} concurrent, "
+        f"{settings.max_queued_runs} queued, {settings.runs_per_api_key} per API key"
+    )
+
     # Log CORS configuration
     logger.info(f"CORS allowed origins: {settings.cors_allowed_origins}")
 
     yield
 
-    # Shutdown (nothing to clean up currently)
+    # Shutdown
+    global _async_database
+    if _async_database is not None:
+        _async_database.close()
+        _async_database = None
 
 
 # FastAPI app
@@ -131,8 +183,8 @@ async def rate_limit_middleware(request: Request, call_next):
     """
     settings = get_settings()
 
-    # Skip rate limiting for health and root endpoints
-    if request.url.path in ["/", "/api/health", "/docs", "/openapi.json", "/redoc"]:
+    # Skip rate limiting for health, metrics and root endpoints
+    if request.url.path in ["/", "/api/health", "/metrics", "/docs", "/openapi.json", "/redoc"]:
         return await call_next(request)
 
     # Check rate limit
@@ -174,19 +226,28 @@ class ScenarioExecuteRequest(BaseModel):
     enable_database: bool = Field(
         True, description="Enable database persistence for analytics"
     )
+    priority: int = Field(
+        0, description="Queue priority (higher values start first when runs are queued)"
+    )
+    stream: bool = Field(
+        False,
+        description="Stream actor decisions; WebSocket clients receive "
+        "actor_decision_progress events as the text arrives",
+    )
 
 
 class ScenarioStatus(BaseModel):
     """Status of a running or completed scenario"""
 
     scenario_id: str
-    status: str  # running, completed, halted, failed
+    status: str  # queued, initializing, running, completed, halted, failed
     current_turn: int
     total_cost: float
     started_at: datetime
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
     waiting_for_human: Optional[str] = None  # Actor name waiting for input
+    queue_position: Optional[int] = None  # Position in queue while status is "queued"
 
 
 class HumanDecisionRequest(BaseModel):
@@ -208,6 +269,22 @@ class RunSummary(BaseModel):
     turns: int
     total_cost: float
     created: datetime
+    scenario_id: Optional[str] = None
+    config: Optional[Dict[str, Any]] = None
+
+
+def _run_summary(row: Dict[str, Any]) -> RunSummary:
+    """Build a RunSummary from a list_runs_page row"""
+    return RunSummary(
+        run_id=row["id"],
+        scenario_id=row.get("scenario_id"),
+        scenario_name=row["scenario_name"],
+        status=row["status"],
+        turns=row["total_turns"],
+        total_cost=row["total_cost"],
+        created=row["created"],
+        config=row.get("config"),
+    )
 
 
 @app.get("/")
@@ -220,6 +297,7 @@ async def root():
         "endpoints": {
             "scenarios": "/api/scenarios",
             "runs": "/api/runs",
+            "search": "/api/search",
             "docs": "/docs",
             "openapi": "/openapi.json",
         },
@@ -230,17 +308,29 @@ async def root():
 async def health_check():
     """Health check endpoint (no authentication required)"""
     settings = get_settings()
+    executor = get_executor()
+    executor.evict_expired()
     return {
         "status": "healthy",
         "version": __version__,
         "database": "connected" if database else "not configured",
         "running_scenarios": len(running_scenarios),
+        "active_scenarios": executor.active_count,
+        "queued_scenarios": executor.queued_count,
         "auth_enabled": settings.auth_enabled,
         "rate_limit_enabled": settings.rate_limit_enabled,
         "dev_mode": settings.dev_mode,
     }
 
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics in text exposition format (no authentication required)"""
+    executor = get_executor()
+    executor.evict_expired()
+    return Response(content=render_metrics(executor, running_scenarios), media_type=CONTENT_TYPE)
+
+
 @app.post("/api/scenarios/execute", response_model=ScenarioStatus)
 async def execute_scenario(
     request: ScenarioExecuteRequest,
@@ -251,40 +341,42 @@ async def execute_scenario(
     Execute a scenario in the background
 
     Returns immediately with a scenario_id that can be used to monitor progress.
+    Runs beyond the concurrency limit are queued by priority; submissions over
+    the per-API-key quota are rejected with 429, and a full queue with 503.
     """
     # Validate scenario path
     scenario_path = Path(request.scenario_path)
     if not scenario_path.exists():
         raise HTTPException(status_code=404, detail=f"Scenario not found: {request.scenario_path}")
 
-    # Generate scenario ID
-    scenario_id = f"scenario-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    executor = get_executor()
+    scenario_id = executor.new_scenario_id()
 
-    # Initialize status
-    running_scenarios[scenario_id] = {
-        "scenario_id": scenario_id,
-        "status": "initializing",
-        "current_turn": 0,
-        "total_cost": 0.0,
-        "started_at": datetime.now(),
-        "completed_at": None,
-        "error": None,
-        "runner": None,
-    }
+    try:
+        entry = executor.submit(
+            scenario_id,
+            lambda: _run_scenario_background(scenario_id, request),
+            api_key=api_key,
+            priority=request.priority,
+        )
+    except ExecutionRejectedError as e:
+        get_metrics_registry().counter(
+            "scenario_lab_scenario_rejections_total",
+            "Scenario submissions rejected by the execution service",
+            ("status",),
+        ).inc(status=e.status_code)
+        raise HTTPException(status_code=e.status_code, detail=str(e)) from e
 
-    # Start scenario in background
-    background_tasks.add_task(
-        _run_scenario_background,
-        scenario_id,
-        request,
-    )
+    # Start a drain pass (returns immediately if all worker slots are busy)
+    background_tasks.add_task(executor.drain)
 
     return ScenarioStatus(
         scenario_id=scenario_id,
-        status="initializing",
+        status=entry["status"],
         current_turn=0,
         total_cost=0.0,
-        started_at=running_scenarios[scenario_id]["started_at"],
+        started_at=entry["started_at"],
+        queue_position=executor.queue_position(scenario_id) if entry["status"] == "queued" else None,
     )
 
 
@@ -301,6 +393,7 @@ async def _run_scenario_background(scenario_id: str, request: ScenarioExecuteReq
             end_turn=request.end_turn,
             credit_limit=request.credit_limit,
             database=database if request.enable_database else None,
+            stream=request.stream,
         )
 
         # Setup
@@ -308,23 +401,25 @@ async def _run_scenario_background(scenario_id: str, request: ScenarioExecuteReq
         running_scenarios[scenario_id]["runner"] = runner
 
         # Setup event handlers to track progress
-        @runner.event_bus.on(EventType.TURN_STARTED)
         async def on_turn_start(event: Event):
             turn = event.data.get("turn", 0)
             running_scenarios[scenario_id]["current_turn"] = turn
 
-        @runner.event_bus.on(EventType.TURN_COMPLETED)
         async def on_turn_complete(event: Event):
             state = event.data.get("state")
             if state:
                 running_scenarios[scenario_id]["total_cost"] = state.total_cost()
 
-        @runner.event_bus.on(EventType.SCENARIO_HALTED)
         async def on_halted(event: Event):
             reason = event.data.get("reason", "unknown")
             running_scenarios[scenario_id]["status"] = "halted"
             running_scenarios[scenario_id]["error"] = reason
 
+        runner.event_bus.on(EventType.TURN_STARTED, on_turn_start)
+        runner.event_bus.on(EventType.TURN_COMPLETED, on_turn_complete)
+        runner.event_bus.on(EventType.SCENARIO_HALTED, on_halted)
+        track_runner(runner)
+
         # Execute scenario
         final_state = await runner.run()
 
@@ -352,10 +447,16 @@ async def get_scenario_status(
     api_key: Optional[str] = Depends(verify_api_key),
 ):
     """Get the current status of a running or completed scenario"""
+    executor = get_executor()
+    executor.evict_expired()
     if scenario_id not in running_scenarios:
         raise HTTPException(status_code=404, detail=f"Scenario not found: {scenario_id}")
 
     info = running_scenarios[scenario_id]
+    queue_position = None
+    if info["status"] == "queued":
+        queue_position = executor.queue_position(scenario_id)
+
     return ScenarioStatus(
         scenario_id=scenario_id,
         status=info["status"],
@@ -365,31 +466,84 @@ async def get_scenario_status(
         completed_at=info["completed_at"],
         error=info["error"],
         waiting_for_human=info.get("waiting_for_human"),
+        queue_position=queue_position,
     )
 
 
 @app.get("/api/runs", response_model=list[RunSummary])
 async def list_runs(
+    response: Response,
     scenario: Optional[str] = None,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    include_config: bool = False,
     api_key: Optional[str] = Depends(verify_api_key),
 ):
-    """List all runs, optionally filtered by scenario"""
-    if not database:
-        raise HTTPException(status_code=503, detail="Database not configured")
-
-    runs = database.list_runs(scenario_id=scenario)
+    """
+    List runs, newest first, one page at a time
 
-    return [
-        RunSummary(
-            run_id=run.id,
-            scenario_name=run.scenario_name,
-            status=run.status,
-            turns=run.total_turns,
-            total_cost=run.total_cost,
-            created=run.created,
+    The cursor for the next page is returned in the X-Next-Cursor header
+    (absent on the last page). Use /api/runs/export for bulk export.
+    """
+    db = get_async_database()
+    try:
+        rows, next_cursor = await db.list_runs_page(
+            scenario_id=scenario,
+            status=status,
+            created_after=created_after,
+            created_before=created_before,
+            limit=limit,
+            cursor=cursor,
+            include_config=include_config,
         )
-        for run in runs
-    ]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return [_run_summary(row) for row in rows]
+
+
+@app.get("/api/runs/export")
+async def export_runs(
+    scenario: Optional[str] = None,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    include_config: bool = False,
+    page_size: int = Query(500, ge=1, le=5000),
+    api_key: Optional[str] = Depends(verify_api_key),
+):
+    """
+    Stream all matching runs as NDJSON (one RunSummary per line)
+
+    Runs are read page by page, so server memory stays flat regardless of
+    the number of runs.
+    """
+    db = get_async_database()
+
+    async def lines() -> AsyncIterator[str]:
+        cursor = None
+        while True:
+            rows, cursor = await db.list_runs_page(
+                scenario_id=scenario,
+                status=status,
+                created_after=created_after,
+                created_before=created_before,
+                limit=page_size,
+                cursor=cursor,
+                include_config=include_config,
+            )
+            for row in rows:
+                yield _run_summary(row).model_dump_json() + "\n"
+            if cursor is None:
+                return
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @app.get("/api/runs/{run_id}")
@@ -398,15 +552,13 @@ async def get_run(
     api_key: Optional[str] = Depends(verify_api_key),
 ):
     """Get detailed information about a specific run"""
-    if not database:
-        raise HTTPException(status_code=503, detail="Database not configured")
-
-    run = database.get_run(run_id)
+    db = get_async_database()
+    run = await db.get_run(run_id)
     if not run:
         raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
 
     # Get statistics
-    stats = database.get_run_statistics(run_id)
+    stats = await db.get_run_statistics(run_id)
 
     return stats
 
@@ -417,10 +569,8 @@ async def get_run_statistics(
     api_key: Optional[str] = Depends(verify_api_key),
 ):
     """Get comprehensive statistics for a run"""
-    if not database:
-        raise HTTPException(status_code=503, detail="Database not configured")
-
-    stats = database.get_run_statistics(run_id)
+    db = get_async_database()
+    stats = await db.get_run_statistics(run_id)
     if not stats:
         raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
 
@@ -433,10 +583,8 @@ async def compare_runs(
     api_key: Optional[str] = Depends(verify_api_key),
 ):
     """Compare multiple runs side by side"""
-    if not database:
-        raise HTTPException(status_code=503, detail="Database not configured")
-
-    comparison = database.compare_runs(run_ids)
+    db = get_async_database()
+    comparison = await db.compare_runs(run_ids)
     return comparison
 
 
@@ -447,13 +595,82 @@ async def aggregate_metric(
     api_key: Optional[str] = Depends(verify_api_key),
 ):
     """Aggregate a metric across runs"""
-    if not database:
-        raise HTTPException(status_code=503, detail="Database not configured")
-
-    aggregation = database.aggregate_metrics(metric_name, scenario=scenario)
+    db = get_async_database()
+    aggregation = await db.aggregate_metrics(metric_name, scenario=scenario)
     return aggregation
 
 
+@app.get("/api/metrics/{metric_name}/bands")
+async def metric_bands(
+    metric_name: str,
+    scenario: str,
+    actor: Optional[str] = None,
+    api_key: Optional[str] = Depends(verify_api_key),
+):
+    """
+    Per-turn mean and standard deviation of a metric across a scenario's runs
+
+    Served from pre-aggregated rollups. Pass actor to restrict to one actor's
+    values (an empty actor selects scenario-level metrics).
+    """
+    db = get_async_database()
+    bands = await db.metric_turn_bands(metric_name, scenario, actor=actor)
+    return {"metric": metric_name, "scenario": scenario, "actor": actor, "turns": bands}
+
+
+@app.get("/api/metrics/{metric_name}/runs")
+async def metric_runs(
+    metric_name: str,
+    scenario: Optional[str] = None,
+    actor: Optional[str] = None,
+    api_key: Optional[str] = Depends(verify_api_key),
+):
+    """Final, minimum and maximum value of a metric for each run"""
+    db = get_async_database()
+    runs = await db.run_metric_summaries(metric_name, scenario=scenario, actor=actor)
+    return {"metric": metric_name, "scenario": scenario, "runs": runs}
+
+
+class SearchResult(BaseModel):
+    """A full-text search match"""
+
+    run_id: str
+    scenario_id: Optional[str] = None
+    turn: int
+    kind: str
+    actor: Optional[str] = None
+    ref_id: Optional[str] = None
+    rank: float
+    snippet: str
+
+
+@app.get("/api/search", response_model=list[SearchResult])
+async def search(
+    q: str = Query(..., min_length=1, description="Search query (FTS5 syntax supported)"),
+    scenario: Optional[str] = None,
+    run_id: Optional[str] = None,
+    kind: Optional[str] = Query(None, pattern="^(world_state|decision|communication)$"),
+    limit: int = Query(20, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    api_key: Optional[str] = Depends(verify_api_key),
+):
+    """
+    Search world states, decisions and communications across runs
+
+    Results are ranked by relevance (BM25) and include a snippet with the
+    matching terms in [brackets].
+    """
+    db = get_async_database()
+    try:
+        results = await db.search(
+            q, scenario_id=scenario, run_id=run_id, kind=kind, limit=limit, offset=offset
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+
+    return [SearchResult(**result) for result in results]
+
+
 @app.post("/api/scenarios/{scenario_id}/pause")
 async def pause_scenario(
     scenario_id: str,
@@ -553,18 +770,20 @@ async def websocket_stream(websocket: WebSocket, scenario_id: str):
             await asyncio.sleep(0.1)
             elapsed += 0.1
 
-        # Wait for runner to be initialized (with timeout)
+        # Wait for runner to be initialized (with timeout; time spent queued doesn't count)
         runner = None
         elapsed = 0
         while not runner:
-            runner = running_scenarios[scenario_id].get("runner")
+            info = running_scenarios.get(scenario_id, {})
+            runner = info.get("runner")
             if elapsed >= timeout:
                 await websocket.send_json({"error": "Runner initialization timeout"})
                 await websocket.close()
                 return
             if not runner:
                 await asyncio.sleep(0.1)
-                elapsed += 0.1
+                if info.get("status") != "queued":
+                    elapsed += 0.1
 
         # Setup event handlers to forward to WebSocket
         handlers = []
@@ -0,0 +1,306 @@
+"""
+Scenario Execution Service for Scenario Lab API
+
+Provides admission control for scenario runs submitted through the API:
+- Bounded number of concurrently executing scenarios
+- Priority queue for runs waiting for a free slot
+- Per-API-key quota on queued + active runs
+- TTL eviction of finished run status entries
+
+Runs are dispatched through FastAPI background tasks. Each submission schedules
+a drain pass; a drain pass only proceeds while a worker slot is free, so the
+number of scenarios executing at once never exceeds the configured limit.
+Every run executes in its own asyncio task, giving it an isolated context
+(logging context variables, run-scoped response cache).
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from scenario_lab.api.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Statuses that hold a worker slot or a queue position
+ACTIVE_STATUSES = ("queued", "initializing", "running")
+
+# Statuses after which an entry may be evicted once its TTL expires
+TERMINAL_STATUSES = ("completed", "failed", "halted")
+
+ANONYMOUS_KEY = "anonymous"
+
+
+class ExecutionRejectedError(Exception):
+    """Base class for rejected scenario submissions."""
+
+    status_code = 503
+
+
+class QueueFullError(ExecutionRejectedError):
+    """Raised when the execution queue has no free capacity."""
+
+    status_code = 503
+
+
+class QuotaExceededError(ExecutionRejectedError):
+    """Raised when an API key already has its maximum number of runs."""
+
+    status_code = 429
+
+
+@dataclass(order=True)
+class QueuedRun:
+    """A scenario run waiting for a worker slot (ordered by priority, then FIFO)."""
+
+    sort_key: tuple
+    scenario_id: str = field(compare=False)
+    job: Callable[[], Awaitable[None]] = field(compare=False)
+    quota_key: str = field(compare=False)
+
+
+class ExecutionService:
+    """
+    Bounded scenario execution service.
+
+    Status entries live in ``runs`` (shared with the API as ``running_scenarios``).
+    Slot and quota accounting is protected by a lock so that submissions from
+    different event loops or threads stay consistent.
+    """
+
+    def __init__(
+        self,
+        runs: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_concurrent: int = 4,
+        max_queued: int = 100,
+        per_key_limit: int = 5,
+        status_ttl: int = 3600,
+    ) -> None:
+        """
+        Initialize the execution service.
+
+        Args:
+            runs: Dictionary of run status entries keyed by scenario_id
+            max_concurrent: Maximum number of scenarios executing at once
+            max_queued: Maximum number of scenarios waiting for a slot
+            per_key_limit: Maximum queued + active runs per API key (0 = unlimited)
+            status_ttl: Seconds to keep finished entries (0 = keep forever)
+        """
+        self.runs: Dict[str, Dict[str, Any]] = runs if runs is not None else {}
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max_queued
+        self.per_key_limit = per_key_limit
+        self.status_ttl = status_ttl
+
+        self._lock = threading.Lock()
+        self._queue: List[QueuedRun] = []
+        self._sequence = itertools.count()
+        self._active = 0
+        self._per_key: Dict[str, int] = {}
+
+    @property
+    def active_count(self) -> int:
+        """Number of scenarios currently holding a worker slot."""
+        return self._active
+
+    @property
+    def queued_count(self) -> int:
+        """Number of scenarios waiting for a worker slot."""
+        return len(self._queue)
+
+    def new_scenario_id(self, now: Optional[datetime] = None) -> str:
+        """
+        Generate a unique scenario ID of the form ``scenario-YYYYMMDD-HHMMSS``.
+
+        If the ID for the current second is taken, the timestamp is advanced
+        to the next free second so concurrent submitters never share an entry.
+        """
+        moment = now or datetime.now()
+        with self._lock:
+            while True:
+                scenario_id = f"scenario-{moment.strftime('%Y%m%d-%H%M%S')}"
+                if scenario_id not in self.runs:
+                    # Reserve the ID until submit() fills in the entry
+                    self.runs[scenario_id] = {"scenario_id": scenario_id, "status": "queued"}
+                    return scenario_id
+                moment += timedelta(seconds=1)
+
+    def submit(
+        self,
+        scenario_id: str,
+        job: Callable[[], Awaitable[None]],
+        api_key: Optional[str] = None,
+        priority: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Admit a scenario run into the queue.
+
+        Args:
+            scenario_id: ID of the run (see new_scenario_id)
+            job: Coroutine function executing the run
+            api_key: API key of the submitter (used for quotas)
+            priority: Higher values are started first
+
+        Returns:
+            The run's status entry
+
+        Raises:
+            QuotaExceededError: If the API key has too many queued/active runs
+            QueueFullError: If the queue is at capacity
+        """
+        self.evict_expired()
+        quota_key = api_key or ANONYMOUS_KEY
+
+        with self._lock:
+            if self.per_key_limit and self._per_key.get(quota_key, 0) >= self.per_key_limit:
+                self.runs.pop(scenario_id, None)
+                raise QuotaExceededError(
+                    f"Run quota exceeded: {self.per_key_limit} queued or active runs per API key"
+                )
+            # Queued entries up to the free slots start on the next drain
+            free_slots = max(self.max_concurrent - self._active, 0)
+            if len(self._queue) - free_slots >= self.max_queued:
+                self.runs.pop(scenario_id, None)
+                raise QueueFullError(
+                    f"Execution queue is full ({self.max_queued} runs waiting)"
+                )
+
+            status = "initializing" if len(self._queue) < free_slots else "queued"
+            entry = {
+                "scenario_id": scenario_id,
+                "status": status,
+                "current_turn": 0,
+                "total_cost": 0.0,
+                "started_at": datetime.now(),
+                "completed_at": None,
+                "error": None,
+                "runner": None,
+                "priority": priority,
+                "api_key": quota_key,
+            }
+            self.runs[scenario_id] = entry
+            self._per_key[quota_key] = self._per_key.get(quota_key, 0) + 1
+            heapq.heappush(
+                self._queue,
+                QueuedRun(
+                    sort_key=(-priority, next(self._sequence)),
+                    scenario_id=scenario_id,
+                    job=job,
+                    quota_key=quota_key,
+                ),
+            )
+
+        logger.info(f"Scenario {scenario_id} admitted (status={status}, priority={priority})")
+        return entry
+
+    def queue_position(self, scenario_id: str) -> Optional[int]:
+        """Return the 1-based queue position of a waiting run, or None."""
+        with self._lock:
+            ordered = sorted(self._queue)
+        for position, queued in enumerate(ordered, start=1):
+            if queued.scenario_id == scenario_id:
+                return position
+        return None
+
+    async def drain(self) -> None:
+        """
+        Execute queued runs while a worker slot is free.
+
+        Scheduled once per submission. Returns immediately when all slots are
+        busy; the pass holding a slot picks up the next run when it finishes.
+        """
+        while True:
+            with self._lock:
+                if self._active >= self.max_concurrent or not self._queue:
+                    return
+                queued = heapq.heappop(self._queue)
+                self._active += 1
+                entry = self.runs.get(queued.scenario_id)
+                if entry is not None and entry.get("status") == "queued":
+                    entry["status"] = "initializing"
+
+            try:
+                # Separate task = separate context (logging vars, run cache)
+                await asyncio.ensure_future(queued.job())
+            except Exception as e:
+                logger.error(f"Scenario {queued.scenario_id} crashed in worker: {e}")
+                entry = self.runs.get(queued.scenario_id)
+                if entry is not None:
+                    entry["status"] = "failed"
+                    entry["error"] = str(e)
+                    entry["completed_at"] = datetime.now()
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    remaining = self._per_key.get(queued.quota_key, 1) - 1
+                    if remaining > 0:
+                        self._per_key[queued.quota_key] = remaining
+                    else:
+                        self._per_key.pop(queued.quota_key, None)
+
+    def evict_expired(self) -> int:
+        """
+        Remove finished status entries older than the TTL.
+
+        Returns:
+            Number of evicted entries
+        """
+        if self.status_ttl <= 0:
+            return 0
+
+        cutoff = datetime.now() - timedelta(seconds=self.status_ttl)
+        with self._lock:
+            expired = [
+                scenario_id
+                for scenario_id, info in self.runs.items()
+                if info.get("status") in TERMINAL_STATUSES
+                and isinstance(info.get("completed_at"), datetime)
+                and info["completed_at"] < cutoff
+            ]
+            for scenario_id in expired:
+                del self.runs[scenario_id]
+
+        if expired:
+            logger.debug(f"Evicted {len(expired)} finished scenario entries")
+        return len(expired)
+
+
+# Global execution service instance
+_execution_service: Optional[ExecutionService] = None
+
+
+def get_execution_service(
+    runs: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> ExecutionService:
+    """
+    Get the global execution service, creating it from settings if needed.
+
+    Args:
+        runs: Status dictionary to use when the service is created
+
+    Returns:
+        ExecutionService instance
+    """
+    global _execution_service
+    if _execution_service is None:
+        settings = get_settings()
+        _execution_service = ExecutionService(
+            runs=runs,
+            max_concurrent=settings.max_concurrent_runs,
+            max_queued=settings.max_queued_runs,
+            per_key_limit=settings.runs_per_api_key,
+            status_ttl=settings.run_status_ttl,
+        )
+    return _execution_service
+
+
+def reset_execution_service() -> None:
+    """Reset the execution service (useful for testing)."""
+    global _execution_service
+    _execution_service = None
@@ -0,0 +1,201 @@
+"""
+Operational metrics for the Scenario Lab API
+
+Feeds the Prometheus registry (see utils.prometheus_metrics) that the API
+serves at /metrics. Event-driven values are updated where they happen:
+
+- turns: a TURN_COMPLETED handler on each runner's event bus (track_runner)
+- database query latency: SQLAlchemy cursor events (instrument_database)
+- LLM calls: make_llm_call (utils.api_client)
+- rate-limit rejections: RateLimiter and the execution service quota
+
+Everything else is read when the endpoint is scraped (collect_metrics):
+active/queued scenarios, event-bus queue depth, LLM calls in flight and 429s
+per model from the outbound limiter, response-cache stats and process RSS.
+
+Useful queries:
+    rate(scenario_lab_turns_total[5m])                      turns per second
+    sum by (model) (scenario_lab_llm_in_flight)             LLM concurrency
+    histogram_quantile(0.99, rate(scenario_lab_db_query_duration_seconds_bucket[5m]))
+"""
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from sqlalchemy import event
+
+from scenario_lab.core.events import Event, EventBus, EventType, get_event_bus
+from scenario_lab.utils.memory_optimizer import MemoryMonitor
+from scenario_lab.utils.outbound_limiter import get_outbound_limiter
+from scenario_lab.utils.prometheus_metrics import MetricsRegistry, get_metrics_registry
+from scenario_lab.utils.response_cache import get_cache_stats
+
+# Window over which scenario_lab_turns_per_second is averaged
+TURN_RATE_WINDOW = 60.0
+
+# Completion times of recent turns (for the turns-per-second gauge)
+_turn_times: Deque[float] = deque(maxlen=100_000)
+_memory_monitor: Optional[MemoryMonitor] = None
+
+
+def track_runner(runner: Any) -> None:
+    """
+    Count a runner's completed turns
+
+    Args:
+        runner: SyncRunner (after setup) whose event bus to subscribe to
+    """
+    runner.event_bus.on(EventType.TURN_COMPLETED, _on_turn_completed)
+
+
+async def _on_turn_completed(event: Event) -> None:
+    registry = get_metrics_registry()
+    registry.counter("scenario_lab_turns_total", "Completed scenario turns").inc()
+    duration = event.data.get("duration")
+    if duration is not None:
+        registry.histogram(
+            "scenario_lab_turn_duration_seconds",
+            "Wall-clock duration of scenario turns",
+            buckets=(1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+        ).observe(duration)
+    _turn_times.append(time.monotonic())
+
+
+def instrument_database(database: Any) -> None:
+    """
+    Record the latency of every query run through a Database's engine
+
+    Idempotent; covers the async access layer too (it uses the same engine).
+
+    Args:
+        database: Database instance
+    """
+    engine = database.engine
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.get("query_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+    get_metrics_registry().histogram(
+        "scenario_lab_db_query_duration_seconds",
+        "Database query latency by SQL operation",
+        ("operation",),
+    ).observe(elapsed, operation=operation)
+
+
+def _event_buses(running_scenarios: Dict[str, Dict[str, Any]]) -> Dict[int, EventBus]:
+    buses: Dict[int, EventBus] = {}
+    for entry in list(running_scenarios.values()):
+        runner = entry.get("runner")
+        bus = getattr(runner, "event_bus", None)
+        if bus is not None:
+            buses[id(bus)] = bus
+    global_bus = get_event_bus(create_if_missing=False)
+    if global_bus is not None:
+        buses[id(global_bus)] = global_bus
+    return buses
+
+
+def collect_metrics(
+    registry: MetricsRegistry,
+    executor: Any,
+    running_scenarios: Dict[str, Dict[str, Any]],
+) -> None:
+    """
+    Copy current state into scrape-time gauges
+
+    Args:
+        registry: Registry to update
+        executor: ExecutionService with active_count and queued_count
+        running_scenarios: Scenario status entries (runners hold event buses)
+    """
+    registry.gauge(
+        "scenario_lab_scenarios_active", "Scenarios holding a worker slot"
+    ).set(executor.active_count)
+    registry.gauge(
+        "scenario_lab_scenarios_queued", "Scenarios waiting for a worker slot"
+    ).set(executor.queued_count)
+
+    now = time.monotonic()
+    while _turn_times and now - _turn_times[0] > TURN_RATE_WINDOW:
+        _turn_times.popleft()
+    registry.gauge(
+        "scenario_lab_turns_per_second",
+        f"Completed turns per second over the last {TURN_RATE_WINDOW:g}s",
+    ).set(len(_turn_times) / TURN_RATE_WINDOW)
+
+    registry.gauge(
+        "scenario_lab_event_bus_pending_handlers",
+        "Event handler invocations in progress (event-bus queue depth)",
+    ).set(sum(bus.pending for bus in _event_buses(running_scenarios).values()))
+
+    in_flight = registry.gauge(
+        "scenario_lab_llm_in_flight", "LLM calls in flight per provider:model", ("model",)
+    )
+    rate_limited = registry.counter(
+        "scenario_lab_llm_rate_limited_total",
+        "HTTP 429 responses from LLM providers per provider:model",
+        ("model",),
+    )
+    concurrency = registry.gauge(
+        "scenario_lab_llm_concurrency_limit",
+        "Adaptive outbound concurrency limit per provider:model",
+        ("model",),
+    )
+    in_flight.clear()
+    concurrency.clear()
+    for key, status in get_outbound_limiter().get_status().items():
+        in_flight.set(status["in_flight"], model=key)
+        concurrency.set(status["concurrency_limit"], model=key)
+        rate_limited.set(status["rate_limited_total"], model=key)
+
+    stats = get_cache_stats()
+    registry.counter(
+        "scenario_lab_cache_requests_total", "Response cache lookups"
+    ).set(stats.total_requests)
+    registry.counter("scenario_lab_cache_hits_total", "Response cache hits").set(stats.cache_hits)
+    registry.gauge(
+        "scenario_lab_cache_hit_ratio", "Response cache hit rate (0-1) since start"
+    ).set(stats.hit_rate / 100)
+
+    global _memory_monitor
+    if _memory_monitor is None:
+        _memory_monitor = MemoryMonitor()
+    memory = _memory_monitor.get_memory_stats()
+    if memory is not None:
+        registry.gauge(
+            "process_resident_memory_bytes", "Resident memory size in bytes"
+        ).set(memory.process_mb * 1024 * 1024)
+
+
+def render_metrics(executor: Any, running_scenarios: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Collect scrape-time gauges and render all metrics
+
+    Args:
+        executor: ExecutionService with active_count and queued_count
+        running_scenarios: Scenario status entries
+
+    Returns:
+        Metrics in Prometheus text exposition format
+    """
+    registry = get_metrics_registry()
+    collect_metrics(registry, executor, running_scenarios)
+    return registry.render()
+
+
+def reset_api_metrics() -> None:
+    """Clear the turn-rate window (useful for testing)"""
+    _turn_times.clear()
@@ -1,41 +1,224 @@
 """
 Rate Limiting for Scenario Lab API
 
-Provides configurable rate limiting using an in-memory sliding window approach.
+Provides configurable rate limiting using the Generic Cell Rate Algorithm (GCRA).
+
+GCRA keeps a single "theoretical arrival time" (TAT) per client, so state is O(1)
+per client regardless of the request rate. A limit of N requests per window W
+allows bursts of up to N requests and then one request every W/N seconds.
+
+State is kept in a pluggable store:
+- MemoryRateLimitStore: in-process, with idle-client eviction (default)
+- SQLiteRateLimitStore: file-backed, shared by several API worker processes
 """
 from __future__ import annotations
 
 import logging
+import math
+import sqlite3
+import threading
 import time
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Optional
+from collections import OrderedDict
+from typing import Callable, Optional, Protocol, Tuple
 
 from fastapi import HTTPException, Request, status
 
 from scenario_lab.api.settings import get_settings
+from scenario_lab.utils.prometheus_metrics import get_metrics_registry
 
 logger = logging.getLogger(__name__)
 
+# Store update function: receives the stored TAT (None if unknown) and returns
+# (new TAT to store or None to leave unchanged, result passed back to caller)
+TATUpdate = Callable[[Optional[float]], Tuple[Optional[float], Tuple[bool, int, int]]]
+
+
+class RateLimitStore(Protocol):
+    """
+    Protocol for rate limit state stores.
+
+    A store maps client IDs to their theoretical arrival time (TAT) and must
+    apply updates atomically. A TAT in the past means the client is idle
+    (its full burst is available), so such entries may be evicted freely.
+    """
+
+    def update(self, key: str, now: float, fn: TATUpdate) -> Tuple[bool, int, int]:
+        """
+        Atomically read, update and write the TAT for a client.
+
+        Args:
+            key: Client identifier
+            now: Current time (seconds since epoch)
+            fn: Update function (see TATUpdate)
+
+        Returns:
+            The result returned by fn
+        """
+        ...
+
+    def reset(self) -> None:
+        """Remove all stored state."""
+        ...
+
+    def __len__(self) -> int:
+        """Number of tracked clients."""
+        ...
+
+
+class MemoryRateLimitStore:
+    """
+    In-process rate limit store.
+
+    Entries are kept in least-recently-updated order; idle entries at the front
+    are evicted as new requests arrive, and the total number of tracked clients
+    is capped at max_clients.
+    """
+
+    def __init__(self, max_clients: int = 100_000) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            max_clients: Maximum number of tracked clients
+        """
+        self.max_clients = max_clients
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def update(self, key: str, now: float, fn: TATUpdate) -> Tuple[bool, int, int]:
+        with self._lock:
+            new_tat, result = fn(self._tats.get(key))
+            if new_tat is not None:
+                self._tats[key] = new_tat
+                self._tats.move_to_end(key)
+            self._evict_idle(now)
+            return result
+
+    def _evict_idle(self, now: float) -> None:
+        """Evict idle clients from the front, and the oldest clients beyond the cap."""
+        while self._tats:
+            oldest_key, oldest_tat = next(iter(self._tats.items()))
+            if oldest_tat > now and len(self._tats) <= self.max_clients:
+                break
+            del self._tats[oldest_key]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tats.clear()
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+
+class SQLiteRateLimitStore:
+    """
+    SQLite-backed rate limit store shared between processes.
+
+    Each update runs in an immediate transaction, so several API worker
+    processes pointing at the same file enforce one combined limit.
+    Idle entries are purged every cleanup_every updates.
+    """
+
+    def __init__(self, path: str, cleanup_every: int = 1000) -> None:
+        """
+        Initialize the store.
 
-@dataclass
-class RateLimitState:
-    """Track request timestamps for a single client."""
+        Args:
+            path: Path to the SQLite database file
+            cleanup_every: Number of updates between idle-entry purges
+        """
+        self.path = path
+        self.cleanup_every = cleanup_every
+        self._local = threading.local()
+        self._updates = 0
+
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit (key TEXT PRIMARY KEY, tat REAL NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection (sqlite3 connections aren't shared across threads)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def update(self, key: str, now: float, fn: TATUpdate) -> Tuple[bool, int, int]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tat FROM rate_limit WHERE key = ?", (key,)).fetchone()
+            new_tat, result = fn(row[0] if row else None)
+            if new_tat is not None:
+                conn.execute(
+                    "INSERT INTO rate_limit (key, tat) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                    (key, new_tat),
+                )
+
+            self._updates += 1
+            if self.cleanup_every and self._updates % self.cleanup_every == 0:
+                conn.execute("DELETE FROM rate_limit WHERE tat <= ?", (now,))
+
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    def reset(self) -> None:
+        self._connection().execute("DELETE FROM rate_limit")
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM rate_limit").fetchone()[0]
+
+
+def create_rate_limit_store(backend: str, path: Optional[str] = None) -> RateLimitStore:
+    """
+    Create a rate limit store.
+
+    Args:
+        backend: "memory" or "sqlite"
+        path: Database file for the sqlite backend
+
+    Returns:
+        RateLimitStore instance
 
-    timestamps: list[float] = field(default_factory=list)
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend == "memory":
+        return MemoryRateLimitStore()
+    if backend == "sqlite":
+        return SQLiteRateLimitStore(path or "scenario-lab-ratelimit.db")
+    raise ValueError(f"Unknown rate limit backend: {backend} (expected 'memory' or 'sqlite')")
 
 
 class RateLimiter:
     """
-    In-memory rate limiter using sliding window algorithm.
+    GCRA rate limiter.
 
     Tracks requests per client (identified by IP or API key) and enforces
-    configurable rate limits.
+    configurable rate limits with constant work and memory per request.
     """
 
-    def __init__(self) -> None:
-        """Initialize the rate limiter."""
-        self._clients: dict[str, RateLimitState] = defaultdict(RateLimitState)
+    def __init__(self, store: Optional[RateLimitStore] = None) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            store: State store (defaults to the backend configured in settings)
+        """
+        if store is None:
+            settings = get_settings()
+            store = create_rate_limit_store(
+                settings.rate_limit_backend, settings.rate_limit_store_path
+            )
+        self.store = store
 
     def _get_client_id(self, request: Request, api_key: Optional[str] = None) -> str:
         """
@@ -63,18 +246,33 @@ class RateLimiter:
 
         return f"ip:{client_ip}"
 
-    def _cleanup_old_timestamps(
-        self, state: RateLimitState, window_seconds: int
-    ) -> None:
+    @staticmethod
+    def _gcra(now: float, limit: int, window: float) -> TATUpdate:
         """
-        Remove timestamps older than the current window.
+        Build the GCRA update for one request.
 
         Args:
-            state: The rate limit state to clean
-            window_seconds: The window size in seconds
+            now: Current time
+            limit: Requests allowed per window
+            window: Window size in seconds
+
+        Returns:
+            Store update function
         """
-        cutoff = time.time() - window_seconds
-        state.timestamps = [ts for ts in state.timestamps if ts > cutoff]
+        interval = window / limit
+
+        def apply(tat: Optional[float]) -> Tuple[Optional[float], Tuple[bool, int, int]]:
+            new_tat = max(tat or now, now) + interval
+            allow_at = new_tat - window
+
+            if now < allow_at:
+                reset_seconds = max(1, math.ceil(allow_at - now))
+                return None, (False, 0, reset_seconds)
+
+            remaining = int((window - (new_tat - now)) / interval + 1e-9)
+            return new_tat, (True, max(0, remaining), 0)
+
+        return apply
 
     def check_rate_limit(
         self,
@@ -98,34 +296,24 @@ class RateLimiter:
             return True, settings.rate_limit_requests, 0
 
         client_id = self._get_client_id(request, api_key)
-        state = self._clients[client_id]
-
-        # Clean up old timestamps
-        self._cleanup_old_timestamps(state, settings.rate_limit_window)
-
-        # Check if limit exceeded
-        current_count = len(state.timestamps)
-        remaining = max(0, settings.rate_limit_requests - current_count)
-
-        if current_count >= settings.rate_limit_requests:
-            # Calculate reset time
-            if state.timestamps:
-                oldest = min(state.timestamps)
-                reset_seconds = int(settings.rate_limit_window - (time.time() - oldest))
-            else:
-                reset_seconds = settings.rate_limit_window
+        now = time.time()
+        allowed, remaining, reset_seconds = self.store.update(
+            client_id,
+            now,
+            self._gcra(now, settings.rate_limit_requests, settings.rate_limit_window),
+        )
 
+        if not allowed:
             logger.warning(f"Rate limit exceeded for client {client_id}")
-            return False, 0, max(1, reset_seconds)
-
-        # Record this request
-        state.timestamps.append(time.time())
+            get_metrics_registry().counter(
+                "scenario_lab_api_rate_limited_total", "API requests rejected by the rate limiter"
+            ).inc()
 
-        return True, remaining - 1, 0
+        return allowed, remaining, reset_seconds
 
     def reset(self) -> None:
         """Reset all rate limit state (useful for testing)."""
-        self._clients.clear()
+        self.store.reset()
 
 
 # Global rate limiter instance
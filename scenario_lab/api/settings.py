@@ -33,9 +33,18 @@ class APISettings:
         SCENARIO_LAB_RATE_LIMIT_ENABLED: Enable/disable rate limiting (default: true)
         SCENARIO_LAB_RATE_LIMIT_REQUESTS: Max requests per window (default: 100)
         SCENARIO_LAB_RATE_LIMIT_WINDOW: Time window in seconds (default: 60)
+        SCENARIO_LAB_RATE_LIMIT_BACKEND: Rate limit state store, "memory" or "sqlite"
+                                         (default: memory; sqlite shares limits across workers)
+        SCENARIO_LAB_RATE_LIMIT_DB: SQLite file for the sqlite backend
+                                    (default: scenario-lab-ratelimit.db)
         SCENARIO_LAB_DEV_MODE: Enable development mode with relaxed security (default: false)
         SCENARIO_LAB_CORS_ORIGINS: Comma-separated list of allowed CORS origins
                                    (default: localhost only for security)
+        SCENARIO_LAB_MAX_CONCURRENT_RUNS: Max scenarios executing at once (default: 4)
+        SCENARIO_LAB_MAX_QUEUED_RUNS: Max scenarios waiting for a slot (default: 100)
+        SCENARIO_LAB_RUNS_PER_API_KEY: Max queued + active runs per API key (default: 5, 0 = unlimited)
+        SCENARIO_LAB_RUN_STATUS_TTL: Seconds to keep finished run status (default: 3600)
+        SCENARIO_LAB_DB_WORKERS: Max concurrent database queries from API handlers (default: 4)
     """
 
     # Authentication settings
@@ -46,6 +55,8 @@ class APISettings:
     rate_limit_enabled: bool = True
     rate_limit_requests: int = 100  # requests per window
     rate_limit_window: int = 60  # seconds
+    rate_limit_backend: str = "memory"  # memory or sqlite
+    rate_limit_store_path: str = "scenario-lab-ratelimit.db"
 
     # Development mode (disables auth and rate limiting)
     dev_mode: bool = False
@@ -53,6 +64,15 @@ class APISettings:
     # CORS settings
     cors_allowed_origins: list[str] = field(default_factory=lambda: DEFAULT_CORS_ORIGINS.copy())
 
+    # Scenario execution settings
+    max_concurrent_runs: int = 4
+    max_queued_runs: int = 100
+    runs_per_api_key: int = 5
+    run_status_ttl: int = 3600  # seconds
+
+    # Database access settings
+    db_max_workers: int = 4
+
     @classmethod
     def from_env(cls) -> "APISettings":
         """
@@ -91,6 +111,12 @@ class APISettings:
         rate_limit_window = int(
             os.environ.get("SCENARIO_LAB_RATE_LIMIT_WINDOW", "60")
         )
+        rate_limit_backend = os.environ.get(
+            "SCENARIO_LAB_RATE_LIMIT_BACKEND", "memory"
+        ).strip().lower()
+        rate_limit_store_path = os.environ.get(
+            "SCENARIO_LAB_RATE_LIMIT_DB", "scenario-lab-ratelimit.db"
+        )
 
         # CORS origins (comma-separated, defaults to localhost only)
         cors_origins_str = os.environ.get("SCENARIO_LAB_CORS_ORIGINS", "")
@@ -101,14 +127,38 @@ class APISettings:
         else:
             cors_allowed_origins = DEFAULT_CORS_ORIGINS.copy()
 
+        # Scenario execution limits
+        max_concurrent_runs = int(
+            os.environ.get("SCENARIO_LAB_MAX_CONCURRENT_RUNS", "4")
+        )
+        max_queued_runs = int(
+            os.environ.get("SCENARIO_LAB_MAX_QUEUED_RUNS", "100")
+        )
+        runs_per_api_key = int(
+            os.environ.get("SCENARIO_LAB_RUNS_PER_API_KEY", "5")
+        )
+        run_status_ttl = int(
+            os.environ.get("SCENARIO_LAB_RUN_STATUS_TTL", "3600")
+        )
+        db_max_workers = int(
+            os.environ.get("SCENARIO_LAB_DB_WORKERS", "4")
+        )
+
         return cls(
             api_keys=api_keys,
             auth_enabled=auth_enabled,
             rate_limit_enabled=rate_limit_enabled,
             rate_limit_requests=rate_limit_requests,
             rate_limit_window=rate_limit_window,
+            rate_limit_backend=rate_limit_backend,
+            rate_limit_store_path=rate_limit_store_path,
             dev_mode=dev_mode,
             cors_allowed_origins=cors_allowed_origins,
+            max_concurrent_runs=max_concurrent_runs,
+            max_queued_runs=max_queued_runs,
+            runs_per_api_key=runs_per_api_key,
+            run_status_ttl=run_status_ttl,
+            db_max_workers=db_max_workers,
         )
 
     def validate_api_key(self, key: Optional[str]) -> bool:
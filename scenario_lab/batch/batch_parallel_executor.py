@@ -19,6 +19,8 @@ from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
 import logging
 
+from scenario_lab.utils.outbound_limiter import get_outbound_limiter
+
 
 class RateLimitManager:
     """
@@ -29,6 +31,9 @@ class RateLimitManager:
     - Support for server-provided retry-after headers
     - Shared state across workers
     - Automatic backoff clearing on success
+
+    Also honours the cooldowns of the shared outbound LLM limiter, which is fed
+    429s by every LLM call, so workers don't start new work into a cooldown.
     """
 
     def __init__(self):
@@ -45,8 +50,11 @@ class RateLimitManager:
         If yes, wait until backoff expires
         """
         async with self.lock:
-            if self.backoff_until > time.time():
-                wait_time = self.backoff_until - time.time()
+            wait_time = max(
+                self.backoff_until - time.time(),
+                get_outbound_limiter().cooldown_remaining(),
+            )
+            if wait_time > 0:
                 self.logger.warning(f"Rate limit active, waiting {wait_time:.1f}s...")
                 await asyncio.sleep(wait_time)
 
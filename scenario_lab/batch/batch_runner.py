@@ -43,6 +43,7 @@ from scenario_lab.utils.error_handler import (
     ErrorSeverity
 )
 from scenario_lab.utils.response_cache import get_global_cache
+from scenario_lab.utils.outbound_limiter import get_outbound_limiter
 from scenario_lab.utils.memory_optimizer import get_memory_monitor, optimize_memory
 from scenario_lab.utils.cost_estimator import CostEstimator
 
@@ -65,7 +66,8 @@ class BatchRunner:
         config_path: str,
         resume: bool = False,
         progress_display: bool = True,
-        dry_run: bool = False
+        dry_run: bool = False,
+        profile: bool = False
     ):
         """
         Initialize batch runner
@@ -75,11 +77,13 @@ class BatchRunner:
             resume: Whether to resume incomplete batch
             progress_display: Whether to show rich progress display
             dry_run: Preview mode (don't execute)
+            profile: Write per-phase profiles into each run's profile/ directory
         """
         self.config_path = config_path
         self.resume_mode = resume
         self.progress_display = progress_display
         self.dry_run = dry_run
+        self.profile = profile
 
         # Load configuration
         self._load_config()
@@ -114,6 +118,9 @@ class BatchRunner:
 
         self.error_handler = ErrorHandler()
 
+        # Holds new runs back while the provider is cooling down after 429s
+        self.rate_limit_manager = RateLimitManager()
+
         # Execution state
         self.variations: List[Dict[str, Any]] = []
         self.completed_runs: Set[str] = set()
@@ -283,7 +290,8 @@ class BatchRunner:
             final_state = await run_scenario_async(
                 scenario_path=modified_scenario_path,
                 output_path=output_path,
-                credit_limit=self.cost_manager.cost_per_run_limit
+                credit_limit=self.cost_manager.cost_per_run_limit,
+                profile=self.profile
             )
 
             # Get cost from final state
@@ -725,6 +733,9 @@ class BatchRunner:
                     if not can_continue:
                         return {'status': 'budget_exceeded', 'run_id': run_id}
 
+                    # Don't start new runs into an active provider cooldown
+                    await self.rate_limit_manager.check_rate_limit()
+
                     # Notify progress tracker
                     if progress_tracker:
                         progress_tracker.update_run_started(run_id, variation['description'])
@@ -802,7 +813,8 @@ class BatchRunner:
             'runs_failed': len(self.failed_runs),
             'duration_seconds': duration,
             'cost_summary': self.cost_manager.get_summary(),
-            'failed_runs': self.failed_runs
+            'failed_runs': self.failed_runs,
+            'outbound_limits': get_outbound_limiter().get_status()
         }
 
         # Save JSON summary
@@ -847,6 +859,19 @@ class BatchRunner:
             self.logger.info(f"   Tokens saved: {cache_stats.tokens_saved:,}")
             self.logger.info(f"   Cost saved: ${cache_stats.estimated_cost_saved:.4f}")
 
+        # Show outbound LLM limiter state (only interesting if providers pushed back)
+        throttled = {
+            key: state for key, state in summary['outbound_limits'].items()
+            if state['rate_limited_total'] > 0
+        }
+        if throttled:
+            self.logger.info("\n🚦 Provider Rate Limits:")
+            for key, state in throttled.items():
+                self.logger.info(
+                    f"   {key}: {state['rate_limited_total']} rate-limited calls, "
+                    f"settled at {state['concurrency_limit']:.1f} concurrent"
+                )
+
         # Show memory usage summary
         memory_monitor = get_memory_monitor()
         mem_stats = memory_monitor.get_memory_stats()
@@ -883,6 +908,11 @@ def main():
         action='store_true',
         help='Show preview of what will be executed without running'
     )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Sample each phase and write profiles into every run directory'
+    )
 
     args = parser.parse_args()
 
@@ -891,7 +921,8 @@ def main():
         args.config,
         resume=args.resume,
         progress_display=not args.no_progress,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        profile=args.profile
     )
     batch_runner.run()
 
@@ -0,0 +1,52 @@
+"""
+Benchmark suite for Scenario Lab hot paths
+
+Micro-benchmarks with synthetic fixtures at several scales, JSON reports and
+comparison against a baseline report. Run with `scenario-lab bench`.
+
+ScenarioBenchmark times whole scenario runs against a mock or replayed LLM
+backend. Run with `scenario-lab benchmark`; generate_scenario writes large
+synthetic scenarios to run it on.
+"""
+from scenario_lab.benchmarks.fixtures import SCALES, Scale, build_batch_output, build_state
+from scenario_lab.benchmarks.generator import GeneratedScenario, generate_scenario
+from scenario_lab.benchmarks.scenario import ScenarioBenchmark, write_csv
+from scenario_lab.benchmarks.suite import (
+    DEFAULT_THRESHOLD,
+    BenchmarkCase,
+    BenchmarkContext,
+    BenchmarkResult,
+    Comparison,
+    benchmark,
+    compare_reports,
+    get_benchmarks,
+    load_report,
+    measure,
+    run_benchmark,
+    run_suite,
+    save_report,
+)
+
+__all__ = [
+    "SCALES",
+    "Scale",
+    "build_batch_output",
+    "build_state",
+    "GeneratedScenario",
+    "generate_scenario",
+    "ScenarioBenchmark",
+    "write_csv",
+    "DEFAULT_THRESHOLD",
+    "BenchmarkCase",
+    "BenchmarkContext",
+    "BenchmarkResult",
+    "Comparison",
+    "benchmark",
+    "compare_reports",
+    "get_benchmarks",
+    "load_report",
+    "measure",
+    "run_benchmark",
+    "run_suite",
+    "save_report",
+]
@@ -0,0 +1,275 @@
+"""
+Benchmark cases for the hot paths Scenario Lab owns
+
+State transformations and serialization, response parsing, the response
+cache, file and database persistence, event dispatch and batch analysis.
+Fixtures are built in setup so only the operation itself is timed.
+"""
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import random
+from dataclasses import replace
+from typing import Any, Callable
+
+from scenario_lab.benchmarks.fixtures import (
+    SCALES,
+    actor_names,
+    build_batch_output,
+    build_state,
+    synthetic_decision_response,
+    synthetic_text,
+)
+from scenario_lab.benchmarks.suite import BenchmarkContext, benchmark
+
+Operation = Callable[[], Any]
+
+
+@functools.lru_cache(maxsize=len(SCALES))
+def _build_state(turns: int, actors: int):
+    # States are immutable, so benchmarks at the same scale can share one
+    return build_state(turns, actors)
+
+
+def _state(context: BenchmarkContext):
+    return _build_state(context.scale.turns, context.scale.actors)
+
+
+# State transformations
+
+
+@benchmark("state.with_decision", group="state")
+def bench_with_decision(context: BenchmarkContext) -> Operation:
+    """Record one actor's decision on a full-history state"""
+    state = _state(context)
+    decisions = itertools.cycle(state.decisions.items())
+    return lambda: state.with_decision(*next(decisions))
+
+
+@benchmark("state.with_communication", group="state")
+def bench_with_communication(context: BenchmarkContext) -> Operation:
+    """Append a communication to a full-history state"""
+    state = _state(context)
+    comm = state.communications[-1]
+    return lambda: state.with_communication(comm)
+
+
+@benchmark("state.with_metric", group="state")
+def bench_with_metric(context: BenchmarkContext) -> Operation:
+    """Append a metric record to a full-history state"""
+    state = _state(context)
+    metric = state.metrics[-1]
+    return lambda: state.with_metric(metric)
+
+
+@benchmark("state.with_cost", group="state")
+def bench_with_cost(context: BenchmarkContext) -> Operation:
+    """Append a cost record to a full-history state"""
+    state = _state(context)
+    cost = state.costs[-1]
+    return lambda: state.with_cost(cost)
+
+
+@benchmark("state.with_turn", group="state")
+def bench_with_turn(context: BenchmarkContext) -> Operation:
+    """Advance a full-history state to the next turn"""
+    state = _state(context)
+    return lambda: state.with_turn(state.turn + 1)
+
+
+@benchmark("state.total_cost", group="state")
+def bench_total_cost(context: BenchmarkContext) -> Operation:
+    """Sum the cost history"""
+    state = _state(context)
+    return state.total_cost
+
+
+@benchmark("state.to_dict", group="state")
+def bench_to_dict(context: BenchmarkContext) -> Operation:
+    """Convert a full-history state to a dictionary"""
+    return _state(context).to_dict
+
+
+@benchmark("state.to_json", group="state")
+def bench_to_json(context: BenchmarkContext) -> Operation:
+    """Serialize a full-history state to JSON as the persistence phase does"""
+    state = _state(context)
+    return lambda: json.dumps(state.to_dict(), indent=2)
+
+
+# Response parsing
+
+
+@benchmark("parser.parse_decision", group="parser", scales=None)
+def bench_parse_decision(context: BenchmarkContext) -> Operation:
+    """Parse a markdown decision response"""
+    from scenario_lab.utils.response_parser import parse_decision
+
+    content = synthetic_decision_response(random.Random(0), words=300)
+    return lambda: parse_decision(content)
+
+
+@benchmark("parser.parse_decision_json", group="parser", scales=None)
+def bench_parse_decision_json(context: BenchmarkContext) -> Operation:
+    """Parse a JSON decision response inside a code block"""
+    from scenario_lab.utils.response_parser import parse_decision
+
+    rng = random.Random(0)
+    content = "```json\n" + json.dumps({
+        "goals": {"long_term": synthetic_text(rng, 20), "short_term": synthetic_text(rng, 20)},
+        "reasoning": synthetic_text(rng, 150),
+        "action": synthetic_text(rng, 150),
+    }, indent=2) + "\n```"
+    return lambda: parse_decision(content, json_mode=True)
+
+
+@benchmark("parser.extract_section", group="parser", scales=None)
+def bench_extract_section(context: BenchmarkContext) -> Operation:
+    """Extract the last section of a markdown decision response"""
+    from scenario_lab.utils.response_parser import extract_section
+
+    content = synthetic_decision_response(random.Random(0), words=300)
+    return lambda: extract_section(content, "ACTION")
+
+
+# Response cache
+
+
+def _cache_messages(index: int):
+    return [
+        {"role": "system", "content": "You are an actor in a scenario."},
+        {"role": "user", "content": f"Turn prompt {index}"},
+    ]
+
+
+@benchmark("cache.get_hit", group="cache")
+def bench_cache_get_hit(context: BenchmarkContext) -> Operation:
+    """Look up a cached response with one entry per actor per turn"""
+    from scenario_lab.utils.response_cache import ResponseCache
+
+    entries = context.scale.turns * context.scale.actors
+    cache = ResponseCache(max_memory_entries=entries)
+    for i in range(entries):
+        cache.put("openai/gpt-4o-mini", _cache_messages(i), "Response", 30, 20, 10)
+    keys = itertools.cycle([_cache_messages(i) for i in range(0, entries, 7)])
+    return lambda: cache.get("openai/gpt-4o-mini", next(keys))
+
+
+@benchmark("cache.put", group="cache")
+def bench_cache_put(context: BenchmarkContext) -> Operation:
+    """Store a new response in a full cache (includes eviction)"""
+    from scenario_lab.utils.response_cache import ResponseCache
+
+    cache = ResponseCache(max_memory_entries=context.scale.turns * context.scale.actors)
+    counter = itertools.count()
+    for _ in range(cache.max_memory_entries):
+        cache.put("openai/gpt-4o-mini", _cache_messages(next(counter)), "Response", 30, 20, 10)
+    return lambda: cache.put(
+        "openai/gpt-4o-mini", _cache_messages(next(counter)), "Response", 30, 20, 10
+    )
+
+
+# Persistence
+
+
+@benchmark("persistence.files", group="persistence")
+def bench_persistence_files(context: BenchmarkContext) -> Operation:
+    """Write a turn's markdown and JSON files including the resumable state"""
+    from scenario_lab.services.persistence_phase import PersistencePhase
+
+    state = _state(context)
+    phase = PersistencePhase(str(context.workdir / "run"))
+    return lambda: context.run(phase.execute(state))
+
+
+@benchmark("persistence.database", group="persistence")
+def bench_persistence_database(context: BenchmarkContext) -> Operation:
+    """Persist a turn to SQLite including search index and metric rollups"""
+    from scenario_lab.database.models import Database
+    from scenario_lab.services.database_persistence_phase import DatabasePersistencePhase
+
+    database = Database(f"sqlite:///{context.workdir / 'bench.db'}")
+    context.add_cleanup(database.engine.dispose)
+    phase = DatabasePersistencePhase(database)
+
+    state = _state(context)
+    history = [c for c in state.communications if c.turn != state.turn]
+    current = [c for c in state.communications if c.turn == state.turn]
+    counter = itertools.count()
+
+    def persist_turn():
+        # Communication ids are primary keys: give each persisted turn fresh ones
+        n = next(counter)
+        comms = history + [replace(c, id=f"{c.id}-{n}") for c in current]
+        return context.run(phase.execute(replace(state, communications=comms)))
+
+    return persist_turn
+
+
+# Events
+
+EMITS_PER_CALL = 100
+
+
+@benchmark(
+    "events.emit", group="events", scales=("t10-a5", "t100-a50"), ops_per_call=EMITS_PER_CALL
+)
+def bench_emit(context: BenchmarkContext) -> Operation:
+    """Dispatch an event to one handler per actor plus a wildcard handler"""
+    from scenario_lab.core.events import EventBus
+
+    bus = EventBus()
+
+    async def handler(event):
+        return None
+
+    for _ in range(context.scale.actors):
+        bus.on("turn_completed", handler)
+    bus.on("*", handler)
+
+    async def emit_many():
+        for turn in range(EMITS_PER_CALL):
+            await bus.emit("turn_completed", {"turn": turn})
+
+    return lambda: context.run(emit_many())
+
+
+# Batch processing
+
+
+@benchmark("batch.generate_variations", group="batch", scales=("t10-a5", "t100-a50"))
+def bench_generate_variations(context: BenchmarkContext) -> Operation:
+    """Generate the Cartesian product of two actor-model dimensions and a parameter"""
+    from scenario_lab.batch.parameter_variator import ParameterVariator
+
+    models = [f"provider/model-{i}" for i in range(context.scale.actors)]
+    names = actor_names(2)
+    variator = ParameterVariator(str(context.workdir), [
+        {"type": "actor_model", "actor": names[0], "values": models},
+        {"type": "actor_model", "actor": names[1], "values": models},
+        {"type": "scenario_parameter", "parameter": "turns", "values": [5, 10, 20, 40]},
+    ])
+    return variator.generate_variations
+
+
+@benchmark("batch.analyze", group="batch", scales=("t10-a5", "t100-a5", "t100-a50"))
+def bench_batch_analyze(context: BenchmarkContext) -> Operation:
+    """Collect and summarize batch runs (one variation per actor, turns/10 runs each)"""
+    from scenario_lab.batch.batch_analyzer import BatchAnalyzer
+
+    batch_dir = build_batch_output(
+        context.workdir / "batch",
+        variations=context.scale.actors,
+        runs_per_variation=max(2, context.scale.turns // 10),
+    )
+
+    def analyze():
+        analyzer = BatchAnalyzer(str(batch_dir))
+        analyzer.collect_run_data()
+        analyzer.calculate_metric_statistics()
+        return analyzer.calculate_variation_statistics()
+
+    return analyze
+
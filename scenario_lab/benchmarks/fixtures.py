@@ -0,0 +1,288 @@
+"""
+Synthetic fixtures for the benchmark suite
+
+Builds realistic in-memory scenario states, LLM responses and batch output
+directories at a given scale without calling any model. All fixtures are
+deterministic for a given seed so benchmark runs are comparable.
+"""
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+
+from scenario_lab.models.state import (
+    ActorState,
+    Communication,
+    CostRecord,
+    Decision,
+    MetricRecord,
+    ScenarioState,
+    ScenarioStatus,
+    WorldState,
+)
+
+_WORDS = (
+    "actor negotiation treaty capability oversight compute export controls coalition "
+    "frontier safety evaluation deployment incident audit standard regulator market "
+    "alliance sanction verification disclosure investment research pressure timeline "
+    "agreement proposal signal escalation restraint capacity leverage commitment"
+).split()
+
+METRIC_NAMES = ("tension", "cooperation")
+BASE_TIME = datetime(2025, 1, 1)
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a synthetic scenario"""
+    name: str
+    turns: int
+    actors: int
+
+
+SCALES: Dict[str, Scale] = {
+    scale.name: scale
+    for scale in (
+        Scale("t10-a5", 10, 5),
+        Scale("t100-a5", 100, 5),
+        Scale("t1000-a5", 1000, 5),
+        Scale("t100-a50", 100, 50),
+        Scale("t1000-a50", 1000, 50),
+    )
+}
+
+
+def synthetic_text(rng: random.Random, words: int) -> str:
+    """
+    Generate filler prose of roughly the given number of words
+
+    Args:
+        rng: Random source
+        words: Number of words
+
+    Returns:
+        Text split into sentences of 8-16 words
+    """
+    sentences = []
+    remaining = max(1, words)
+    while remaining > 0:
+        length = min(remaining, rng.randint(8, 16))
+        sentence = " ".join(rng.choice(_WORDS) for _ in range(length))
+        sentences.append(sentence.capitalize() + ".")
+        remaining -= length
+    return " ".join(sentences)
+
+
+def synthetic_decision_response(rng: random.Random, words: int = 150) -> str:
+    """
+    Generate a markdown actor decision in the format the decision prompt asks for
+
+    Args:
+        rng: Random source
+        words: Approximate length of the reasoning and action sections together
+
+    Returns:
+        LLM-style decision response
+    """
+    goals = "\n".join(f"- {synthetic_text(rng, 8)}" for _ in range(3))
+    priorities = "\n".join(f"- {synthetic_text(rng, 8)}" for _ in range(2))
+    return (
+        f"**LONG-TERM GOALS:**\n{goals}\n\n"
+        f"**SHORT-TERM PRIORITIES:**\n{priorities}\n\n"
+        f"**REASONING:**\n{synthetic_text(rng, words // 2)}\n\n"
+        f"**ACTION:**\n{synthetic_text(rng, words - words // 2)}"
+    )
+
+
+def actor_names(actors: int) -> List[str]:
+    """Names of the synthetic actors"""
+    return [f"Actor {i + 1:02d}" for i in range(actors)]
+
+
+def build_turn_records(
+    rng: random.Random,
+    turn: int,
+    names: List[str],
+    run_id: str = "bench-run",
+) -> tuple:
+    """
+    Build one turn's decisions, communications, metrics and costs
+
+    Args:
+        rng: Random source
+        turn: Turn number
+        names: Actor names
+        run_id: Run identifier (communication ids are unique per run)
+
+    Returns:
+        Tuple of (decisions dict, communications, metrics, costs)
+    """
+    timestamp = BASE_TIME + timedelta(hours=turn)
+    decisions = {}
+    communications = []
+    metrics = []
+    costs = []
+
+    for index, name in enumerate(names):
+        decisions[name] = Decision(
+            actor=name,
+            turn=turn,
+            goals=[synthetic_text(rng, 8), synthetic_text(rng, 8)],
+            reasoning=synthetic_text(rng, 60),
+            action=synthetic_text(rng, 40),
+            timestamp=timestamp,
+        )
+        communications.append(Communication(
+            id=f"{run_id}-{turn}-{index}",
+            turn=turn,
+            type="bilateral",
+            sender=name,
+            recipients=[names[(index + 1) % len(names)]],
+            content=synthetic_text(rng, 40),
+            timestamp=timestamp,
+        ))
+        for metric_name in METRIC_NAMES:
+            metrics.append(MetricRecord(
+                name=metric_name,
+                value=round(rng.uniform(0, 10), 2),
+                turn=turn,
+                actor=name,
+                timestamp=timestamp,
+            ))
+        costs.append(CostRecord(
+            timestamp=timestamp + timedelta(seconds=index),
+            actor=name,
+            phase="decision",
+            model="openai/gpt-4o-mini",
+            input_tokens=1500,
+            output_tokens=300,
+            cost=0.0004,
+        ))
+
+    costs.append(CostRecord(
+        timestamp=timestamp + timedelta(minutes=30),
+        actor=None,
+        phase="world_update",
+        model="openai/gpt-4o-mini",
+        input_tokens=3000,
+        output_tokens=600,
+        cost=0.0008,
+    ))
+    return decisions, communications, metrics, costs
+
+
+def build_state(turns: int, actors: int, seed: int = 0) -> ScenarioState:
+    """
+    Build a scenario state as it looks after running the given number of turns
+
+    The state carries the full communication, metric and cost history, the
+    last five decisions per actor and the final turn's decisions.
+
+    Args:
+        turns: Number of completed turns
+        actors: Number of actors
+        seed: Random seed
+
+    Returns:
+        Running ScenarioState at turn `turns`
+    """
+    rng = random.Random(seed)
+    names = actor_names(actors)
+    recent: Dict[str, List[Decision]] = {name: [] for name in names}
+    communications: List[Communication] = []
+    metrics: List[MetricRecord] = []
+    costs: List[CostRecord] = []
+    decisions: Dict[str, Decision] = {}
+
+    for turn in range(1, turns + 1):
+        decisions, turn_comms, turn_metrics, turn_costs = build_turn_records(rng, turn, names)
+        communications.extend(turn_comms)
+        metrics.extend(turn_metrics)
+        costs.extend(turn_costs)
+        for name, decision in decisions.items():
+            recent[name] = (recent[name] + [decision])[-5:]
+
+    actor_states = {
+        name: ActorState(
+            name=name,
+            short_name=f"actor-{i + 1:02d}",
+            model="openai/gpt-4o-mini",
+            current_goals=recent[name][-1].goals if recent[name] else [],
+            recent_decisions=recent[name],
+            private_information=synthetic_text(rng, 30),
+        )
+        for i, name in enumerate(names)
+    }
+
+    return ScenarioState(
+        scenario_id="bench-scenario",
+        scenario_name="Benchmark Scenario",
+        run_id="bench-run",
+        status=ScenarioStatus.RUNNING,
+        scenario_config={"name": "Benchmark Scenario", "turns": turns, "actors": names},
+        turn=turns,
+        world_state=WorldState(turn=turns, content=synthetic_text(rng, 400), timestamp=BASE_TIME),
+        actors=actor_states,
+        communications=communications,
+        decisions=decisions,
+        metrics=metrics,
+        costs=costs,
+        started_at=BASE_TIME,
+    )
+
+
+def build_batch_output(
+    output_dir: Path,
+    variations: int,
+    runs_per_variation: int,
+    seed: int = 0,
+) -> Path:
+    """
+    Write a batch output directory in the layout BatchRunner produces
+
+    Args:
+        output_dir: Directory to create the batch in
+        variations: Number of variations
+        runs_per_variation: Runs per variation
+        seed: Random seed
+
+    Returns:
+        Path to the batch directory
+    """
+    rng = random.Random(seed)
+    output_dir = Path(output_dir)
+    runs_dir = output_dir / "runs"
+    runs_dir.mkdir(parents=True, exist_ok=True)
+
+    with open(output_dir / "batch-config.yaml", "w") as f:
+        yaml.dump({"experiment_name": "benchmark", "runs_per_variation": runs_per_variation}, f)
+    with open(output_dir / "batch-summary.json", "w") as f:
+        json.dump({"total_runs": variations * runs_per_variation}, f)
+    with open(output_dir / "batch-costs.json", "w") as f:
+        json.dump({"total_cost": 0.0}, f)
+    with open(output_dir / "batch-state.json", "w") as f:
+        json.dump({"variations": [
+            {"variation_id": v, "description": f"Variation {v}"}
+            for v in range(1, variations + 1)
+        ]}, f)
+
+    for variation in range(1, variations + 1):
+        for run in range(1, runs_per_variation + 1):
+            run_dir = runs_dir / f"var-{variation:03d}-run-{run:03d}"
+            run_dir.mkdir(exist_ok=True)
+            final_metrics = {name: round(rng.uniform(0, 10), 2) for name in METRIC_NAMES}
+            with open(run_dir / "metrics.json", "w") as f:
+                json.dump({"final_metrics": final_metrics}, f)
+            with open(run_dir / "costs.json", "w") as f:
+                json.dump({"total_cost": round(rng.uniform(0.01, 0.5), 4)}, f)
+            with open(run_dir / "scenario-state.json", "w") as f:
+                status = "completed" if rng.random() < 0.9 else "failed"
+                json.dump({"status": status, "current_turn": 10}, f)
+
+    return output_dir
@@ -0,0 +1,242 @@
+"""
+Synthetic scenario generator for scale testing
+
+Writes complete, valid scenario directories with any number of actors,
+turns, metrics and exogenous events. The bundled scenarios are small; these
+are meant to be run against the mock LLM backend to find where the
+orchestrator, state handling and persistence stop scaling:
+
+    scenario-lab generate-scenario /tmp/large --actors 100 --turns 500
+    scenario-lab benchmark /tmp/large --backend mock --turns 20
+"""
+from __future__ import annotations
+
+import math
+import random
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+from scenario_lab.benchmarks.fixtures import synthetic_text
+
+DEFAULT_MODEL = "mock/scale"
+
+# How the expected events per turn are split across event types
+_EVENT_MIX = {"scheduled": 0.5, "random": 0.25, "trend": 0.15, "conditional": 0.1}
+_TREND_FREQUENCY = 10
+_RANDOM_WINDOW = 10
+
+
+@dataclass
+class GeneratedScenario:
+    """Summary of a generated scenario directory"""
+    path: Path
+    actors: int
+    turns: int
+    metrics: int
+    events: Dict[str, int]
+
+    @property
+    def total_events(self) -> int:
+        """Number of exogenous event definitions"""
+        return sum(self.events.values())
+
+
+def _write_yaml(path: Path, data: Any) -> None:
+    with open(path, "w") as f:
+        yaml.safe_dump(data, f, sort_keys=False, width=100)
+
+
+def _actor_config(rng: random.Random, index: int, model: str) -> Dict[str, Any]:
+    short_name = f"actor-{index:03d}"
+    return {
+        "name": f"Actor {index:03d}",
+        "short_name": short_name,
+        "llm_model": model,
+        "system_prompt": synthetic_text(rng, 60),
+        "goals": [synthetic_text(rng, 10) for _ in range(3)],
+        "constraints": [synthetic_text(rng, 10) for _ in range(2)],
+        "expertise": synthetic_text(rng, 30),
+        "decision_making_style": synthetic_text(rng, 30),
+        "information_access": {"public": True, "private": [synthetic_text(rng, 8)]},
+    }
+
+
+def _words(rng: random.Random, count: int) -> List[str]:
+    return synthetic_text(rng, count).rstrip(".").lower().split()
+
+
+def _metric_config(rng: random.Random, index: int, model: str) -> Dict[str, Any]:
+    # Rotate through the three automatic extraction types; llm metrics are
+    # batched into one call per turn by MetricsTrackerV2
+    name = f"metric_{index:03d}"
+    kind = ("keyword", "pattern", "llm")[index % 3]
+    if kind == "keyword":
+        extraction = {"type": "keyword", "keywords": _words(rng, 3)}
+        value_range = [0, 100]
+    elif kind == "pattern":
+        extraction = {"type": "pattern", "pattern": rf"{name}:\s*(\d+(?:\.\d+)?)"}
+        value_range = [0, 10]
+    else:
+        extraction = {
+            "type": "llm",
+            "prompt": f"Rate the level of {' '.join(_words(rng, 2))} from 0 to 10",
+            "model": model,
+        }
+        value_range = [0, 10]
+    return {
+        "name": name,
+        "description": synthetic_text(rng, 8),
+        "type": "continuous",
+        "range": value_range,
+        "extraction": extraction,
+        "actor_specific": False,
+    }
+
+
+def _event_counts(turns: int, event_density: float, metrics: int) -> Dict[str, int]:
+    target = event_density * turns
+    counts = {
+        "scheduled": round(target * _EVENT_MIX["scheduled"]),
+        # Each random event fires about once within its window
+        "random": round(target * _EVENT_MIX["random"]),
+        # Each trend fires every _TREND_FREQUENCY turns over the whole run
+        "trend": math.ceil(
+            target * _EVENT_MIX["trend"] / max(1.0, turns / _TREND_FREQUENCY)
+        ),
+        "conditional": round(target * _EVENT_MIX["conditional"]) if metrics else 0,
+    }
+    if target > 0 and not any(counts.values()):
+        counts["scheduled"] = 1
+    return counts
+
+
+def _events(
+    rng: random.Random, turns: int, counts: Dict[str, int], metric_names: List[str]
+) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = []
+
+    for i in range(counts["scheduled"]):
+        events.append({
+            "type": "scheduled",
+            "name": f"scheduled-{i + 1:04d}",
+            "description": synthetic_text(rng, 25),
+            "turn": rng.randint(1, turns),
+        })
+
+    for i in range(counts["random"]):
+        start = rng.randint(1, max(1, turns - _RANDOM_WINDOW + 1))
+        events.append({
+            "type": "random",
+            "name": f"random-{i + 1:04d}",
+            "description": synthetic_text(rng, 25),
+            "probability": 0.5,
+            "turn_range": [start, min(turns, start + _RANDOM_WINDOW - 1)],
+        })
+
+    for i in range(counts["trend"]):
+        events.append({
+            "type": "trend",
+            "name": f"trend-{i + 1:04d}",
+            "description": synthetic_text(rng, 25),
+            "frequency": _TREND_FREQUENCY,
+            "turn_range": [rng.randint(1, min(turns, _TREND_FREQUENCY)), turns],
+            "once": False,
+        })
+
+    for i in range(counts["conditional"]):
+        events.append({
+            "type": "conditional",
+            "name": f"conditional-{i + 1:04d}",
+            "description": synthetic_text(rng, 25),
+            "conditions": {rng.choice(metric_names): f">= {rng.randint(3, 8)}"},
+        })
+
+    return events
+
+
+def generate_scenario(
+    output_dir: str,
+    actors: int = 10,
+    turns: int = 20,
+    metrics: int = 6,
+    event_density: float = 0.2,
+    model: str = DEFAULT_MODEL,
+    seed: int = 0,
+    overwrite: bool = False,
+) -> GeneratedScenario:
+    """
+    Write a synthetic scenario directory
+
+    Creates scenario.yaml, actors/*.yaml, metrics.yaml and
+    definition/exogenous-events.yaml (where the exogenous events loader
+    looks for them). Every actor, the world state and llm metrics use
+    `model`, so the default mock model needs no API key.
+
+    Args:
+        output_dir: Directory to create
+        actors: Number of actors
+        turns: Number of turns
+        metrics: Number of metrics (keyword, pattern and llm in rotation)
+        event_density: Approximate number of exogenous events triggering per turn
+        model: Model for actors, world state and llm metrics
+        seed: Random seed; the same arguments always produce the same files
+        overwrite: Replace output_dir if it already exists
+
+    Returns:
+        GeneratedScenario describing what was written
+
+    Raises:
+        ValueError: If a count is out of range
+        FileExistsError: If output_dir exists, is not empty and overwrite is False
+    """
+    if actors < 1 or turns < 1:
+        raise ValueError("A scenario needs at least one actor and one turn")
+    if metrics < 0 or event_density < 0:
+        raise ValueError("metrics and event_density cannot be negative")
+
+    path = Path(output_dir)
+    if path.exists() and any(path.iterdir()):
+        if not overwrite:
+            raise FileExistsError(f"Output directory is not empty: {path}")
+        shutil.rmtree(path)
+
+    rng = random.Random(seed)
+    (path / "actors").mkdir(parents=True, exist_ok=True)
+
+    actor_configs = [_actor_config(rng, i + 1, model) for i in range(actors)]
+    for config in actor_configs:
+        _write_yaml(path / "actors" / f"{config['short_name']}.yaml", config)
+
+    _write_yaml(path / "scenario.yaml", {
+        "name": f"Synthetic Scenario ({actors} actors, {turns} turns)",
+        "description": "Generated by scenario-lab generate-scenario for scale testing.",
+        "system_prompt": synthetic_text(rng, 80),
+        "initial_world_state": synthetic_text(rng, 300),
+        "turns": turns,
+        "turn_duration": "1 month",
+        "world_state_model": model,
+        "actors": [config["short_name"] for config in actor_configs],
+    })
+
+    metric_configs = [_metric_config(rng, i + 1, model) for i in range(metrics)]
+    if metric_configs:
+        _write_yaml(path / "metrics.yaml", {"metrics": metric_configs})
+
+    counts = _event_counts(turns, event_density, metrics)
+    events = _events(rng, turns, counts, [m["name"] for m in metric_configs])
+    if events:
+        (path / "definition").mkdir(exist_ok=True)
+        _write_yaml(path / "definition" / "exogenous-events.yaml", {"exogenous_events": events})
+
+    return GeneratedScenario(
+        path=path,
+        actors=actors,
+        turns=turns,
+        metrics=metrics,
+        events=counts,
+    )
+
@@ -0,0 +1,428 @@
+"""
+Scenario benchmark - end-to-end timing of whole scenario runs
+
+Runs a scenario several times (after optional warm-up runs) and breaks the
+time down by turn and by phase using the orchestrator's TURN_* and PHASE_*
+events. LLM time is split into worker-thread wait, outbound-limiter queue
+wait, network time and retry backoff (see llm_timing), and memory can be
+traced with tracemalloc.
+
+Backends:
+- live: the scenario's own models (real API calls)
+- mock: every model answered by the mock LLM backend with a configurable
+  latency, so the numbers measure the engine instead of the provider
+- replay: responses served from a recorded cassette (see llm_cassette)
+
+Reports are JSON-serializable dicts; summary_row() flattens one into a CSV
+row so runs can be tracked over time.
+"""
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+import math
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from scenario_lab.benchmarks.suite import environment_info
+from scenario_lab.utils.llm_timing import get_llm_timing_stats
+from scenario_lab.utils.profiler import PhaseProfiler
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("live", "mock", "replay")
+LLM_COMPONENTS = ("wall", "executor_wait", "queue_wait", "network", "backoff")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Percentile with linear interpolation between closest ranks
+
+    Args:
+        values: Samples (need not be sorted)
+        q: Percentile in [0, 100]
+
+    Returns:
+        Interpolated percentile (0.0 for no samples)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """
+    Summary statistics of a list of samples
+
+    Args:
+        values: Samples
+
+    Returns:
+        Dict with count, mean, stdev, min, p50, p95, max
+    """
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean": statistics.mean(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "min": min(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": max(values),
+    }
+
+
+def _allocated_blocks() -> int:
+    # CPython only; other interpreters report 0
+    getter = getattr(sys, "getallocatedblocks", None)
+    return getter() if getter else 0
+
+
+@dataclass
+class RunMeasurement:
+    """Measurements of one scenario run"""
+    repetition: int
+    warmup: bool = False
+    startup: float = 0.0
+    total: float = 0.0
+    turns_completed: int = 0
+    cost: float = 0.0
+    turn_times: List[float] = field(default_factory=list)
+    phase_times: Dict[str, List[float]] = field(default_factory=dict)
+    llm: Dict[str, Any] = field(default_factory=dict)
+    memory_peak: Optional[int] = None  # Bytes (tracemalloc)
+    turn_alloc_peak: List[int] = field(default_factory=list)  # Bytes above turn start
+    turn_retained: List[int] = field(default_factory=list)  # Bytes still held at turn end
+    turn_blocks: List[int] = field(default_factory=list)  # Net allocated blocks per turn
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return asdict(self)
+
+
+class ScenarioBenchmark:
+    """Runs a scenario repeatedly and collects timing and memory measurements"""
+
+    def __init__(
+        self,
+        scenario_path: str,
+        turns: int = 3,
+        repetitions: int = 1,
+        warmup: int = 0,
+        backend: str = "live",
+        mock_latency: float = 0.0,
+        mock_distribution: str = "fixed",
+        replay_path: Optional[str] = None,
+        replay_latency: float = 0.0,
+        trace_memory: bool = False,
+        profile: bool = False,
+    ):
+        """
+        Initialize scenario benchmark
+
+        Args:
+            scenario_path: Path to scenario directory
+            turns: Turns per run
+            repetitions: Measured runs
+            warmup: Runs executed first and left out of the results
+            backend: "live", "mock" or "replay"
+            mock_latency: Mean mock latency in seconds (mock backend)
+            mock_distribution: Mock latency distribution (mock backend)
+            replay_path: Cassette to replay (replay backend)
+            replay_latency: Replay latency as a multiple of the recorded latency
+            trace_memory: Trace allocations with tracemalloc (slows Python code down)
+            profile: Sample each phase of the measured runs into one PhaseProfiler
+
+        Raises:
+            ValueError: If the backend is unknown or replay has no cassette
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}' (expected one of {BACKENDS})")
+        if backend == "replay" and not replay_path:
+            raise ValueError("The replay backend needs a cassette path")
+
+        self.scenario_path = scenario_path
+        self.turns = turns
+        self.repetitions = max(1, repetitions)
+        self.warmup = max(0, warmup)
+        self.backend = backend
+        self.mock_latency = mock_latency
+        self.mock_distribution = mock_distribution
+        self.replay_path = replay_path
+        self.replay_latency = replay_latency
+        self.trace_memory = trace_memory
+        self.profiler: Optional[PhaseProfiler] = PhaseProfiler() if profile else None
+        self.runs: List[RunMeasurement] = []
+
+    def _activate_backend(self) -> Callable[[], None]:
+        """Switch LLM calls to the selected backend and return the undo function"""
+        if self.backend == "mock":
+            from scenario_lab.utils.mock_llm import (
+                MockLLMBackend,
+                MockLLMConfig,
+                set_mock_all_models,
+                set_mock_backend,
+            )
+
+            config = replace(
+                MockLLMConfig.from_env(),
+                latency=self.mock_latency,
+                distribution=self.mock_distribution,
+            )
+            set_mock_backend(MockLLMBackend(config))
+            set_mock_all_models(True)
+
+            def restore() -> None:
+                set_mock_all_models(None)
+                set_mock_backend(None)
+            return restore
+
+        if self.backend == "replay":
+            from scenario_lab.utils.llm_cassette import LLMCassette, set_cassette
+
+            set_cassette(LLMCassette(self.replay_path, mode="replay",
+                                     latency_scale=self.replay_latency))
+            return lambda: set_cassette(None)
+
+        return lambda: None
+
+    def run(self, progress: Optional[Callable[[RunMeasurement], None]] = None) -> Dict[str, Any]:
+        """
+        Execute warm-up and measured runs
+
+        Args:
+            progress: Optional callback invoked after each run
+
+        Returns:
+            Report dictionary (see build_report)
+        """
+        restore = self._activate_backend()
+        try:
+            total_runs = self.warmup + self.repetitions
+            for index in range(total_runs):
+                is_warmup = index < self.warmup
+                repetition = index + 1 if is_warmup else index - self.warmup + 1
+                measurement = self._run_once(repetition, is_warmup)
+                if not is_warmup:
+                    self.runs.append(measurement)
+                if progress:
+                    progress(measurement)
+        finally:
+            restore()
+
+        return self.build_report()
+
+    def _run_once(self, repetition: int, warmup: bool) -> RunMeasurement:
+        """Run the scenario once in a scratch output directory"""
+        from scenario_lab.core.events import EventType
+        from scenario_lab.runners import SyncRunner
+
+        measurement = RunMeasurement(repetition=repetition, warmup=warmup)
+        get_llm_timing_stats().reset()
+
+        if self.trace_memory:
+            tracemalloc.start()
+
+        with tempfile.TemporaryDirectory(prefix="scenario-lab-benchmark-") as tmp:
+            runner = SyncRunner(
+                scenario_path=self.scenario_path,
+                output_path=str(Path(tmp) / "run"),
+                end_turn=self.turns,
+            )
+            if self.profiler is not None and not warmup:
+                runner.profiler = self.profiler
+
+            try:
+                started = time.perf_counter()
+                runner.setup()
+                measurement.startup = time.perf_counter() - started
+
+                turn_started: Dict[str, Any] = {}
+                phase_started: Dict[str, float] = {}
+
+                async def on_turn_started(event) -> None:
+                    if self.trace_memory:
+                        tracemalloc.reset_peak()
+                        turn_started["memory"] = tracemalloc.get_traced_memory()[0]
+                    turn_started["blocks"] = _allocated_blocks()
+                    turn_started["time"] = time.perf_counter()
+
+                async def on_turn_completed(event) -> None:
+                    if "time" not in turn_started:
+                        return
+                    measurement.turn_times.append(time.perf_counter() - turn_started["time"])
+                    measurement.turn_blocks.append(_allocated_blocks() - turn_started["blocks"])
+                    if self.trace_memory:
+                        current, peak = tracemalloc.get_traced_memory()
+                        measurement.turn_alloc_peak.append(peak - turn_started["memory"])
+                        measurement.turn_retained.append(current - turn_started["memory"])
+
+                async def on_phase_started(event) -> None:
+                    phase_started[event.data.get("phase")] = time.perf_counter()
+
+                async def on_phase_completed(event) -> None:
+                    phase = event.data.get("phase")
+                    if phase in phase_started:
+                        duration = time.perf_counter() - phase_started.pop(phase)
+                        measurement.phase_times.setdefault(phase, []).append(duration)
+
+                runner.event_bus.on(EventType.TURN_STARTED, on_turn_started)
+                runner.event_bus.on(EventType.TURN_COMPLETED, on_turn_completed)
+                runner.event_bus.on(EventType.PHASE_STARTED, on_phase_started)
+                runner.event_bus.on(EventType.PHASE_COMPLETED, on_phase_completed)
+
+                started = time.perf_counter()
+                final_state = asyncio.run(runner.run())
+                measurement.total = time.perf_counter() - started
+                measurement.turns_completed = final_state.turn
+                measurement.cost = final_state.total_cost()
+            finally:
+                if self.trace_memory:
+                    measurement.memory_peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                measurement.llm = get_llm_timing_stats().snapshot()
+
+                # The run-scoped response cache lives outside the scratch directory
+                cache_dir = getattr(runner.response_cache, "cache_dir", None)
+                if isinstance(cache_dir, str):
+                    shutil.rmtree(cache_dir, ignore_errors=True)
+
+        return measurement
+
+    def build_report(self) -> Dict[str, Any]:
+        """
+        Build the report for the measured runs
+
+        Returns:
+            Dict with settings, environment, summary statistics pooled over
+            all measured runs, and the raw per-run measurements
+        """
+        runs = self.runs
+        turn_times = [t for run in runs for t in run.turn_times]
+        phases: Dict[str, List[float]] = {}
+        for run in runs:
+            for phase, times in run.phase_times.items():
+                phases.setdefault(phase, []).extend(times)
+
+        llm = {
+            "calls": sum(sum(run.llm.get("calls", {}).values()) for run in runs),
+            "network_calls": sum(run.llm.get("calls", {}).get("network", 0) for run in runs),
+            "retries": sum(run.llm.get("retries", 0) for run in runs),
+        }
+        for component in LLM_COMPONENTS:
+            llm[component] = summarize([run.llm.get(component, 0.0) for run in runs])
+
+        summary: Dict[str, Any] = {
+            "startup": summarize([run.startup for run in runs]),
+            "total": summarize([run.total for run in runs]),
+            "turn": summarize(turn_times),
+            "phases": {phase: summarize(times) for phase, times in phases.items()},
+            "llm": llm,
+            "cost": summarize([run.cost for run in runs]),
+            "turn_blocks": summarize([b for run in runs for b in run.turn_blocks]),
+        }
+        if self.trace_memory:
+            summary["memory_peak"] = summarize([run.memory_peak or 0 for run in runs])
+            summary["turn_alloc_peak"] = summarize([b for run in runs for b in run.turn_alloc_peak])
+            summary["turn_retained"] = summarize([b for run in runs for b in run.turn_retained])
+
+        return {
+            "format_version": 1,
+            "created": datetime.now().isoformat(),
+            "scenario": self.scenario_path,
+            "backend": self.backend,
+            "settings": {
+                "turns": self.turns,
+                "repetitions": self.repetitions,
+                "warmup": self.warmup,
+                "mock_latency": self.mock_latency if self.backend == "mock" else None,
+                "mock_distribution": self.mock_distribution if self.backend == "mock" else None,
+                "replay": self.replay_path,
+                "trace_memory": self.trace_memory,
+            },
+            "environment": environment_info(),
+            "summary": summary,
+            "runs": [run.to_dict() for run in runs],
+        }
+
+
+def summary_row(report: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a report's summary into one CSV row
+
+    Args:
+        report: Report from ScenarioBenchmark.run
+
+    Returns:
+        Ordered dict of column -> value (times in seconds, memory in bytes)
+    """
+    summary = report["summary"]
+    row: Dict[str, Any] = {
+        "created": report["created"],
+        "scenario": report["scenario"],
+        "backend": report["backend"],
+        "python": report["environment"]["python"],
+        "turns": report["settings"]["turns"],
+        "repetitions": report["settings"]["repetitions"],
+        "startup_mean": summary["startup"].get("mean"),
+        "total_mean": summary["total"].get("mean"),
+        "turn_mean": summary["turn"].get("mean"),
+        "turn_p50": summary["turn"].get("p50"),
+        "turn_p95": summary["turn"].get("p95"),
+        "turn_max": summary["turn"].get("max"),
+    }
+    for phase, stats in sorted(summary["phases"].items()):
+        row[f"phase_{phase}_mean"] = stats.get("mean")
+    row["llm_calls"] = summary["llm"]["calls"]
+    row["llm_retries"] = summary["llm"]["retries"]
+    for component in LLM_COMPONENTS:
+        row[f"llm_{component}_mean"] = summary["llm"][component].get("mean")
+    row["cost_mean"] = summary["cost"].get("mean")
+    row["turn_blocks_mean"] = summary["turn_blocks"].get("mean")
+    if "memory_peak" in summary:
+        row["memory_peak_max"] = summary["memory_peak"].get("max")
+        row["turn_alloc_peak_mean"] = summary["turn_alloc_peak"].get("mean")
+        row["turn_retained_mean"] = summary["turn_retained"].get("mean")
+    return row
+
+
+def write_csv(report: Dict[str, Any], path: str) -> None:
+    """
+    Append a report's summary row to a CSV file
+
+    The header is written when the file is new. Appending to an existing
+    file keeps its header, so benchmark history accumulates in one file as
+    long as the set of phases stays the same.
+
+    Args:
+        report: Report from ScenarioBenchmark.run
+        path: CSV file path
+    """
+    row = summary_row(report)
+    path = Path(path)
+    exists = path.exists() and path.stat().st_size > 0
+
+    fieldnames = list(row)
+    if exists:
+        with open(path, newline="") as f:
+            fieldnames = next(csv.reader(f), fieldnames)
+
+    with open(path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        if not exists:
+            writer.writeheader()
+        writer.writerow(row)
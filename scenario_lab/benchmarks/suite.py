@@ -0,0 +1,487 @@
+"""
+Benchmark Suite - micro-benchmarks for Scenario Lab hot paths
+
+Benchmarks are registered with the @benchmark decorator. Each one has a setup
+function that receives a BenchmarkContext (scale, scratch directory, event
+loop) and returns the operation to time. Scale-dependent benchmarks run once
+per scale in SCALES; scale-independent ones run once.
+
+Timing follows timeit: the operation is calibrated to run for at least
+min_time per sample, garbage collection is disabled while timing, and the
+per-operation time of each of `repeat` samples is reported.
+
+Reports are plain JSON so they can be kept as baselines and compared:
+
+    report = run_suite(scales=["t10-a5"])
+    save_report(report, "bench.json")
+    comparisons = compare_reports(report, load_report("baseline.json"), threshold=0.1)
+"""
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from scenario_lab.benchmarks.fixtures import SCALES, Scale
+
+logger = logging.getLogger(__name__)
+
+REPORT_FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+
+
+class BenchmarkContext:
+    """Resources available to a benchmark's setup function"""
+
+    def __init__(self, scale: Optional[Scale], workdir: Path):
+        """
+        Initialize context
+
+        Args:
+            scale: Scale to build fixtures at (None for scale-independent benchmarks)
+            workdir: Scratch directory, removed after the benchmark
+        """
+        self.scale = scale
+        self.workdir = workdir
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cleanups: List[Callable[[], Any]] = []
+
+    def run(self, awaitable: Awaitable[Any]) -> Any:
+        """Run a coroutine to completion on the benchmark's event loop"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(awaitable)
+
+    def add_cleanup(self, callback: Callable[[], Any]) -> None:
+        """Register a callback to run after the benchmark"""
+        self._cleanups.append(callback)
+
+    def close(self) -> None:
+        """Run cleanups and close the event loop"""
+        for callback in reversed(self._cleanups):
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Benchmark cleanup failed: {e}")
+        self._cleanups.clear()
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A registered benchmark"""
+    name: str
+    group: str
+    setup: Callable[[BenchmarkContext], Callable[[], Any]]
+    scales: Optional[Tuple[str, ...]] = None  # None = scale-independent
+    ops_per_call: int = 1  # Operations performed by one call of the timed function
+    description: str = ""
+
+
+_REGISTRY: Dict[str, BenchmarkCase] = {}
+
+
+def benchmark(
+    name: str,
+    group: str,
+    scales: Optional[Iterable[str]] = tuple(SCALES),
+    ops_per_call: int = 1,
+) -> Callable:
+    """
+    Register a benchmark setup function
+
+    Args:
+        name: Unique benchmark name (e.g. "state.with_decision")
+        group: Group for reporting (e.g. "state")
+        scales: Names of the scales to run at, or None if scale-independent
+        ops_per_call: Operations performed by one call of the returned function
+
+    Returns:
+        Decorator registering the function
+    """
+    def decorator(setup: Callable[[BenchmarkContext], Callable[[], Any]]):
+        if name in _REGISTRY:
+            raise ValueError(f"Benchmark '{name}' is already registered")
+        unknown = set(scales or ()) - set(SCALES)
+        if unknown:
+            raise ValueError(f"Unknown scales for benchmark '{name}': {sorted(unknown)}")
+        _REGISTRY[name] = BenchmarkCase(
+            name=name,
+            group=group,
+            setup=setup,
+            scales=tuple(scales) if scales is not None else None,
+            ops_per_call=ops_per_call,
+            description=(setup.__doc__ or "").strip().splitlines()[0] if setup.__doc__ else "",
+        )
+        return setup
+    return decorator
+
+
+def get_benchmarks(patterns: Optional[Iterable[str]] = None) -> List[BenchmarkCase]:
+    """
+    Get registered benchmarks
+
+    Args:
+        patterns: Glob patterns or substrings matched against benchmark names
+            and groups (None = all)
+
+    Returns:
+        Matching benchmarks in registration order
+    """
+    # Importing the cases registers them
+    import scenario_lab.benchmarks.cases  # noqa: F401
+
+    cases = list(_REGISTRY.values())
+    if not patterns:
+        return cases
+
+    patterns = list(patterns)
+
+    def matches(case: BenchmarkCase) -> bool:
+        for pattern in patterns:
+            if any(ch in pattern for ch in "*?["):
+                if fnmatch.fnmatch(case.name, pattern) or fnmatch.fnmatch(case.group, pattern):
+                    return True
+            elif pattern in case.name or pattern == case.group:
+                return True
+        return False
+
+    return [case for case in cases if matches(case)]
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark at one scale (seconds per operation)"""
+    name: str
+    group: str
+    scale: Optional[str]
+    loops: int
+    times: List[float] = field(default_factory=list)
+    turns: Optional[int] = None
+    actors: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        """Identifier used to match results across reports"""
+        return f"{self.name}[{self.scale}]" if self.scale else self.name
+
+    @property
+    def min(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def mean(self) -> float:
+        return statistics.mean(self.times)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1.0 / self.median if self.median > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        data = asdict(self)
+        data.update({
+            "key": self.key,
+            "min": self.min,
+            "median": self.median,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "ops_per_sec": self.ops_per_sec,
+        })
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> BenchmarkResult:
+        """Create from a dictionary produced by to_dict"""
+        return cls(
+            name=data["name"],
+            group=data.get("group", ""),
+            scale=data.get("scale"),
+            loops=data.get("loops", 1),
+            times=list(data.get("times") or [data["median"]]),
+            turns=data.get("turns"),
+            actors=data.get("actors"),
+        )
+
+
+def measure(
+    operation: Callable[[], Any],
+    repeat: int = 5,
+    min_time: float = 0.05,
+    max_loops: int = 1_000_000,
+) -> Tuple[int, List[float]]:
+    """
+    Time an operation
+
+    The first call doubles as warm-up and calibration: the number of loops
+    per sample is chosen so a sample takes at least min_time.
+
+    Args:
+        operation: Function to time
+        repeat: Number of samples
+        min_time: Minimum duration of one sample in seconds
+        max_loops: Upper bound on loops per sample
+
+    Returns:
+        Tuple of (loops per sample, seconds per call for each sample)
+    """
+    start = time.perf_counter()
+    operation()
+    first = time.perf_counter() - start
+
+    loops = 1
+    if first < min_time:
+        loops = min(max_loops, max(1, int(min_time / max(first, 1e-7))))
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            for _ in range(loops):
+                operation()
+            samples.append((time.perf_counter() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return loops, samples
+
+
+def run_benchmark(
+    case: BenchmarkCase,
+    scale: Optional[Scale] = None,
+    repeat: int = 5,
+    min_time: float = 0.05,
+) -> BenchmarkResult:
+    """
+    Set up and time one benchmark at one scale
+
+    Args:
+        case: Benchmark to run
+        scale: Scale (None for scale-independent benchmarks)
+        repeat: Number of samples
+        min_time: Minimum duration of one sample in seconds
+
+    Returns:
+        BenchmarkResult
+    """
+    with tempfile.TemporaryDirectory(prefix="scenario-lab-bench-") as tmp:
+        context = BenchmarkContext(scale, Path(tmp))
+        try:
+            operation = case.setup(context)
+            loops, samples = measure(operation, repeat=repeat, min_time=min_time)
+        finally:
+            context.close()
+
+    return BenchmarkResult(
+        name=case.name,
+        group=case.group,
+        scale=scale.name if scale else None,
+        loops=loops * case.ops_per_call,
+        times=[sample / case.ops_per_call for sample in samples],
+        turns=scale.turns if scale else None,
+        actors=scale.actors if scale else None,
+    )
+
+
+def environment_info() -> Dict[str, Any]:
+    """Describe the machine and interpreter a report was produced on"""
+    from scenario_lab import __version__
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "scenario_lab": __version__,
+        "argv": sys.argv[1:],
+    }
+
+
+def run_suite(
+    patterns: Optional[Iterable[str]] = None,
+    scales: Optional[Iterable[str]] = None,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark suite
+
+    Args:
+        patterns: Benchmark name/group patterns (None = all)
+        scales: Scale names to run at (None = every scale each benchmark declares)
+        repeat: Samples per benchmark
+        min_time: Minimum duration of one sample in seconds
+        progress: Optional callback invoked with each result
+
+    Returns:
+        Report dictionary (see save_report)
+
+    Raises:
+        ValueError: If a scale name is unknown
+    """
+    selected_scales = list(scales) if scales else None
+    unknown = set(selected_scales or ()) - set(SCALES)
+    if unknown:
+        raise ValueError(f"Unknown scales: {sorted(unknown)} (available: {list(SCALES)})")
+
+    results = []
+    started = time.perf_counter()
+    for case in get_benchmarks(patterns):
+        if case.scales is None:
+            case_scales: List[Optional[Scale]] = [None]
+        else:
+            case_scales = [
+                SCALES[name] for name in case.scales
+                if selected_scales is None or name in selected_scales
+            ]
+
+        for scale in case_scales:
+            logger.debug(f"Running benchmark {case.name} at {scale.name if scale else '-'}")
+            result = run_benchmark(case, scale, repeat=repeat, min_time=min_time)
+            results.append(result)
+            if progress:
+                progress(result)
+
+    return {
+        "format_version": REPORT_FORMAT_VERSION,
+        "created": datetime.now().isoformat(),
+        "duration": time.perf_counter() - started,
+        "environment": environment_info(),
+        "settings": {"repeat": repeat, "min_time": min_time},
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    """
+    Write a report to a JSON file
+
+    Args:
+        report: Report from run_suite
+        path: Output path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    """
+    Load a report from a JSON file
+
+    Args:
+        path: Report path
+
+    Returns:
+        Report dictionary
+
+    Raises:
+        ValueError: If the file isn't a benchmark report
+    """
+    with open(path) as f:
+        report = json.load(f)
+    if not isinstance(report, dict) or "results" not in report:
+        raise ValueError(f"{path} is not a benchmark report")
+    return report
+
+
+@dataclass
+class Comparison:
+    """A benchmark result compared against its baseline"""
+    key: str
+    status: str  # regression, improvement, unchanged, new, missing
+    current: Optional[float] = None  # Median seconds per operation
+    baseline: Optional[float] = None
+    ratio: Optional[float] = None  # current / baseline
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return asdict(self)
+
+
+def compare_reports(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Comparison]:
+    """
+    Compare a report against a baseline on median time per operation
+
+    Args:
+        current: Report from this run
+        baseline: Baseline report
+        threshold: Relative slowdown (0.1 = 10%) above which a benchmark is a
+            regression; speedups beyond it are reported as improvements
+
+    Returns:
+        Comparisons for every benchmark in either report, current order first
+    """
+    current_results = {
+        result.key: result for result in map(BenchmarkResult.from_dict, current["results"])
+    }
+    baseline_results = {
+        result.key: result for result in map(BenchmarkResult.from_dict, baseline["results"])
+    }
+
+    comparisons = []
+    for key, result in current_results.items():
+        base = baseline_results.get(key)
+        if base is None:
+            comparisons.append(Comparison(key=key, status="new", current=result.median))
+            continue
+
+        ratio = result.median / base.median if base.median > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "unchanged"
+        comparisons.append(Comparison(
+            key=key, status=status, current=result.median, baseline=base.median, ratio=ratio,
+        ))
+
+    for key, base in baseline_results.items():
+        if key not in current_results:
+            comparisons.append(Comparison(key=key, status="missing", baseline=base.median))
+
+    return comparisons
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration with an appropriate unit"""
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.0f} ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
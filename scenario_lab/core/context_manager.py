@@ -8,14 +8,24 @@ Provides actors with:
 - Summary of old turns (beyond window)
 - Full detail of recent turns (within window)
 - Full communication history they participated in
+
+Turns are kept in a per-run TurnHistory. The summary is rolling: when a
+turn leaves the window it is folded into the previous summary with one LLM
+call, so the summarization cost per turn stays constant however long the
+run gets. Summaries are cached by (scenario, run, last summarized turn).
+The responses of the summarization calls are handed back to the caller so
+their cost is accounted for with the rest of the run.
 """
+import asyncio
 import logging
-from typing import Dict, Optional, List
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
-from scenario_lab.models.state import ScenarioState, Decision, Communication
+from scenario_lab.models.state import ScenarioState
 from scenario_lab.utils.api_client import make_llm_call_async, LLMResponse
 from scenario_lab.core.prompt_builder import build_messages_for_llm
+from scenario_lab.core.turn_history import TurnHistory, TurnRecord, format_turn_record
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +46,23 @@ class ContextManagerV2:
     preserving important historical information.
     """
 
+    SYSTEM_PROMPT = """You are a scenario historian. Your job is to create concise summaries of scenario history.
+
+Focus on:
+- Key events and turning points
+- Important decisions by actors
+- Changes in world state
+- Trends and patterns
+
+Keep the summary clear and factual. Aim for 200-400 words."""
+
     def __init__(
         self,
         window_size: int = 3,
         summarization_model: str = "openai/gpt-4o-mini",
         max_cache_size: int = 1000,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        history: Optional[TurnHistory] = None,
     ):
         """
         Initialize context manager
@@ -51,6 +72,8 @@ class ContextManagerV2:
             summarization_model: LLM model for summarization (should be cheap)
             max_cache_size: Maximum number of summaries to cache (must be >= 1)
             api_key: API key for LLM calls (if None, uses environment variable)
+            history: Turn history of the run, e.g. the run directory's DiskTurnHistory
+                (a new in-memory one, reset whenever the run changes, if None)
 
         Raises:
             ValueError: If window_size < 1 or max_cache_size < 1 or summarization_model is empty
@@ -69,44 +92,51 @@ class ContextManagerV2:
         self.summarization_model = summarization_model
         self.max_cache_size = max_cache_size
         self.api_key = api_key
+        self.history = history if history is not None else TurnHistory()
+        self._owns_history = history is None
+        self._history_run_id: Optional[str] = None
 
-        # LRU cache for summaries
-        self.summaries_cache: Dict[str, str] = {}
-        self.cache_access_order: List[str] = []
+        # LRU cache for summaries: (scenario_id, run_id, last summarized turn) -> summary
+        self.summaries_cache: "OrderedDict[Tuple[str, str, int], str]" = OrderedDict()
+        self._summary_lock = asyncio.Lock()
+        self.summary_calls = 0
 
         logger.debug(
             f"ContextManagerV2 initialized: window_size={window_size}, "
             f"model={summarization_model}, cache_size={max_cache_size}"
         )
 
-    def _get_cached_summary(self, key: str) -> Optional[str]:
-        """Get summary from cache and update LRU order"""
-        if key in self.summaries_cache:
-            # Move to end (most recently used)
-            if key in self.cache_access_order:
-                self.cache_access_order.remove(key)
-            self.cache_access_order.append(key)
-            return self.summaries_cache[key]
-        return None
-
-    def _cache_summary(self, key: str, value: str) -> None:
-        """Cache summary with LRU eviction if needed"""
-        # Evict oldest if cache is full
-        if len(self.summaries_cache) >= self.max_cache_size and key not in self.summaries_cache:
-            oldest_key = self.cache_access_order.pop(0)
-            del self.summaries_cache[oldest_key]
-
-        # Add to cache
+    def _get_cached_summary(self, key: Tuple[str, str, int]) -> Optional[str]:
+        """Get summary from cache and mark it most recently used"""
+        summary = self.summaries_cache.get(key)
+        if summary is not None:
+            self.summaries_cache.move_to_end(key)
+        return summary
+
+    def _cache_summary(self, key: Tuple[str, str, int], value: str) -> None:
+        """Cache summary, evicting the least recently used entry if full"""
         self.summaries_cache[key] = value
-        if key in self.cache_access_order:
-            self.cache_access_order.remove(key)
-        self.cache_access_order.append(key)
+        self.summaries_cache.move_to_end(key)
+        while len(self.summaries_cache) > self.max_cache_size:
+            self.summaries_cache.popitem(last=False)
+
+    def _observe(self, state: ScenarioState) -> None:
+        """Record the previous turn of the run in the turn history"""
+        if (
+            self._owns_history
+            and self._history_run_id is not None
+            and self._history_run_id != state.run_id
+        ):
+            # Another run: its history does not apply
+            self.history = TurnHistory()
+        self._history_run_id = state.run_id
+        self.history.record_previous_turn(state)
 
     async def get_context_for_actor(
         self,
         actor_name: str,
         state: ScenarioState,
-    ) -> str:
+    ) -> Tuple[str, List[LLMResponse]]:
         """
         Get contextualized world state for an actor
 
@@ -115,56 +145,65 @@ class ContextManagerV2:
             state: Current scenario state
 
         Returns:
-            Formatted context string combining summary and recent detail
+            Tuple of (formatted context string combining summary and recent
+            detail, responses of the summarization calls made for it)
         """
+        self._observe(state)
         turn = state.turn
 
         # If we're within the window size, return full history
         if turn <= self.window_size:
-            return self._get_full_history(state, actor_name)
+            return self._get_full_history(state, actor_name), []
 
         # Otherwise, return summary + recent window
         return await self._get_windowed_context(state, actor_name)
 
-    def _get_full_history(
-        self,
-        state: ScenarioState,
-        actor_name: str
-    ) -> str:
-        """Get full history when scenario is short enough"""
-        context = "## Scenario History\n\n"
-
-        # Initial state (turn 0)
-        context += f"### Turn 0 (Initial State)\n\n{state.scenario_config.get('initial_world_state', '')}\n\n"
-
-        # Note: In V2, we only have the current turn's world_state in state.world_state
-        # For full history, we would need to reconstruct from saved states or
-        # maintain a history in ScenarioState. For Phase 2.1, we'll use a simplified approach:
-        # Show only current world state for now (this will be enhanced in later phases)
+    def _format_turns(self, state: ScenarioState, start_turn: int) -> str:
+        """Recorded turns from start_turn up to the current turn, in full detail"""
+        context = ""
+        for record in self.history.range(start_turn, state.turn - 1):
+            is_last = record.turn == state.turn - 1
+            if record.turn == 0 and is_last:
+                # The initial state is the current world state
+                continue
+            # The last turn's resulting world state is shown as the current state
+            context += format_turn_record(record, include_world_state=not is_last)
+        return context
 
-        # Current turn
-        context += f"### Turn {state.turn} (Current)\n\n"
+    def _format_current_turn(self, state: ScenarioState) -> str:
+        """Current world state and the actions already taken this turn"""
+        context = f"### Turn {state.turn} (Current)\n\n"
         context += f"**Current World State:**\n{state.world_state.content}\n\n"
 
-        # Recent decisions (from current state)
         if state.decisions:
-            context += "**Recent Actions Taken:**\n\n"
+            context += "**Actions Taken This Turn:**\n\n"
             for actor, decision in state.decisions.items():
                 context += f"- **{actor}:** {decision.action}\n"
             context += "\n"
+        return context
 
-        # Phase 2.1: Communications will be added in Phase 2.2
-        # For now, stub it out
-        # if state.communications:
-        #     context += self._format_communications_for_actor(state, actor_name)
+    def _get_full_history(
+        self,
+        state: ScenarioState,
+        actor_name: str
+    ) -> str:
+        """Get full history when scenario is short enough"""
+        context = "## Scenario History\n\n"
 
+        if 0 not in self.history:
+            # Initial state (turn 0) when the run's start was not observed
+            initial = state.scenario_config.get('initial_world_state', '')
+            context += f"### Turn 0 (Initial State)\n\n{initial}\n\n"
+
+        context += self._format_turns(state, 0)
+        context += self._format_current_turn(state)
         return context
 
     async def _get_windowed_context(
         self,
         state: ScenarioState,
         actor_name: str
-    ) -> str:
+    ) -> Tuple[str, List[LLMResponse]]:
         """Get summarized old history + detailed recent history"""
         context = ""
 
@@ -172,17 +211,7 @@ class ContextManagerV2:
         window_start = state.turn - self.window_size + 1
         summary_end = window_start - 1  # Last turn to include in summary
 
-        # Generate or retrieve summary for old turns
-        summary_key = f"{state.scenario_id}-0-{summary_end}"
-
-        summary = self._get_cached_summary(summary_key)
-        if summary is None:
-            # Phase 2.1: Simplified summary (just mention we're X turns in)
-            # Full LLM-based summarization will be added when we have full history
-            summary = f"This scenario has been running for {summary_end + 1} turns. The actors have been making decisions and the world state has been evolving based on their actions."
-            # Future: Call LLM to generate proper summary
-            # summary = await self._generate_summary(state, 0, summary_end)
-            self._cache_summary(summary_key, summary)
+        summary, responses = await self._get_summary(state, summary_end)
 
         context += "## Earlier Events (Summary)\n\n"
         context += summary + "\n\n"
@@ -190,85 +219,132 @@ class ContextManagerV2:
 
         # Add recent turns in full detail
         context += f"## Recent History (Last {self.window_size} Turns)\n\n"
+        context += self._format_turns(state, window_start)
+        context += self._format_current_turn(state)
 
-        # Phase 2.1: Simplified - show current turn only
-        # Full history tracking will be added in later phases
-        context += f"### Turn {state.turn} (Current)\n\n"
-        context += f"**Current World State:**\n{state.world_state.content}\n\n"
-
-        # Recent decisions
-        if state.decisions:
-            context += "**Actions Taken This Turn:**\n\n"
-            for actor, decision in state.decisions.items():
-                context += f"- **{actor}:** {decision.action}\n"
-            context += "\n"
-
-        return context
+        return context, responses
 
-    async def _generate_summary(
+    async def _get_summary(
         self,
         state: ScenarioState,
-        start_turn: int,
-        end_turn: int
-    ) -> str:
+        end_turn: int,
+    ) -> Tuple[str, List[LLMResponse]]:
         """
-        Generate LLM-powered summary of turns from start to end
+        Get the summary of turns 0 to end_turn
 
-        Phase 2.1: Stub implementation. Full implementation will require
-        access to historical states, which will be added in later phases.
+        Builds on the latest cached summary and folds in the turns after it
+        one at a time. Once the run is past the window that is a single turn
+        (the one that just left the window) per call. If a fold fails, the
+        summary so far is returned without being cached, so the fold is
+        retried the next time.
 
         Args:
             state: Current scenario state
-            start_turn: First turn to summarize (inclusive)
             end_turn: Last turn to summarize (inclusive)
 
         Returns:
-            Summary text
+            Tuple of (summary text, responses of the summarization calls made)
         """
-        # For now, return a placeholder
-        # In the future, this will:
-        # 1. Load historical world states from persistence
-        # 2. Build history text from those states
-        # 3. Call LLM to summarize
+        key = (state.scenario_id, state.run_id, end_turn)
+        summary = self._get_cached_summary(key)
+        if summary is not None:
+            return summary, []
+
+        # One fold at a time, so actors asking concurrently share the result
+        async with self._summary_lock:
+            summary = self._get_cached_summary(key)
+            if summary is not None:
+                return summary, []
+
+            start = end_turn
+            previous: Optional[str] = None
+            while start > 0 and previous is None:
+                previous = self._get_cached_summary((state.scenario_id, state.run_id, start - 1))
+                if previous is None:
+                    start -= 1
+
+            responses: List[LLMResponse] = []
+            for turn in range(start, end_turn + 1):
+                record = self.history.get(turn)
+                if record is None:
+                    continue
+                response = await self._generate_summary(previous, record)
+                if response is None:
+                    if previous is None:
+                        previous = f"Summary of turns 0 to {end_turn} (summarization failed)"
+                    return previous, responses
+                responses.append(response)
+                previous = response.content
+                self._cache_summary((state.scenario_id, state.run_id, turn), previous)
+
+            if previous is None:
+                # No recorded history to summarize (e.g. resumed run)
+                previous = (
+                    f"This scenario has been running for {end_turn + 1} turns. The actors have "
+                    "been making decisions and the world state has been evolving based on "
+                    "their actions."
+                )
+            self._cache_summary(key, previous)
+            return previous, responses
 
-        system_prompt = """You are a scenario historian. Your job is to create concise summaries of scenario history.
-
-Focus on:
-- Key events and turning points
-- Important decisions by actors
-- Changes in world state
-- Trends and patterns
+    async def _generate_summary(
+        self,
+        previous_summary: Optional[str],
+        record: TurnRecord,
+    ) -> Optional[LLMResponse]:
+        """
+        Fold one turn into the summary of the turns before it
 
-Keep the summary clear and factual. Aim for 200-400 words."""
+        The prompt holds the previous summary and a single turn, so its size
+        does not grow with the length of the run.
 
-        user_prompt = f"""Please summarize the following scenario history from turn {start_turn} to turn {end_turn}:
+        Args:
+            previous_summary: Summary of turns 0 to record.turn - 1 (None if none)
+            record: Turn to add
 
-[Phase 2.1: Historical data access not yet implemented]
+        Returns:
+            Response holding the summary of turns 0 to record.turn, or None
+            if summarization failed
+        """
+        turn_text = format_turn_record(record)
+        if previous_summary is None:
+            user_prompt = f"""Please summarize the following scenario history up to turn {record.turn}:
 
+{turn_text}
 Provide a concise summary that captures the key events, decisions, and state changes."""
+        else:
+            user_prompt = f"""Summary of the scenario so far (turns 0 to {record.turn - 1}):
+
+{previous_summary}
+
+---
+
+What happened in turn {record.turn}:
+
+{turn_text}
+Update the summary so it also covers turn {record.turn}. Keep the key events, decisions, and state changes from earlier turns, condensing older details where needed."""
 
         try:
-            messages = build_messages_for_llm(system_prompt, user_prompt)
+            messages = build_messages_for_llm(self.SYSTEM_PROMPT, user_prompt)
 
             llm_response: LLMResponse = await make_llm_call_async(
                 model=self.summarization_model,
                 messages=messages,
                 api_key=self.api_key,
                 max_retries=3,
-                context={'phase': 'context_summary', 'turns': f'{start_turn}-{end_turn}'}
+                context={'phase': 'context_summary', 'turns': f'0-{record.turn}'}
             )
+            self.summary_calls += 1
 
-            logger.info(f"Generated summary for turns {start_turn}-{end_turn} ({llm_response.tokens_used} tokens)")
+            logger.info(f"Summarized turns 0-{record.turn} ({llm_response.tokens_used} tokens)")
 
-            return llm_response.content
+            return llm_response
 
         except Exception as e:
-            logger.error(f"Failed to generate summary: {e}")
-            # Return fallback summary
-            return f"Summary of turns {start_turn} to {end_turn} (summarization failed)"
+            logger.error(f"Failed to summarize turn {record.turn}: {e}")
+            return None
 
     def clear_cache(self):
         """Clear summary cache (useful for testing or memory management)"""
-        self.summaries_cache = {}
-        self.cache_access_order = []
+        self.summaries_cache.clear()
         logger.info("Context summary cache cleared")
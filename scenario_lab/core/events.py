@@ -17,6 +17,8 @@ from enum import Enum
 import asyncio
 import logging
 
+from scenario_lab.utils.tracing import current_span
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +45,7 @@ class EventType(str, Enum):
 
     # Actor events
     ACTOR_DECISION_STARTED = "actor_decision_started"
+    ACTOR_DECISION_PROGRESS = "actor_decision_progress"  # Streamed text so far
     ACTOR_DECISION_COMPLETED = "actor_decision_completed"
     ACTOR_DECISION_FAILED = "actor_decision_failed"
 
@@ -104,6 +107,7 @@ class EventBus:
     - Error isolation (one handler failure doesn't break others)
     - Handler removal support
     - Event history for debugging
+    - Pending handler count (queue depth) for monitoring
     """
 
     def __init__(self, keep_history: bool = False, max_history: int = 1000):
@@ -119,6 +123,8 @@ class EventBus:
         self.max_history = max_history
         self.history: List[Event] = []
         self._handler_errors: List[tuple[Event, Exception]] = []
+        # Handler invocations started by emit() that have not finished yet
+        self.pending = 0
 
     def on(self, event_type: str, handler: EventHandler) -> None:
         """
@@ -162,11 +168,17 @@ class EventBus:
             event_type: The type of event
             data: Event data dictionary
             source: Source component that emitted the event
-            correlation_id: ID to correlate related events
+            correlation_id: ID to correlate related events (defaults to the ID
+                of the current tracing span, e.g. the turn or phase)
 
         Returns:
             The emitted Event object
         """
+        if correlation_id is None:
+            active = current_span()
+            if active is not None:
+                correlation_id = active.span_id
+
         event = Event(
             type=event_type,
             data=data or {},
@@ -182,22 +194,25 @@ class EventBus:
             if len(self.history) > self.max_history:
                 self.history = self.history[-self.max_history :]
 
-        # Get handlers for this event type
-        handlers = self.handlers.get(event_type, [])
-
-        # Also get wildcard handlers (listening to all events)
-        handlers.extend(self.handlers.get("*", []))
+        # Get handlers for this event type plus wildcard handlers (listening to
+        # all events). Build a new list: extending the registered one would add
+        # the wildcard handlers to this event type on every emit.
+        handlers = self.handlers.get(event_type, []) + self.handlers.get("*", [])
 
         if not handlers:
-            logger.debug(f"No handlers for {event_type}")
+            logger.debug("No handlers for %s", event_type)
             return event
 
         # Execute all handlers concurrently
         # Use gather with return_exceptions to prevent one failure from breaking others
-        results = await asyncio.gather(
-            *[self._safe_execute_handler(handler, event) for handler in handlers],
-            return_exceptions=True,
-        )
+        self.pending += len(handlers)
+        try:
+            results = await asyncio.gather(
+                *[self._safe_execute_handler(handler, event) for handler in handlers],
+                return_exceptions=True,
+            )
+        finally:
+            self.pending -= len(handlers)
 
         # Log any errors
         for i, result in enumerate(results):
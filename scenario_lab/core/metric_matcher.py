@@ -0,0 +1,181 @@
+"""
+Precompiled matching engine for keyword and pattern metrics
+
+MetricsTrackerV2 compiles its metric configs once into:
+- One keyword matcher covering the keywords of every keyword metric. Each text
+  is scanned once and per-keyword counts are shared by all metrics.
+- Precompiled regexes for pattern metrics (invalid patterns are reported once,
+  at compile time, instead of on every turn).
+
+Keyword counts match ``text.lower().count(keyword.lower())``: case-insensitive,
+non-overlapping occurrences per keyword, with keywords counted independently of
+each other (so "deal" and "deal signed" both match "deal signed").
+
+The keyword scan uses an Aho-Corasick automaton when pyahocorasick is
+installed, and otherwise a single combined regex that locates candidate
+positions for all keywords at once.
+"""
+import logging
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+# Optional pyahocorasick import for the keyword automaton
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+from scenario_lab.schemas.metrics import MetricConfig
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordMatcher:
+    """
+    Counts occurrences of many keywords in a single pass over the text
+    """
+
+    def __init__(self, keywords: Iterable[str], use_automaton: bool = True):
+        """
+        Compile keywords
+
+        Args:
+            keywords: Keywords to match (case-insensitive)
+            use_automaton: Use Aho-Corasick if pyahocorasick is available
+        """
+        self.keywords: List[str] = sorted({k.lower() for k in keywords if k})
+        self._automaton = None
+        self._candidates: Optional[Pattern] = None
+        self._by_first_char: Dict[str, List[str]] = {}
+
+        if not self.keywords:
+            return
+
+        if use_automaton and AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            # Longest first, so the lookahead also covers keywords that share a prefix
+            alternation = "|".join(
+                re.escape(k) for k in sorted(self.keywords, key=len, reverse=True)
+            )
+            self._candidates = re.compile(f"(?=(?:{alternation}))")
+            for keyword in self.keywords:
+                self._by_first_char.setdefault(keyword[0], []).append(keyword)
+
+    def _occurrences(self, text_lower: str) -> Iterator[Tuple[int, str]]:
+        """Yield (start, keyword) for every occurrence, including overlapping ones"""
+        if self._automaton is not None:
+            for end, keyword in self._automaton.iter(text_lower):
+                yield end - len(keyword) + 1, keyword
+            return
+
+        for match in self._candidates.finditer(text_lower):
+            start = match.start()
+            for keyword in self._by_first_char.get(text_lower[start], ()):
+                if text_lower.startswith(keyword, start):
+                    yield start, keyword
+
+    def count(self, text_lower: str) -> Dict[str, int]:
+        """
+        Count non-overlapping occurrences of each keyword
+
+        Args:
+            text_lower: Lowercased text
+
+        Returns:
+            Dict mapping lowercased keyword to count (keywords not found omitted)
+        """
+        counts: Dict[str, int] = {}
+        if not self.keywords:
+            return counts
+
+        next_allowed: Dict[str, int] = {}
+        for start, keyword in self._occurrences(text_lower):
+            # Same semantics as str.count: skip overlaps with the previous match
+            if start >= next_allowed.get(keyword, 0):
+                counts[keyword] = counts.get(keyword, 0) + 1
+                next_allowed[keyword] = start + len(keyword)
+        return counts
+
+
+class TextScan:
+    """
+    Result of scanning one text: shared by all keyword metrics
+    """
+
+    def __init__(self, text: str, keyword_counts: Dict[str, int]):
+        self.text = text
+        self.keyword_counts = keyword_counts
+        self._word_count: Optional[int] = None
+
+    @property
+    def word_count(self) -> int:
+        """Number of whitespace-separated words (computed once, on demand)"""
+        if self._word_count is None:
+            self._word_count = len(self.text.split())
+        return self._word_count
+
+    def matches(self, keywords: List[str]) -> List[str]:
+        """
+        Expand counts into a match list in keyword order
+
+        Args:
+            keywords: A metric's configured keywords
+
+        Returns:
+            Each keyword repeated once per occurrence
+        """
+        matches: List[str] = []
+        for keyword in keywords:
+            count = self.keyword_counts.get(keyword.lower(), 0)
+            if count:
+                matches.extend([keyword] * count)
+        return matches
+
+
+class CompiledMetrics:
+    """
+    Keyword and pattern metrics compiled for repeated extraction
+    """
+
+    def __init__(self, metrics: Iterable[MetricConfig], use_automaton: bool = True):
+        """
+        Compile metric configurations
+
+        Args:
+            metrics: Metric configurations
+            use_automaton: Use Aho-Corasick for keywords if available
+        """
+        keywords: List[str] = []
+        self.patterns: Dict[str, Pattern] = {}
+        self.invalid_patterns: Dict[str, str] = {}
+
+        for metric in metrics:
+            extraction = metric.extraction
+            if extraction.type == "keyword" and extraction.keywords:
+                keywords.extend(extraction.keywords)
+            elif extraction.type == "pattern" and extraction.pattern:
+                try:
+                    self.patterns[metric.name] = re.compile(extraction.pattern, re.IGNORECASE)
+                except re.error as e:
+                    self.invalid_patterns[metric.name] = str(e)
+                    logger.error(f"Invalid regex pattern for metric '{metric.name}': {e}")
+
+        self.keyword_matcher = KeywordMatcher(keywords, use_automaton=use_automaton)
+
+    def scan(self, text: str) -> TextScan:
+        """
+        Scan a text once for all keywords
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            TextScan with per-keyword counts
+        """
+        return TextScan(text, self.keyword_matcher.count(text.lower()))
@@ -7,11 +7,12 @@ Replaces V1-style metrics_tracker.py with clean V2 patterns.
 Key Differences from V1:
 - Takes MetricsConfig (Pydantic) instead of YAML path
 - Supports V2 extraction types (llm, keyword, pattern, manual)
-- Uses async LLM calls for 'llm' extraction type
+- Uses async LLM calls for 'llm' extraction type, batched per text and model
+- Keyword and pattern metrics are compiled once and each text is scanned once
 - Works with immutable ScenarioState
 - No internal mutable state
 """
-import re
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -19,11 +20,15 @@ from pathlib import Path
 import json
 
 from scenario_lab.schemas.metrics import MetricsConfig, MetricConfig, MetricExtraction
+from scenario_lab.core.metric_matcher import CompiledMetrics, TextScan
 from scenario_lab.models.state import MetricRecord, ScenarioState
 from scenario_lab.utils.api_client import make_llm_call_async, LLMResponse
+from scenario_lab.utils.json_response_parser import decode_json, extract_json_from_response
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EXTRACTION_MODEL = "openai/gpt-4o-mini"
+
 
 class MetricsTrackerV2:
     """
@@ -52,6 +57,12 @@ class MetricsTrackerV2:
             m.name: m for m in metrics_config.metrics
         }
 
+        # Ask for all LLM metrics of a text in one call (per model)
+        self.batch_llm = metrics_config.batch_llm_extraction is not False
+
+        # Keyword matcher and regexes, compiled once for all turns
+        self.compiled = CompiledMetrics(metrics_config.metrics)
+
         logger.info(f"Initialized MetricsTrackerV2 with {len(self.metrics)} metrics")
 
     async def extract_metrics_from_text(
@@ -71,7 +82,9 @@ class MetricsTrackerV2:
         Returns:
             List of MetricRecord objects extracted from text
         """
-        extracted: List[MetricRecord] = []
+        records: Dict[str, MetricRecord] = {}
+        llm_metrics: List[MetricConfig] = []
+        scan: Optional[TextScan] = None
 
         for metric_name, metric_config in self.metrics.items():
             # Skip actor-specific metrics if no actor context
@@ -85,33 +98,227 @@ class MetricsTrackerV2:
 
             # Extract based on type
             extraction = metric_config.extraction
+            record = None
 
             if extraction.type == "llm":
-                record = await self._extract_with_llm(
-                    metric_config, turn, text, actor_name
-                )
-                if record:
-                    extracted.append(record)
+                # Collected and extracted together below
+                llm_metrics.append(metric_config)
 
             elif extraction.type == "keyword":
+                # One scan of the text serves every keyword metric
+                if scan is None:
+                    scan = self.compiled.scan(text)
                 record = self._extract_with_keyword(
-                    metric_config, turn, text, actor_name
+                    metric_config, turn, text, actor_name, scan
                 )
-                if record:
-                    extracted.append(record)
 
             elif extraction.type == "pattern":
                 record = self._extract_with_pattern(
                     metric_config, turn, text, actor_name
                 )
-                if record:
-                    extracted.append(record)
 
             elif extraction.type == "manual":
                 # Manual metrics are created directly, skip extraction
                 pass
 
-        return extracted
+            if record:
+                records[metric_name] = record
+
+        if llm_metrics:
+            records.update(
+                await self._extract_llm_metrics(llm_metrics, turn, text, actor_name)
+            )
+
+        # Keep configuration order
+        return [records[name] for name in self.metrics if name in records]
+
+    async def _extract_llm_metrics(
+        self,
+        metrics: List[MetricConfig],
+        turn: int,
+        text: str,
+        actor_name: Optional[str],
+    ) -> Dict[str, MetricRecord]:
+        """
+        Extract several LLM metrics from one text
+
+        In batch mode, metrics sharing a model are requested in one structured
+        call; otherwise each metric gets its own call. Calls run concurrently.
+
+        Args:
+            metrics: LLM metric configurations
+            turn: Current turn
+            text: Text to analyze
+            actor_name: Optional actor name
+
+        Returns:
+            Dict mapping metric name to MetricRecord (failed metrics omitted)
+        """
+        if self.batch_llm and len(metrics) > 1:
+            by_model: Dict[str, List[MetricConfig]] = {}
+            for metric in metrics:
+                model = metric.extraction.model or DEFAULT_EXTRACTION_MODEL
+                by_model.setdefault(model, []).append(metric)
+
+            batches = await asyncio.gather(*[
+                self._extract_with_llm_batch(group, model, turn, text, actor_name)
+                for model, group in by_model.items()
+            ])
+            results: Dict[str, MetricRecord] = {}
+            for batch in batches:
+                results.update(batch)
+            return results
+
+        records = await asyncio.gather(*[
+            self._extract_with_llm(metric, turn, text, actor_name) for metric in metrics
+        ])
+        return {record.name: record for record in records if record}
+
+    async def _extract_with_llm_batch(
+        self,
+        metrics: List[MetricConfig],
+        model: str,
+        turn: int,
+        text: str,
+        actor_name: Optional[str],
+    ) -> Dict[str, MetricRecord]:
+        """
+        Extract several metrics using a single structured LLM call
+
+        The model is asked for a JSON object keyed by metric name. Metrics
+        missing from the answer (or all of them, if the call fails or the
+        answer can't be parsed) fall back to individual extraction.
+
+        Args:
+            metrics: Metric configurations sharing the same model
+            model: Model to use
+            turn: Current turn
+            text: Text to analyze
+            actor_name: Optional actor name
+
+        Returns:
+            Dict mapping metric name to MetricRecord (failed metrics omitted)
+        """
+        if len(metrics) == 1:
+            record = await self._extract_with_llm(metrics[0], turn, text, actor_name)
+            return {record.name: record} if record else {}
+
+        metric_lines = []
+        for metric in metrics:
+            if metric.type == "categorical" and metric.categories:
+                answer = f"one of: {', '.join(metric.categories)}"
+            elif metric.type == "boolean":
+                answer = "true or false"
+            else:
+                answer = "number"
+            metric_lines.append(f"- {metric.name} ({answer}): {metric.extraction.prompt}")
+
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are a metrics extraction assistant. "
+                    "Extract each requested metric from the provided text. "
+                    "Return ONLY a JSON object mapping each metric name to its value. "
+                    "If a metric cannot be determined, use 0."
+                )
+            },
+            {
+                "role": "user",
+                "content": (
+                    "Metrics to extract:\n" + "\n".join(metric_lines)
+                    + f"\n\nText to analyze:\n{text}"
+                )
+            }
+        ]
+
+        values: Dict[str, Any] = {}
+        try:
+            response: LLMResponse = await make_llm_call_async(
+                model=model,
+                messages=messages,
+                api_key=self.api_key,
+                max_retries=2,
+                context={"metrics": ",".join(m.name for m in metrics), "turn": turn},
+            )
+        except Exception as e:
+            logger.error(
+                f"Batched LLM call for metrics {[m.name for m in metrics]} failed, "
+                f"extracting them individually: {e}"
+            )
+        else:
+            json_str = extract_json_from_response(response.content)
+            try:
+                parsed = decode_json(json_str) if json_str else None
+                if isinstance(parsed, dict):
+                    values = parsed
+            except json.JSONDecodeError:
+                pass
+
+            if not values:
+                logger.warning(
+                    f"Could not parse batched metrics response (turn {turn}), "
+                    f"extracting {len(metrics)} metrics individually"
+                )
+
+        records: Dict[str, MetricRecord] = {}
+        missing: List[MetricConfig] = []
+        for metric in metrics:
+            if metric.name not in values:
+                missing.append(metric)
+                continue
+
+            raw_value = values[metric.name]
+            if isinstance(raw_value, bool):
+                raw_value = "true" if raw_value else "false"
+
+            value = self._parse_numeric_value(str(raw_value), metric.type, metric.categories)
+            records[metric.name] = self._llm_record(
+                metric, value, turn, actor_name, model, str(raw_value), batch_size=len(metrics)
+            )
+
+        if missing:
+            fallback = await asyncio.gather(*[
+                self._extract_with_llm(metric, turn, text, actor_name) for metric in missing
+            ])
+            records.update({record.name: record for record in fallback if record})
+
+        return records
+
+    def _llm_record(
+        self,
+        metric: MetricConfig,
+        value: float,
+        turn: int,
+        actor_name: Optional[str],
+        model: str,
+        raw_response: str,
+        batch_size: Optional[int] = None,
+    ) -> MetricRecord:
+        """Build the MetricRecord for an LLM-extracted value"""
+        metadata = {
+            "actor": actor_name,
+            "extraction_type": "llm",
+            "model": model,
+            "raw_response": raw_response,
+            "unit": metric.unit,
+            "description": metric.description,
+        }
+        if batch_size:
+            metadata["batch_size"] = batch_size
+
+        logger.debug(
+            "Extracted metric '%s' via LLM: %s (turn %s, actor: %s)",
+            metric.name, value, turn, actor_name or "N/A",
+        )
+
+        return MetricRecord(
+            name=metric.name,
+            value=value,
+            turn=turn,
+            timestamp=datetime.now(),
+            metadata=metadata,
+        )
 
     async def _extract_with_llm(
         self,
@@ -156,7 +363,7 @@ class MetricsTrackerV2:
         ]
 
         # Determine model to use
-        model = extraction.model or "openai/gpt-4o-mini"
+        model = extraction.model or DEFAULT_EXTRACTION_MODEL
 
         try:
             # Make async LLM call
@@ -173,29 +380,10 @@ class MetricsTrackerV2:
                 response.content, metric.type, metric.categories
             )
 
-            # Create MetricRecord
-            record = MetricRecord(
-                name=metric.name,
-                value=value,
-                turn=turn,
-                timestamp=datetime.now(),
-                metadata={
-                    "actor": actor_name,
-                    "extraction_type": "llm",
-                    "model": model,
-                    "raw_response": response.content,
-                    "unit": metric.unit,
-                    "description": metric.description,
-                }
+            return self._llm_record(
+                metric, value, turn, actor_name, model, response.content
             )
 
-            logger.debug(
-                f"Extracted metric '{metric.name}' via LLM: {value} "
-                f"(turn {turn}, actor: {actor_name or 'N/A'})"
-            )
-
-            return record
-
         except Exception as e:
             logger.error(f"Failed to extract metric '{metric.name}' via LLM: {e}")
             return None
@@ -206,6 +394,7 @@ class MetricsTrackerV2:
         turn: int,
         text: str,
         actor_name: Optional[str],
+        scan: Optional[TextScan] = None,
     ) -> Optional[MetricRecord]:
         """
         Extract metric using keyword search
@@ -215,6 +404,7 @@ class MetricsTrackerV2:
             turn: Current turn
             text: Text to analyze
             actor_name: Optional actor name
+            scan: Precomputed keyword scan of text (scanned here if not given)
 
         Returns:
             MetricRecord if keywords found, None otherwise
@@ -226,14 +416,9 @@ class MetricsTrackerV2:
             return None
 
         # Count keyword occurrences
-        text_lower = text.lower()
-        matches = []
-
-        for keyword in extraction.keywords:
-            keyword_lower = keyword.lower()
-            count = text_lower.count(keyword_lower)
-            if count > 0:
-                matches.extend([keyword] * count)
+        if scan is None:
+            scan = self.compiled.scan(text)
+        matches = scan.matches(extraction.keywords)
 
         # Calculate value based on scoring method
         scoring = extraction.scoring or "count"
@@ -244,7 +429,7 @@ class MetricsTrackerV2:
             value = 1.0 if matches else 0.0
         elif scoring == "density":
             # Keywords per 100 words
-            word_count = len(text.split())
+            word_count = scan.word_count
             value = (len(matches) / word_count * 100) if word_count > 0 else 0.0
         else:
             logger.warning(f"Unknown scoring method '{scoring}', using count")
@@ -271,8 +456,8 @@ class MetricsTrackerV2:
         )
 
         logger.debug(
-            f"Extracted metric '{metric.name}' via keyword: {value} "
-            f"(turn {turn}, actor: {actor_name or 'N/A'})"
+            "Extracted metric '%s' via keyword: %s (turn %s, actor: %s)",
+            metric.name, value, turn, actor_name or "N/A",
         )
 
         return record
@@ -302,9 +487,14 @@ class MetricsTrackerV2:
             logger.warning(f"No pattern specified for pattern extraction of {metric.name}")
             return None
 
+        compiled = self.compiled.patterns.get(metric.name)
+        if compiled is None:
+            # Invalid pattern, already reported when compiling
+            return None
+
         try:
             # Find all matches
-            matches = re.findall(extraction.pattern, text, re.IGNORECASE)
+            matches = compiled.findall(text)
 
             if not matches:
                 return None
@@ -336,15 +526,12 @@ class MetricsTrackerV2:
             )
 
             logger.debug(
-                f"Extracted metric '{metric.name}' via pattern: {value} "
-                f"(turn {turn}, actor: {actor_name or 'N/A'})"
+                "Extracted metric '%s' via pattern: %s (turn %s, actor: %s)",
+                metric.name, value, turn, actor_name or "N/A",
             )
 
             return record
 
-        except re.error as e:
-            logger.error(f"Invalid regex pattern for metric '{metric.name}': {e}")
-            return None
         except Exception as e:
             logger.error(f"Failed to extract metric '{metric.name}' via pattern: {e}")
             return None
@@ -431,24 +618,24 @@ class MetricsTrackerV2:
         Returns:
             List of MetricRecord objects
         """
-        extracted: List[MetricRecord] = []
-
-        for actor_name, decision in state.decisions.items():
-            # Extract from reasoning
-            reasoning_metrics = await self.extract_metrics_from_text(
+        # Reasoning and action of every actor, extracted concurrently
+        texts = [
+            (actor_name, text)
+            for actor_name, decision in state.decisions.items()
+            for text in (decision.reasoning, decision.action)
+        ]
+        results = await asyncio.gather(*[
+            self.extract_metrics_from_text(
                 turn=state.turn,
-                text=decision.reasoning,
+                text=text,
                 actor_name=actor_name,
             )
-            extracted.extend(reasoning_metrics)
+            for actor_name, text in texts
+        ])
 
-            # Extract from action
-            action_metrics = await self.extract_metrics_from_text(
-                turn=state.turn,
-                text=decision.action,
-                actor_name=actor_name,
-            )
-            extracted.extend(action_metrics)
+        extracted: List[MetricRecord] = []
+        for records in results:
+            extracted.extend(records)
 
         return extracted
 
@@ -7,6 +7,7 @@ It's the bridge between V1's monolithic run_scenario.py and V2's modular service
 Based on ROADMAP_V2.md Phase 2.1 design.
 """
 from __future__ import annotations
+import time
 import uuid
 import logging
 from typing import Optional, Dict, Any, Protocol
@@ -23,6 +24,8 @@ from scenario_lab.models.state import (
 from scenario_lab.core.events import EventBus, EventType, get_event_bus
 from scenario_lab.utils.state_persistence import StatePersistence
 from scenario_lab.utils.logging_config import set_context, clear_context
+from scenario_lab.utils.profiler import PhaseProfiler
+from scenario_lab.utils.tracing import start_span
 
 
 logger = logging.getLogger(__name__)
@@ -75,6 +78,7 @@ class ScenarioOrchestrator:
         output_dir: Optional[str] = None,
         save_state_every_turn: bool = True,
         exogenous_event_manager: Optional[Any] = None,  # ExogenousEventManager
+        profiler: Optional[PhaseProfiler] = None,
     ):
         """
         Initialize orchestrator
@@ -86,6 +90,7 @@ class ScenarioOrchestrator:
             output_dir: Output directory for state saving
             save_state_every_turn: Whether to save state after each turn
             exogenous_event_manager: Optional event manager for background events
+            profiler: Optional sampling profiler started around each phase
         """
         self.event_bus = event_bus or get_event_bus()
         self.end_turn = end_turn
@@ -93,6 +98,7 @@ class ScenarioOrchestrator:
         self.output_dir = output_dir
         self.save_state_every_turn = save_state_every_turn
         self.exogenous_event_manager = exogenous_event_manager
+        self.profiler = profiler
 
         # Phase services (to be injected)
         self.phases: Dict[PhaseType, PhaseService] = {}
@@ -124,6 +130,7 @@ class ScenarioOrchestrator:
         """
         # Set logging context for entire scenario
         set_context(scenario=state.scenario_id, run_id=state.run_id)
+        scenario_span = start_span("scenario", scenario=state.scenario_id, run_id=state.run_id)
 
         # Mark as started
         state = state.with_started()
@@ -217,6 +224,7 @@ class ScenarioOrchestrator:
         except Exception as e:
             logger.error(f"Scenario execution failed: {e}", exc_info=True)
             state = state.with_error(str(e))
+            scenario_span.set_error(e)
 
             await self.event_bus.emit(
                 EventType.SCENARIO_FAILED,
@@ -230,6 +238,9 @@ class ScenarioOrchestrator:
             )
 
         finally:
+            scenario_span.set_attribute("turns", state.turn)
+            scenario_span.set_attribute("status", state.status.value)
+            scenario_span.end()
             # Clear logging context
             clear_context()
 
@@ -253,12 +264,16 @@ class ScenarioOrchestrator:
         Returns:
             New scenario state after turn completion
         """
+        turn_started = time.perf_counter()
+        phase_durations: Dict[str, float] = {}
+
         # Advance turn
         turn = state.turn + 1
         state = state.with_turn(turn)
 
         # Set turn context for logging
         set_context(turn=turn)
+        turn_span = start_span("turn", turn=turn)
 
         logger.info(f"Starting turn {turn}", extra={"total_cost": state.total_cost()})
 
@@ -304,7 +319,7 @@ class ScenarioOrchestrator:
                     logger.warning(f"Phase {phase_type.value} not registered, skipping")
                     continue
 
-                state = await self._execute_phase(phase_type, state)
+                state = await self._execute_phase(phase_type, state, phase_durations)
 
                 # Check credit limit after each phase
                 if await self._check_credit_limit(state):
@@ -326,6 +341,8 @@ class ScenarioOrchestrator:
                     "turn": turn,
                     "total_cost": state.total_cost(),
                     "decisions": len(state.decisions),
+                    "duration": time.perf_counter() - turn_started,
+                    "phase_durations": phase_durations,
                     "state": state,  # Include state for event handlers
                 },
                 source="orchestrator",
@@ -337,18 +354,30 @@ class ScenarioOrchestrator:
 
         except Exception as e:
             logger.error(f"Turn {turn} failed: {e}", exc_info=True)
+            turn_span.set_error(e)
 
             await self.event_bus.emit(
                 EventType.TURN_FAILED,
-                data={"turn": turn, "error": str(e)},
+                data={
+                    "turn": turn,
+                    "error": str(e),
+                    "duration": time.perf_counter() - turn_started,
+                },
                 source="orchestrator",
             )
             raise
 
+        finally:
+            turn_span.set_attribute("cost", state.total_cost())
+            turn_span.end()
+
         return state
 
     async def _execute_phase(
-        self, phase_type: PhaseType, state: ScenarioState
+        self,
+        phase_type: PhaseType,
+        state: ScenarioState,
+        durations: Optional[Dict[str, float]] = None,
     ) -> ScenarioState:
         """
         Execute a single phase
@@ -356,6 +385,7 @@ class ScenarioOrchestrator:
         Args:
             phase_type: The type of phase to execute
             state: Current scenario state
+            durations: Optional dict to store the phase's duration in (seconds)
 
         Returns:
             New scenario state after phase execution
@@ -365,8 +395,9 @@ class ScenarioOrchestrator:
 
         # Set phase context for logging
         set_context(phase=phase_type.value)
+        phase_span = start_span("phase", phase=phase_type.value, turn=state.turn)
 
-        logger.debug(f"Starting phase: {phase_type.value}")
+        logger.debug("Starting phase: %s", phase_type.value)
 
         # Emit phase started event
         await self.event_bus.emit(
@@ -375,30 +406,53 @@ class ScenarioOrchestrator:
             source="orchestrator",
         )
 
+        if self.profiler is not None:
+            self.profiler.start_phase(phase_type.value)
+
+        started = time.perf_counter()
         try:
             # Execute the phase service
             service = self.phases[phase_type]
             state = await service.execute(state)
 
-            logger.debug(f"Phase completed: {phase_type.value}")
+            duration = time.perf_counter() - started
+            if durations is not None:
+                durations[phase_type.value] = duration
+
+            logger.debug("Phase completed: %s", phase_type.value)
 
             # Emit phase completed event
             await self.event_bus.emit(
                 EventType.PHASE_COMPLETED,
-                data={"phase": phase_type.value, "turn": state.turn},
+                data={
+                    "phase": phase_type.value,
+                    "turn": state.turn,
+                    "duration": duration,
+                },
                 source="orchestrator",
             )
 
         except Exception as e:
             logger.error(f"Phase {phase_type.value} failed: {e}", exc_info=True)
+            phase_span.set_error(e)
 
             await self.event_bus.emit(
                 EventType.PHASE_FAILED,
-                data={"phase": phase_type.value, "turn": state.turn, "error": str(e)},
+                data={
+                    "phase": phase_type.value,
+                    "turn": state.turn,
+                    "error": str(e),
+                    "duration": time.perf_counter() - started,
+                },
                 source="orchestrator",
             )
             raise
 
+        finally:
+            if self.profiler is not None:
+                self.profiler.stop_phase()
+            phase_span.end()
+
         return state
 
     def _get_phase_sequence(self, state: ScenarioState) -> list[PhaseType]:
@@ -37,6 +37,60 @@ def build_actor_system_prompt(
     return combined
 
 
+def build_decision_instructions(json_mode: bool = False) -> str:
+    """
+    Build the task and response format instructions of decision prompts
+
+    The instructions are the same for every actor and turn, so they open the
+    user prompt: together with the system prompt they form a prefix that
+    providers with prompt caching can reuse across calls.
+
+    Args:
+        json_mode: Whether to request JSON format response (default: False)
+
+    Returns:
+        Instructions markdown
+    """
+    if json_mode:
+        return """## Your Task
+
+Analyze the situation below and respond with a valid JSON object:
+
+```json
+{
+  "goals": {
+    "long_term": "List 2-4 enduring objectives you're pursuing. These may evolve based on events, but changes should be justified.",
+    "short_term": "List 1-3 immediate objectives for the next few turns."
+  },
+  "reasoning": "Explain your thinking, how this action serves your goals, and why your goals may have evolved or remained stable.",
+  "action": "Describe the specific action you will take this turn - be concrete and specific."
+}
+```
+
+**Important:** Provide only the JSON object. You may use markdown formatting within the string values.
+"""
+
+    # Markdown format instructions (V1 compatibility)
+    return """## Your Task
+
+Given the situation below, first state your current goals given recent developments:
+
+**LONG-TERM GOALS:**
+[List 2-4 enduring objectives you're pursuing. These may evolve based on events, but changes should be justified.]
+
+**SHORT-TERM PRIORITIES:**
+[List 1-3 immediate objectives for the next few turns.]
+
+Then decide your action:
+
+**REASONING:**
+[Explain your thinking, how this action serves your goals, and why your goals may have evolved or remained stable]
+
+**ACTION:**
+[Describe the specific action you will take this turn - be concrete and specific]
+"""
+
+
 def build_decision_prompt(
     world_state: str,
     turn: int,
@@ -52,6 +106,11 @@ def build_decision_prompt(
     """
     Build decision-making prompts for an actor
 
+    The prompts run from stable to volatile content: the system prompt
+    (scenario and actor profile), then the task instructions (see
+    build_decision_instructions), then this turn's situation, so successive
+    calls share the longest possible prefix.
+
     Args:
         world_state: Current world state description
         turn: Current turn number
@@ -87,61 +146,18 @@ def build_decision_prompt(
     if recent_goals:
         recent_goals_text = f"\n\n## Your Recent Goals\n\n{recent_goals}\n"
 
-    # Build format instructions based on mode
-    if json_mode:
-        # JSON format instructions
-        format_instructions = f"""
-## Your Task
+    response_format = "JSON object" if json_mode else "format"
 
-Analyze the situation and respond with a valid JSON object:
-
-```json
-{{
-  "goals": {{
-    "long_term": "List 2-4 enduring objectives you're pursuing. These may evolve based on events, but changes should be justified.",
-    "short_term": "List 1-3 immediate objectives for the next few turns."
-  }},
-  "reasoning": "Explain your thinking, how this action serves your goals, and why your goals may have evolved or remained stable.",
-  "action": "Describe the specific action you will take this turn - be concrete and specific."
-}}
-```
-
-**Important:** Provide only the JSON object. You may use markdown formatting within the string values.
-
-Remember: This is turn {turn} of {total_turns}. Your goals can evolve based on experience, but maintain some continuity unless events strongly justify change.
-"""
-    else:
-        # Markdown format instructions (V1 compatibility)
-        format_instructions = f"""
-## Your Task
-
-First, state your current goals given recent developments:
-
-**LONG-TERM GOALS:**
-[List 2-4 enduring objectives you're pursuing. These may evolve based on events, but changes should be justified.]
-
-**SHORT-TERM PRIORITIES:**
-[List 1-3 immediate objectives for the next few turns.]
-
-Then decide your action:
-
-**REASONING:**
-[Explain your thinking, how this action serves your goals, and why your goals may have evolved or remained stable]
-
-**ACTION:**
-[Describe the specific action you will take this turn - be concrete and specific]
-
-Remember: This is turn {turn} of {total_turns}. Your goals can evolve based on experience, but maintain some continuity unless events strongly justify change.
-"""
-
-    # Build user prompt
-    user_prompt = f"""## Current Situation (Turn {turn} of {total_turns})
+    # Build user prompt: static instructions first, this turn's content last
+    user_prompt = f"""{build_decision_instructions(json_mode)}
+## Current Situation (Turn {turn} of {total_turns})
 
 {world_state}
 {communications_text}
 {other_decisions_text}
 {recent_goals_text}
-{format_instructions}"""
+Remember: This is turn {turn} of {total_turns}. Your goals can evolve based on experience, but maintain some continuity unless events strongly justify change. Respond in the {response_format} described under Your Task.
+"""
 
     return system_prompt, user_prompt
 
@@ -255,14 +271,21 @@ Provide your response in this format:
 
 def build_messages_for_llm(
     system_prompt: str,
-    user_prompt: str
+    user_prompt: str,
+    cacheable_prefix: str = ""
 ) -> List[Dict[str, str]]:
     """
     Build messages array for LLM API call
 
+    When the user prompt starts with a stable prefix (e.g. the instructions
+    from build_decision_instructions), it is sent as its own user message.
+    Every message but the last is then part of the cacheable prompt prefix,
+    which is where the API client places cache-control hints.
+
     Args:
         system_prompt: System prompt (may be empty)
         user_prompt: User prompt
+        cacheable_prefix: Stable start of the user prompt (optional)
 
     Returns:
         List of message dicts with 'role' and 'content'
@@ -272,6 +295,12 @@ def build_messages_for_llm(
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
 
-    messages.append({"role": "user", "content": user_prompt})
+    if cacheable_prefix and user_prompt.startswith(cacheable_prefix) and (
+        len(user_prompt) > len(cacheable_prefix)
+    ):
+        messages.append({"role": "user", "content": cacheable_prefix})
+        messages.append({"role": "user", "content": user_prompt[len(cacheable_prefix):]})
+    else:
+        messages.append({"role": "user", "content": user_prompt})
 
     return messages
@@ -0,0 +1,387 @@
+"""
+Turn history for Scenario Lab V2
+
+ScenarioState only carries the current world state and the current turn's
+decisions. TurnHistory keeps what happened in earlier turns of a run - the
+world state each turn produced, the decisions taken in it and the
+communications sent - so context windowing can show recent turns in full and
+summarize older ones.
+
+TurnHistory keeps the records in memory. DiskTurnHistory stores them in the
+run directory instead, append-only:
+
+    history/turns.jsonl   one JSON record per line, in the order written
+    history/turns.idx     fixed-width (offset, length) entry per turn number
+
+so any turn is read with two positioned reads, without loading the other
+turns, and a long run doesn't hold its whole history in memory. The data is
+written before its index entry; a crash mid-write leaves an unindexed tail,
+which is cut off when the store is reopened.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from scenario_lab.models.state import ScenarioState
+
+logger = logging.getLogger(__name__)
+
+# Name of the history directory inside a run directory
+HISTORY_DIR = "history"
+
+# Index entry per turn: offset and length of its record in turns.jsonl
+# (length 0 = turn not recorded)
+_INDEX_ENTRY = struct.Struct("<QI")
+
+
+@dataclass(frozen=True)
+class TurnRecord:
+    """What happened in one turn (turn 0 is the initial world state)"""
+    turn: int
+    world_state: str  # World state at the end of the turn
+    actions: Dict[str, str] = field(default_factory=dict)  # actor -> action taken
+    # actor -> {"goals", "reasoning", "action"} (empty when only actions are known)
+    decisions: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Communications sent during the turn (Communication fields as plain values)
+    communications: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_state(cls, state: ScenarioState) -> TurnRecord:
+        """
+        Build the record of a finished turn
+
+        Args:
+            state: Scenario state at the end of the turn (after its world update)
+
+        Returns:
+            Record of state.turn
+        """
+        return cls(
+            turn=state.turn,
+            world_state=state.world_state.content,
+            actions={actor: d.action for actor, d in state.decisions.items()},
+            decisions={
+                actor: {"goals": list(d.goals), "reasoning": d.reasoning, "action": d.action}
+                for actor, d in state.decisions.items()
+            },
+            communications=[
+                {
+                    "id": c.id,
+                    "type": c.type,
+                    "sender": c.sender,
+                    "recipients": list(c.recipients),
+                    "content": c.content,
+                    "timestamp": c.timestamp.isoformat(),
+                }
+                for c in state.communications
+                if c.turn == state.turn
+            ],
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict"""
+        return {
+            "turn": self.turn,
+            "world_state": self.world_state,
+            "actions": self.actions,
+            "decisions": self.decisions,
+            "communications": self.communications,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> TurnRecord:
+        """Create from a dict produced by to_dict"""
+        return cls(
+            turn=data["turn"],
+            world_state=data["world_state"],
+            actions=data.get("actions", {}),
+            decisions=data.get("decisions", {}),
+            communications=data.get("communications", []),
+        )
+
+
+class TurnHistory:
+    """
+    In-memory turn history of a single run
+
+    Records are added in turn order as the run progresses; a turn is only
+    recorded once.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[int, TurnRecord] = {}
+
+    def record(self, record: TurnRecord) -> bool:
+        """
+        Add a turn record
+
+        Args:
+            record: Record to add
+
+        Returns:
+            True if added, False if the turn was already recorded
+        """
+        if record.turn in self._records:
+            return False
+        self._records[record.turn] = record
+        return True
+
+    def record_previous_turn(self, state: ScenarioState) -> bool:
+        """
+        Record the turn before state.turn from a state at the start of a turn
+
+        At the start of turn N the state holds the world state produced by
+        turn N-1 and each actor's recent decisions, which include its turn
+        N-1 decision.
+
+        Args:
+            state: Scenario state during turn N (N >= 1)
+
+        Returns:
+            True if turn N-1 was added
+        """
+        previous = state.turn - 1
+        if previous < 0 or previous in self:
+            return False
+        actions = {}
+        decisions = {}
+        for actor_name, actor_state in state.actors.items():
+            for decision in actor_state.recent_decisions:
+                if decision.turn == previous:
+                    actions[actor_name] = decision.action
+                    decisions[actor_name] = {
+                        "goals": list(decision.goals),
+                        "reasoning": decision.reasoning,
+                        "action": decision.action,
+                    }
+        return self.record(
+            TurnRecord(
+                turn=previous,
+                world_state=state.world_state.content,
+                actions=actions,
+                decisions=decisions,
+            )
+        )
+
+    def get(self, turn: int) -> Optional[TurnRecord]:
+        """Get the record for a turn, if recorded"""
+        return self._records.get(turn)
+
+    def clear(self) -> None:
+        """Remove all records"""
+        self._records.clear()
+
+    def record_state(self, state: ScenarioState) -> bool:
+        """
+        Record a finished turn with its decisions and communications
+
+        Args:
+            state: Scenario state at the end of the turn
+
+        Returns:
+            True if added, False if the turn was already recorded
+        """
+        return self.record(TurnRecord.from_state(state))
+
+    def range(self, start: int, end: int) -> List[TurnRecord]:
+        """Recorded turns from start to end (inclusive), in turn order"""
+        records = (self.get(turn) for turn in range(max(start, 0), end + 1))
+        return [record for record in records if record is not None]
+
+    @property
+    def latest_turn(self) -> Optional[int]:
+        """Highest recorded turn"""
+        return max(self._records) if self._records else None
+
+    def __contains__(self, turn: int) -> bool:
+        return turn in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[TurnRecord]:
+        return iter(self._records[t] for t in sorted(self._records))
+
+
+class DiskTurnHistory(TurnHistory):
+    """
+    Append-only turn history stored in a run directory
+
+    Reads and writes open the files for the duration of the call, so the
+    store holds no file handles and can be shared by the phases of a run
+    (and reopened by a resumed run or read by another process).
+    """
+
+    def __init__(self, directory: str, recover: bool = False):
+        """
+        Open (or prepare) a history store
+
+        The directory is created with the first record. Only the run that
+        owns the store (its single writer) should pass recover=True: another
+        process may be mid-record while this one opens the store, and cutting
+        the files under it would corrupt them.
+
+        Args:
+            directory: History directory, usually <run dir>/history
+            recover: Truncate a partially written tail left by a crash
+        """
+        self.directory = Path(directory)
+        self.data_path = self.directory / "turns.jsonl"
+        self.index_path = self.directory / "turns.idx"
+        self._lock = threading.Lock()
+        self._slots = 0  # Index entries (highest recorded turn + 1)
+        self._count = 0  # Recorded turns
+        self._data_size = 0
+        if self.index_path.exists():
+            self._load(recover)
+
+    @classmethod
+    def for_run(cls, run_dir: str, recover: bool = False) -> DiskTurnHistory:
+        """Open the history store of a run directory"""
+        return cls(str(Path(run_dir) / HISTORY_DIR), recover=recover)
+
+    def _load(self, recover: bool) -> None:
+        """
+        Load the index size, skipping a partially written tail
+
+        Args:
+            recover: Also cut the partial tail off the files (writer only)
+        """
+        index = self.index_path.read_bytes()
+        data_size = self.data_path.stat().st_size if self.data_path.exists() else 0
+        slots = len(index) // _INDEX_ENTRY.size
+        entries = [_INDEX_ENTRY.unpack_from(index, i * _INDEX_ENTRY.size) for i in range(slots)]
+        # Entries pointing past the data were written for data that never made it
+        while entries and entries[-1][0] + entries[-1][1] > data_size:
+            entries.pop()
+
+        if recover:
+            end = max((offset + length for offset, length in entries if length), default=0)
+            if len(entries) * _INDEX_ENTRY.size != len(index):
+                with open(self.index_path, "r+b") as f:
+                    f.truncate(len(entries) * _INDEX_ENTRY.size)
+            if end != data_size:
+                logger.warning(f"Truncating incomplete turn history record in {self.data_path}")
+                with open(self.data_path, "r+b") as f:
+                    f.truncate(end)
+            data_size = end
+
+        self._slots = len(entries)
+        self._count = sum(1 for _, length in entries if length)
+        self._data_size = data_size
+
+    def clear(self) -> None:
+        """Remove all records (empties the files)"""
+        with self._lock:
+            for path in (self.data_path, self.index_path):
+                if path.exists():
+                    with open(path, "r+b") as f:
+                        f.truncate(0)
+            self._slots = self._count = self._data_size = 0
+
+    def _entry(self, turn: int) -> Tuple[int, int]:
+        if turn < 0 or turn >= self._slots:
+            return (0, 0)
+        fd = os.open(self.index_path, os.O_RDONLY)
+        try:
+            raw = os.pread(fd, _INDEX_ENTRY.size, turn * _INDEX_ENTRY.size)
+        finally:
+            os.close(fd)
+        if len(raw) < _INDEX_ENTRY.size:
+            return (0, 0)
+        return _INDEX_ENTRY.unpack(raw)
+
+    def record(self, record: TurnRecord) -> bool:
+        """
+        Append a turn record
+
+        Args:
+            record: Record to add
+
+        Returns:
+            True if added, False if the turn was already recorded
+        """
+        line = json.dumps(record.to_dict(), ensure_ascii=False).encode("utf-8") + b"\n"
+        with self._lock:
+            if self._entry(record.turn)[1]:
+                return False
+            self.directory.mkdir(parents=True, exist_ok=True)
+            offset = self._data_size
+            with open(self.data_path, "ab") as f:
+                f.write(line)
+
+            # Empty entries for skipped turns, then this turn's entry
+            entries = b"".join(
+                _INDEX_ENTRY.pack(0, 0) for _ in range(self._slots, record.turn)
+            )
+            entries += _INDEX_ENTRY.pack(offset, len(line))
+            fd = os.open(self.index_path, os.O_WRONLY | os.O_CREAT, 0o644)
+            try:
+                os.pwrite(fd, entries, min(self._slots, record.turn) * _INDEX_ENTRY.size)
+            finally:
+                os.close(fd)
+
+            self._data_size += len(line)
+            self._slots = max(self._slots, record.turn + 1)
+            self._count += 1
+        return True
+
+    def get(self, turn: int) -> Optional[TurnRecord]:
+        """Read the record for a turn, if recorded"""
+        offset, length = self._entry(turn)
+        if not length:
+            return None
+        fd = os.open(self.data_path, os.O_RDONLY)
+        try:
+            raw = os.pread(fd, length, offset)
+        finally:
+            os.close(fd)
+        if len(raw) < length:
+            return None  # Indexed data that never made it to disk
+        return TurnRecord.from_dict(json.loads(raw))
+
+    @property
+    def latest_turn(self) -> Optional[int]:
+        """Highest recorded turn"""
+        return self._slots - 1 if self._slots else None
+
+    def __contains__(self, turn: int) -> bool:
+        return self._entry(turn)[1] > 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[TurnRecord]:
+        return iter(self.range(0, self._slots - 1))
+
+
+def format_turn_record(record: TurnRecord, include_world_state: bool = True) -> str:
+    """
+    Format a turn record as markdown
+
+    Args:
+        record: Turn record
+        include_world_state: Whether to include the resulting world state
+
+    Returns:
+        Markdown section for the turn
+    """
+    if record.turn == 0:
+        return f"### Turn 0 (Initial State)\n\n{record.world_state}\n\n"
+
+    text = f"### Turn {record.turn}\n\n"
+    if record.actions:
+        text += "**Actions Taken:**\n\n"
+        for actor, action in record.actions.items():
+            text += f"- **{actor}:** {action}\n"
+        text += "\n"
+    if include_world_state:
+        text += f"**Resulting World State:**\n{record.world_state}\n\n"
+    return text
@@ -76,6 +76,54 @@ You MUST follow the exact format specified in the user prompt. This includes:
 
 Do NOT skip any sections. Do NOT merge sections together."""
 
+    def build_task_instructions(self, with_events: bool = False) -> str:
+        """
+        Build the task and response format instructions of the user prompt
+
+        They don't change between turns (apart from mentioning background
+        events when there are any), so they open the user prompt and extend
+        the cacheable prompt prefix.
+
+        Args:
+            with_events: Whether the turn has background events
+
+        Returns:
+            Instructions markdown
+        """
+        return f"""## Your Task
+
+Synthesize the actor actions{' and background events' if with_events else ''} below into an updated world state. Describe:
+
+1. **What happened**: How did each actor's action play out?
+{f'2. **Background developments**: How did any background events affect the situation?' if with_events else ''}
+3. **Interactions**: How did actors' actions affect each other?
+4. **Consequences**: What are the immediate and near-term effects?
+5. **New dynamics**: What new situations or tensions emerged?
+6. **Current status**: What is the state of the situation now?
+
+Provide your response in this format:
+
+**UPDATED STATE:**
+[Write a cohesive narrative (2-4 paragraphs) describing the new world state after this turn's actions{' and events' if with_events else ''}]
+
+**KEY CHANGES:**
+- [Change 1]
+- [Change 2]
+- [Change 3]
+
+**CONSEQUENCES:**
+- [Consequence 1]
+- [Consequence 2]
+
+CRITICAL REQUIREMENTS:
+1. Be specific, realistic, and show how actions create ripple effects
+2. Include both intended and unintended consequences
+3. Maintain logical consistency with the previous state
+
+---
+
+"""
+
     def build_user_prompt(
         self,
         current_state: str,
@@ -87,6 +135,9 @@ Do NOT skip any sections. Do NOT merge sections together."""
         """
         Build user prompt with current state and actor decisions
 
+        The static task instructions (build_task_instructions) come first and
+        this turn's world state, actions and events last.
+
         Args:
             current_state: Current world state description
             turn: Current turn number
@@ -106,13 +157,12 @@ Do NOT skip any sections. Do NOT merge sections together."""
         # Phase 1.3: Stub for exogenous events (to be implemented in Phase 3)
         events_text = ""
         if exogenous_events and len(exogenous_events) > 0:
-            events_text = "\n## Background Events This Turn\n\n"
+            events_text = "\n---\n\n## Background Events This Turn\n\n"
             events_text += "Independent of actor decisions, the following also occurred:\n\n"
             for event in exogenous_events:
                 events_text += f"**{event.get('name', 'Event')}:** {event.get('description', '')}\n\n"
-            events_text += "---\n\n"
 
-        prompt = f"""## Current World State (Turn {turn} of {total_turns})
+        prompt = f"""{self.build_task_instructions(bool(exogenous_events))}## Current World State (Turn {turn} of {total_turns})
 
 {current_state}
 
@@ -120,40 +170,9 @@ Do NOT skip any sections. Do NOT merge sections together."""
 
 ## Actor Actions This Turn
 {actions_text}
+{events_text}"""
 
----
-{events_text}
-## Your Task
-
-Synthesize these actions{' and background events' if exogenous_events else ''} into an updated world state. Describe:
-
-1. **What happened**: How did each actor's action play out?
-{f'2. **Background developments**: How did any background events affect the situation?' if exogenous_events else ''}
-3. **Interactions**: How did actors' actions affect each other?
-4. **Consequences**: What are the immediate and near-term effects?
-5. **New dynamics**: What new situations or tensions emerged?
-6. **Current status**: What is the state of the situation now?
-
-Provide your response in this format:
-
-**UPDATED STATE:**
-[Write a cohesive narrative (2-4 paragraphs) describing the new world state after this turn's actions{' and events' if exogenous_events else ''}]
-
-**KEY CHANGES:**
-- [Change 1]
-- [Change 2]
-- [Change 3]
-
-**CONSEQUENCES:**
-- [Consequence 1]
-- [Consequence 2]
-
-CRITICAL REQUIREMENTS:
-1. Be specific, realistic, and show how actions create ripple effects
-2. Include both intended and unintended consequences
-3. Maintain logical consistency with the previous state"""
-
-        return prompt
+        return prompt.rstrip()
 
     def parse_world_update_response(self, content: str) -> Dict[str, Any]:
         """
@@ -165,19 +184,18 @@ CRITICAL REQUIREMENTS:
         Returns:
             Dict with 'updated_state', 'key_changes', 'consequences' keys
         """
-        from scenario_lab.utils.response_parser import extract_section
+        from scenario_lab.utils.response_parser import ResponseSections
 
         result = {
             'updated_state': '',
             'key_changes': [],
             'consequences': []
         }
+        # Section names match case-insensitively
+        sections = ResponseSections(content)
 
         # Extract UPDATED STATE section (stop at KEY CHANGES)
-        updated_state = extract_section(content, "UPDATED STATE", "KEY CHANGES")
-        if not updated_state:
-            # Fallback: try without markdown bold
-            updated_state = extract_section(content, "Updated State", "Key Changes")
+        updated_state = sections.get("UPDATED STATE", "KEY CHANGES")
         if not updated_state:
             # Final fallback - use entire content
             updated_state = content
@@ -185,9 +203,7 @@ CRITICAL REQUIREMENTS:
         result['updated_state'] = updated_state
 
         # Extract KEY CHANGES section
-        key_changes_text = extract_section(content, "KEY CHANGES", "CONSEQUENCES")
-        if not key_changes_text:
-            key_changes_text = extract_section(content, "Key Changes", "Consequences")
+        key_changes_text = sections.get("KEY CHANGES", "CONSEQUENCES")
 
         # Parse bulleted list
         if key_changes_text:
@@ -197,9 +213,7 @@ CRITICAL REQUIREMENTS:
                     result['key_changes'].append(line[1:].strip())
 
         # Extract CONSEQUENCES section
-        consequences_text = extract_section(content, "CONSEQUENCES", None)
-        if not consequences_text:
-            consequences_text = extract_section(content, "Consequences", None)
+        consequences_text = sections.get("CONSEQUENCES")
 
         # Parse bulleted list
         if consequences_text:
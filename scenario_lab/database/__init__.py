@@ -9,8 +9,11 @@ try:
         Communication,
         Metric,
         Cost,
+        MetricTurnRollup,
+        RunMetricRollup,
         Base,
     )
+    from scenario_lab.database.async_db import AsyncDatabase
 
     __all__ = [
         "Database",
@@ -20,7 +23,10 @@ try:
         "Communication",
         "Metric",
         "Cost",
+        "MetricTurnRollup",
+        "RunMetricRollup",
         "Base",
+        "AsyncDatabase",
     ]
 except ImportError:
     # SQLAlchemy not installed - database features not available
@@ -0,0 +1,187 @@
+"""
+Async access layer for the Scenario Lab database
+
+The Database class is synchronous (SQLAlchemy ORM sessions). Calling it from
+async API handlers blocks the event loop that also drives running scenarios
+and WebSocket streams. AsyncDatabase runs every query on a dedicated, bounded
+thread pool instead, so a heavy analytics query only occupies a DB worker.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from scenario_lab.database.models import Database, Decision, Metric, Run
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncDatabase:
+    """
+    Awaitable wrapper around Database
+
+    Each method mirrors the Database method of the same name and runs it on
+    the wrapper's thread pool. At most max_workers queries run at once; the
+    rest wait in the pool's queue without blocking the event loop.
+    """
+
+    def __init__(self, database: Database, max_workers: int = 4):
+        """
+        Initialize async database wrapper
+
+        Args:
+            database: Synchronous Database instance
+            max_workers: Maximum number of queries running concurrently
+        """
+        self.database = database
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="scenario-lab-db"
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking database function on the DB thread pool
+
+        Args:
+            func: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def save_run(self, run: Run) -> None:
+        """Save a run to the database"""
+        await self.run(self.database.save_run, run)
+
+    async def get_run(self, run_id: str) -> Optional[Run]:
+        """Get a run by ID"""
+        return await self.run(self.database.get_run, run_id)
+
+    async def list_runs(self, scenario_id: Optional[str] = None) -> List[Run]:
+        """List all runs, optionally filtered by scenario"""
+        return await self.run(self.database.list_runs, scenario_id=scenario_id)
+
+    async def list_runs_page(
+        self,
+        scenario_id: Optional[str] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_config: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List one page of runs using keyset pagination"""
+        return await self.run(
+            self.database.list_runs_page,
+            scenario_id=scenario_id,
+            status=status,
+            created_after=created_after,
+            created_before=created_before,
+            limit=limit,
+            cursor=cursor,
+            include_config=include_config,
+        )
+
+    async def query_metrics(
+        self,
+        scenario: Optional[str] = None,
+        actor: Optional[str] = None,
+        metric_name: Optional[str] = None,
+    ) -> List[Metric]:
+        """Query metrics with optional filters"""
+        return await self.run(
+            self.database.query_metrics,
+            scenario=scenario,
+            actor=actor,
+            metric_name=metric_name,
+        )
+
+    async def query_decisions_for_actor(
+        self, actor: str, scenario: Optional[str] = None
+    ) -> List[Decision]:
+        """Get all decisions made by an actor"""
+        return await self.run(
+            self.database.query_decisions_for_actor, actor, scenario=scenario
+        )
+
+    async def get_run_statistics(self, run_id: str) -> dict:
+        """Get comprehensive statistics for a run"""
+        return await self.run(self.database.get_run_statistics, run_id)
+
+    async def compare_runs(self, run_ids: List[str]) -> dict:
+        """Compare multiple runs side by side"""
+        return await self.run(self.database.compare_runs, run_ids)
+
+    async def aggregate_metrics(
+        self, metric_name: str, scenario: Optional[str] = None
+    ) -> dict:
+        """Aggregate a metric across runs"""
+        return await self.run(
+            self.database.aggregate_metrics, metric_name, scenario=scenario
+        )
+
+    async def metric_turn_bands(
+        self, metric_name: str, scenario: str, actor: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Per-turn mean and standard deviation of a metric across runs"""
+        return await self.run(
+            self.database.metric_turn_bands, metric_name, scenario, actor=actor
+        )
+
+    async def run_metric_summaries(
+        self,
+        metric_name: str,
+        scenario: Optional[str] = None,
+        actor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Final, minimum and maximum value of a metric for each run"""
+        return await self.run(
+            self.database.run_metric_summaries, metric_name, scenario=scenario, actor=actor
+        )
+
+    async def search(
+        self,
+        query: str,
+        scenario_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        kind: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over world states, decisions and communications"""
+        return await self.run(
+            self.database.search,
+            query,
+            scenario_id=scenario_id,
+            run_id=run_id,
+            kind=kind,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def rebuild_search_index(self) -> int:
+        """Rebuild the full-text search index from the stored turns"""
+        return await self.run(self.database.rebuild_search_index)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut down the thread pool
+
+        Args:
+            wait: Whether to block until running queries finish
+        """
+        self._executor.shutdown(wait=wait)
@@ -4,8 +4,12 @@ Database models for Scenario Lab V2
 SQLAlchemy ORM models for persisting scenario runs, turns, decisions, metrics, etc.
 """
 from __future__ import annotations
+import base64
+import json
+import logging
+import math
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 from sqlalchemy import (
     Column,
     Integer,
@@ -14,12 +18,21 @@ from sqlalchemy import (
     DateTime,
     Text,
     ForeignKey,
+    case,
     JSON,
+    Index,
+    and_,
     create_engine,
+    event,
+    or_,
+    text,
 )
-from sqlalchemy.orm import declarative_base, relationship, Session
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
+logger = logging.getLogger(__name__)
+
 Base = declarative_base()
 
 
@@ -41,6 +54,9 @@ class Run(Base):
     turns = relationship("Turn", back_populates="run", cascade="all, delete-orphan")
     costs = relationship("Cost", back_populates="run", cascade="all, delete-orphan")
 
+    # Keyset pagination order (newest first)
+    __table_args__ = (Index("ix_runs_created_id", "created", "id"),)
+
     def __repr__(self) -> str:
         return f"<Run(id='{self.id}', scenario='{self.scenario_name}', turns={self.total_turns}, cost=${self.total_cost:.2f})>"
 
@@ -150,6 +166,147 @@ class Cost(Base):
         return f"<Cost(actor='{self.actor}', phase='{self.phase}', cost=${self.cost:.4f})>"
 
 
+class MetricTurnRollup(Base):
+    """
+    Running aggregate of one metric at one turn across all runs of a scenario
+
+    Updated incrementally as turns are persisted, so per-turn mean/stdev bands
+    don't require scanning raw metric rows. Scenario-level metrics use
+    actor="" (part of the primary key, so it can't be NULL).
+    """
+
+    __tablename__ = "metric_turn_rollups"
+
+    scenario_id = Column(String, primary_key=True)
+    metric_name = Column(String, primary_key=True)
+    actor = Column(String, primary_key=True, default="")
+    turn_num = Column(Integer, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    sum = Column(Float, nullable=False, default=0.0)
+    sumsq = Column(Float, nullable=False, default=0.0)
+    min = Column(Float, nullable=False)
+    max = Column(Float, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<MetricTurnRollup(scenario='{self.scenario_id}', metric='{self.metric_name}', "
+            f"turn={self.turn_num}, count={self.count})>"
+        )
+
+
+class RunMetricRollup(Base):
+    """Final, minimum and maximum value of one metric over a run"""
+
+    __tablename__ = "run_metric_rollups"
+
+    run_id = Column(String, ForeignKey("runs.id"), primary_key=True)
+    metric_name = Column(String, primary_key=True)
+    actor = Column(String, primary_key=True, default="")
+    final_turn = Column(Integer, nullable=False)
+    final_value = Column(Float, nullable=False)
+    min = Column(Float, nullable=False)
+    max = Column(Float, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<RunMetricRollup(run_id='{self.run_id}', metric='{self.metric_name}', "
+            f"final={self.final_value})>"
+        )
+
+
+# Columns returned by list_runs_page (config only on request)
+RUN_SUMMARY_COLUMNS = (
+    Run.id,
+    Run.scenario_id,
+    Run.scenario_name,
+    Run.created,
+    Run.status,
+    Run.total_turns,
+    Run.total_cost,
+)
+
+
+def encode_run_cursor(created: datetime, run_id: str) -> str:
+    """Encode a (created, id) keyset position as an opaque cursor"""
+    raw = json.dumps([created.isoformat(), run_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_run_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_run_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created, run_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created), str(run_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def _rollup_insert(session: Session, table):
+    """
+    INSERT statement for a rollup table that can upsert, if the dialect allows
+
+    Returns:
+        Dialect-specific insert construct, or None if upserts aren't supported
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    return insert(table)
+
+
+def _least(current, new):
+    """SQL expression for the smaller of two values (portable MIN(a, b))"""
+    return case((new < current, new), else_=current)
+
+
+def _greatest(current, new):
+    """SQL expression for the larger of two values (portable MAX(a, b))"""
+    return case((new > current, new), else_=current)
+
+
+def _stdev(count: int, total: float, sumsq: float) -> Optional[float]:
+    """Sample standard deviation from count, sum and sum of squares"""
+    if count < 2:
+        return None
+    variance = (sumsq - total * total / count) / (count - 1)
+    return math.sqrt(max(0.0, variance))
+
+
+# Full-text search index (SQLite FTS5). Only `content` is tokenized; the other
+# columns locate the matching text.
+SEARCH_INDEX_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+    "content, run_id UNINDEXED, turn_num UNINDEXED, kind UNINDEXED, "
+    "actor UNINDEXED, ref_id UNINDEXED, tokenize='porter unicode61')"
+)
+
+# Kinds of text in the search index
+SEARCH_KINDS = ("world_state", "decision", "communication")
+
+
+def _is_sqlite_memory(db_url: str) -> bool:
+    """Check whether a SQLite URL refers to an in-memory database"""
+    return db_url in ("sqlite://", "sqlite:///") or ":memory:" in db_url or "mode=memory" in db_url
+
+
+def _enable_sqlite_wal(dbapi_connection, connection_record) -> None:
+    """Configure new SQLite connections for concurrent access"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 class Database:
     """
     Database manager for Scenario Lab V2
@@ -164,25 +321,46 @@ class Database:
         Args:
             db_url: SQLAlchemy database URL
         """
-        # Use StaticPool for SQLite to avoid threading issues
-        if db_url.startswith("sqlite"):
+        if db_url.startswith("sqlite") and _is_sqlite_memory(db_url):
+            # In-memory SQLite exists per connection: share a single one
             self.engine = create_engine(
                 db_url,
                 connect_args={"check_same_thread": False},
                 poolclass=StaticPool,
             )
+        elif db_url.startswith("sqlite"):
+            # File SQLite: pooled connections so concurrent readers (API
+            # threads, async access layer) don't share one connection. WAL
+            # lets them read while a run is being persisted.
+            self.engine = create_engine(
+                db_url,
+                connect_args={"check_same_thread": False, "timeout": 30},
+            )
+            event.listen(self.engine, "connect", _enable_sqlite_wal)
         else:
             self.engine = create_engine(db_url)
 
-        # Create tables
+        # Create tables (and indexes added to existing tables since)
         Base.metadata.create_all(self.engine)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
+        self._session_factory = sessionmaker(bind=self.engine)
+
+        # Full-text search needs SQLite built with FTS5
+        self.search_enabled = False
+        if self.engine.dialect.name == "sqlite":
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(text(SEARCH_INDEX_DDL))
+                self.search_enabled = True
+            except OperationalError as e:
+                logger.warning(f"Full-text search disabled (FTS5 not available): {e}")
 
     def get_session(self) -> Session:
         """Get a new database session"""
-        from sqlalchemy.orm import sessionmaker
-
-        SessionLocal = sessionmaker(bind=self.engine)
-        return SessionLocal()
+        return self._session_factory()
 
     def save_run(self, run: Run) -> None:
         """Save a run to the database"""
@@ -212,6 +390,95 @@ class Database:
         finally:
             session.close()
 
+    def list_runs_page(
+        self,
+        scenario_id: Optional[str] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_config: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List one page of runs, newest first, using keyset pagination
+
+        Only summary columns are loaded unless include_config is set, and rows
+        are returned as plain dicts rather than ORM objects.
+
+        Args:
+            scenario_id: Filter by scenario ID
+            status: Filter by run status
+            created_after: Only runs created at or after this time
+            created_before: Only runs created before this time
+            limit: Maximum rows to return
+            cursor: Cursor from the previous page (None for the first page)
+            include_config: Also load the JSON config column
+
+        Returns:
+            Tuple of (rows, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        columns = RUN_SUMMARY_COLUMNS + ((Run.config,) if include_config else ())
+
+        session = self.get_session()
+        try:
+            query = session.query(*columns)
+            if scenario_id:
+                query = query.filter(Run.scenario_id == scenario_id)
+            if status:
+                query = query.filter(Run.status == status)
+            if created_after:
+                query = query.filter(Run.created >= created_after)
+            if created_before:
+                query = query.filter(Run.created < created_before)
+            if cursor:
+                after_created, after_id = decode_run_cursor(cursor)
+                query = query.filter(
+                    or_(
+                        Run.created < after_created,
+                        and_(Run.created == after_created, Run.id < after_id),
+                    )
+                )
+
+            rows = (
+                query.order_by(Run.created.desc(), Run.id.desc())
+                .limit(limit + 1)
+                .all()
+            )
+        finally:
+            session.close()
+
+        page = [dict(row._mapping) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and page:
+            next_cursor = encode_run_cursor(page[-1]["created"], page[-1]["id"])
+        return page, next_cursor
+
+    def iter_runs(
+        self,
+        page_size: int = 500,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all matching runs page by page (constant memory)
+
+        Args:
+            page_size: Rows fetched per query
+            **filters: Arguments accepted by list_runs_page (except limit/cursor)
+
+        Yields:
+            Run rows as dicts, newest first
+        """
+        cursor = None
+        while True:
+            page, cursor = self.list_runs_page(limit=page_size, cursor=cursor, **filters)
+            yield from page
+            if cursor is None:
+                return
+
     def query_metrics(
         self,
         scenario: Optional[str] = None,
@@ -387,3 +654,450 @@ class Database:
             }
         finally:
             session.close()
+
+    def update_metric_rollups(
+        self,
+        session: Session,
+        scenario_id: str,
+        run_id: str,
+        turn_num: int,
+        values: List[Tuple[str, Optional[str], float]],
+    ) -> None:
+        """
+        Fold one turn's metric values into the rollup tables
+
+        Called by DatabasePersistencePhase within the turn's transaction.
+        Uses atomic upserts on SQLite and PostgreSQL, so concurrent batch runs
+        of the same scenario don't lose updates.
+
+        Args:
+            session: Open session (caller commits)
+            scenario_id: Scenario of the run
+            run_id: Run identifier
+            turn_num: Turn the values belong to
+            values: (metric name, actor or None, value) tuples
+        """
+        if not values:
+            return
+
+        # Combine duplicates first; one upsert per key
+        turn_rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        run_rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for name, actor, value in values:
+            value = float(value)
+            key = (name, actor or "")
+            row = turn_rows.get(key)
+            if row is None:
+                turn_rows[key] = {
+                    "scenario_id": scenario_id,
+                    "metric_name": name,
+                    "actor": actor or "",
+                    "turn_num": turn_num,
+                    "count": 1,
+                    "sum": value,
+                    "sumsq": value * value,
+                    "min": value,
+                    "max": value,
+                }
+            else:
+                row["count"] += 1
+                row["sum"] += value
+                row["sumsq"] += value * value
+                row["min"] = min(row["min"], value)
+                row["max"] = max(row["max"], value)
+
+            run_row = run_rows.get(key)
+            if run_row is None:
+                run_rows[key] = {
+                    "run_id": run_id,
+                    "metric_name": name,
+                    "actor": actor or "",
+                    "final_turn": turn_num,
+                    "final_value": value,
+                    "min": value,
+                    "max": value,
+                    "count": 1,
+                }
+            else:
+                run_row["final_value"] = value
+                run_row["min"] = min(run_row["min"], value)
+                run_row["max"] = max(run_row["max"], value)
+                run_row["count"] += 1
+
+        turn_table = MetricTurnRollup.__table__
+        run_table = RunMetricRollup.__table__
+        insert = _rollup_insert(session, turn_table)
+        if insert is not None:
+            excluded = insert.excluded
+            session.execute(
+                insert.on_conflict_do_update(
+                    index_elements=["scenario_id", "metric_name", "actor", "turn_num"],
+                    set_={
+                        "count": turn_table.c["count"] + excluded["count"],
+                        "sum": turn_table.c["sum"] + excluded["sum"],
+                        "sumsq": turn_table.c["sumsq"] + excluded["sumsq"],
+                        "min": _least(turn_table.c["min"], excluded["min"]),
+                        "max": _greatest(turn_table.c["max"], excluded["max"]),
+                    },
+                ),
+                list(turn_rows.values()),
+            )
+
+            insert = _rollup_insert(session, run_table)
+            excluded = insert.excluded
+            later = excluded["final_turn"] >= run_table.c["final_turn"]
+            session.execute(
+                insert.on_conflict_do_update(
+                    index_elements=["run_id", "metric_name", "actor"],
+                    set_={
+                        "final_turn": case(
+                            (later, excluded["final_turn"]), else_=run_table.c["final_turn"]
+                        ),
+                        "final_value": case(
+                            (later, excluded["final_value"]), else_=run_table.c["final_value"]
+                        ),
+                        "min": _least(run_table.c["min"], excluded["min"]),
+                        "max": _greatest(run_table.c["max"], excluded["max"]),
+                        "count": run_table.c["count"] + excluded["count"],
+                    },
+                ),
+                list(run_rows.values()),
+            )
+            return
+
+        # Other dialects: read-modify-write within the caller's transaction
+        for key, row in turn_rows.items():
+            existing = session.get(MetricTurnRollup, (scenario_id, key[0], key[1], turn_num))
+            if existing is None:
+                session.add(MetricTurnRollup(**row))
+            else:
+                existing.count += row["count"]
+                existing.sum += row["sum"]
+                existing.sumsq += row["sumsq"]
+                existing.min = min(existing.min, row["min"])
+                existing.max = max(existing.max, row["max"])
+        for key, row in run_rows.items():
+            existing = session.get(RunMetricRollup, (run_id, key[0], key[1]))
+            if existing is None:
+                session.add(RunMetricRollup(**row))
+            else:
+                if row["final_turn"] >= existing.final_turn:
+                    existing.final_turn = row["final_turn"]
+                    existing.final_value = row["final_value"]
+                existing.min = min(existing.min, row["min"])
+                existing.max = max(existing.max, row["max"])
+                existing.count += row["count"]
+
+    def rebuild_metric_rollups(self) -> int:
+        """
+        Recompute the rollup tables from the raw metric rows
+
+        Useful for databases created before rollups existed.
+
+        Returns:
+            Number of metric values folded into the rollups
+        """
+        session = self.get_session()
+        try:
+            session.query(MetricTurnRollup).delete()
+            session.query(RunMetricRollup).delete()
+
+            rows = (
+                session.query(
+                    Run.scenario_id, Turn.run_id, Turn.turn_num,
+                    Metric.name, Metric.actor, Metric.value,
+                )
+                .join(Turn, Metric.turn_id == Turn.id)
+                .join(Run, Turn.run_id == Run.id)
+                .order_by(Turn.run_id, Turn.turn_num, Metric.id)
+            )
+
+            count = 0
+            batch: List[Tuple[str, Optional[str], float]] = []
+            current = None
+            for scenario_id, run_id, turn_num, name, actor, value in rows.yield_per(1000):
+                if (scenario_id, run_id, turn_num) != current:
+                    if batch:
+                        self.update_metric_rollups(session, *current, batch)
+                    current = (scenario_id, run_id, turn_num)
+                    batch = []
+                batch.append((name, actor, value))
+                count += 1
+            if batch:
+                self.update_metric_rollups(session, *current, batch)
+
+            session.commit()
+            return count
+        finally:
+            session.close()
+
+    def metric_turn_bands(
+        self,
+        metric_name: str,
+        scenario: str,
+        actor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-turn mean and standard deviation of a metric across runs
+
+        Read from the rollup tables, so the cost depends on the number of
+        turns rather than the number of stored metric values.
+
+        Args:
+            metric_name: Metric name
+            scenario: Scenario ID
+            actor: Only this actor's values ("" for scenario-level metrics);
+                None combines all actors
+
+        Returns:
+            One dict per turn (ascending) with turn, count, mean, stdev, min,
+            max, lower and upper (mean -/+ one stdev)
+        """
+        from sqlalchemy import func
+
+        session = self.get_session()
+        try:
+            query = session.query(
+                MetricTurnRollup.turn_num,
+                func.sum(MetricTurnRollup.count).label("count"),
+                func.sum(MetricTurnRollup.sum).label("sum"),
+                func.sum(MetricTurnRollup.sumsq).label("sumsq"),
+                func.min(MetricTurnRollup.min).label("min"),
+                func.max(MetricTurnRollup.max).label("max"),
+            ).filter(
+                MetricTurnRollup.scenario_id == scenario,
+                MetricTurnRollup.metric_name == metric_name,
+            )
+            if actor is not None:
+                query = query.filter(MetricTurnRollup.actor == actor)
+            query = query.group_by(MetricTurnRollup.turn_num).order_by(MetricTurnRollup.turn_num)
+
+            bands = []
+            for row in query.all():
+                count = int(row.count)
+                mean = row.sum / count
+                stdev = _stdev(count, row.sum, row.sumsq)
+                spread = stdev or 0.0
+                bands.append({
+                    "turn": int(row.turn_num),
+                    "count": count,
+                    "mean": mean,
+                    "stdev": stdev,
+                    "min": float(row.min),
+                    "max": float(row.max),
+                    "lower": mean - spread,
+                    "upper": mean + spread,
+                })
+            return bands
+        finally:
+            session.close()
+
+    def run_metric_summaries(
+        self,
+        metric_name: str,
+        scenario: Optional[str] = None,
+        actor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Final, minimum and maximum value of a metric for each run
+
+        Args:
+            metric_name: Metric name
+            scenario: Optional scenario filter
+            actor: Optional actor filter ("" for scenario-level metrics)
+
+        Returns:
+            One dict per run and actor with run_id, actor, final_turn,
+            final_value, min, max and count
+        """
+        session = self.get_session()
+        try:
+            query = session.query(RunMetricRollup).filter(
+                RunMetricRollup.metric_name == metric_name
+            )
+            if scenario:
+                query = query.join(Run, RunMetricRollup.run_id == Run.id).filter(
+                    Run.scenario_id == scenario
+                )
+            if actor is not None:
+                query = query.filter(RunMetricRollup.actor == actor)
+
+            return [
+                {
+                    "run_id": row.run_id,
+                    "actor": row.actor or None,
+                    "final_turn": row.final_turn,
+                    "final_value": row.final_value,
+                    "min": row.min,
+                    "max": row.max,
+                    "count": row.count,
+                }
+                for row in query.order_by(RunMetricRollup.run_id, RunMetricRollup.actor)
+            ]
+        finally:
+            session.close()
+
+    def index_search_entries(self, session: Session, entries: List[Dict[str, Any]]) -> None:
+        """
+        Add texts to the full-text search index within an open session
+
+        Called by DatabasePersistencePhase so that a turn's texts are indexed
+        in the same transaction as the turn itself.
+
+        Args:
+            session: Open session (caller commits)
+            entries: Dicts with content, run_id, turn_num, kind, actor, ref_id
+        """
+        if not self.search_enabled:
+            return
+
+        rows = [
+            {
+                "content": entry["content"],
+                "run_id": entry["run_id"],
+                "turn_num": entry["turn_num"],
+                "kind": entry["kind"],
+                "actor": entry.get("actor"),
+                "ref_id": entry.get("ref_id"),
+            }
+            for entry in entries
+            if entry.get("content")
+        ]
+        if rows:
+            session.execute(
+                text(
+                    "INSERT INTO search_index (content, run_id, turn_num, kind, actor, ref_id) "
+                    "VALUES (:content, :run_id, :turn_num, :kind, :actor, :ref_id)"
+                ),
+                rows,
+            )
+
+    def rebuild_search_index(self) -> int:
+        """
+        Rebuild the full-text search index from the stored turns
+
+        Useful for databases created before search indexing existed.
+
+        Returns:
+            Number of indexed texts
+        """
+        if not self.search_enabled:
+            return 0
+
+        session = self.get_session()
+        try:
+            session.execute(text("DELETE FROM search_index"))
+            count = 0
+            for turn in session.query(Turn).yield_per(200):
+                entries = [{
+                    "content": turn.world_state,
+                    "run_id": turn.run_id,
+                    "turn_num": turn.turn_num,
+                    "kind": "world_state",
+                }]
+                for decision in turn.decisions:
+                    entries.append({
+                        "content": "\n\n".join(filter(None, [decision.reasoning, decision.action])),
+                        "run_id": turn.run_id,
+                        "turn_num": turn.turn_num,
+                        "kind": "decision",
+                        "actor": decision.actor,
+                    })
+                for comm in turn.communications:
+                    entries.append({
+                        "content": comm.content,
+                        "run_id": turn.run_id,
+                        "turn_num": turn.turn_num,
+                        "kind": "communication",
+                        "actor": comm.sender,
+                        "ref_id": comm.id,
+                    })
+                self.index_search_entries(session, entries)
+                count += sum(1 for entry in entries if entry.get("content"))
+            session.commit()
+            return count
+        finally:
+            session.close()
+
+    def search(
+        self,
+        query: str,
+        scenario_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        kind: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Full-text search over world states, decisions and communications
+
+        Accepts FTS5 query syntax ("blockade AND oil", "naval NEAR/5 blockade",
+        "sanction*"). Input that isn't valid FTS5 syntax is searched as plain
+        terms instead.
+
+        Args:
+            query: Search query
+            scenario_id: Only runs of this scenario
+            run_id: Only this run
+            kind: Only this kind of text (world_state, decision, communication)
+            limit: Maximum results
+            offset: Results to skip
+
+        Returns:
+            Matches ordered by relevance (BM25), each with run_id, turn, kind,
+            actor, ref_id, scenario_id, rank and a highlighted snippet
+
+        Raises:
+            RuntimeError: If full-text search is not available
+        """
+        if not self.search_enabled:
+            raise RuntimeError("Full-text search is not available for this database")
+
+        sql = (
+            "SELECT s.run_id, s.turn_num, s.kind, s.actor, s.ref_id, r.scenario_id, "
+            "bm25(search_index) AS rank, "
+            "snippet(search_index, 0, '[', ']', '...', 16) AS snippet "
+            "FROM search_index AS s JOIN runs AS r ON r.id = s.run_id "
+            "WHERE search_index MATCH :query"
+        )
+        params: Dict[str, Any] = {"limit": limit, "offset": offset}
+        if scenario_id:
+            sql += " AND r.scenario_id = :scenario_id"
+            params["scenario_id"] = scenario_id
+        if run_id:
+            sql += " AND s.run_id = :run_id"
+            params["run_id"] = run_id
+        if kind:
+            sql += " AND s.kind = :kind"
+            params["kind"] = kind
+        sql += " ORDER BY rank LIMIT :limit OFFSET :offset"
+
+        session = self.get_session()
+        try:
+            try:
+                rows = session.execute(text(sql), {**params, "query": query}).all()
+            except OperationalError:
+                # Not valid FTS5 syntax: search the words as plain terms
+                session.rollback()
+                terms = " ".join(
+                    '"' + term.replace('"', '""') + '"' for term in query.split()
+                )
+                if not terms:
+                    return []
+                rows = session.execute(text(sql), {**params, "query": terms}).all()
+
+            return [
+                {
+                    "run_id": row.run_id,
+                    "scenario_id": row.scenario_id,
+                    "turn": int(row.turn_num),
+                    "kind": row.kind,
+                    "actor": row.actor,
+                    "ref_id": row.ref_id,
+                    "rank": float(row.rank),
+                    "snippet": row.snippet,
+                }
+                for row in rows
+            ]
+        finally:
+            session.close()
@@ -13,6 +13,7 @@ from typing import Optional
 
 from scenario_lab import __version__
 from scenario_lab.core.events import EventBus, Event, EventType
+from scenario_lab.utils.logging_config import setup_logging
 from scenario_lab.utils.cli_helpers import (
     print_header,
     print_info,
@@ -46,14 +47,13 @@ def cli(verbose: bool) -> None:
         # Get cost estimate
         scenario-lab estimate scenarios/ai-summit
     """
-    # Configure logging
+    # Configure logging (formatted and written on a background thread)
     # Default: INFO level with clean format (no timestamps/module names)
     # Verbose: DEBUG level with full technical details
-    level = logging.DEBUG if verbose else logging.INFO
-    format_str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s" if verbose else "%(message)s"
-    logging.basicConfig(
-        level=level,
-        format=format_str,
+    setup_logging(
+        level="DEBUG" if verbose else "INFO",
+        format_type="simple" if verbose else "message",
+        stream=sys.stderr,
     )
 
 
@@ -64,6 +64,12 @@ def cli(verbose: bool) -> None:
 @click.option("--resume", type=click.Path(exists=True, file_okay=False), help="Resume from run directory")
 @click.option("--branch-from", type=click.Path(exists=True, file_okay=False), help="Branch from run directory")
 @click.option("--branch-at-turn", type=int, help="Turn number to branch from")
+@click.option("--record", "record_path", type=click.Path(dir_okay=False), help="Record all LLM calls to a cassette file (.jsonl or .jsonl.gz)")
+@click.option("--replay", "replay_path", type=click.Path(exists=True, dir_okay=False), help="Serve LLM calls from a recorded cassette instead of the network")
+@click.option("--replay-latency", type=float, default=0.0, show_default=True, help="Replay latency as a multiple of the recorded latency (0 = instant)")
+@click.option("--trace", "trace_format", type=click.Choice(["chrome", "otlp"]), help="Export spans (scenario, turn, phase, actor, LLM call) to trace.json (Chrome/Perfetto) or trace-otlp.json (OTLP)")
+@click.option("--profile", is_flag=True, help="Sample each phase and write per-phase and merged collapsed-stack profiles (flamegraph.pl, speedscope) to the run's profile/ directory")
+@click.option("--stream", is_flag=True, help="Stream actor decisions: show progress as they are written and stop generation once the action is complete")
 def run(
     scenario_path: str,
     end_turn: Optional[int],
@@ -71,12 +77,22 @@ def run(
     resume: Optional[str],
     branch_from: Optional[str],
     branch_at_turn: Optional[int],
+    record_path: Optional[str],
+    replay_path: Optional[str],
+    replay_latency: float,
+    trace_format: Optional[str],
+    profile: bool,
+    stream: bool,
 ) -> None:
     """
     Run a scenario simulation
 
     SCENARIO_PATH: Path to scenario directory
     """
+    if record_path and replay_path:
+        print_error("Invalid options", "--record and --replay cannot be combined")
+        sys.exit(1)
+
     # Print header
     print_header(f"Scenario Lab V2 ({__version__})")
 
@@ -93,6 +109,18 @@ def run(
         if branch_at_turn is not None:
             click.echo(f"   At turn: {click.style(str(branch_at_turn), fg='blue')}")
 
+    cassette = None
+    if record_path or replay_path:
+        from scenario_lab.utils.llm_cassette import LLMCassette, set_cassette
+
+        if record_path:
+            cassette = LLMCassette(record_path, mode="record")
+            print_info("Recording LLM calls", record_path, "magenta")
+        else:
+            cassette = LLMCassette(replay_path, mode="replay", latency_scale=replay_latency)
+            print_info("Replaying LLM calls", replay_path, "magenta")
+        set_cassette(cassette)
+
     # Use V2 SyncRunner for all operations (including resume/branch)
     try:
         from scenario_lab.runners import SyncRunner
@@ -106,6 +134,9 @@ def run(
             resume_from=resume,
             branch_from=branch_from,
             branch_at_turn=branch_at_turn,
+            trace=trace_format,
+            profile=profile,
+            stream=stream,
         )
 
         print_section("Initializing scenario...")
@@ -131,7 +162,27 @@ def run(
             reason = event.data.get("reason", "unknown")
             print_warning(f"Scenario halted: {reason}")
 
+        # Section each actor is writing (streamed decisions)
+        writing: dict = {}
+
+        async def on_decision_progress(event: Event):
+            actor, section = event.data.get("actor"), event.data.get("section")
+            if section and writing.get(actor) != section:
+                writing[actor] = section
+                click.echo(click.style(f"    … {actor}: {section.title()}", dim=True))
+
+        async def on_decision_complete(event: Event):
+            writing.pop(event.data.get("actor"), None)
+            if event.data.get("ttft"):
+                click.echo(click.style(
+                    f"    {event.data['actor']}: first token after {event.data['ttft']:.2f}s",
+                    dim=True,
+                ))
+
         # Register handlers
+        if stream:
+            event_bus.on(EventType.ACTOR_DECISION_PROGRESS, on_decision_progress)
+            event_bus.on(EventType.ACTOR_DECISION_COMPLETED, on_decision_complete)
         event_bus.on(EventType.TURN_STARTED, on_turn_start)
         event_bus.on(EventType.PHASE_COMPLETED, on_phase_complete)
         event_bus.on(EventType.CREDIT_LIMIT_WARNING, on_credit_warning)
@@ -147,6 +198,17 @@ def run(
         click.echo(f"  Turns: {click.style(str(final_state.turn), fg='green')}")
         click.echo(f"  Total cost: {click.style(f'${final_state.total_cost():.2f}', fg='green')}")
         click.echo(f"  Output: {click.style(runner.output_path, fg='blue')}")
+        if runner.tracer is not None:
+            click.echo(f"  Trace: {click.style(str(len(runner.tracer.spans)), fg='blue')} spans")
+        if profile:
+            profile_dir = os.path.join(runner.output_path, "profile")
+            click.echo(f"  Profile: {click.style(profile_dir, fg='blue')}")
+        if cassette is not None:
+            stats = cassette.get_stats()
+            click.echo(
+                f"  Cassette: {stats['recorded']} recorded, {stats['replayed']} replayed, "
+                f"{stats['misses']} missed"
+            )
 
         print_success("Scenario completed successfully")
 
@@ -163,6 +225,9 @@ def run(
         if logging.getLogger().level == logging.DEBUG:
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        if cassette is not None:
+            cassette.close()
 
 
 @cli.command()
@@ -348,7 +413,8 @@ def estimate(scenario_path: str, end_turn: Optional[int]) -> None:
 
 @cli.command()
 @click.argument("run_paths", nargs=-1, required=True, type=click.Path(exists=True))
-def compare(run_paths: tuple[str, ...]) -> None:
+@click.option("--turn", type=int, default=None, help="Show each run's actions and world state at this turn (read from the run's turn history)")
+def compare(run_paths: tuple[str, ...], turn: Optional[int]) -> None:
     """
     Compare multiple scenario runs
 
@@ -359,8 +425,10 @@ def compare(run_paths: tuple[str, ...]) -> None:
     - Actor decision differences
     - Metrics comparison
     - Cost analysis
+    - First turn where the world states diverge
     """
     from pathlib import Path
+    from scenario_lab.core.turn_history import DiskTurnHistory
     from scenario_lab.utils.state_persistence import StatePersistence
 
     print_header("Run Comparison")
@@ -477,6 +545,37 @@ def compare(run_paths: tuple[str, ...]) -> None:
 
         click.echo()
 
+    # Turn histories (runs made before the history store have none)
+    histories = [DiskTurnHistory.for_run(rp) for rp in run_paths]
+    if all(len(h) for h in histories):
+        print_section("Divergence")
+        last_common = min(h.latest_turn for h in histories)
+        divergent = None
+        for t in range(last_common + 1):
+            world_states = {h.get(t).world_state if t in h else None for h in histories}
+            if len(world_states) > 1:
+                divergent = t
+                break
+        if divergent is None:
+            click.echo(f"  World states identical through turn {last_common}")
+        else:
+            click.echo(f"  World states first differ at turn {divergent}")
+        click.echo()
+
+    if turn is not None:
+        print_section(f"Turn {turn}")
+        for rp, history in zip(run_paths, histories):
+            record = history.get(turn)
+            click.echo(click.style(f"  {Path(rp).name}", bold=True))
+            if record is None:
+                click.echo("    (turn not recorded)")
+                continue
+            for actor_name, action in record.actions.items():
+                click.echo(f"    {actor_name}: {action[:200]}")
+            world = " ".join(record.world_state.split())
+            click.echo(f"    World state: {world[:300]}{'...' if len(world) > 300 else ''}")
+        click.echo()
+
     # Cost difference summary
     if len(states) == 2:
         print_section("Comparison Summary")
@@ -503,7 +602,33 @@ def compare(run_paths: tuple[str, ...]) -> None:
 @click.argument("scenario_path", type=click.Path(exists=True, file_okay=False))
 @click.option("--turns", type=int, default=3, help="Number of turns to benchmark (default: 3)")
 @click.option("--dry-run", is_flag=True, help="Show what would be benchmarked without running")
-def benchmark(scenario_path: str, turns: int, dry_run: bool) -> None:
+@click.option("--backend", type=click.Choice(["live", "mock", "replay"]), default=None, help="LLM backend: real models, the mock backend, or a recorded cassette (default: live, or replay with --replay)")
+@click.option("--mock-latency", type=float, default=0.0, help="Mean mock LLM latency in seconds (mock backend)")
+@click.option("--mock-distribution", type=click.Choice(["fixed", "uniform", "normal", "lognormal", "exponential"]), default="fixed", help="Mock LLM latency distribution")
+@click.option("--replay", "replay_path", type=click.Path(exists=True, dir_okay=False), help="Cassette to replay LLM calls from")
+@click.option("--replay-latency", type=float, default=0.0, help="Replay at this multiple of the recorded latency (default: 0 = instant)")
+@click.option("--repetitions", type=int, default=1, help="Number of measured runs (default: 1)")
+@click.option("--warmup", type=int, default=0, help="Runs executed before measuring and discarded (default: 0)")
+@click.option("--tracemalloc", "trace_memory", is_flag=True, help="Trace Python allocations (peak and per turn; slows execution)")
+@click.option("--format", "output_format", type=click.Choice(["text", "json", "csv"]), default="text", help="Output format (default: text)")
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Write JSON report, or append a CSV row, to this file")
+@click.option("--profile", is_flag=True, help="Sample each phase of the measured runs and write collapsed-stack profiles to profile/ (next to --output, else in the current directory)")
+def benchmark(
+    scenario_path: str,
+    turns: int,
+    dry_run: bool,
+    backend: Optional[str],
+    mock_latency: float,
+    mock_distribution: str,
+    replay_path: Optional[str],
+    replay_latency: float,
+    repetitions: int,
+    warmup: int,
+    trace_memory: bool,
+    output_format: str,
+    output: Optional[str],
+    profile: bool,
+) -> None:
     """
     Run performance benchmark on scenario
 
@@ -511,18 +636,42 @@ def benchmark(scenario_path: str, turns: int, dry_run: bool) -> None:
 
     Measures:
     - Startup time (scenario loading and initialization)
-    - Turn execution time (average and P95)
-    - Memory usage (initial, peak, final)
+    - Turn execution time (mean, P50, P95 over all measured runs)
+    - Time per phase (from phase events)
+    - LLM time split into queue wait, network time and retry backoff
+    - Memory (tracemalloc peak and allocations per turn with --tracemalloc)
     - Cost per turn
+
+    With --backend mock every model is answered by the mock LLM backend, and
+    with --replay calls are served from a recorded cassette, so the numbers
+    measure the engine rather than provider latency. Runs are written to
+    temporary directories.
+
+    With --profile the measured runs are sampled phase by phase; the merged
+    profile.collapsed opens in speedscope or renders with flamegraph.pl.
+
+    Examples:
+
+        scenario-lab benchmark scenarios/test-regulation-negotiation --backend mock --repetitions 5 --warmup 1
+
+        scenario-lab benchmark scenarios/x --replay run.jsonl --format csv -o benchmarks.csv
     """
-    import time
-    import statistics
-    from pathlib import Path
-    from scenario_lab.utils.memory_optimizer import get_memory_monitor, MemoryStats
+    import json
+    from scenario_lab.benchmarks.scenario import ScenarioBenchmark, write_csv
+    from scenario_lab.benchmarks.suite import format_duration
 
-    print_header("Performance Benchmark")
-    print_info("Scenario", scenario_path)
-    print_info("Turns", str(turns))
+    backend = backend or ("replay" if replay_path else "live")
+    if backend == "replay" and not replay_path:
+        print_error("The replay backend needs a cassette", tip="Pass --replay FILE")
+        sys.exit(1)
+
+    quiet = output_format != "text" and not output
+    if not quiet:
+        print_header("Performance Benchmark")
+        print_info("Scenario", scenario_path)
+        print_info("Turns", str(turns))
+        print_info("Backend", backend + (f" ({mock_latency:.3f}s {mock_distribution})" if backend == "mock" else ""))
+        print_info("Runs", f"{repetitions} measured + {warmup} warm-up")
 
     if dry_run:
         click.echo()
@@ -531,168 +680,248 @@ def benchmark(scenario_path: str, turns: int, dry_run: bool) -> None:
         click.echo("Would benchmark:")
         click.echo(f"  - Scenario: {scenario_path}")
         click.echo(f"  - Turns: {turns}")
+        click.echo(f"  - Backend: {backend}")
+        click.echo(f"  - Repetitions: {repetitions} (+{warmup} warm-up)")
         click.echo()
         click.echo("Metrics that will be measured:")
         click.echo("  - Startup time (scenario loading)")
-        click.echo("  - Turn execution time (avg, P95)")
-        click.echo("  - Memory usage (initial, peak, final)")
+        click.echo("  - Turn execution time (mean, P50, P95)")
+        click.echo("  - Time per phase")
+        click.echo("  - LLM queue wait vs network time")
+        click.echo("  - Memory (with --tracemalloc)")
         click.echo("  - Total and per-turn cost")
         return
 
-    click.echo()
+    def on_run(measurement) -> None:
+        if quiet:
+            return
+        label = "Warm-up" if measurement.warmup else "Run"
+        click.echo(
+            f"  {label} {measurement.repetition}: {measurement.turns_completed} turns in "
+            f"{click.style(f'{measurement.total:.2f}s', fg='cyan')}"
+        )
 
-    # Initialize memory monitor
-    mem_monitor = get_memory_monitor()
-    initial_stats = mem_monitor.get_memory_stats()
-    peak_memory_mb = initial_stats.process_mb if initial_stats else 0
+    try:
+        bench = ScenarioBenchmark(
+            scenario_path,
+            turns=turns,
+            repetitions=repetitions,
+            warmup=warmup,
+            backend=backend,
+            mock_latency=mock_latency,
+            mock_distribution=mock_distribution,
+            replay_path=replay_path,
+            replay_latency=replay_latency,
+            trace_memory=trace_memory,
+            profile=profile,
+        )
+        if not quiet:
+            click.echo()
+            print_section("Running benchmark...")
+        report = bench.run(progress=on_run)
+        if bench.profiler is not None:
+            profile_dir = bench.profiler.save(os.path.dirname(output) if output else ".")
+    except ImportError as e:
+        print_error(
+            "Could not load benchmark dependencies",
+            str(e),
+            "Make sure scenario_lab is installed correctly"
+        )
+        sys.exit(1)
+    except Exception as e:
+        import traceback
+        print_error("Benchmark failed", str(e))
+        if logging.getLogger().level == logging.DEBUG:
+            traceback.print_exc()
+        sys.exit(1)
 
-    # Track timing
-    turn_times: list[float] = []
+    if output_format == "csv":
+        if output:
+            write_csv(report, output)
+        else:
+            import tempfile
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "benchmark.csv")
+                write_csv(report, path)
+                click.echo(Path(path).read_text(), nl=False)
+    elif output_format == "json":
+        if output:
+            Path(output).write_text(json.dumps(report, indent=2))
+        else:
+            click.echo(json.dumps(report, indent=2))
+    elif output:
+        Path(output).write_text(json.dumps(report, indent=2))
 
-    try:
-        from scenario_lab.runners import SyncRunner
-        from scenario_lab.core.events import EventType, Event
+    if quiet:
+        return
 
-        # Measure startup time
-        print_section("Initializing...")
-        startup_start = time.time()
+    summary = report["summary"]
 
-        runner = SyncRunner(
-            scenario_path=scenario_path,
-            end_turn=turns,
-        )
-        runner.setup()
+    def stat(stats: dict, key: str = "mean") -> str:
+        return format_duration(stats[key]) if stats.get("count") else "-"
 
-        startup_time = time.time() - startup_start
-        click.echo(f"  Startup time: {click.style(f'{startup_time:.2f}s', fg='green')}")
+    click.echo()
+    print_section("Results")
 
-        # Track turn times via events
-        turn_start_time = None
+    click.echo()
+    click.echo(click.style("  Timing:", bold=True))
+    click.echo(f"    Startup time:     {click.style(stat(summary['startup']), fg='green')}")
+    click.echo(f"    Total time:       {click.style(stat(summary['total']), fg='green')}")
+    turn = summary["turn"]
+    if turn.get("count"):
+        click.echo(f"    Turn time:        mean {click.style(stat(turn), fg='cyan')}, "
+                   f"P50 {stat(turn, 'p50')}, P95 {stat(turn, 'p95')}, max {stat(turn, 'max')} "
+                   f"({turn['count']} turns)")
+
+    if summary["phases"]:
+        click.echo()
+        click.echo(click.style("  Phases (mean / P95 per turn):", bold=True))
+        for phase, stats in summary["phases"].items():
+            click.echo(f"    {phase:<20} {stat(stats):>10} / {stat(stats, 'p95'):>10}")
 
-        async def on_turn_start(event: Event):
-            nonlocal turn_start_time
-            turn_start_time = time.time()
-            turn = event.data.get("turn", 0)
-            click.echo(f"  Running turn {turn}...", nl=False)
+    llm = summary["llm"]
+    if llm["calls"]:
+        click.echo()
+        click.echo(click.style("  LLM calls (per run, summed over calls):", bold=True))
+        click.echo(f"    Calls:            {llm['calls'] // len(report['runs'])} ({llm['retries']} retries in total)")
+        click.echo(f"    Call time:        {stat(llm['wall'])}")
+        click.echo(f"    Thread wait:      {stat(llm['executor_wait'])}")
+        click.echo(f"    Limiter queue:    {stat(llm['queue_wait'])}")
+        click.echo(f"    Network:          {stat(llm['network'])}")
+        click.echo(f"    Retry backoff:    {stat(llm['backoff'])}")
 
-        async def on_turn_complete(event: Event):
-            nonlocal turn_start_time, peak_memory_mb
-            if turn_start_time:
-                turn_time = time.time() - turn_start_time
-                turn_times.append(turn_time)
-                click.echo(f" {click.style(f'{turn_time:.2f}s', fg='cyan')}")
+    click.echo()
+    click.echo(click.style("  Memory:", bold=True))
+    if "memory_peak" in summary:
+        click.echo(f"    Peak (traced):    {summary['memory_peak']['max'] / 1024 / 1024:.1f} MB")
+        click.echo(f"    Peak per turn:    {summary['turn_alloc_peak'].get('mean', 0) / 1024:.0f} KB")
+        click.echo(f"    Kept per turn:    {summary['turn_retained'].get('mean', 0) / 1024:.0f} KB")
+    else:
+        click.echo("    Run with --tracemalloc for allocation tracing")
+    if summary["turn_blocks"].get("count"):
+        click.echo(f"    Blocks per turn:  {summary['turn_blocks']['mean']:+.0f} (net)")
 
-                # Check memory after each turn
-                current_stats = mem_monitor.get_memory_stats()
-                if current_stats and current_stats.process_mb > peak_memory_mb:
-                    peak_memory_mb = current_stats.process_mb
+    click.echo()
+    click.echo(click.style("  Cost:", bold=True))
+    cost = summary["cost"].get("mean", 0.0)
+    click.echo(f"    Cost per run:     {click.style(f'${cost:.4f}', fg='green')}"
+               + (" (estimated from model pricing)" if backend == "mock" else ""))
+    turns_done = report["runs"][0]["turns_completed"] if report["runs"] else 0
+    if turns_done:
+        click.echo(f"    Cost per turn:    {click.style(f'${cost / turns_done:.4f}', fg='green')}")
 
-        # Register handlers
-        event_bus = runner.event_bus
-        event_bus.on(EventType.TURN_STARTED, on_turn_start)
-        event_bus.on(EventType.TURN_COMPLETED, on_turn_complete)
+    click.echo()
+    print_success("Benchmark complete")
+    if output:
+        click.echo(f"Report written to: {click.style(output, fg='blue')}")
+    if profile:
+        click.echo(f"Profiles written to: {click.style(str(profile_dir), fg='blue')}")
 
-        # Run benchmark
-        print_section("Running benchmark...")
-        total_start = time.time()
-        final_state = asyncio.run(runner.run())
-        total_time = time.time() - total_start
 
-        # Get final memory stats
-        final_stats = mem_monitor.get_memory_stats()
+@cli.command()
+@click.option("-k", "--filter", "patterns", multiple=True, help="Only run benchmarks matching this name, group or glob (repeatable)")
+@click.option("--scale", "scales", multiple=True, help="Only run at this scale, e.g. t10-a5 (repeatable; default: all)")
+@click.option("--repeat", type=int, default=5, help="Samples per benchmark (default: 5)")
+@click.option("--min-time", type=float, default=0.05, help="Minimum seconds per sample (default: 0.05)")
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Write the JSON report to this file")
+@click.option("--baseline", type=click.Path(exists=True, dir_okay=False), help="Compare against a previous JSON report")
+@click.option("--threshold", type=float, default=0.10, help="Slowdown flagged as a regression (default: 0.10 = 10%)")
+@click.option("--list", "list_only", is_flag=True, help="List benchmarks and scales without running")
+def bench(
+    patterns: tuple,
+    scales: tuple,
+    repeat: int,
+    min_time: float,
+    output: Optional[str],
+    baseline: Optional[str],
+    threshold: float,
+    list_only: bool,
+) -> None:
+    """
+    Run micro-benchmarks for hot paths
+
+    Times state transformations, response parsing, the response cache,
+    persistence, event dispatch and batch analysis on synthetic fixtures
+    (scales tTURNS-aACTORS). No LLM calls are made.
 
-        # Calculate statistics
-        click.echo()
-        print_section("Results")
+    Exits with status 1 if --baseline is given and any benchmark is slower
+    than the baseline by more than --threshold.
 
-        # Timing stats
-        click.echo()
-        click.echo(click.style("  Timing:", bold=True))
-        click.echo(f"    Startup time:     {click.style(f'{startup_time:.2f}s', fg='green')}")
-        click.echo(f"    Total time:       {click.style(f'{total_time:.2f}s', fg='green')}")
-
-        if turn_times:
-            avg_turn = statistics.mean(turn_times)
-            click.echo(f"    Avg turn time:    {click.style(f'{avg_turn:.2f}s', fg='cyan')}")
-
-            if len(turn_times) >= 2:
-                # Calculate P95 (or max if too few samples)
-                sorted_times = sorted(turn_times)
-                p95_index = int(len(sorted_times) * 0.95)
-                p95_time = sorted_times[min(p95_index, len(sorted_times) - 1)]
-                click.echo(f"    P95 turn time:    {click.style(f'{p95_time:.2f}s', fg='cyan')}")
-
-                min_time = min(turn_times)
-                max_time = max(turn_times)
-                click.echo(f"    Min/Max turn:     {min_time:.2f}s / {max_time:.2f}s")
-
-        # Memory stats
-        click.echo()
-        click.echo(click.style("  Memory:", bold=True))
-        if initial_stats:
-            click.echo(f"    Initial:          {click.style(f'{initial_stats.process_mb:.1f} MB', fg='blue')}")
-        if peak_memory_mb > 0:
-            click.echo(f"    Peak:             {click.style(f'{peak_memory_mb:.1f} MB', fg='yellow')}")
-        if final_stats:
-            click.echo(f"    Final:            {click.style(f'{final_stats.process_mb:.1f} MB', fg='blue')}")
-            if initial_stats:
-                memory_delta = final_stats.process_mb - initial_stats.process_mb
-                delta_color = "red" if memory_delta > 50 else "green"
-                click.echo(f"    Delta:            {click.style(f'{memory_delta:+.1f} MB', fg=delta_color)}")
-
-        # Cost stats
-        click.echo()
-        click.echo(click.style("  Cost:", bold=True))
-        total_cost = final_state.total_cost()
-        click.echo(f"    Total cost:       {click.style(f'${total_cost:.4f}', fg='green')}")
-
-        if final_state.turn > 0:
-            cost_per_turn = total_cost / final_state.turn
-            click.echo(f"    Cost per turn:    {click.style(f'${cost_per_turn:.4f}', fg='green')}")
-
-        # Cost by phase
-        phase_costs: dict[str, float] = {}
-        for cost_record in final_state.costs:
-            phase = cost_record.phase or "unknown"
-            phase_costs[phase] = phase_costs.get(phase, 0) + cost_record.cost
-
-        if phase_costs:
-            click.echo(f"    By phase:")
-            for phase, cost in sorted(phase_costs.items()):
-                click.echo(f"      {phase:<16} ${cost:.4f}")
-
-        # Summary
-        click.echo()
-        print_section("Summary")
-        efficiency = total_cost / total_time if total_time > 0 else 0
-        click.echo(f"  Turns completed: {final_state.turn}")
-        click.echo(f"  Time efficiency: ${efficiency:.4f}/second")
+    Examples:
 
-        if turn_times:
-            throughput = len(turn_times) / sum(turn_times) if sum(turn_times) > 0 else 0
-            click.echo(f"  Throughput:      {throughput:.2f} turns/second")
+        scenario-lab bench --scale t10-a5 -o bench.json
 
+        scenario-lab bench -k state -k parser --baseline bench.json
+    """
+    from scenario_lab.benchmarks import (
+        SCALES,
+        compare_reports,
+        get_benchmarks,
+        load_report,
+        run_suite,
+        save_report,
+    )
+    from scenario_lab.benchmarks.suite import format_duration
+
+    unknown = sorted(set(scales) - set(SCALES))
+    if unknown:
+        print_error("Unknown scale", ", ".join(unknown), f"Available scales: {', '.join(SCALES)}")
+        sys.exit(1)
+
+    cases = get_benchmarks(patterns or None)
+    if not cases:
+        print_error("No benchmarks match", ", ".join(patterns))
+        sys.exit(1)
+
+    if list_only:
+        print_header("Benchmarks")
+        for case in cases:
+            case_scales = ", ".join(case.scales) if case.scales else "-"
+            click.echo(f"  {case.name:<30} {case_scales}")
+            if case.description:
+                click.echo(click.style(f"      {case.description}", dim=True))
         click.echo()
-        print_success("Benchmark complete")
+        click.echo("Scales:")
+        for scale in SCALES.values():
+            click.echo(f"  {scale.name:<12} {scale.turns} turns, {scale.actors} actors")
+        return
 
-        # Output location
-        if hasattr(runner, 'output_path') and runner.output_path:
-            click.echo()
-            click.echo(f"Benchmark run saved to: {click.style(runner.output_path, fg='blue')}")
+    print_header("Benchmark Suite")
+    print_info("Benchmarks", str(len(cases)))
+    print_info("Scales", ", ".join(scales) if scales else "all")
+    click.echo()
 
-    except ImportError as e:
-        print_error(
-            "Could not load benchmark dependencies",
-            str(e),
-            "Make sure scenario_lab is installed correctly"
+    def show(result) -> None:
+        click.echo(
+            f"  {result.key:<40} {format_duration(result.median):>12}"
+            f"  ±{format_duration(result.stdev):>10}  ({result.loops} loops x {repeat})"
         )
+
+    report = run_suite(patterns or None, scales or None, repeat=repeat, min_time=min_time, progress=show)
+    click.echo()
+    print_success(f"Ran {len(report['results'])} benchmarks in {report['duration']:.1f}s")
+
+    if output:
+        save_report(report, output)
+        click.echo(f"Report saved to: {click.style(output, fg='blue')}")
+
+    if not baseline:
+        return
+
+    comparisons = compare_reports(report, load_report(baseline), threshold=threshold)
+    print_section(f"Comparison with {baseline} (threshold {threshold:.0%})")
+    colors = {"regression": "red", "improvement": "green", "new": "blue", "missing": "yellow"}
+    for comparison in comparisons:
+        change = f"{comparison.ratio - 1:+.1%}" if comparison.ratio is not None else ""
+        status = click.style(f"{comparison.status:<11}", fg=colors.get(comparison.status))
+        click.echo(f"  {status} {comparison.key:<40} {change:>8}")
+
+    regressions = [c for c in comparisons if c.status == "regression"]
+    click.echo()
+    if regressions:
+        print_error(f"{len(regressions)} benchmark(s) regressed by more than {threshold:.0%}")
         sys.exit(1)
-    except Exception as e:
-        import traceback
-        print_error("Benchmark failed", str(e))
-        if logging.getLogger().level == logging.DEBUG:
-            traceback.print_exc()
-        sys.exit(1)
+    print_success("No regressions")
 
 
 @cli.command()
@@ -760,6 +989,134 @@ def serve(host: str, port: int, reload: bool) -> None:
         sys.exit(1)
 
 
+@cli.command("mock-server")
+@click.option("--host", default="127.0.0.1", help="Host to bind to")
+@click.option("--port", default=8900, help="Port to bind to")
+@click.option("--latency", type=float, default=0.0, help="Mean response latency in seconds")
+@click.option("--distribution", type=click.Choice(["fixed", "uniform", "normal", "lognormal", "exponential"]), default="fixed", help="Latency distribution")
+@click.option("--stddev", type=float, default=0.0, help="Latency spread (uniform/normal/lognormal)")
+@click.option("--tokens", type=int, default=150, help="Approximate completion tokens per response")
+@click.option("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+@click.option("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 5xx")
+@click.option("--seed", type=int, default=0, help="Seed for responses, latencies and failures")
+def mock_server(
+    host: str,
+    port: int,
+    latency: float,
+    distribution: str,
+    stddev: float,
+    tokens: int,
+    rate_limit_rate: float,
+    error_rate: float,
+    seed: int,
+) -> None:
+    """
+    Start a local mock LLM server for load testing
+
+    Serves an OpenAI-compatible /v1/chat/completions endpoint with
+    deterministic, well-formed scenario responses. Point Ollama models at it:
+
+        OLLAMA_BASE_URL=http://127.0.0.1:8900 (models named ollama/<anything>)
+
+    For in-process load tests without HTTP, use mock/<name> models instead.
+    """
+    from scenario_lab.utils.mock_llm import MockLLMBackend, MockLLMConfig, MockLLMServer
+
+    config = MockLLMConfig(
+        latency=latency,
+        distribution=distribution,
+        stddev=stddev,
+        tokens=tokens,
+        rate_limit_rate=rate_limit_rate,
+        error_rate=error_rate,
+        seed=seed,
+    )
+    server = MockLLMServer(host, port, backend=MockLLMBackend(config))
+
+    print_header("Scenario Lab Mock LLM Server")
+    print_info("URL", server.url, "blue")
+    print_info("Latency", f"{latency:.3f}s ({distribution})")
+    if rate_limit_rate or error_rate:
+        print_info("Injected failures", f"429: {rate_limit_rate:.0%}, 5xx: {error_rate:.0%}", "yellow")
+    click.echo()
+    click.echo(f"   export OLLAMA_BASE_URL={server.url}")
+    click.echo()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        click.echo()
+        stats = server.backend.get_stats()
+        print_success(f"Served {stats['requests']} requests")
+
+
+@cli.command("generate-scenario")
+@click.argument("output_dir", type=click.Path(file_okay=False))
+@click.option("--actors", type=int, default=10, help="Number of actors (default: 10)")
+@click.option("--turns", type=int, default=20, help="Number of turns (default: 20)")
+@click.option("--metrics", type=int, default=6, help="Number of metrics (default: 6)")
+@click.option("--event-density", type=float, default=0.2, help="Approximate exogenous events per turn (default: 0.2)")
+@click.option("--model", default="mock/scale", help="Model for actors, world state and LLM metrics (default: mock/scale)")
+@click.option("--seed", type=int, default=0, help="Random seed (default: 0)")
+@click.option("--force", is_flag=True, help="Replace OUTPUT_DIR if it exists")
+def generate_scenario(
+    output_dir: str,
+    actors: int,
+    turns: int,
+    metrics: int,
+    event_density: float,
+    model: str,
+    seed: int,
+    force: bool,
+) -> None:
+    """
+    Generate a synthetic scenario for scale testing
+
+    OUTPUT_DIR: Directory to write the scenario to
+
+    Writes scenario.yaml, one actor file per actor, metrics.yaml and
+    exogenous events. Actors use the mock LLM backend by default, so the
+    scenario runs without API keys and costs nothing.
+
+    Examples:
+
+        scenario-lab generate-scenario /tmp/large --actors 100 --turns 500
+
+        scenario-lab benchmark /tmp/large --turns 20 --tracemalloc
+    """
+    from scenario_lab.benchmarks.generator import generate_scenario as generate
+
+    try:
+        generated = generate(
+            output_dir,
+            actors=actors,
+            turns=turns,
+            metrics=metrics,
+            event_density=event_density,
+            model=model,
+            seed=seed,
+            overwrite=force,
+        )
+    except FileExistsError as e:
+        print_error(str(e), tip="Use --force to replace it")
+        sys.exit(1)
+    except ValueError as e:
+        print_error("Invalid generator settings", str(e))
+        sys.exit(1)
+
+    print_success(f"Scenario written to {generated.path}")
+    print_info("Actors", str(generated.actors))
+    print_info("Turns", str(generated.turns))
+    print_info("Metrics", str(generated.metrics))
+    print_info(
+        "Exogenous events",
+        f"{generated.total_events} ("
+        + ", ".join(f"{count} {kind}" for kind, count in generated.events.items() if count)
+        + ")"
+    )
+    print_info("Model", model)
+
+
 @cli.command()
 @click.argument("output_dir", type=click.Path(), required=False)
 def create(output_dir: Optional[str]) -> None:
@@ -17,6 +17,7 @@ from scenario_lab.models.state import ScenarioState, ScenarioStatus
 from scenario_lab.loaders import ScenarioLoader
 from scenario_lab.runners.sync_runner import SyncRunner
 from scenario_lab.utils.logging_config import setup_logging, set_context, clear_context
+from scenario_lab.utils.response_cache import use_run_cache
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ class AsyncExecutor:
         credit_limit: Optional[float] = None,
         json_mode: bool = False,
         log_level: str = "INFO",
+        profile: bool = False,
     ):
         """
         Initialize async executor
@@ -52,12 +54,14 @@ class AsyncExecutor:
             credit_limit: Maximum cost in USD
             json_mode: Whether to use JSON response format for actors
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            profile: Sample each phase and write profiles to the run's profile/ directory
         """
         self.scenario_path = scenario_path
         self.output_path = output_path
         self.end_turn = end_turn
         self.credit_limit = credit_limit
         self.json_mode = json_mode
+        self.profile = profile
 
         # Setup structured logging
         setup_logging(level=log_level, format_type="colored")
@@ -87,6 +91,7 @@ class AsyncExecutor:
             end_turn=self.end_turn,
             credit_limit=self.credit_limit,
             json_mode=self.json_mode,
+            profile=self.profile,
         )
 
         # Setup the runner (initializes all components)
@@ -177,8 +182,12 @@ class AsyncExecutor:
         )
 
         try:
-            # Execute scenario
-            final_state = await self.orchestrator.execute(self.initial_state)
+            # Execute scenario with the run-scoped cache bound to this context
+            with use_run_cache(self.sync_runner.response_cache if self.sync_runner else None):
+                final_state = await self.orchestrator.execute(self.initial_state)
+
+            if self.sync_runner:
+                self.sync_runner.save_profile()
 
             return final_state
 
@@ -301,6 +310,7 @@ async def run_scenario_async(
     end_turn: Optional[int] = None,
     credit_limit: Optional[float] = None,
     json_mode: bool = False,
+    profile: bool = False,
 ) -> ScenarioState:
     """
     Convenience function to run a scenario asynchronously
@@ -311,6 +321,7 @@ async def run_scenario_async(
         end_turn: Number of turns to execute
         credit_limit: Maximum cost in USD
         json_mode: Whether to use JSON response format
+        profile: Write per-phase profiles to the run's profile/ directory
 
     Returns:
         Final scenario state
@@ -321,6 +332,7 @@ async def run_scenario_async(
         end_turn=end_turn,
         credit_limit=credit_limit,
         json_mode=json_mode,
+        profile=profile,
     )
 
     await executor.setup()
@@ -13,17 +13,22 @@ from typing import Optional
 from scenario_lab.loaders import ScenarioLoader, load_metrics_config, load_validation_config
 from scenario_lab.loaders.exogenous_events_loader import load_exogenous_events
 from scenario_lab.core.orchestrator import ScenarioOrchestrator, PhaseType
-from scenario_lab.core.events import EventBus
+from scenario_lab.core.events import Event, EventBus, EventType
 from scenario_lab.core.metrics_tracker_v2 import MetricsTrackerV2
 from scenario_lab.core.qa_validator_v2 import QAValidatorV2
+from scenario_lab.core.turn_history import DiskTurnHistory
 from scenario_lab.services.communication_phase import CommunicationPhase
 from scenario_lab.services.decision_phase_v2 import DecisionPhaseV2
 from scenario_lab.services.world_update_phase_v2 import WorldUpdatePhaseV2
 from scenario_lab.services.persistence_phase import PersistencePhase
 from scenario_lab.services.database_persistence_phase import DatabasePersistencePhase
 from scenario_lab.services.exogenous_events_manager import ExogenousEventManager
-from scenario_lab.models.state import ScenarioState
+from scenario_lab.models.state import ScenarioState, WorldState
 from scenario_lab.utils.state_persistence import StatePersistence
+from scenario_lab.utils.latency_histogram import LatencyRecorder, use_latency_recorder
+from scenario_lab.utils.response_cache import ResponseCache, create_run_cache, use_run_cache
+from scenario_lab.utils.profiler import PhaseProfiler
+from scenario_lab.utils.tracing import TRACE_FILES, TRACE_FORMATS, Tracer, use_tracer
 
 try:
     from scenario_lab.database import Database
@@ -57,6 +62,9 @@ class SyncRunner:
         branch_from: Optional[str] = None,
         branch_at_turn: Optional[int] = None,
         json_mode: bool = False,
+        trace: Optional[str] = None,
+        profile: bool = False,
+        stream: bool = False,
     ):
         """
         Initialize sync runner
@@ -71,7 +79,16 @@ class SyncRunner:
             branch_from: Path to run directory to branch from
             branch_at_turn: Turn number to branch at (required with branch_from)
             json_mode: Whether to use JSON response format for actors (default: False)
+            trace: Record tracing spans and export them with the run, in
+                "chrome" (trace.json) or "otlp" (trace-otlp.json) format
+            profile: Sample each phase with PhaseProfiler and write the
+                profiles to the run's profile/ directory
+            stream: Stream actor decisions, emitting ACTOR_DECISION_PROGRESS
+                events and stopping generation once an action is complete
         """
+        if trace is not None and trace not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {trace} (expected one of {TRACE_FORMATS})")
+
         self.scenario_path = scenario_path
         self.output_path = output_path or self._default_output_path()
         self.end_turn = end_turn
@@ -81,6 +98,7 @@ class SyncRunner:
         self.branch_from = branch_from
         self.branch_at_turn = branch_at_turn
         self.json_mode = json_mode
+        self.stream = stream
 
         # Will be initialized in setup()
         self.loader: Optional[ScenarioLoader] = None
@@ -95,6 +113,23 @@ class SyncRunner:
         self.qa_validator: Optional[QAValidatorV2] = None
         self.exogenous_event_manager: Optional[ExogenousEventManager] = None
 
+        # Turn history of this run, stored in <output>/history/
+        self.history: Optional[DiskTurnHistory] = None
+
+        # Run-scoped response cache (bound to the execution context in run())
+        self.response_cache: Optional[ResponseCache] = None
+
+        # Latency histograms for LLM calls, phases and turns of this run
+        self.latency = LatencyRecorder()
+
+        # Spans of this run (scenario -> turn -> phase -> actor -> LLM call)
+        self.trace_format = trace
+        self.tracer: Optional[Tracer] = Tracer() if trace else None
+
+        # Per-phase sampling profiler (replace before setup() to share one across runs)
+        self.profile = profile
+        self.profiler: Optional[PhaseProfiler] = PhaseProfiler() if profile else None
+
     def _default_output_path(self) -> str:
         """
         Generate default output path with auto-incrementing run number
@@ -133,21 +168,27 @@ class SyncRunner:
         # Create output directory
         os.makedirs(self.output_path, exist_ok=True)
 
-        # Set run-scoped cache: Use output_path as unique run identifier
+        # Create run-scoped cache: Use output_path as unique run identifier
         # This ensures each run gets its own cache directory, preventing
-        # different runs from sharing cached responses (which would give identical results)
+        # different runs from sharing cached responses (which would give identical results).
+        # The cache is bound per execution context rather than via process globals,
+        # so concurrent runs in one process don't overwrite each other's cache scope.
         run_id = self.output_path.replace('/', '_').replace('\\', '_')
-        os.environ['SCENARIO_RUN_ID'] = run_id
-        logger.debug(f"Set SCENARIO_RUN_ID={run_id} for run-scoped cache")
-
-        # Reset global cache to pick up new run_id
-        from scenario_lab.utils.response_cache import reset_global_cache
-        reset_global_cache()
+        self.response_cache = create_run_cache(run_id)
+        logger.debug(f"Created run-scoped cache for {run_id}")
 
         # Load scenario configuration
         self.loader = ScenarioLoader(self.scenario_path, json_mode=self.json_mode)
         self.initial_state, self.actors, self.scenario_config = self.loader.load()
 
+        self.history = DiskTurnHistory.for_run(self.output_path, recover=True)
+        resuming_in_place = self.resume_from and (
+            Path(self.resume_from).resolve() == Path(self.output_path).resolve()
+        )
+        if not resuming_in_place:
+            # Left over from an earlier run in this directory
+            self.history.clear()
+
         # Handle resume/branch modes
         if self.resume_from:
             logger.info(f"Resuming from {self.resume_from}")
@@ -169,6 +210,8 @@ class SyncRunner:
 
         # Event bus
         self.event_bus = EventBus(keep_history=True)
+        self.event_bus.on(EventType.PHASE_COMPLETED, self._record_phase_latency)
+        self.event_bus.on(EventType.TURN_COMPLETED, self._record_turn_latency)
 
         # Exogenous event manager (if exogenous-events.yaml exists)
         # Load before orchestrator since orchestrator needs it
@@ -181,11 +224,16 @@ class SyncRunner:
         # Orchestrator
         self.orchestrator = ScenarioOrchestrator(
             event_bus=self.event_bus,
-            end_turn=self.end_turn or self.scenario_config.get("num_turns", 10),
+            end_turn=(
+                self.end_turn
+                or self.scenario_config.get("num_turns")
+                or self.scenario_config.get("turns", 10)
+            ),
             credit_limit=self.credit_limit,
             output_dir=self.output_path,
             save_state_every_turn=True,
             exogenous_event_manager=self.exogenous_event_manager,
+            profiler=self.profiler,
         )
 
         # Metrics tracker V2 (if metrics.yaml exists)
@@ -238,6 +286,10 @@ class SyncRunner:
                 "decision_style": actor.decision_style,
             }
 
+        world_state_model = self.scenario_config.get(
+            "world_state_model", "openai/gpt-4o-mini"
+        )
+
         decision_phase = DecisionPhaseV2(
             actor_configs=actor_configs,
             scenario_system_prompt=self.scenario_config.get("system_prompt", ""),
@@ -245,13 +297,17 @@ class SyncRunner:
             json_mode=self.json_mode,
             context_window_size=self.scenario_config.get("context_window", 3),
             metrics_tracker=self.metrics_tracker,
+            summarization_model=(
+                self.scenario_config.get("context_summary_model") or world_state_model
+            ),
+            history=self.history,
+            event_bus=self.event_bus,
+            stream=self.stream,
+            max_decision_chars=self.scenario_config.get("max_decision_chars"),
         )
         self.orchestrator.register_phase(PhaseType.DECISION, decision_phase)
 
         # World update phase (V2)
-        world_state_model = self.scenario_config.get(
-            "world_state_model", "openai/gpt-4o-mini"
-        )
         world_update_phase = WorldUpdatePhaseV2(
             scenario_name=self.scenario_config["name"],
             world_state_model=world_state_model,
@@ -262,7 +318,7 @@ class SyncRunner:
         self.orchestrator.register_phase(PhaseType.WORLD_UPDATE, world_update_phase)
 
         # File persistence phase (always enabled)
-        persistence_phase = PersistencePhase(output_dir=self.output_path)
+        persistence_phase = PersistencePhase(output_dir=self.output_path, history=self.history)
         self.orchestrator.register_phase(PhaseType.PERSISTENCE, persistence_phase)
 
         # Database persistence phase (optional)
@@ -285,8 +341,15 @@ class SyncRunner:
         if not self.orchestrator:
             self.setup()
 
-        # Execute scenario
-        final_state = await self.orchestrator.execute(self.initial_state)
+        # Execute scenario with this run's cache, latency recorder and tracer
+        # bound to the execution context
+        with use_run_cache(self.response_cache), use_latency_recorder(self.latency):
+            with use_tracer(self.tracer):
+                final_state = await self.orchestrator.execute(self.initial_state)
+
+        self._save_latency()
+        self._save_trace()
+        self.save_profile()
 
         logger.info(
             f"Scenario execution complete: {final_state.turn} turns, "
@@ -295,6 +358,47 @@ class SyncRunner:
 
         return final_state
 
+    async def _record_phase_latency(self, event: Event) -> None:
+        """Record a completed phase's duration"""
+        self.latency.record("phase", event.data["duration"], phase=event.data["phase"])
+
+    async def _record_turn_latency(self, event: Event) -> None:
+        """Record a completed turn's duration"""
+        self.latency.record("turn", event.data["duration"])
+
+    def _save_latency(self) -> None:
+        """Export the run's latency histograms next to its other outputs"""
+        output_dir = Path(self.output_path)
+        if not output_dir.exists():
+            return
+        try:
+            self.latency.save(str(output_dir / "latency-histograms.json"))
+        except OSError as e:
+            logger.warning(f"Could not save latency histograms: {e}")
+
+    def _save_trace(self) -> None:
+        """Export the run's spans next to its other outputs"""
+        output_dir = Path(self.output_path)
+        if self.tracer is None or not output_dir.exists():
+            return
+        path = output_dir / TRACE_FILES[self.trace_format]
+        try:
+            self.tracer.save(str(path), self.trace_format)
+            logger.info(f"Trace written to {path}")
+        except OSError as e:
+            logger.warning(f"Could not save trace: {e}")
+
+    def save_profile(self) -> None:
+        """Write the run's phase profiles to its profile/ directory (when profiling)"""
+        output_dir = Path(self.output_path)
+        if not self.profile or self.profiler is None or not output_dir.exists():
+            return
+        try:
+            profile_dir = self.profiler.save(str(output_dir))
+            logger.info(f"Phase profiles written to {profile_dir}")
+        except OSError as e:
+            logger.warning(f"Could not save profile: {e}")
+
     def _load_resume_state(self) -> None:
         """Load state for resuming from a previous run"""
         state_file = Path(self.resume_from) / "scenario-state-v2.json"
@@ -309,6 +413,7 @@ class SyncRunner:
 
         # Override initial state
         self.initial_state = loaded_state
+        self._copy_history(self.resume_from, loaded_state.turn)
         logger.info(f"Loaded resume state from turn {loaded_state.turn}")
 
     def _load_branch_state(self) -> None:
@@ -330,8 +435,31 @@ class SyncRunner:
             new_output_dir=self.output_path,
         )
 
+        # The state file holds the source run's final world state; the history
+        # has the world state at the branch point
+        self._copy_history(self.branch_from, self.branch_at_turn)
+        record = self.history.get(self.branch_at_turn)
+        if record is not None:
+            branched_state = branched_state.with_world_state(
+                WorldState(turn=self.branch_at_turn, content=record.world_state)
+            )
+
         # Override initial state
         self.initial_state = branched_state
         logger.info(
             f"Created branch from {self.branch_from} at turn {self.branch_at_turn}"
         )
+
+    def _copy_history(self, source_dir: str, up_to_turn: int) -> None:
+        """
+        Copy turns 0..up_to_turn of another run's turn history into this run's
+
+        Args:
+            source_dir: Run directory to copy from
+            up_to_turn: Last turn to copy
+        """
+        if Path(source_dir).resolve() == Path(self.output_path).resolve():
+            return
+        source = DiskTurnHistory.for_run(source_dir)
+        copied = sum(1 for record in source.range(0, up_to_turn) if self.history.record(record))
+        logger.debug("Copied %d turns of history from %s", copied, source_dir)
@@ -193,6 +193,7 @@ class MetricsConfig(BaseModel):
               keywords: ["agreement", "deal", "success"]
 
         export_format: json
+        batch_llm_extraction: true
     """
 
     metrics: List[MetricConfig] = Field(
@@ -216,6 +217,11 @@ class MetricsConfig(BaseModel):
         description="Path for metric exports (default: run directory)",
     )
 
+    batch_llm_extraction: Optional[bool] = Field(
+        default=True,
+        description="Extract all LLM metrics for a text in one structured call per model",
+    )
+
     @field_validator('metrics')
     @classmethod
     def validate_unique_names(cls, v: List[MetricConfig]) -> List[MetricConfig]:
@@ -151,6 +151,18 @@ class ScenarioConfig(BaseModel):
         gt=0,
     )
 
+    context_summary_model: Optional[str] = Field(
+        default=None,
+        description="LLM model for summarizing turns older than the context window "
+        "(defaults to world_state_model)",
+    )
+
+    max_decision_chars: Optional[int] = Field(
+        default=None,
+        description="Stop streamed actor decisions after this many characters",
+        gt=0,
+    )
+
     # Communication settings
     enable_bilateral_communication: Optional[bool] = Field(
         default=False,
@@ -4,6 +4,7 @@ Database Persistence Phase Service for Scenario Lab V2
 Persists scenario data to SQLite database for analytics while maintaining markdown files.
 """
 from __future__ import annotations
+import asyncio
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -35,8 +36,9 @@ class DatabasePersistencePhase:
     This phase:
     1. Persists run metadata to database
     2. Persists turn data (world state, decisions, communications)
-    3. Persists metrics and costs
-    4. Complements (not replaces) markdown file persistence
+    3. Persists metrics and costs, and updates the metric rollups
+    4. Adds the turn's texts to the full-text search index
+    5. Complements (not replaces) markdown file persistence
     """
 
     def __init__(self, database=None):
@@ -69,6 +71,17 @@ class DatabasePersistencePhase:
 
         logger.info(f"Executing database persistence for turn {state.turn}")
 
+        # SQLAlchemy sessions are blocking; keep them off the event loop
+        await asyncio.to_thread(self._persist, state)
+        return state
+
+    def _persist(self, state: ScenarioState) -> None:
+        """
+        Write the turn's data in one transaction
+
+        Args:
+            state: Current immutable scenario state
+        """
         session = self.database.get_session()
         try:
             # Get or create run
@@ -103,6 +116,14 @@ class DatabasePersistencePhase:
             session.flush()  # Get turn.id
             logger.debug(f"Created turn record: {turn.turn_num}")
 
+            # Texts for the full-text search index
+            search_entries = [{
+                "content": state.world_state.content,
+                "run_id": state.run_id,
+                "turn_num": state.turn,
+                "kind": "world_state",
+            }]
+
             # Persist decisions
             for actor_name, decision in state.decisions.items():
                 db_decision = DBDecision(
@@ -114,6 +135,13 @@ class DatabasePersistencePhase:
                     timestamp=datetime.now(),
                 )
                 session.add(db_decision)
+                search_entries.append({
+                    "content": "\n\n".join(filter(None, [decision.reasoning, decision.action])),
+                    "run_id": state.run_id,
+                    "turn_num": state.turn,
+                    "kind": "decision",
+                    "actor": actor_name,
+                })
             logger.debug(f"Persisted {len(state.decisions)} decisions")
 
             # Persist communications for this turn
@@ -131,8 +159,20 @@ class DatabasePersistencePhase:
                     timestamp=comm.timestamp,
                 )
                 session.add(db_comm)
+                search_entries.append({
+                    "content": comm.content,
+                    "run_id": state.run_id,
+                    "turn_num": state.turn,
+                    "kind": "communication",
+                    "actor": comm.sender,
+                    "ref_id": comm.id,
+                })
             logger.debug(f"Persisted {len(turn_communications)} communications")
 
+            # Index this turn's texts in the same transaction
+            if getattr(self.database, "search_enabled", False):
+                self.database.index_search_entries(session, search_entries)
+
             # Persist metrics for this turn
             turn_metrics = [m for m in state.metrics if m.turn == state.turn]
             for metric in turn_metrics:
@@ -146,6 +186,15 @@ class DatabasePersistencePhase:
                 session.add(db_metric)
             logger.debug(f"Persisted {len(turn_metrics)} metrics")
 
+            # Fold this turn's metrics into the dashboard rollups
+            self.database.update_metric_rollups(
+                session,
+                state.scenario_id,
+                state.run_id,
+                state.turn,
+                [(m.name, m.actor, m.value) for m in turn_metrics],
+            )
+
             # Persist costs - only new ones not yet persisted
             for cost in state.costs:
                 if not cost.actor:
@@ -181,5 +230,3 @@ class DatabasePersistencePhase:
 
         finally:
             session.close()
-
-        return state
@@ -12,21 +12,36 @@ Phase 2.2 Updates:
 - ✅ Uses V2 CommunicationManager for communication context (Phase 2.2)
 - ⏳ Defers metrics extraction to Phase 3.3 (stub)
 - ⏳ Defers QA validation to Phase 3.4 (stub)
+
+With an event bus, each actor's decision emits ACTOR_DECISION_STARTED and
+ACTOR_DECISION_COMPLETED (or ACTOR_DECISION_FAILED). With streaming enabled,
+responses are streamed and ACTOR_DECISION_PROGRESS events carry the text as
+it arrives; in markdown mode generation stops once the action is complete.
 """
 from __future__ import annotations
+import asyncio
 import os
 import logging
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
+from scenario_lab.core.events import EventBus, EventType
 from scenario_lab.models.state import ScenarioState, Decision, CostRecord
 from scenario_lab.utils.api_client import make_llm_call_async, LLMResponse
-from scenario_lab.core.prompt_builder import build_decision_prompt, build_messages_for_llm
+from scenario_lab.utils.llm_streaming import LLMStream
+from scenario_lab.core.prompt_builder import (
+    build_decision_instructions,
+    build_decision_prompt,
+    build_messages_for_llm,
+)
 from scenario_lab.utils.response_parser import parse_decision
 from scenario_lab.utils.model_pricing import calculate_cost
 from scenario_lab.core.context_manager import ContextManagerV2
+from scenario_lab.core.turn_history import TurnHistory
 from scenario_lab.core.communication_manager import format_communications_for_context
+from scenario_lab.utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +68,11 @@ class DecisionPhaseV2:
         json_mode: bool = False,
         context_window_size: int = 3,
         metrics_tracker: Optional[Any] = None,  # MetricsTracker from Phase 3.3
+        summarization_model: str = "openai/gpt-4o-mini",
+        history: Optional[TurnHistory] = None,
+        event_bus: Optional[EventBus] = None,
+        stream: bool = False,
+        max_decision_chars: Optional[int] = None,
     ):
         """
         Initialize decision phase
@@ -64,6 +84,12 @@ class DecisionPhaseV2:
             json_mode: Whether to use JSON response format (default: False)
             metrics_tracker: Optional MetricsTracker for metrics extraction
             context_window_size: Number of recent turns to keep in full detail (default: 3)
+            summarization_model: Model that summarizes turns older than the context window
+            history: Turn history of the run for context windowing (in-memory if None)
+            event_bus: Optional event bus for per-actor decision events
+            stream: Stream responses, emitting progress events and (in markdown
+                mode) stopping generation once the action is complete
+            max_decision_chars: Stop streamed responses after this many characters
         """
         self.actor_configs = actor_configs
         self.scenario_system_prompt = scenario_system_prompt
@@ -71,12 +97,16 @@ class DecisionPhaseV2:
         self.json_mode = json_mode
         self.api_key = os.environ.get('OPENROUTER_API_KEY')
         self.metrics_tracker = metrics_tracker  # Phase 3.3
+        self.event_bus = event_bus
+        self.stream = stream
+        self.max_decision_chars = max_decision_chars
 
         # Create context manager for windowing
         self.context_manager = ContextManagerV2(
             window_size=context_window_size,
-            summarization_model="openai/gpt-4o-mini",
-            api_key=self.api_key
+            summarization_model=summarization_model,
+            api_key=self.api_key,
+            history=history,
         )
 
     async def execute(self, state: ScenarioState) -> ScenarioState:
@@ -97,110 +127,144 @@ class DecisionPhaseV2:
         # For each actor, make decision
         for actor_short_name, actor_config in self.actor_configs.items():
             actor_name = actor_config['name']
-            logger.debug(f"Getting decision from {actor_name}")
+            with span("actor", actor=actor_name, turn=state.turn):
+                logger.debug("Getting decision from %s", actor_name)
+
+                # Phase 2.1: Get contextualized world state for this actor
+                current_world_state, summary_responses = (
+                    await self.context_manager.get_context_for_actor(
+                        actor_name=actor_name,
+                        state=state
+                    )
+                )
+                for summary_response in summary_responses:
+                    state = state.with_cost(self._summary_cost(summary_response))
 
-            # Phase 2.1: Get contextualized world state for this actor
-            current_world_state = await self.context_manager.get_context_for_actor(
-                actor_name=actor_name,
-                state=state
-            )
+                # Extract recent goals from previous decisions
+                recent_goals = self._extract_recent_goals(state, actor_name)
 
-            # Extract recent goals from previous decisions
-            recent_goals = self._extract_recent_goals(state, actor_name)
+                # Phase 2.2: Get communication context for this actor
+                communications_context = format_communications_for_context(
+                    state=state,
+                    actor_name=actor_name,
+                    turn=state.turn
+                )
 
-            # Phase 2.2: Get communication context for this actor
-            communications_context = format_communications_for_context(
-                state=state,
-                actor_name=actor_name,
-                turn=state.turn
-            )
+                # Build prompts
+                system_prompt, user_prompt = build_decision_prompt(
+                    world_state=current_world_state,
+                    turn=state.turn,
+                    total_turns=total_turns,
+                    actor_name=actor_name,
+                    scenario_system_prompt=self.scenario_system_prompt,
+                    actor_system_prompt=actor_config.get('system_prompt'),
+                    recent_goals=recent_goals,
+                    json_mode=self.json_mode,
+                    communications_context=communications_context,  # Phase 2.2: Now included
+                    # Phase 2+: Deferred to later phases
+                    other_actors_decisions=None,  # Future: Actor interactions/simultaneous reveal
+                )
 
-            # Build prompts
-            system_prompt, user_prompt = build_decision_prompt(
-                world_state=current_world_state,
-                turn=state.turn,
-                total_turns=total_turns,
-                actor_name=actor_name,
-                scenario_system_prompt=self.scenario_system_prompt,
-                actor_system_prompt=actor_config.get('system_prompt'),
-                recent_goals=recent_goals,
-                json_mode=self.json_mode,
-                communications_context=communications_context,  # Phase 2.2: Now included
-                # Phase 2+: Deferred to later phases
-                other_actors_decisions=None,  # Future: Actor interactions/simultaneous reveal
-            )
+                # Build messages for LLM
+                messages = build_messages_for_llm(
+                    system_prompt,
+                    user_prompt,
+                    cacheable_prefix=build_decision_instructions(self.json_mode),
+                )
+
+                # Make LLM call
+                event_data = {"actor": actor_name, "turn": state.turn}
+                progress: List[Future] = []
+                stream = self._create_stream(event_data, progress) if self.stream else None
+                await self._emit(EventType.ACTOR_DECISION_STARTED, event_data)
+                try:
+                    llm_response: LLMResponse = await make_llm_call_async(
+                        model=actor_config['llm_model'],
+                        messages=messages,
+                        api_key=self.api_key,
+                        max_retries=3,
+                        context={'actor': actor_name, 'turn': state.turn, 'phase': 'decision'},
+                        stream=stream,
+                    )
+                except Exception as e:
+                    logger.error(f"LLM call failed for {actor_name}: {e}")
+                    await self._wait_for_progress(progress)
+                    await self._emit(
+                        EventType.ACTOR_DECISION_FAILED, {**event_data, "error": str(e)}
+                    )
+                    raise
+                # Progress events go out before the decision is reported complete
+                await self._wait_for_progress(progress)
+
+                # Parse response
+                try:
+                    parsed = parse_decision(llm_response.content, json_mode=self.json_mode)
+                except Exception as e:
+                    logger.error(f"Response parsing failed for {actor_name}: {e}")
+                    # Create empty decision on parse failure
+                    parsed = {'goals': '', 'reasoning': '', 'action': ''}
+
+                # Create V2 Decision
+                decision = Decision(
+                    actor=actor_name,
+                    turn=state.turn,
+                    goals=parsed.get('goals', '').split('\n') if parsed.get('goals') else [],
+                    reasoning=parsed.get('reasoning', ''),
+                    action=parsed.get('action', ''),
+                )
 
-            # Build messages for LLM
-            messages = build_messages_for_llm(system_prompt, user_prompt)
+                # Add decision to state
+                state = state.with_decision(actor_name, decision)
 
-            # Make LLM call
-            try:
-                llm_response: LLMResponse = await make_llm_call_async(
+                # Track costs
+                cost_amount = calculate_cost(
                     model=actor_config['llm_model'],
-                    messages=messages,
-                    api_key=self.api_key,
-                    max_retries=3,
-                    context={'actor': actor_name, 'turn': state.turn, 'phase': 'decision'}
+                    input_tokens=llm_response.input_tokens,
+                    output_tokens=llm_response.output_tokens,
+                    cached_input_tokens=llm_response.cached_input_tokens,
                 )
-            except Exception as e:
-                logger.error(f"LLM call failed for {actor_name}: {e}")
-                raise
-
-            # Parse response
-            try:
-                parsed = parse_decision(llm_response.content, json_mode=self.json_mode)
-            except Exception as e:
-                logger.error(f"Response parsing failed for {actor_name}: {e}")
-                # Create empty decision on parse failure
-                parsed = {'goals': '', 'reasoning': '', 'action': ''}
-
-            # Create V2 Decision
-            decision = Decision(
-                actor=actor_name,
-                turn=state.turn,
-                goals=parsed.get('goals', '').split('\n') if parsed.get('goals') else [],
-                reasoning=parsed.get('reasoning', ''),
-                action=parsed.get('action', ''),
-            )
-
-            # Add decision to state
-            state = state.with_decision(actor_name, decision)
 
-            # Track costs
-            cost_amount = calculate_cost(
-                model=actor_config['llm_model'],
-                input_tokens=llm_response.input_tokens,
-                output_tokens=llm_response.output_tokens
-            )
+                cost_record = CostRecord(
+                    timestamp=datetime.now(),
+                    actor=actor_name,
+                    phase="decision",
+                    model=actor_config['llm_model'],
+                    input_tokens=llm_response.input_tokens,
+                    output_tokens=llm_response.output_tokens,
+                    cost=cost_amount,
+                    metadata={"cached_input_tokens": llm_response.cached_input_tokens},
+                )
+                state = state.with_cost(cost_record)
+
+                await self._emit(
+                    EventType.ACTOR_DECISION_COMPLETED,
+                    {
+                        **event_data,
+                        "action": decision.action,
+                        "tokens": llm_response.tokens_used,
+                        "cost": cost_amount,
+                        "ttft": llm_response.timing.ttft if llm_response.timing else 0.0,
+                        "stopped_early": stream.stop_reason if stream else None,
+                    },
+                )
 
-            cost_record = CostRecord(
-                timestamp=datetime.now(),
-                actor=actor_name,
-                phase="decision",
-                model=actor_config['llm_model'],
-                input_tokens=llm_response.input_tokens,
-                output_tokens=llm_response.output_tokens,
-                cost=cost_amount,
-            )
-            state = state.with_cost(cost_record)
-
-            # Show actor name and preview of decision
-            action_preview = decision.action[:20].replace('\n', ' ') if decision.action else ""
-            if len(decision.action) > 20:
-                action_preview += "..."
-
-            # Write decision to markdown file and get path for link
-            if self.output_dir:
-                filepath = self._write_decision_file(actor_short_name, actor_name, state.turn, parsed)
-                # Create terminal hyperlink on the preview text (OSC 8 format)
-                linked_preview = f"\033]8;;file://{filepath}\033\\\"{action_preview}\"\033]8;;\033\\"
-            else:
-                linked_preview = f"\"{action_preview}\""
-
-            logger.info(
-                f"  ✓ {actor_name}: {linked_preview} "
-                f"({llm_response.tokens_used:,} tokens, ${cost_amount:.4f})"
-            )
+                # Show actor name and preview of decision
+                action_preview = decision.action[:20].replace('\n', ' ') if decision.action else ""
+                if len(decision.action) > 20:
+                    action_preview += "..."
+
+                # Write decision to markdown file and get path for link
+                if self.output_dir:
+                    filepath = self._write_decision_file(actor_short_name, actor_name, state.turn, parsed)
+                    # Create terminal hyperlink on the preview text (OSC 8 format)
+                    linked_preview = f"\033]8;;file://{filepath}\033\\\"{action_preview}\"\033]8;;\033\\"
+                else:
+                    linked_preview = f"\"{action_preview}\""
+
+                logger.info(
+                    f"  ✓ {actor_name}: {linked_preview} "
+                    f"({llm_response.tokens_used:,} tokens, ${cost_amount:.4f})"
+                )
 
         # Phase 3.3: Extract metrics from all decisions after all actors have decided
         if self.metrics_tracker:
@@ -212,6 +276,89 @@ class DecisionPhaseV2:
 
         return state
 
+    async def _emit(self, event_type: EventType, data: Dict[str, Any]) -> None:
+        """Emit a decision event if an event bus is configured"""
+        if self.event_bus is not None:
+            await self.event_bus.emit(event_type, data=data, source="decision_phase")
+
+    def _create_stream(self, event_data: Dict[str, Any], pending: List[Future]) -> LLMStream:
+        """
+        Create the stream for one actor's decision call
+
+        The stream's progress callback runs on the worker thread making the
+        call, so progress events are scheduled on the event loop; their
+        futures are collected in pending.
+
+        Args:
+            event_data: Actor and turn, included in every progress event
+            pending: List the scheduled progress emits are appended to
+
+        Returns:
+            LLMStream for make_llm_call_async
+        """
+        loop = asyncio.get_running_loop()
+        sent = 0  # Characters already sent in earlier progress events
+
+        def on_progress(stream: LLMStream) -> None:
+            nonlocal sent
+            if self.event_bus is None:
+                return
+            restarted = stream.chars < sent  # A retry started over
+            if restarted:
+                sent = 0
+            text = stream.text
+            data = {
+                **event_data,
+                "delta": text[sent:],
+                "chars": stream.chars,
+                "restarted": restarted,
+                "section": stream.parser.current_section,
+                "action_complete": stream.action_complete,
+                "action": stream.parser.final_text,
+            }
+            sent = len(text)
+            pending.append(
+                asyncio.run_coroutine_threadsafe(
+                    self.event_bus.emit(
+                        EventType.ACTOR_DECISION_PROGRESS, data=data, source="decision_phase"
+                    ),
+                    loop,
+                )
+            )
+
+        return LLMStream(
+            on_progress=on_progress,
+            # Markdown decisions end with the action; JSON must be read to the end
+            stop_after_action=not self.json_mode,
+            max_chars=self.max_decision_chars,
+        )
+
+    @staticmethod
+    async def _wait_for_progress(pending: List[Future]) -> None:
+        """Wait until the scheduled progress events have been emitted"""
+        if pending:
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in pending))
+            pending.clear()
+
+    def _summary_cost(self, llm_response: LLMResponse) -> CostRecord:
+        """Cost record for a context summarization call"""
+        model = self.context_manager.summarization_model
+        return CostRecord(
+            timestamp=datetime.now(),
+            actor=None,  # Summaries are shared by all actors
+            phase="context_summary",
+            model=model,
+            input_tokens=llm_response.input_tokens,
+            output_tokens=llm_response.output_tokens,
+            cost=calculate_cost(
+                model=model,
+                input_tokens=llm_response.input_tokens,
+                output_tokens=llm_response.output_tokens,
+                cached_input_tokens=llm_response.cached_input_tokens,
+            ),
+            metadata={"cached_input_tokens": llm_response.cached_input_tokens},
+        )
+
     def _extract_recent_goals(self, state: ScenarioState, actor_name: str) -> str:
         """
         Extract recent goals from previous turns (last 2 turns)
@@ -9,8 +9,10 @@ import os
 import json
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 from scenario_lab.models.state import ScenarioState
+from scenario_lab.core.turn_history import TurnHistory
 
 logger = logging.getLogger(__name__)
 
@@ -25,16 +27,20 @@ class PersistencePhase:
     3. Saves metrics to JSON
     4. Saves costs to JSON
     5. Saves full state for resume capability
+    6. Appends the turn to the run's turn history (if given)
     """
 
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, history: Optional[TurnHistory] = None):
         """
         Initialize persistence phase
 
         Args:
             output_dir: Directory to save files to
+            history: Turn history to append each finished turn to
+                (world state, decisions and communications)
         """
         self.output_dir = Path(output_dir)
+        self.history = history
         self.files_saved = 0
 
     async def execute(self, state: ScenarioState) -> ScenarioState:
@@ -67,6 +73,10 @@ class PersistencePhase:
         # Save full state for resume
         await self._save_scenario_state(state)
 
+        # Append to turn history
+        if self.history is not None:
+            self.history.record_state(state)
+
         logger.info(f"Persistence complete: {self.files_saved} files saved")
         return state
 
@@ -149,6 +159,7 @@ class PersistencePhase:
                     "model": c.model,
                     "input_tokens": c.input_tokens,
                     "output_tokens": c.output_tokens,
+                    "cached_input_tokens": c.metadata.get("cached_input_tokens", 0),
                     "cost": c.cost,
                 }
                 for c in state.costs
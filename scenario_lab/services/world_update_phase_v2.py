@@ -114,7 +114,11 @@ class WorldUpdatePhaseV2:
         )
 
         # Build messages for LLM
-        messages = build_messages_for_llm(system_prompt, user_prompt)
+        messages = build_messages_for_llm(
+            system_prompt,
+            user_prompt,
+            cacheable_prefix=self.synthesizer.build_task_instructions(bool(exogenous_events)),
+        )
 
         # Make LLM call
         try:
@@ -159,7 +163,8 @@ class WorldUpdatePhaseV2:
         cost_amount = calculate_cost(
             model=self.world_state_model,
             input_tokens=llm_response.input_tokens,
-            output_tokens=llm_response.output_tokens
+            output_tokens=llm_response.output_tokens,
+            cached_input_tokens=llm_response.cached_input_tokens,
         )
 
         cost_record = CostRecord(
@@ -170,6 +175,7 @@ class WorldUpdatePhaseV2:
             input_tokens=llm_response.input_tokens,
             output_tokens=llm_response.output_tokens,
             cost=cost_amount,
+            metadata={"cached_input_tokens": llm_response.cached_input_tokens},
         )
         state = state.with_cost(cost_record)
 
@@ -80,6 +80,26 @@ class TestEventBus:
         assert "event2" in received
         assert "event3" in received
 
+    @pytest.mark.asyncio
+    async def test_wildcard_handler_not_added_to_event_type(self):
+        """Test emitting doesn't register wildcard handlers on the event type"""
+        bus = EventBus()
+        received = []
+
+        async def specific(event: Event):
+            received.append("specific")
+
+        async def wildcard(event: Event):
+            received.append("wildcard")
+
+        bus.on("event1", specific)
+        bus.on("*", wildcard)
+        await bus.emit("event1")
+        await bus.emit("event1")
+
+        assert received == ["specific", "wildcard"] * 2
+        assert bus.handlers["event1"] == [specific]
+
     @pytest.mark.asyncio
     async def test_event_history(self):
         """Test event history tracking"""
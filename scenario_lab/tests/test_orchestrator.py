@@ -96,6 +96,36 @@ class TestScenarioOrchestrator:
         assert EventType.PHASE_COMPLETED in event_types
         assert EventType.TURN_COMPLETED in event_types
 
+    @pytest.mark.asyncio
+    async def test_events_carry_durations(self):
+        """Test that phase and turn events report how long they took"""
+        class SlowPhase:
+            async def execute(self, state: ScenarioState) -> ScenarioState:
+                await asyncio.sleep(0.02)
+                return state
+
+        bus = EventBus(keep_history=True)
+        orchestrator = ScenarioOrchestrator(event_bus=bus)
+        orchestrator.register_phase(PhaseType.DECISION, SlowPhase())
+        orchestrator.register_phase(PhaseType.WORLD_UPDATE, MockPhase("world_update"))
+
+        state = ScenarioState(
+            scenario_id="test",
+            scenario_name="Test",
+            run_id="run-001",
+            status=ScenarioStatus.RUNNING,
+        )
+        await orchestrator.execute_turn(state)
+
+        phase_events = bus.get_history(EventType.PHASE_COMPLETED)
+        durations = {e.data["phase"]: e.data["duration"] for e in phase_events}
+        assert durations["decision"] >= 0.02
+        assert durations["world_update"] < durations["decision"]
+
+        turn_event = bus.get_history(EventType.TURN_COMPLETED)[0]
+        assert turn_event.data["phase_durations"] == durations
+        assert turn_event.data["duration"] >= sum(durations.values())
+
     @pytest.mark.asyncio
     async def test_end_turn_respected(self):
         """Test that end_turn stops execution"""
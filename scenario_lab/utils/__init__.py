@@ -20,6 +20,7 @@ from scenario_lab.utils.model_pricing import (
 )
 from scenario_lab.utils.logging_config import (
     setup_logging,
+    shutdown_logging,
     set_context,
     clear_context,
     log_cost,
@@ -42,6 +43,7 @@ __all__ = [
     "is_expensive_model",
     "is_free_model",
     "setup_logging",
+    "shutdown_logging",
     "set_context",
     "clear_context",
     "log_cost",
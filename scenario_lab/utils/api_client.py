@@ -10,24 +10,62 @@ Migrated from V1's api_utils.py with the following enhancements:
 Supports multiple LLM backends:
 - OpenRouter (cloud API)
 - Ollama (local models)
+- Mock models for load testing (see mock_llm)
 
 Features:
 - Automatic retry with exponential backoff
+- Shared adaptive outbound limiter per provider/model (see outbound_limiter)
 - Connection pooling for better performance
 - Optional response caching via external cache
+- Record/replay of calls via a cassette (see llm_cassette)
+- Queue-wait/network/backoff/TTFB timing of every call (see llm_timing),
+  returned on LLMResponse.timing and recorded into the run's latency
+  histograms (see latency_histogram)
+- Call, retry and latency counters for the API's /metrics endpoint
+  (see prometheus_metrics)
+- Tracing spans for every call and attempt (see tracing)
+- Prompt-prefix caching: cache-control hints for providers that need them
+  and cached-input token counts on LLMResponse
+- Optional streaming through an LLMStream (see llm_streaming): progress
+  callbacks, time to first token and stopping generation early
 """
+import asyncio
 import time
 import requests
 import os
 import logging
+from datetime import timedelta
 from typing import Optional, Callable, Any, Dict, Tuple
 from dataclasses import dataclass
 
+from scenario_lab.utils.latency_histogram import get_latency_recorder
+from scenario_lab.utils.llm_cassette import LLMCassette, get_cassette
+from scenario_lab.utils.llm_streaming import STOP_MAX_CHARS, LLMStream, sse_lines
+from scenario_lab.utils.llm_timing import CallTiming, get_llm_timing_stats
+from scenario_lab.utils.logging_config import current_actor, current_phase
+from scenario_lab.utils.mock_llm import (
+    build_http_response,
+    get_mock_backend,
+    is_mock_model,
+    mock_all_models,
+)
+from scenario_lab.utils.outbound_limiter import (
+    AdaptiveLimiter,
+    estimate_tokens,
+    get_outbound_limiter,
+)
+from scenario_lab.utils.prometheus_metrics import get_metrics_registry
+from scenario_lab.utils.tracing import span
+
 logger = logging.getLogger(__name__)
 
 # Global session for connection pooling
 _http_session: Optional[requests.Session] = None
 
+# Model prefixes whose providers only cache prompts up to explicit
+# cache_control breakpoints (OpenAI, DeepSeek and others cache automatically)
+EXPLICIT_CACHE_MODELS = ("anthropic/", "google/gemini")
+
 
 @dataclass
 class LLMResponse:
@@ -38,6 +76,54 @@ class LLMResponse:
     output_tokens: int = 0
     model: str = ""
     cached: bool = False
+    timing: Optional[CallTiming] = None
+    cached_input_tokens: int = 0  # Input tokens served from the provider's prompt cache
+
+
+def with_cache_control(model: str, messages: list) -> list:
+    """
+    Mark the end of the stable prompt prefix for providers that need it
+
+    Every message but the last is treated as the stable prefix (see
+    build_messages_for_llm); for models in EXPLICIT_CACHE_MODELS the last of
+    them gets an ephemeral cache_control breakpoint. Other models get the
+    messages unchanged.
+
+    Args:
+        model: Model identifier
+        messages: Request messages
+
+    Returns:
+        Messages to send (a marked copy, or the original list)
+    """
+    if len(messages) < 2 or not model.startswith(EXPLICIT_CACHE_MODELS):
+        return messages
+    marked = list(messages)
+    prefix_end = marked[-2]
+    if isinstance(prefix_end.get('content'), str) and prefix_end['content']:
+        marked[-2] = {
+            **prefix_end,
+            'content': [{
+                'type': 'text',
+                'text': prefix_end['content'],
+                'cache_control': {'type': 'ephemeral'},
+            }],
+        }
+    return marked
+
+
+def count_cached_input_tokens(usage: Dict[str, Any]) -> int:
+    """
+    Get the number of prompt tokens read from the provider's cache
+
+    Args:
+        usage: Usage block of a chat completion response
+
+    Returns:
+        Cached input tokens (0 if not reported)
+    """
+    details = usage.get('prompt_tokens_details') or {}
+    return int(details.get('cached_tokens') or usage.get('cache_read_input_tokens') or 0)
 
 
 def get_http_session() -> requests.Session:
@@ -72,11 +158,18 @@ def api_call_with_retry(
     max_delay: float = 60.0,
     backoff_factor: float = 2.0,
     retryable_status_codes: tuple = (500, 502, 503, 504, 429),
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[Dict[str, Any]] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+    estimated_tokens: int = 0,
+    timing: Optional[CallTiming] = None,
 ) -> Any:
     """
     Execute an API call with exponential backoff retry logic
 
+    When a limiter is given, each attempt takes a slot from it and reports its
+    outcome (latency, 429 + Retry-After). Rate-limited attempts then wait on the
+    limiter's shared cooldown instead of sleeping on their own.
+
     Args:
         api_func: Function that makes the API call (should return requests.Response)
         max_retries: Maximum number of retry attempts
@@ -85,6 +178,9 @@ def api_call_with_retry(
         backoff_factor: Multiplier for delay after each retry
         retryable_status_codes: HTTP status codes that should trigger retries
         context: Optional dict with context info (e.g., {'actor': 'name', 'turn': 1})
+        limiter: Optional outbound limiter for the called provider/model
+        estimated_tokens: Expected token usage per attempt (for the limiter's budget)
+        timing: Optional CallTiming to add limiter wait, request time and backoff to
 
     Returns:
         The result from api_func
@@ -101,12 +197,38 @@ def api_call_with_retry(
         context_str = f" [{', '.join(context_parts)}]"
 
     for attempt in range(max_retries + 1):
-        try:
-            result = api_func()
+        waited = 0.0
+        if limiter is not None:
+            waited = limiter.acquire(estimated_tokens)
+            if timing is not None:
+                timing.queue_wait += waited
+        started = time.monotonic()
+        released = False
+
+        def release(**outcome: Any) -> None:
+            nonlocal released
+            if limiter is not None and not released:
+                released = True
+                limiter.release(**outcome)
 
-            # If it's a requests.Response object, check status
-            if isinstance(result, requests.Response):
-                result.raise_for_status()
+        try:
+            with span("llm_attempt", attempt=attempt + 1, queue_wait=waited) as attempt_span:
+                try:
+                    result = api_func()
+                finally:
+                    if timing is not None:
+                        timing.attempts += 1
+                        timing.network += time.monotonic() - started
+
+                # If it's a requests.Response object, check status
+                if isinstance(result, requests.Response):
+                    attempt_span.set_attribute("status_code", result.status_code)
+                    result.raise_for_status()
+                    if timing is not None:
+                        # Time until the response headers arrived
+                        timing.ttfb = result.elapsed.total_seconds()
+
+            release(latency=time.monotonic() - started)
 
             # Log successful retry if this wasn't the first attempt
             if attempt > 0:
@@ -126,18 +248,24 @@ def api_call_with_retry(
                 except (AttributeError, Exception):
                     pass
 
+            # Check for Retry-After header (rate limiting)
+            retry_after = None
+            if e.response is not None and hasattr(e.response, 'headers'):
+                try:
+                    if 'Retry-After' in e.response.headers:
+                        retry_after = float(e.response.headers['Retry-After'])
+                except (ValueError, KeyError, TypeError):
+                    pass
+
+            if status_code == 429:
+                # Slow down every caller of this model, not just this one
+                release(rate_limited=True, retry_after=retry_after, refund_tokens=estimated_tokens)
+
             # Check if this is a retryable error
             if status_code in retryable_status_codes:
                 if attempt < max_retries:
-                    # Check for Retry-After header (rate limiting)
-                    retry_after = None
-                    if e.response is not None and hasattr(e.response, 'headers'):
-                        try:
-                            if 'Retry-After' in e.response.headers:
-                                retry_after = float(e.response.headers['Retry-After'])
-                                delay = min(retry_after, max_delay)
-                        except (ValueError, KeyError, TypeError):
-                            pass
+                    if retry_after is not None:
+                        delay = min(retry_after, max_delay)
 
                     # Retryable error - wait and retry
                     logger.warning(
@@ -146,7 +274,12 @@ def api_call_with_retry(
                     )
                     logger.debug(f"Response body: {response_body}")
 
-                    time.sleep(delay)
+                    release(refund_tokens=estimated_tokens)
+                    if limiter is None or status_code != 429:
+                        if timing is not None:
+                            timing.backoff += delay
+                        time.sleep(delay)
+                    # else: the limiter's shared cooldown makes the next acquire() wait
 
                     # Only increase delay if we didn't get Retry-After header
                     if retry_after is None:
@@ -178,6 +311,9 @@ def api_call_with_retry(
                     f"Network error{context_str}: {str(e)[:200]}. "
                     f"Retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})"
                 )
+                release(refund_tokens=estimated_tokens)
+                if timing is not None:
+                    timing.backoff += delay
                 time.sleep(delay)
                 delay = min(delay * backoff_factor, max_delay)
                 continue
@@ -187,12 +323,92 @@ def api_call_with_retry(
                 )
                 raise
 
+        finally:
+            # Final failures and unexpected errors still give the slot back
+            release(refund_tokens=estimated_tokens)
+
     # Should never reach here, but just in case
     if last_exception:
         raise last_exception
     raise RuntimeError("Unexpected error in api_call_with_retry")
 
 
+def _limited_call(
+    api_call: Callable,
+    provider: str,
+    model: str,
+    messages: list,
+    max_retries: int,
+    context: Optional[Dict[str, Any]],
+    timing: Optional[CallTiming] = None,
+    stream: Optional[LLMStream] = None,
+) -> Dict[str, Any]:
+    """
+    Run a chat completion request through the shared outbound limiter
+
+    Args:
+        api_call: Function posting the request (returns requests.Response)
+        provider: Backend name used to key the limiter
+        model: Model identifier used to key the limiter
+        messages: Request messages (for the token estimate)
+        max_retries: Maximum number of retry attempts
+        context: Optional dict with context info for error logging
+        timing: Optional CallTiming to fill in
+        stream: Stream the api_call reads the response body into, if streaming
+
+    Returns:
+        Parsed response JSON (built from the stream when streaming)
+    """
+    limiter = get_outbound_limiter().for_model(provider, model)
+    estimated = estimate_tokens(messages)
+
+    response = api_call_with_retry(
+        api_call,
+        max_retries=max_retries,
+        context=context,
+        limiter=limiter,
+        estimated_tokens=estimated,
+        timing=timing,
+    )
+    if stream is not None:
+        result = stream.result(estimated)
+        if timing is not None and stream.first_token_delay is not None:
+            timing.ttft = timing.ttfb + stream.first_token_delay
+    else:
+        result = response.json()
+
+    # Charge the budget for what the call actually used
+    total_tokens = (result.get('usage') or {}).get('total_tokens')
+    if total_tokens:
+        limiter.record_tokens(total_tokens - estimated)
+
+    return result
+
+
+def _read_stream(response: requests.Response, stream: LLMStream) -> requests.Response:
+    """
+    Read a streamed response body into the stream
+
+    Runs inside the attempt, so the limiter slot is held while the body
+    arrives and a connection dropped mid-stream is retried. Closing the
+    response when the stream stops early ends generation at the provider.
+    Error responses are returned unread for api_call_with_retry to handle.
+    """
+    if response.status_code != 200:
+        return response
+    stream.reset()
+    try:
+        stream.consume(response.iter_lines())
+    finally:
+        response.close()
+    return response
+
+
+def _stream_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Ask an OpenAI-compatible endpoint to stream, with usage in the last chunk"""
+    return {**payload, "stream": True, "stream_options": {"include_usage": True}}
+
+
 def is_local_model(model: str) -> bool:
     """
     Check if a model string indicates a local model
@@ -211,7 +427,9 @@ def make_ollama_call(
     messages: list,
     max_retries: int = 3,
     base_url: Optional[str] = None,
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[Dict[str, Any]] = None,
+    timing: Optional[CallTiming] = None,
+    stream: Optional[LLMStream] = None,
 ) -> Dict[str, Any]:
     """
     Make a call to local Ollama instance with connection pooling
@@ -222,6 +440,8 @@ def make_ollama_call(
         max_retries: Maximum number of retry attempts
         base_url: Ollama API URL (default: http://localhost:11434)
         context: Optional dict with context info for error logging
+        timing: Optional CallTiming to fill in
+        stream: Optional LLMStream to stream the response into
 
     Returns:
         Response dict with 'choices' and 'usage' keys
@@ -241,10 +461,59 @@ def make_ollama_call(
     }
 
     def api_call():
-        return session.post(url, json=payload, timeout=300)
+        if stream is None:
+            return session.post(url, json=payload, timeout=300)
+        response = session.post(url, json=_stream_payload(payload), timeout=300, stream=True)
+        return _read_stream(response, stream)
+
+    return _limited_call(
+        api_call, "ollama", model, messages, max_retries, context, timing, stream
+    )
+
+
+def make_mock_call(
+    model: str,
+    messages: list,
+    max_retries: int = 3,
+    context: Optional[Dict[str, Any]] = None,
+    timing: Optional[CallTiming] = None,
+    stream: Optional[LLMStream] = None,
+) -> Dict[str, Any]:
+    """
+    Make a call to the built-in mock backend
+
+    Goes through the same retry logic and outbound limiter as real providers,
+    so injected 429/5xx responses behave like real ones. When streaming, the
+    completion is replayed to the stream as server-sent events.
+
+    Args:
+        model: Mock model string (e.g., "mock/fast?latency=0.2")
+        messages: List of message dicts with 'role' and 'content'
+        max_retries: Maximum number of retry attempts
+        context: Optional dict with context info for error logging
+        timing: Optional CallTiming to fill in
+        stream: Optional LLMStream to stream the response into
+
+    Returns:
+        Response dict with 'choices' and 'usage' keys
+
+    Raises:
+        requests.exceptions.HTTPError: If all retries fail
+    """
+    backend = get_mock_backend()
+
+    def api_call():
+        started = time.monotonic()
+        response = build_http_response(*backend.complete(model, messages))
+        response.elapsed = timedelta(seconds=time.monotonic() - started)
+        if stream is not None and response.status_code == 200:
+            stream.reset()
+            stream.consume(sse_lines(response.json()))
+        return response
 
-    response = api_call_with_retry(api_call, max_retries=max_retries, context=context)
-    return response.json()
+    return _limited_call(
+        api_call, "mock", model, messages, max_retries, context, timing, stream
+    )
 
 
 def make_openrouter_call(
@@ -252,17 +521,24 @@ def make_openrouter_call(
     messages: list,
     api_key: str,
     max_retries: int = 3,
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[Dict[str, Any]] = None,
+    timing: Optional[CallTiming] = None,
+    stream: Optional[LLMStream] = None,
 ) -> Dict[str, Any]:
     """
     Make an OpenRouter API call with automatic retry logic and connection pooling
 
+    Models that need explicit prompt-cache breakpoints get them on the stable
+    prefix of the messages (see with_cache_control).
+
     Args:
         model: Model identifier (e.g., "openai/gpt-4o-mini")
         messages: List of message dicts with 'role' and 'content'
         api_key: OpenRouter API key
         max_retries: Maximum number of retry attempts
         context: Optional dict with context info for error logging
+        timing: Optional CallTiming to fill in
+        stream: Optional LLMStream to stream the response into
 
     Returns:
         Response dict with 'choices' and 'usage' keys
@@ -280,14 +556,20 @@ def make_openrouter_call(
 
     payload = {
         "model": model,
-        "messages": messages
+        "messages": with_cache_control(model, messages)
     }
 
     def api_call():
-        return session.post(url, headers=headers, json=payload, timeout=120)
+        if stream is None:
+            return session.post(url, headers=headers, json=payload, timeout=120)
+        response = session.post(
+            url, headers=headers, json=_stream_payload(payload), timeout=120, stream=True
+        )
+        return _read_stream(response, stream)
 
-    response = api_call_with_retry(api_call, max_retries=max_retries, context=context)
-    return response.json()
+    return _limited_call(
+        api_call, "openrouter", model, messages, max_retries, context, timing, stream
+    )
 
 
 def make_llm_call(
@@ -297,11 +579,15 @@ def make_llm_call(
     max_retries: int = 3,
     context: Optional[Dict[str, Any]] = None,
     use_cache: bool = True,
+    timing: Optional[CallTiming] = None,
+    stream: Optional[LLMStream] = None,
 ) -> LLMResponse:
     """
     Make an LLM API call using the appropriate backend
 
     Automatically routes to:
+    - The mock backend for models starting with "mock/" (or every model when
+      mock_all_models() is enabled)
     - Ollama for models starting with "ollama/" or "local/"
     - OpenRouter for all other models
 
@@ -310,6 +596,10 @@ def make_llm_call(
     - Automatic retry with exponential backoff
     - Detailed token usage tracking
     - Response caching (optional)
+    - Record/replay via the active cassette (see llm_cassette)
+    - Streaming (optional): the response is read incrementally into the
+      stream, which reports progress and may stop generation early; cached
+      and replayed responses are fed to it whole
 
     Args:
         model: Model identifier (e.g., "openai/gpt-4o-mini", "ollama/llama3.1:70b")
@@ -318,14 +608,75 @@ def make_llm_call(
         max_retries: Maximum number of retry attempts
         context: Optional dict with context info (e.g., {'actor': 'name', 'turn': 1, 'operation': 'decision'})
         use_cache: Whether to use response caching (default: True)
+        timing: Optional CallTiming to fill in (recorded in the global LLM timing stats)
+        stream: Optional LLMStream to stream the response into
 
     Returns:
-        LLMResponse object with content and token usage
+        LLMResponse object with content and token usage (the streamed text,
+        which is cut short if the stream stopped early)
 
     Raises:
         requests.exceptions.HTTPError: If all retries fail
         ValueError: If API key is missing for cloud models
     """
+    if timing is None:
+        timing = CallTiming()
+    labels = context or {}
+    with span(
+        "llm_call",
+        model=model,
+        actor=labels.get('actor'),
+        phase=labels.get('phase'),
+    ) as call_span:
+        response = _make_llm_call(
+            model, messages, api_key, max_retries, context, use_cache, timing, stream
+        )
+        if response.cached:
+            source = "cache"
+        else:
+            source = "network" if timing.attempts else "replay"
+        call_span.set_attribute("source", source)
+        call_span.set_attribute("attempts", timing.attempts)
+        call_span.set_attribute("input_tokens", response.input_tokens)
+        call_span.set_attribute("output_tokens", response.output_tokens)
+        if response.cached_input_tokens:
+            call_span.set_attribute("cached_input_tokens", response.cached_input_tokens)
+        if stream is not None and stream.stop_reason:
+            call_span.set_attribute("stream_stop", stream.stop_reason)
+        return response
+
+
+def _make_llm_call(
+    model: str,
+    messages: list,
+    api_key: Optional[str],
+    max_retries: int,
+    context: Optional[Dict[str, Any]],
+    use_cache: bool,
+    timing: CallTiming,
+    stream: Optional[LLMStream] = None,
+) -> LLMResponse:
+    """Route an LLM call (see make_llm_call)"""
+    started = time.monotonic()
+
+    # Replay from cassette (no provider, no API key needed)
+    cassette = get_cassette()
+    if cassette is not None and cassette.mode == "replay":
+        entry = cassette.replay(model, messages, context)
+        if entry is not None:
+            _feed_whole(stream, entry.content)
+            _finish_timing(timing, started, "replay", model, context)
+            return LLMResponse(
+                content=entry.content,
+                tokens_used=entry.tokens_used,
+                input_tokens=entry.input_tokens,
+                output_tokens=entry.output_tokens,
+                model=model,
+                cached=False,
+                timing=timing,
+                cached_input_tokens=entry.cached_input_tokens,
+            )
+
     # Check cache first (if enabled)
     if use_cache:
         from scenario_lab.utils.response_cache import get_global_cache
@@ -334,25 +685,49 @@ def make_llm_call(
 
         if cached_entry is not None:
             # Cache hit!
-            return LLMResponse(
+            llm_response = LLMResponse(
                 content=cached_entry.response,
                 tokens_used=cached_entry.tokens_used,
                 input_tokens=cached_entry.input_tokens,
                 output_tokens=cached_entry.output_tokens,
                 model=cached_entry.model,
-                cached=True
+                cached=True,
+                timing=timing,
             )
+            _feed_whole(stream, cached_entry.response)
+            _finish_timing(timing, started, "cache", model, context)
+            _record_call(cassette, model, messages, llm_response, started, context)
+            return llm_response
 
     # Add model to context for better error tracking
     call_context = {'model': model}
     if context:
         call_context.update(context)
 
-    if is_local_model(model):
+    if is_mock_model(model) or mock_all_models():
+        result = make_mock_call(
+            model, messages, max_retries, context=call_context, timing=timing, stream=stream
+        )
+
+        usage = result['usage']
+        llm_response = LLMResponse(
+            content=result['choices'][0]['message']['content'],
+            tokens_used=usage['total_tokens'],
+            input_tokens=usage['prompt_tokens'],
+            output_tokens=usage['completion_tokens'],
+            model=model,
+            cached=False,
+            cached_input_tokens=count_cached_input_tokens(usage),
+        )
+
+    elif is_local_model(model):
         # Strip the "ollama/" or "local/" prefix
         local_model = model.split('/', 1)[1]
 
-        result = make_ollama_call(local_model, messages, max_retries, context=call_context)
+        result = make_ollama_call(
+            local_model, messages, max_retries, context=call_context, timing=timing,
+            stream=stream,
+        )
 
         response_text = result['choices'][0]['message']['content']
         usage = result.get('usage', {})
@@ -380,7 +755,10 @@ def make_llm_call(
                     "or pass api_key parameter."
                 )
 
-        result = make_openrouter_call(model, messages, api_key, max_retries, context=call_context)
+        result = make_openrouter_call(
+            model, messages, api_key, max_retries, context=call_context, timing=timing,
+            stream=stream,
+        )
 
         response_text = result['choices'][0]['message']['content']
         usage = result.get('usage', {})
@@ -388,21 +766,18 @@ def make_llm_call(
         input_tokens = usage.get('prompt_tokens', int(total_tokens * 0.7))
         output_tokens = usage.get('completion_tokens', int(total_tokens * 0.3))
 
-        # Add small delay for free models to avoid rate limits
-        if ':free' in model:
-            time.sleep(0.5)
-
         llm_response = LLMResponse(
             content=response_text,
             tokens_used=total_tokens,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             model=model,
-            cached=False
+            cached=False,
+            cached_input_tokens=count_cached_input_tokens(usage),
         )
 
-    # Store in cache (if enabled)
-    if use_cache:
+    # Store in cache (if enabled), unless the text was cut off at max_chars
+    if use_cache and not (stream is not None and stream.stop_reason == STOP_MAX_CHARS):
         from scenario_lab.utils.response_cache import get_global_cache
         cache = get_global_cache()
         cache.put(
@@ -414,9 +789,90 @@ def make_llm_call(
             output_tokens=llm_response.output_tokens
         )
 
+    llm_response.timing = timing
+    _finish_timing(timing, started, "network", model, context)
+    _record_call(cassette, model, messages, llm_response, started, context)
     return llm_response
 
 
+def _feed_whole(stream: Optional[LLMStream], content: str) -> None:
+    """Pass a response that didn't come from a provider to the stream in one piece"""
+    if stream is not None:
+        stream.reset()
+        stream.feed(content)
+        stream.finish()
+
+
+def _finish_timing(
+    timing: CallTiming,
+    started: float,
+    source: str,
+    model: str,
+    context: Optional[Dict[str, Any]],
+) -> None:
+    """
+    Complete a call's timing and record it
+
+    Adds the call to the global LLM timing stats and Prometheus counters and,
+    inside a recorded run, to the run's latency histograms under its model,
+    phase and actor (from the call context, falling back to the logging
+    context).
+    """
+    timing.wall = timing.executor_wait + (time.monotonic() - started)
+    get_llm_timing_stats().record(timing, source)
+
+    registry = get_metrics_registry()
+    registry.counter(
+        "scenario_lab_llm_calls_total",
+        "LLM calls by model and response source",
+        ("model", "source"),
+    ).inc(model=model, source=source)
+    if source == "network":
+        if timing.retries:
+            registry.counter(
+                "scenario_lab_llm_retries_total", "LLM call retries by model", ("model",)
+            ).inc(timing.retries, model=model)
+        registry.histogram(
+            "scenario_lab_llm_call_duration_seconds",
+            "Wall-clock duration of LLM calls that reached a provider",
+            ("model",),
+        ).observe(timing.wall, model=model)
+
+    recorder = get_latency_recorder()
+    if recorder is not None:
+        context = context or {}
+        recorder.record_call(
+            timing,
+            model,
+            phase=context.get('phase') or current_phase.get(),
+            actor=context.get('actor') or current_actor.get(),
+            source=source,
+        )
+
+
+def _record_call(
+    cassette: Optional[LLMCassette],
+    model: str,
+    messages: list,
+    response: LLMResponse,
+    started: float,
+    context: Optional[Dict[str, Any]],
+) -> None:
+    """Append a completed call to the cassette when recording"""
+    if cassette is not None and cassette.mode == "record":
+        cassette.record(
+            model=model,
+            messages=messages,
+            content=response.content,
+            tokens_used=response.tokens_used,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            latency=time.monotonic() - started,
+            context=context,
+            cached_input_tokens=response.cached_input_tokens,
+        )
+
+
 async def make_llm_call_async(
     model: str,
     messages: list,
@@ -424,12 +880,15 @@ async def make_llm_call_async(
     max_retries: int = 3,
     context: Optional[Dict[str, Any]] = None,
     use_cache: bool = True,
+    stream: Optional[LLMStream] = None,
 ) -> LLMResponse:
     """
     Async version of make_llm_call
 
-    Note: Currently just wraps the sync version. In the future, this could be
-    made truly async with aiohttp for better performance.
+    Runs the blocking call on a worker thread so concurrent calls (e.g. parallel
+    actor decisions) overlap; the shared outbound limiter decides how many
+    actually reach the provider at once. The calling context (logging context,
+    run-scoped response cache) is carried over to the thread.
 
     Args:
         model: Model identifier
@@ -438,10 +897,18 @@ async def make_llm_call_async(
         max_retries: Maximum retry attempts
         context: Optional context info
         use_cache: Whether to use response caching (default: True)
+        stream: Optional LLMStream to stream the response into (its
+            on_progress callback runs on the worker thread)
 
     Returns:
         LLMResponse object
     """
-    # For now, just call the sync version
-    # In the future, we can implement true async with aiohttp
-    return make_llm_call(model, messages, api_key, max_retries, context, use_cache)
+    submitted = time.monotonic()
+
+    def call() -> LLMResponse:
+        timing = CallTiming(executor_wait=time.monotonic() - submitted)
+        return make_llm_call(
+            model, messages, api_key, max_retries, context, use_cache, timing, stream
+        )
+
+    return await asyncio.to_thread(call)
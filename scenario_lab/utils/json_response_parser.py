@@ -6,15 +6,36 @@ Provides robust JSON parsing for actor decisions with:
 - Markdown fallback for V1 compatibility
 - Markdown generation from JSON
 - Error recovery strategies
+
+JSON is located with a single linear scan that tracks brackets and strings
+(so braces inside string values and deeply nested objects are handled),
+decoded with orjson when it is installed, and validated by Pydantic straight
+from the JSON text.
 """
 import json
 import logging
 import re
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from pydantic import BaseModel, Field, ValidationError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Characters the JSON locator stops at, per kind of value looked for
+_OBJECT_TOKENS = re.compile(r'[{}"\\]')
+_ARRAY_TOKENS = re.compile(r'[\[\]"\\]')
+_VALUE_TOKENS = re.compile(r'[{}\[\]"\\]')
+
+_CLOSERS = {"}": "{", "]": "["}
+
+# A code fence whose content starts with an object or array
+_FENCE_BODY = re.compile(r"[ \t]*\n\s*(?=[{\[])")
+
 
 class ActorDecisionJSON(BaseModel):
     """Schema for actor decision in JSON format"""
@@ -29,6 +50,71 @@ class ActorDecisionJSON(BaseModel):
     model_config = {"extra": "allow"}  # Allow extra fields for future extension
 
 
+def _find_json_span(content: str, start: int, tokens: re.Pattern) -> Optional[Tuple[int, int]]:
+    """
+    Find the outermost balanced JSON value in one pass
+
+    Only bracket, quote and backslash characters are visited. Inside a value,
+    brackets within strings are skipped; text outside values is not
+    interpreted. If the first opening bracket is never closed (stray brace in
+    prose, truncated response), the earliest complete value inside it is
+    returned instead.
+
+    Args:
+        content: Text to search
+        start: Position to start at
+        tokens: Pattern matching the brackets to track plus '"' and backslash
+
+    Returns:
+        (start, end) slice of the value, or None if there is none
+    """
+    stack: List[Tuple[str, int]] = []
+    best: Optional[Tuple[int, int]] = None
+    in_string = False
+    skip_to = 0  # Position after an escaped character
+
+    for match in tokens.finditer(content, start):
+        position = match.start()
+        if position < skip_to:
+            continue
+        char = content[position]
+
+        if in_string:
+            if char == "\\":
+                skip_to = position + 2
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = bool(stack)  # Quotes outside values are prose
+        elif char == "\\":
+            continue
+        elif char in _CLOSERS:
+            if stack and stack[-1][0] == _CLOSERS[char]:
+                opened = stack.pop()[1]
+                if not stack:
+                    return (opened, position + 1)
+                if best is None or opened < best[0]:
+                    best = (opened, position + 1)
+        else:
+            stack.append((char, position))
+
+    return best
+
+
+def _fenced_json_start(content: str) -> Optional[int]:
+    """Position of a ```json code block, or a plain one holding an object or array"""
+    fence = content.find("```json")
+    if fence >= 0:
+        return fence + len("```json")
+    fence = content.find("```")
+    while fence >= 0:
+        body = _FENCE_BODY.match(content, fence + 3)
+        if body:
+            return body.end()
+        fence = content.find("```", fence + 3)
+    return None
+
+
 def extract_json_from_response(content: str) -> Optional[str]:
     """
     Extract JSON object from LLM response
@@ -39,44 +125,58 @@ def extract_json_from_response(content: str) -> Optional[str]:
     - Plain JSON in the response
     - Preceded by text explanation
 
+    Runs in linear time: the outermost object (or, failing that, array) is
+    found with one bracket- and string-aware scan.
+
     Args:
         content: Raw LLM response
 
     Returns:
         Extracted JSON string, or None if not found
     """
-    # Strategy 1: Look for JSON in code blocks
-    patterns = [
-        r"```json\s*\n(.+?)\n```",  # ```json ... ```
-        r"```\s*\n(\{.+?\})\n```",  # ``` {...} ```
-        r"```\s*\n(\[.+?\])\n```",  # ``` [...] ```
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.DOTALL)
-        if match:
+    # Strategy 1: JSON in a code block (object or array, whichever comes first)
+    fenced = _fenced_json_start(content)
+    if fenced is not None:
+        span = _find_json_span(content, fenced, _VALUE_TOKENS)
+        if span:
             logger.debug("Found JSON in markdown code block")
-            return match.group(1).strip()
+            return content[span[0]:span[1]]
 
-    # Strategy 2: Look for raw JSON objects
-    # Find content between first { and last }
-    brace_pattern = r"(\{(?:[^{}]|(?:\{[^{}]*\}))*\})"
-    match = re.search(brace_pattern, content, re.DOTALL)
-    if match:
+    # Strategy 2: Raw JSON object
+    span = _find_json_span(content, 0, _OBJECT_TOKENS)
+    if span:
         logger.debug("Found raw JSON object in response")
-        return match.group(1).strip()
+        return content[span[0]:span[1]]
 
-    # Strategy 3: Look for JSON arrays
-    bracket_pattern = r"(\[(?:[^\[\]]|(?:\[[^\[\]]*\]))*\])"
-    match = re.search(bracket_pattern, content, re.DOTALL)
-    if match:
+    # Strategy 3: Raw JSON array
+    span = _find_json_span(content, 0, _ARRAY_TOKENS)
+    if span:
         logger.debug("Found raw JSON array in response")
-        return match.group(1).strip()
+        return content[span[0]:span[1]]
 
     logger.debug("No JSON found in response")
     return None
 
 
+def decode_json(json_str: str) -> Any:
+    """
+    Decode JSON text, with orjson when it is installed
+
+    Args:
+        json_str: JSON text
+
+    Returns:
+        Decoded value
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError is a json.JSONDecodeError
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
 def parse_json_decision(
     content: str, validate: bool = True
 ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
@@ -97,22 +197,25 @@ def parse_json_decision(
     if not json_str:
         return None, "No JSON found in response"
 
-    # Parse JSON
-    try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
-        logger.warning(f"JSON parsing failed: {e}")
-        return None, f"Invalid JSON: {e}"
-
-    # Validate schema if requested
+    # Validate schema if requested, parsing and validating in one step
     if validate:
         try:
-            validated = ActorDecisionJSON(**data)
+            validated = ActorDecisionJSON.model_validate_json(json_str)
             return validated.model_dump(), None
         except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                logger.warning(f"JSON parsing failed: {e}")
+                return None, f"Invalid JSON: {e}"
             logger.warning(f"JSON validation failed: {e}")
             # Return raw data anyway, but with warning
-            return data, f"Schema validation failed: {e}"
+            return decode_json(json_str), f"Schema validation failed: {e}"
+
+    # Parse JSON
+    try:
+        data = decode_json(json_str)
+    except json.JSONDecodeError as e:
+        logger.warning(f"JSON parsing failed: {e}")
+        return None, f"Invalid JSON: {e}"
 
     return data, None
 
@@ -0,0 +1,338 @@
+"""
+Latency histograms for LLM calls, phases and turns
+
+LatencyHistogram is an HDR-style histogram: values are bucketed by power of
+two and then linearly within each power, so every recorded value keeps a
+fixed relative precision (two significant digits by default) from
+microseconds to minutes in a few hundred sparse buckets. Percentiles are
+read from the buckets, so memory does not grow with the number of samples.
+
+LatencyRecorder keeps one histogram per metric overall and per model, phase
+and actor. SyncRunner binds a recorder to each run (see use_latency_recorder);
+make_llm_call records every call into the bound recorder and the runner adds
+phase and turn durations from orchestrator events, then exports the result
+with the run as latency-histograms.json.
+"""
+from __future__ import annotations
+
+import json
+import math
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from scenario_lab.utils.llm_timing import CallTiming
+
+# Percentiles included in exported summaries
+SUMMARY_PERCENTILES = (50, 90, 95, 99, 99.9)
+
+# Dimensions LLM calls are broken down by
+CALL_DIMENSIONS = ("model", "phase", "actor")
+
+
+class LatencyHistogram:
+    """HDR-style histogram of durations in seconds"""
+
+    def __init__(self, significant_digits: int = 2, lowest: float = 1e-6):
+        """
+        Initialize histogram
+
+        Args:
+            significant_digits: Decimal digits of precision kept for every value (1-5)
+            lowest: Smallest distinguishable value in seconds; smaller values
+                are counted as zero
+        """
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.significant_digits = significant_digits
+        self.lowest = lowest
+        # Linear sub-buckets per power of two, enough to keep the requested digits
+        self.sub_buckets = 2 ** math.ceil(math.log2(2 * 10 ** significant_digits))
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _index(self, value: float) -> int:
+        if value < self.lowest:
+            return -1
+        scaled = value / self.lowest
+        exponent = math.frexp(scaled)[1] - 1
+        sub = int((scaled / 2.0 ** exponent - 1.0) * self.sub_buckets)
+        return exponent * self.sub_buckets + min(sub, self.sub_buckets - 1)
+
+    def _value(self, index: int) -> float:
+        if index < 0:
+            return 0.0
+        exponent, sub = divmod(index, self.sub_buckets)
+        return self.lowest * 2.0 ** exponent * (1.0 + (sub + 0.5) / self.sub_buckets)
+
+    def record(self, value: float, count: int = 1) -> None:
+        """
+        Record a duration
+
+        Args:
+            value: Duration in seconds (negative values are recorded as zero)
+            count: Number of occurrences
+        """
+        value = max(0.0, value)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """
+        Add another histogram's samples to this one
+
+        Args:
+            other: Histogram with the same precision settings
+        """
+        if (other.sub_buckets, other.lowest) != (self.sub_buckets, self.lowest):
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of recorded values"""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Value at a percentile
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Bucket value at the percentile, clamped to the recorded min/max
+            (0.0 when empty)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100.0 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(self._value(index), self.min), self.max)
+        return self.max
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Non-empty buckets as (representative value, count), ascending"""
+        return [(self._value(index), self.counts[index]) for index in sorted(self.counts)]
+
+    def to_dict(self, include_buckets: bool = True) -> Dict[str, Any]:
+        """
+        Convert to dictionary
+
+        Args:
+            include_buckets: Include the raw buckets (needed to merge exports later)
+
+        Returns:
+            Dict with count, min, max, mean, p50/p90/p95/p99/p99.9 and buckets
+        """
+        data: Dict[str, Any] = {
+            "count": self.count,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "mean": self.mean,
+        }
+        for q in SUMMARY_PERCENTILES:
+            data[f"p{q:g}"] = self.percentile(q)
+        if include_buckets:
+            data["significant_digits"] = self.significant_digits
+            data["buckets"] = [[value, count] for value, count in self.buckets()]
+        return data
+
+
+class LatencyRecorder:
+    """
+    Thread-safe set of latency histograms for one run
+
+    Histograms are keyed by metric (e.g. "llm_wall", "phase") and by a
+    breakdown: overall, or one value of a dimension such as model=...,
+    phase=... or actor=....
+    """
+
+    def __init__(self, significant_digits: int = 2):
+        """
+        Initialize recorder
+
+        Args:
+            significant_digits: Precision of every histogram
+        """
+        self.significant_digits = significant_digits
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self._call_counts: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+    def _histogram(self, metric: str, dimension: str, value: str) -> LatencyHistogram:
+        key = (metric, dimension, value)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = LatencyHistogram(self.significant_digits)
+            self._histograms[key] = histogram
+        return histogram
+
+    def record(self, metric: str, seconds: float, **labels: Optional[str]) -> None:
+        """
+        Record a duration overall and under each given label
+
+        Args:
+            metric: Metric name
+            seconds: Duration
+            **labels: Dimension values (None values are skipped)
+        """
+        with self._lock:
+            self._histogram(metric, "", "").record(seconds)
+            for dimension, value in labels.items():
+                if value is not None:
+                    self._histogram(metric, dimension, str(value)).record(seconds)
+
+    def record_call(
+        self,
+        timing: CallTiming,
+        model: str,
+        phase: Optional[str] = None,
+        actor: Optional[str] = None,
+        source: str = "network",
+    ) -> None:
+        """
+        Record a completed LLM call
+
+        Wall time is recorded for every call; queue wait, network time and
+        time to first byte only for calls that reached a provider, and time
+        to first token only for streamed ones.
+
+        Args:
+            timing: The call's timing
+            model: Model identifier
+            phase: Phase the call was made in
+            actor: Actor the call was made for
+            source: Where the response came from: network, cache or replay
+        """
+        labels = {"model": model, "phase": phase, "actor": actor}
+        self.record("llm_wall", timing.wall, **labels)
+        if source == "network":
+            self.record("llm_queue_wait", timing.queue_wait, **labels)
+            self.record("llm_network", timing.network, **labels)
+            self.record("llm_ttfb", timing.ttfb, **labels)
+            if timing.ttft:
+                self.record("llm_ttft", timing.ttft, **labels)
+
+        with self._lock:
+            keys = [("", "")] + [(d, str(v)) for d, v in labels.items() if v is not None]
+            for key in keys:
+                counts = self._call_counts.setdefault(
+                    key, {"calls": 0, "retries": 0, "network": 0, "cache": 0, "replay": 0}
+                )
+                counts["calls"] += 1
+                counts["retries"] += timing.retries
+                counts[source] = counts.get(source, 0) + 1
+
+    def histogram(
+        self, metric: str, dimension: str = "", value: str = ""
+    ) -> Optional[LatencyHistogram]:
+        """
+        Get a histogram
+
+        Args:
+            metric: Metric name
+            dimension: Breakdown dimension ("" for overall)
+            value: Dimension value
+
+        Returns:
+            The histogram, or None if nothing was recorded for it
+        """
+        with self._lock:
+            return self._histograms.get((metric, dimension, value))
+
+    def metrics(self) -> List[str]:
+        """Names of recorded metrics"""
+        with self._lock:
+            return sorted({metric for metric, _, _ in self._histograms})
+
+    def to_dict(self, include_buckets: bool = True) -> Dict[str, Any]:
+        """
+        Convert to dictionary
+
+        Args:
+            include_buckets: Include raw histogram buckets
+
+        Returns:
+            Dict of metric -> {"all": summary, "by_<dimension>": {value: summary}},
+            plus "llm_calls" with call, retry and source counts per breakdown
+        """
+        with self._lock:
+            data: Dict[str, Any] = {}
+            for (metric, dimension, value), histogram in sorted(self._histograms.items()):
+                entry = data.setdefault(metric, {})
+                summary = histogram.to_dict(include_buckets)
+                if dimension:
+                    entry.setdefault(f"by_{dimension}", {})[value] = summary
+                else:
+                    entry["all"] = summary
+
+            calls: Dict[str, Any] = {}
+            for (dimension, value), counts in sorted(self._call_counts.items()):
+                if dimension:
+                    calls.setdefault(f"by_{dimension}", {})[value] = dict(counts)
+                else:
+                    calls["all"] = dict(counts)
+            if calls:
+                data["llm_calls"] = calls
+            return data
+
+    def save(self, path: str) -> None:
+        """
+        Write the histograms to a JSON file
+
+        Args:
+            path: Output file path
+        """
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+
+# Recorder bound to the current run (set per execution context)
+_recorder: ContextVar[Optional[LatencyRecorder]] = ContextVar("latency_recorder", default=None)
+
+
+def get_latency_recorder() -> Optional[LatencyRecorder]:
+    """
+    Get the recorder bound to the current execution context
+
+    Returns:
+        LatencyRecorder, or None outside a recorded run
+    """
+    return _recorder.get()
+
+
+@contextmanager
+def use_latency_recorder(
+    recorder: Optional[LatencyRecorder],
+) -> Iterator[Optional[LatencyRecorder]]:
+    """
+    Bind a recorder to the current execution context
+
+    LLM calls made inside the block (including from make_llm_call_async
+    worker threads) are recorded into it.
+
+    Args:
+        recorder: Recorder to bind (None disables recording)
+    """
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
@@ -0,0 +1,320 @@
+"""
+LLM Cassette - record and replay make_llm_call traffic
+
+A cassette is a JSONL file (gzip-compressed if the path ends in .gz) with one
+line per LLM call: the request (model, messages), the response, token usage
+and the observed latency.
+
+- Record mode appends every call made through make_llm_call to the cassette
+- Replay mode serves responses from the cassette instead of calling a
+  provider, with zero latency or the recorded latency scaled by a factor
+
+Replay makes whole-pipeline runs (orchestrator, parsing, persistence)
+deterministic and offline, which is what regression tests, profiling and
+benchmarks need. Requests are matched on a hash of (model, messages). When the
+same request occurs several times, recorded responses are served in order and
+the last one is repeated once they run out.
+
+Configuration via environment variables:
+- SCENARIO_LLM_CASSETTE: Path to the cassette file (unset = disabled)
+- SCENARIO_LLM_CASSETTE_MODE: "record" or "replay" (default: replay)
+- SCENARIO_LLM_CASSETTE_LATENCY: Replay latency as a multiple of the recorded
+  latency (default: 0 = instant)
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("record", "replay")
+
+
+class CassetteMissError(LookupError):
+    """Raised in strict replay mode when a request isn't on the cassette"""
+
+
+@dataclass
+class CassetteEntry:
+    """One recorded LLM call"""
+    key: str
+    model: str
+    content: str
+    tokens_used: int
+    input_tokens: int
+    output_tokens: int
+    latency: float = 0.0
+    messages: Optional[List[Dict[str, Any]]] = None
+    context: Dict[str, Any] = field(default_factory=dict)
+    cached_input_tokens: int = 0
+
+
+def request_key(model: str, messages: List[Dict[str, Any]]) -> str:
+    """
+    Compute the replay key for a request
+
+    Args:
+        model: Model identifier
+        messages: Request messages
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps({"model": model, "messages": messages}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _open_cassette(path: Path, mode: str) -> IO[str]:
+    """Open a cassette file as text, transparently handling gzip"""
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class LLMCassette:
+    """
+    Records or replays LLM calls
+
+    Thread-safe: make_llm_call runs on worker threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        latency_scale: float = 0.0,
+        strict: bool = True,
+        store_requests: bool = True,
+    ):
+        """
+        Initialize cassette
+
+        Args:
+            path: Cassette file path (.jsonl, or .jsonl.gz for compression)
+            mode: "record" or "replay"
+            latency_scale: Replay latency as a multiple of the recorded latency
+            strict: In replay mode, raise CassetteMissError for unknown requests
+                (otherwise they fall through to the real provider)
+            store_requests: In record mode, store request messages (needed to
+                diagnose replay misses; disable for smaller cassettes)
+
+        Raises:
+            ValueError: If mode is unknown
+            FileNotFoundError: If replaying a cassette that doesn't exist
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}' (expected one of {CASSETTE_MODES})")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = max(0.0, latency_scale)
+        self.strict = strict
+        self.store_requests = store_requests
+
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._file: Optional[IO[str]] = None
+        self._entries: Dict[str, List[CassetteEntry]] = {}
+        self._positions: Dict[str, int] = {}
+
+        if mode == "replay":
+            self._load()
+
+    def _load(self) -> None:
+        """Load all entries of the cassette for replay"""
+        count = 0
+        with _open_cassette(self.path, "r") as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = CassetteEntry(**json.loads(line))
+                except (json.JSONDecodeError, TypeError) as e:
+                    # A run killed mid-write can leave a truncated last line
+                    logger.warning(f"Skipping malformed cassette line {line_num} in {self.path}: {e}")
+                    continue
+                self._entries.setdefault(entry.key, []).append(entry)
+                count += 1
+
+        logger.info(f"Loaded {count} LLM calls from cassette {self.path}")
+
+    def record(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        content: str,
+        tokens_used: int,
+        input_tokens: int,
+        output_tokens: int,
+        latency: float,
+        context: Optional[Dict[str, Any]] = None,
+        cached_input_tokens: int = 0,
+    ) -> None:
+        """
+        Append a call to the cassette
+
+        Args:
+            model: Model identifier
+            messages: Request messages
+            content: Response text
+            tokens_used: Total tokens
+            input_tokens: Prompt tokens
+            output_tokens: Completion tokens
+            latency: Wall-clock duration of the call in seconds
+            context: Optional call context (actor, turn, operation)
+            cached_input_tokens: Prompt tokens served from the provider's cache
+        """
+        entry = CassetteEntry(
+            key=request_key(model, messages),
+            model=model,
+            content=content,
+            tokens_used=tokens_used,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            latency=round(latency, 4),
+            messages=messages if self.store_requests else None,
+            context=dict(context or {}),
+            cached_input_tokens=cached_input_tokens,
+        )
+        line = json.dumps(asdict(entry), ensure_ascii=False, separators=(",", ":"), default=str)
+
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = _open_cassette(self.path, "a")
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.recorded += 1
+
+    def replay(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Optional[CassetteEntry]:
+        """
+        Serve the recorded response for a request
+
+        Sleeps for the recorded latency times latency_scale before returning.
+
+        Args:
+            model: Model identifier
+            messages: Request messages
+            context: Optional call context (for the miss message)
+
+        Returns:
+            Recorded entry, or None if not found and not strict
+
+        Raises:
+            CassetteMissError: If not found and strict
+        """
+        key = request_key(model, messages)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                entry = None
+            else:
+                position = self._positions.get(key, 0)
+                entry = entries[min(position, len(entries) - 1)]
+                self._positions[key] = position + 1
+                self.replayed += 1
+
+        if entry is None:
+            if self.strict:
+                raise CassetteMissError(
+                    f"No recorded response for {model} call {context or {}} in cassette {self.path}"
+                )
+            logger.debug(f"Cassette miss for {model}; calling provider")
+            return None
+
+        if self.latency_scale and entry.latency:
+            time.sleep(entry.latency * self.latency_scale)
+        return entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cassette statistics
+
+        Returns:
+            Dict with mode, path and recorded/replayed/miss counts
+        """
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "path": str(self.path),
+                "recorded": self.recorded,
+                "replayed": self.replayed,
+                "misses": self.misses,
+                "unique_requests": len(self._entries),
+            }
+
+    def close(self) -> None:
+        """Close the cassette file (record mode)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+# Global cassette instance (None = disabled)
+_cassette: Optional[LLMCassette] = None
+_cassette_configured = False
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[LLMCassette]:
+    """
+    Get the active cassette, configured from environment variables on first use
+
+    Returns:
+        LLMCassette, or None if record/replay is disabled
+    """
+    global _cassette, _cassette_configured
+    with _cassette_lock:
+        if not _cassette_configured:
+            _cassette_configured = True
+            path = os.environ.get("SCENARIO_LLM_CASSETTE")
+            if path:
+                _cassette = LLMCassette(
+                    path,
+                    mode=os.environ.get("SCENARIO_LLM_CASSETTE_MODE", "replay").lower(),
+                    latency_scale=float(os.environ.get("SCENARIO_LLM_CASSETTE_LATENCY", "0")),
+                )
+        return _cassette
+
+
+def set_cassette(cassette: Optional[LLMCassette]) -> None:
+    """
+    Activate a cassette for all subsequent make_llm_call calls
+
+    Args:
+        cassette: Cassette to use (None disables record/replay)
+    """
+    global _cassette, _cassette_configured
+    with _cassette_lock:
+        if _cassette is not None and _cassette is not cassette:
+            _cassette.close()
+        _cassette = cassette
+        _cassette_configured = True
+
+
+def reset_cassette() -> None:
+    """Close and forget the active cassette (useful for testing)"""
+    global _cassette, _cassette_configured
+    with _cassette_lock:
+        if _cassette is not None:
+            _cassette.close()
+        _cassette = None
+        _cassette_configured = False
@@ -0,0 +1,334 @@
+"""
+Streaming LLM responses
+
+With an LLMStream passed to make_llm_call, providers are asked for a streamed
+completion and the response body is read chunk by chunk instead of waiting
+for the whole body. Two wire formats are understood, detected per line:
+
+- Server-sent events ("data: {...}" lines ending with "data: [DONE]"), used
+  by OpenRouter and Ollama's OpenAI-compatible endpoint
+- NDJSON (one JSON object per line, the last with "done": true), used by
+  Ollama's native API
+
+While text arrives the stream:
+- calls on_progress with the stream (at most every progress_interval
+  seconds, and once at the end), e.g. to emit progress events
+- feeds an IncrementalSectionParser, which notices when the **ACTION:**
+  section of a markdown decision is finished
+- measures the time to the first content token
+- stops reading (closing the connection, so the provider stops generating)
+  once the action is complete, if stop_after_action is set, or once the
+  text exceeds max_chars
+
+The collected text is returned in the same shape as a non-streamed chat
+completion, so callers don't need to know a response was streamed.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Lines that start a section of a markdown response: **NAME:** (text may follow)
+_HEADER_PATTERN = re.compile(r"^\s*\*\*\s*([\w][\w\s-]*?)\s*:\*\*\s*(.*)$")
+
+# Lines that end the final section. response_parser.extract_section ends a
+# **NAME:** section at the next such header (names without hyphens) or
+# horizontal rule; headings and other bold text stay part of the section.
+_SECTION_END_PATTERN = re.compile(r"^\s*\*\*\s*[\w\s]+\s*:\*\*")
+_RULE_PATTERN = re.compile(r"^---+\s*$")
+
+# Sections a decision needs before generation may be stopped after its action
+DECISION_SECTIONS = ("REASONING", "ACTION")
+
+# Reasons a stream stopped before the provider finished
+STOP_ACTION_COMPLETE = "action_complete"
+STOP_MAX_CHARS = "max_chars"
+
+
+class IncrementalSectionParser:
+    """
+    Tracks the sections of a markdown response as it streams in
+
+    Only complete lines are examined, each once, so feeding a response in
+    any number of chunks costs O(n) overall.
+    """
+
+    def __init__(self, final_section: str = "ACTION"):
+        """
+        Initialize parser
+
+        Args:
+            final_section: Section whose completion is reported (action_complete)
+        """
+        self.final_section = final_section
+        self.sections: List[str] = []
+        self.current_section: Optional[str] = None
+        self.final_text: Optional[str] = None
+        self._pending = ""
+        self._final_lines: List[str] = []
+
+    @property
+    def action_complete(self) -> bool:
+        """Whether the final section has been followed by another section (or the end)"""
+        return self.final_text is not None
+
+    def feed(self, text: str) -> None:
+        """
+        Add streamed text
+
+        Args:
+            text: Next chunk of the response
+        """
+        self._pending += text
+        if "\n" not in text:
+            return
+        *lines, self._pending = self._pending.split("\n")
+        for line in lines:
+            self._line(line)
+
+    def finish(self) -> None:
+        """Process the last (unterminated) line at the end of the response"""
+        if self._pending:
+            self._line(self._pending)
+            self._pending = ""
+        self._close_final_section()
+
+    def _line(self, line: str) -> None:
+        in_final = self.current_section == self.final_section and self.final_text is None
+        if in_final and not (_SECTION_END_PATTERN.match(line) or _RULE_PATTERN.match(line)):
+            self._final_lines.append(line)
+            return
+
+        match = _HEADER_PATTERN.match(line)
+        if match:
+            self._close_final_section()
+            self.current_section = match.group(1).strip().upper()
+            self.sections.append(self.current_section)
+            if self.current_section == self.final_section and match.group(2):
+                self._final_lines.append(match.group(2))
+        elif _RULE_PATTERN.match(line):
+            self._close_final_section()
+            self.current_section = None
+
+    def _close_final_section(self) -> None:
+        if self.current_section == self.final_section and self.final_text is None:
+            self.final_text = "\n".join(self._final_lines).strip()
+
+
+class LLMStream:
+    """
+    Consumes one streamed completion
+
+    make_llm_call resets the stream before every attempt, so a retried call
+    reports only the text of the attempt that succeeded.
+    """
+
+    def __init__(
+        self,
+        on_progress: Optional[Callable[[LLMStream], None]] = None,
+        progress_interval: float = 0.25,
+        stop_after_action: bool = False,
+        max_chars: Optional[int] = None,
+    ):
+        """
+        Initialize stream
+
+        Args:
+            on_progress: Called with the stream as text arrives (on the thread
+                making the call)
+            progress_interval: Minimum seconds between on_progress calls
+            stop_after_action: Stop once a markdown decision's action is complete
+                (and its reasoning was seen)
+            max_chars: Stop once the text is longer than this
+        """
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.stop_after_action = stop_after_action
+        self.max_chars = max_chars
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard everything received (before a new attempt)"""
+        self.parser = IncrementalSectionParser()
+        self.chunks: List[str] = []
+        self.chars = 0
+        self.usage: Dict[str, Any] = {}
+        self.finish_reason: Optional[str] = None
+        self.stop_reason: Optional[str] = None
+        self.first_token_delay: Optional[float] = None
+        self.done = False
+        self._started = time.monotonic()
+        self._last_progress = 0.0
+
+    @property
+    def text(self) -> str:
+        """Text received so far"""
+        return "".join(self.chunks)
+
+    @property
+    def action_complete(self) -> bool:
+        """Whether the decision's action section is complete"""
+        return self.parser.action_complete
+
+    def feed(self, text: str) -> bool:
+        """
+        Add a chunk of generated text
+
+        Args:
+            text: Content delta
+
+        Returns:
+            False if a stop condition was reached and reading should stop
+        """
+        if not text:
+            return True
+        if self.first_token_delay is None:
+            self.first_token_delay = time.monotonic() - self._started
+        self.chunks.append(text)
+        self.chars += len(text)
+        self.parser.feed(text)
+
+        if self.max_chars is not None and self.chars >= self.max_chars:
+            self.stop_reason = STOP_MAX_CHARS
+        elif (
+            self.stop_after_action
+            and self.parser.action_complete
+            and all(section in self.parser.sections for section in DECISION_SECTIONS)
+        ):
+            self.stop_reason = STOP_ACTION_COMPLETE
+
+        now = time.monotonic()
+        if self.on_progress is not None and now - self._last_progress >= self.progress_interval:
+            self._last_progress = now
+            self.on_progress(self)
+        return self.stop_reason is None
+
+    def finish(self) -> None:
+        """Mark the response as complete (calls on_progress a last time)"""
+        if self.done:
+            return
+        self.done = True
+        if self.stop_reason is None:
+            self.parser.finish()
+        if self.stop_reason is not None:
+            self.finish_reason = "length" if self.stop_reason == STOP_MAX_CHARS else "stop"
+        if self.on_progress is not None:
+            self.on_progress(self)
+
+    def consume(self, lines: Iterable[Union[bytes, str]]) -> None:
+        """
+        Read a streamed response body
+
+        Args:
+            lines: Lines of the body (e.g. requests.Response.iter_lines())
+        """
+        for raw in lines:
+            line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+            line = line.strip()
+            if not line or line.startswith(":"):
+                continue  # Blank separator or SSE comment (keep-alive)
+            if line.startswith("data:"):
+                line = line[5:].strip()
+                if line == "[DONE]":
+                    break
+            elif not line.startswith("{"):
+                continue  # Other SSE fields (event:, id:, retry:)
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                logger.debug("Skipping malformed stream line: %s", line[:100])
+                continue
+            if not self._event(event):
+                break
+        self.finish()
+
+    def _event(self, event: Dict[str, Any]) -> bool:
+        """Handle one decoded chunk; False when reading should stop"""
+        if event.get("error"):
+            raise ValueError(f"Provider error in stream: {event['error']}")
+        if event.get("usage"):
+            self.usage = event["usage"]
+        elif "prompt_eval_count" in event or "eval_count" in event:
+            # Ollama native API
+            prompt_tokens = event.get("prompt_eval_count", 0)
+            completion_tokens = event.get("eval_count", 0)
+            self.usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            }
+
+        text = ""
+        choices = event.get("choices") or []
+        if choices:
+            choice = choices[0]
+            delta = choice.get("delta") or choice.get("message") or {}
+            text = delta.get("content") or ""
+            if choice.get("finish_reason"):
+                self.finish_reason = choice["finish_reason"]
+        elif isinstance(event.get("message"), dict):
+            text = event["message"].get("content") or ""
+            if event.get("done"):
+                self.finish_reason = event.get("done_reason", "stop")
+
+        keep_reading = self.feed(text)
+        return keep_reading and not event.get("done", False)
+
+    def result(self, estimated_prompt_tokens: int = 0) -> Dict[str, Any]:
+        """
+        Build a chat completion response from the streamed text
+
+        Args:
+            estimated_prompt_tokens: Prompt tokens to report when the provider
+                sent no usage (or the stream was stopped before it)
+
+        Returns:
+            Dict with 'choices' and 'usage' like a non-streamed response
+        """
+        text = self.text
+        usage = dict(self.usage)
+        if not usage.get("total_tokens"):
+            completion_tokens = max(1, len(text) // 4) if text else 0
+            usage = {
+                "prompt_tokens": estimated_prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": estimated_prompt_tokens + completion_tokens,
+            }
+        return {
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": self.finish_reason or "stop",
+            }],
+            "usage": usage,
+        }
+
+
+def sse_lines(body: Dict[str, Any], chunk_chars: int = 16) -> List[str]:
+    """
+    Render a chat completion response as server-sent events
+
+    Used by the mock backend to stream its responses.
+
+    Args:
+        body: Non-streamed response body ('choices' and 'usage')
+        chunk_chars: Characters per content chunk
+
+    Returns:
+        SSE lines, ending with the usage chunk and "data: [DONE]"
+    """
+    content = body["choices"][0]["message"]["content"]
+    lines = []
+    for start in range(0, len(content), chunk_chars):
+        chunk = {"choices": [{"index": 0, "delta": {"content": content[start:start + chunk_chars]}}]}
+        lines.append("data: " + json.dumps(chunk))
+    final = {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+    lines.append("data: " + json.dumps(final))
+    lines.append("data: " + json.dumps({"choices": [], "usage": body.get("usage", {})}))
+    lines.append("data: [DONE]")
+    return lines
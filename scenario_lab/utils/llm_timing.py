@@ -0,0 +1,126 @@
+"""
+LLM call timing - where the wall-clock time of LLM calls goes
+
+Every make_llm_call fills a CallTiming that splits its duration into:
+- executor_wait: waiting for a worker thread (make_llm_call_async)
+- queue_wait: waiting for a slot from the outbound limiter (including
+  rate-limit cooldowns)
+- network: time spent inside provider requests, summed over attempts
+- backoff: sleeping between retries
+
+plus the number of attempts, the time to first byte (until the successful
+response's headers arrived) and, for streamed calls, the time to the first
+generated token.
+
+Completed calls are aggregated process-wide in LLMTimingStats, so a benchmark
+can tell engine overhead and our own queueing apart from provider latency.
+"""
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+CALL_SOURCES = ("network", "cache", "replay")
+
+
+@dataclass
+class CallTiming:
+    """Timing breakdown of a single LLM call (seconds)"""
+    executor_wait: float = 0.0
+    queue_wait: float = 0.0
+    network: float = 0.0
+    backoff: float = 0.0
+    attempts: int = 0
+    wall: float = 0.0
+    ttfb: float = 0.0
+    ttft: float = 0.0  # Streamed calls only (0 otherwise)
+
+    @property
+    def retries(self) -> int:
+        """Attempts beyond the first"""
+        return max(0, self.attempts - 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {**asdict(self), "retries": self.retries}
+
+
+class LLMTimingStats:
+    """Thread-safe aggregate of CallTimings"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all recorded calls"""
+        with self._lock:
+            self.calls = dict.fromkeys(CALL_SOURCES, 0)
+            self.totals = CallTiming()
+
+    def record(self, timing: CallTiming, source: str = "network") -> None:
+        """
+        Add a completed call
+
+        Args:
+            timing: The call's timing
+            source: Where the response came from: network, cache or replay
+        """
+        with self._lock:
+            self.calls[source] = self.calls.get(source, 0) + 1
+            self.totals.executor_wait += timing.executor_wait
+            self.totals.queue_wait += timing.queue_wait
+            self.totals.network += timing.network
+            self.totals.backoff += timing.backoff
+            self.totals.attempts += timing.attempts
+            self.totals.wall += timing.wall
+            self.totals.ttfb += timing.ttfb
+            self.totals.ttft += timing.ttft
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the aggregated timings
+
+        Returns:
+            Dict with call counts per source, total attempts and retries, and
+            total seconds per component
+        """
+        with self._lock:
+            network_calls = self.calls.get("network", 0)
+            return {
+                "calls": dict(self.calls),
+                "attempts": self.totals.attempts,
+                "retries": max(0, self.totals.attempts - network_calls),
+                "wall": self.totals.wall,
+                "executor_wait": self.totals.executor_wait,
+                "queue_wait": self.totals.queue_wait,
+                "network": self.totals.network,
+                "backoff": self.totals.backoff,
+                "ttfb": self.totals.ttfb,
+                "ttft": self.totals.ttft,
+            }
+
+
+# Global timing stats instance
+_timing_stats: Optional[LLMTimingStats] = None
+_timing_stats_lock = threading.Lock()
+
+
+def get_llm_timing_stats() -> LLMTimingStats:
+    """
+    Get the global LLM timing stats instance
+
+    Returns:
+        LLMTimingStats instance
+    """
+    global _timing_stats
+    with _timing_stats_lock:
+        if _timing_stats is None:
+            _timing_stats = LLMTimingStats()
+        return _timing_stats
+
+
+def reset_llm_timing_stats() -> None:
+    """Reset the global LLM timing stats (useful for testing)"""
+    global _timing_stats
+    with _timing_stats_lock:
+        _timing_stats = None
@@ -3,16 +3,45 @@ Structured logging configuration for Scenario Lab V2
 
 Provides centralized logging with context (turn, actor, phase) and
 optional JSON formatting for production environments.
+
+Log calls do not format or write on the calling thread. setup_logging puts
+a QueueHandler on the root logger that captures the context and the
+message and enqueues the record; a QueueListener thread runs the console
+and file handlers, so formatting, JSON encoding and I/O stay out of the
+event loop and turn latency. JSON uses orjson when installed.
+
+Hot-path debug logs (per actor, per metric, per cache lookup) are sampled
+per call site: the first records from a call site pass, after that one in
+every N, marked with a "sampled" field. Prefer %-style arguments on hot
+paths (logger.debug("Cache hit for %s", model)) so messages that are
+filtered out are never built.
 """
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
 import sys
 import json
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, List, TextIO, Tuple
+from datetime import datetime, timezone
 from contextvars import ContextVar
 
+from scenario_lab.utils.tracing import current_span
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Debug records passed per call site before sampling starts, and the
+# sampling rate after that (1 keeps every record)
+DEBUG_BURST = 100
+DEBUG_SAMPLE_EVERY = 100
+
 
 # Context variables for adding metadata to all logs
 current_turn: ContextVar[Optional[int]] = ContextVar('current_turn', default=None)
@@ -26,7 +55,8 @@ class ContextFilter(logging.Filter):
     """
     Adds context information to log records
 
-    Injects turn, actor, phase, scenario, and run_id into every log record.
+    Injects turn, actor, phase, scenario, run_id and the current tracing
+    span's trace_id and span_id into every log record.
     """
 
     def filter(self, record: logging.LogRecord) -> bool:
@@ -36,9 +66,89 @@ class ContextFilter(logging.Filter):
         record.phase = current_phase.get()
         record.scenario = current_scenario.get()
         record.run_id = current_run_id.get()
+        span = current_span()
+        record.trace_id = span.trace_id if span else None
+        record.span_id = span.span_id if span else None
         return True
 
 
+class SamplingFilter(logging.Filter):
+    """
+    Samples frequent low-level records per call site
+
+    The first `burst` records from each call site (file and line) pass;
+    after that one record in `every` passes, with record.sampled set to
+    the sampling rate. Records above `level` always pass.
+    """
+
+    def __init__(
+        self,
+        burst: int = DEBUG_BURST,
+        every: int = DEBUG_SAMPLE_EVERY,
+        level: int = logging.DEBUG,
+    ):
+        """
+        Initialize sampling filter
+
+        Args:
+            burst: Records passed per call site before sampling
+            every: Pass one record in this many after the burst
+            level: Highest level that is sampled
+        """
+        super().__init__()
+        self.burst = burst
+        self.every = max(1, every)
+        self.level = level
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether a record passes"""
+        if record.levelno > self.level or self.every == 1:
+            return True
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            count = self._counts.get(key, 0) + 1
+            self._counts[key] = count
+        if count <= self.burst:
+            return True
+        if (count - self.burst) % self.every == 0:
+            record.sampled = self.every
+            return True
+        return False
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that defers formatting to the listener thread
+
+    Unlike QueueHandler.prepare, only the message (%-arguments merged, so
+    later changes to the arguments don't show) and the traceback text are
+    resolved on the logging thread; formatters run in the listener.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copy the record with its message and traceback resolved"""
+        message = record.getMessage()
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = self._exception_formatter.formatException(record.exc_info)
+        record = copy.copy(record)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+        return record
+
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str, ensure_ascii=False)
+
+
 class JSONFormatter(logging.Formatter):
     """
     Formats log records as JSON for structured logging
@@ -48,8 +158,10 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
+        # Time of the log call, not of formatting (formatting may be deferred)
+        created = datetime.fromtimestamp(record.created, timezone.utc)
         log_data = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': created.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -71,9 +183,15 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'phase') and record.phase:
             log_data['phase'] = record.phase
 
-        # Add exception info if present
+        if getattr(record, 'span_id', None):
+            log_data['trace_id'] = record.trace_id
+            log_data['span_id'] = record.span_id
+
+        # Add exception info if present (as text when prepared by ContextQueueHandler)
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data['exception'] = record.exc_text
 
         # Add extra fields from record
         if hasattr(record, 'cost'):
@@ -85,7 +203,10 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'model'):
             log_data['model'] = record.model
 
-        return json.dumps(log_data)
+        if hasattr(record, 'sampled'):
+            log_data['sampled'] = record.sampled
+
+        return _json_dumps(log_data)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -107,7 +228,8 @@ class ColoredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors"""
-        # Add color to level name
+        # Color a copy: the record is shared with the other handlers (e.g. the JSON file)
+        record = copy.copy(record)
         levelname = record.levelname
         if levelname in self.COLORS:
             record.levelname = (
@@ -140,21 +262,38 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
+# Listener running the real handlers (when logging through a queue)
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
 def setup_logging(
     level: str = "INFO",
     format_type: str = "colored",
     log_file: Optional[Path] = None,
     enable_file_logging: bool = False,
+    use_queue: bool = True,
+    stream: Optional[TextIO] = None,
+    debug_burst: int = DEBUG_BURST,
+    debug_sample_every: int = DEBUG_SAMPLE_EVERY,
 ) -> None:
     """
     Setup structured logging for Scenario Lab
 
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        format_type: Formatter type ("colored", "json", "simple")
+        format_type: Formatter type ("colored", "json", "simple", "message")
         log_file: Path to log file (if enable_file_logging=True)
         enable_file_logging: Whether to write logs to file
+        use_queue: Format and write on a background thread (QueueListener)
+            instead of on the logging thread
+        stream: Console stream (default: stdout)
+        debug_burst: Debug records passed per call site before sampling
+        debug_sample_every: Keep one in this many debug records per call
+            site after the burst (1 keeps every record)
     """
+    shutdown_logging()
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
@@ -162,14 +301,12 @@ def setup_logging(
     # Remove existing handlers
     root_logger.handlers.clear()
 
+    handlers: List[logging.Handler] = []
+
     # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = logging.StreamHandler(stream or sys.stdout)
     console_handler.setLevel(getattr(logging, level.upper()))
 
-    # Add context filter
-    context_filter = ContextFilter()
-    console_handler.addFilter(context_filter)
-
     # Choose formatter
     if format_type == "json":
         formatter = JSONFormatter()
@@ -178,6 +315,8 @@ def setup_logging(
             fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
+    elif format_type == "message":
+        formatter = logging.Formatter(fmt='%(message)s')
     else:  # simple
         formatter = logging.Formatter(
             fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -185,7 +324,7 @@ def setup_logging(
         )
 
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # Add file handler if requested
     if enable_file_logging:
@@ -202,11 +341,65 @@ def setup_logging(
             backupCount=5,
         )
         file_handler.setLevel(logging.DEBUG)  # Always DEBUG for file
-        file_handler.addFilter(context_filter)
 
         # File logs are always JSON for structured analysis
         file_handler.setFormatter(JSONFormatter())
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Context is read on the logging thread, so the filters sit on the
+    # handler that runs there: the queue handler, or each handler directly
+    filters: List[logging.Filter] = [ContextFilter()]
+    if debug_sample_every > 1:
+        filters.append(SamplingFilter(burst=debug_burst, every=debug_sample_every))
+
+    if not use_queue:
+        for handler in handlers:
+            for log_filter in filters:
+                handler.addFilter(log_filter)
+            root_logger.addHandler(handler)
+        return
+
+    # Unbounded queue: a log call never blocks on a slow console or disk
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = ContextQueueHandler(log_queue)
+    for log_filter in filters:
+        queue_handler.addFilter(log_filter)
+    root_logger.addHandler(queue_handler)
+
+    global _listener
+    with _listener_lock:
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+
+
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop the logging thread
+
+    The listener's handlers are moved to the root logger, so records logged
+    afterwards are still written (synchronously). Called at exit and when
+    setup_logging is called again.
+    """
+    global _listener
+    with _listener_lock:
+        listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, ContextQueueHandler):
+            root_logger.removeHandler(handler)
+            for handler_to_move in listener.handlers:
+                for log_filter in handler.filters:
+                    handler_to_move.addFilter(log_filter)
+                root_logger.addHandler(handler_to_move)
+
+
+atexit.register(shutdown_logging)
 
 
 def set_context(
@@ -0,0 +1,632 @@
+"""
+Mock LLM backend for load testing and offline runs
+
+Models named ``mock/<name>`` are answered in-process by a deterministic
+generator instead of a provider. Responses follow the formats the pipeline
+parses (actor decisions in markdown or JSON, communication decisions,
+bilateral and coalition responses, world updates, single and batched metric
+extraction, QA validation), so a whole scenario runs end to end. The calls
+still go through api_call_with_retry and the shared outbound limiter, so
+injected 429s and 5xx errors exercise the real retry and backoff paths.
+
+Behaviour is configured per model with query parameters, falling back to
+environment variables:
+
+    mock/fast
+    mock/slow?latency=2.0&distribution=lognormal&stddev=1.0
+    mock/flaky?rate_limit_rate=0.1&error_rate=0.05&retry_after=0.5
+    mock/verbose?tokens=800&seed=7
+
+- latency: Mean latency in seconds (SCENARIO_MOCK_LATENCY, default 0)
+- distribution: fixed, uniform, normal, lognormal or exponential
+  (SCENARIO_MOCK_DISTRIBUTION, default fixed)
+- stddev: Spread for uniform/normal/lognormal (SCENARIO_MOCK_STDDEV, default 0)
+- tokens: Approximate completion tokens (SCENARIO_MOCK_TOKENS, default 150)
+- rate_limit_rate: Fraction of attempts answered with 429 (SCENARIO_MOCK_RATE_LIMIT_RATE)
+- error_rate: Fraction of attempts answered with 500/502/503 (SCENARIO_MOCK_ERROR_RATE)
+- retry_after: Retry-After seconds sent with 429s (SCENARIO_MOCK_RETRY_AFTER, default 1)
+- seed: Seed for all randomness (SCENARIO_MOCK_SEED, default 0)
+
+Content, latency and failures are derived from the seed, the request and the
+attempt number, so they don't depend on how concurrent calls interleave.
+
+The backend also simulates a provider prompt cache: when a request's prefix
+(every message but the last) was seen before, its tokens are reported as
+cached in usage.prompt_tokens_details.cached_tokens.
+
+Setting SCENARIO_MOCK_ALL_MODELS=1 (or calling set_mock_all_models(True))
+routes every model to the mock backend with the default configuration, so an
+existing scenario can be benchmarked without editing its model names.
+
+MockLLMServer serves the same backend over HTTP as an OpenAI-compatible
+``/v1/chat/completions`` endpoint (start it with ``scenario-lab mock-server``
+and point OLLAMA_BASE_URL at it) when the full HTTP stack should be measured.
+Requests with "stream": true are answered with server-sent events.
+"""
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, fields, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+import requests
+
+from scenario_lab.utils.llm_streaming import sse_lines
+from scenario_lab.utils.outbound_limiter import CHARS_PER_TOKEN, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+MOCK_PREFIX = "mock/"
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+_WORDS = (
+    "negotiators", "pressure", "coalition", "timeline", "resources", "signals",
+    "concessions", "markets", "observers", "leverage", "delegations", "capacity",
+    "commitments", "uncertainty", "partners", "oversight", "incentives", "risks",
+)
+
+
+@dataclass
+class MockLLMConfig:
+    """Behaviour of a mock model"""
+
+    latency: float = 0.0
+    distribution: str = "fixed"
+    stddev: float = 0.0
+    tokens: int = 150
+    rate_limit_rate: float = 0.0
+    error_rate: float = 0.0
+    retry_after: float = 1.0
+    seed: int = 0
+
+    @classmethod
+    def from_env(cls) -> "MockLLMConfig":
+        """Create the default configuration from environment variables."""
+        return cls(
+            latency=float(os.environ.get("SCENARIO_MOCK_LATENCY", "0")),
+            distribution=os.environ.get("SCENARIO_MOCK_DISTRIBUTION", "fixed"),
+            stddev=float(os.environ.get("SCENARIO_MOCK_STDDEV", "0")),
+            tokens=int(os.environ.get("SCENARIO_MOCK_TOKENS", "150")),
+            rate_limit_rate=float(os.environ.get("SCENARIO_MOCK_RATE_LIMIT_RATE", "0")),
+            error_rate=float(os.environ.get("SCENARIO_MOCK_ERROR_RATE", "0")),
+            retry_after=float(os.environ.get("SCENARIO_MOCK_RETRY_AFTER", "1")),
+            seed=int(os.environ.get("SCENARIO_MOCK_SEED", "0")),
+        )
+
+    def with_params(self, query: str) -> "MockLLMConfig":
+        """
+        Apply overrides from a model query string (e.g. "latency=0.5&tokens=300")
+
+        Raises:
+            ValueError: If a parameter is unknown or the distribution is invalid
+        """
+        names = {f.name for f in fields(self)}
+        overrides: Dict[str, Any] = {}
+        for key, value in parse_qsl(query):
+            if key not in names:
+                raise ValueError(f"Unknown mock model parameter '{key}'")
+            current = getattr(self, key)
+            overrides[key] = type(current)(value)
+        config = replace(self, **overrides)
+        if config.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution '{config.distribution}' "
+                f"(expected one of {LATENCY_DISTRIBUTIONS})"
+            )
+        return config
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """Draw a latency in seconds from the configured distribution."""
+        mean = self.latency
+        if mean <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            value = rng.uniform(mean - self.stddev, mean + self.stddev)
+        elif self.distribution == "normal":
+            value = rng.gauss(mean, self.stddev)
+        elif self.distribution == "lognormal":
+            # Parametrized so the samples have the configured mean and stddev
+            sigma = math.sqrt(math.log(1 + (self.stddev / mean) ** 2))
+            value = rng.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma)
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1.0 / mean)
+        else:
+            value = mean
+        return max(0.0, value)
+
+
+def is_mock_model(model: str) -> bool:
+    """
+    Check if a model string refers to the mock backend
+
+    Args:
+        model: Model identifier
+
+    Returns:
+        True for "mock/..." models
+    """
+    return model.startswith(MOCK_PREFIX)
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256("\x00".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+class MockResponseGenerator:
+    """Produces well-formed responses for the prompts Scenario Lab sends"""
+
+    def __init__(self, seed: int = 0, tokens: int = 150):
+        """
+        Initialize generator
+
+        Args:
+            seed: Seed mixed into every response
+            tokens: Approximate length of narrative responses in tokens
+        """
+        self.seed = seed
+        self.tokens = max(1, tokens)
+
+    def generate(self, messages: List[Dict[str, Any]]) -> str:
+        """
+        Generate a response for a request
+
+        Args:
+            messages: Request messages
+
+        Returns:
+            Response text in the format the prompt asks for
+        """
+        system = "\n".join(str(m.get("content", "")) for m in messages if m.get("role") == "system")
+        user = "\n".join(str(m.get("content", "")) for m in messages if m.get("role") != "system")
+        rng = random.Random(_digest(self.seed, system, user))
+
+        if "Return ONLY a JSON object mapping each metric name" in system:
+            return self._metrics_batch(user, rng)
+        if "Return ONLY a numeric value" in system:
+            return f"{rng.uniform(0, 10):.1f}"
+        if "PASSED: Yes/No" in user:
+            return self._validation(rng)
+        if "**INITIATE_BILATERAL:**" in user:
+            return self._communication_decision(rng)
+        if "## Coalition Proposal" in user:
+            return self._coalition_response(rng)
+        if "**INTERNAL_NOTES:**" in user:
+            return self._bilateral_response(rng)
+        if "**UPDATED STATE:**" in user:
+            return self._world_update(rng)
+        if "respond with a valid JSON object" in user and '"goals"' in user:
+            return self._decision_json(rng)
+        if "**LONG-TERM GOALS:**" in user or "**REASONING:**" in user:
+            return self._decision_markdown(rng)
+        return self._text(rng, self.tokens)
+
+    def _sentence(self, rng: random.Random) -> str:
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(6, 12))]
+        return " ".join(words).capitalize() + "."
+
+    def _text(self, rng: random.Random, tokens: int) -> str:
+        """Filler prose of roughly the given number of tokens"""
+        target = max(1, tokens) * CHARS_PER_TOKEN
+        sentences: List[str] = []
+        length = 0
+        while length < target:
+            sentence = self._sentence(rng)
+            sentences.append(sentence)
+            length += len(sentence) + 1
+        return " ".join(sentences)
+
+    def _bullets(self, rng: random.Random, count: int) -> str:
+        return "\n".join(f"- {self._sentence(rng)}" for _ in range(count))
+
+    def _remaining(self, *parts: str) -> int:
+        """Token budget left for narrative text after fixed parts"""
+        used = sum(len(part) for part in parts) // CHARS_PER_TOKEN
+        return max(1, self.tokens - used)
+
+    def _decision_markdown(self, rng: random.Random) -> str:
+        goals = (
+            f"**LONG-TERM GOALS:**\n{self._bullets(rng, 2)}\n\n"
+            f"**SHORT-TERM PRIORITIES:**\n{self._bullets(rng, 2)}\n\n"
+        )
+        budget = self._remaining(goals) // 2
+        return (
+            f"{goals}"
+            f"**REASONING:**\n{self._text(rng, budget)}\n\n"
+            f"**ACTION:**\n{self._text(rng, budget)}"
+        )
+
+    def _decision_json(self, rng: random.Random) -> str:
+        goals = {
+            "long_term": self._sentence(rng),
+            "short_term": self._sentence(rng),
+        }
+        budget = self._remaining(*goals.values()) // 2
+        decision = {
+            "goals": goals,
+            "reasoning": self._text(rng, budget),
+            "action": self._text(rng, budget),
+        }
+        return "```json\n" + json.dumps(decision, indent=2) + "\n```"
+
+    def _world_update(self, rng: random.Random) -> str:
+        changes = (
+            f"**KEY CHANGES:**\n{self._bullets(rng, 3)}\n\n"
+            f"**CONSEQUENCES:**\n{self._bullets(rng, 2)}"
+        )
+        budget = self._remaining(changes)
+        paragraphs = [self._text(rng, budget // 2), self._text(rng, budget - budget // 2)]
+        return "**UPDATED STATE:**\n" + "\n\n".join(paragraphs) + "\n\n" + changes
+
+    def _communication_decision(self, rng: random.Random) -> str:
+        return (
+            "**INITIATE_BILATERAL:** no\n"
+            "**TARGET_ACTOR:** none\n"
+            "**PROPOSED_MESSAGE:** none\n\n"
+            f"**REASONING:** {self._sentence(rng)}"
+        )
+
+    def _bilateral_response(self, rng: random.Random) -> str:
+        return (
+            f"**RESPONSE:**\n{self._text(rng, self.tokens // 2)}\n\n"
+            f"**INTERNAL_NOTES:**\n{self._sentence(rng)}"
+        )
+
+    def _coalition_response(self, rng: random.Random) -> str:
+        decision = "accept" if rng.random() < 0.5 else "reject"
+        return (
+            f"**DECISION:** {decision}\n"
+            f"**RESPONSE:** {self._sentence(rng)}\n\n"
+            f"**INTERNAL_NOTES:** {self._sentence(rng)}"
+        )
+
+    def _validation(self, rng: random.Random) -> str:
+        return (
+            "PASSED: Yes\n"
+            "ISSUES: None\n"
+            "SEVERITY: None\n"
+            f"EXPLANATION: {self._sentence(rng)}"
+        )
+
+    def _metrics_batch(self, user: str, rng: random.Random) -> str:
+        values: Dict[str, Any] = {}
+        for name, answer in re.findall(r"^- (\S+) \(([^)]*)\):", user, re.MULTILINE):
+            if answer.startswith("one of:"):
+                categories = [c.strip() for c in answer[len("one of:"):].split(",") if c.strip()]
+                values[name] = rng.choice(categories) if categories else 0
+            elif answer == "true or false":
+                values[name] = rng.random() < 0.5
+            else:
+                values[name] = round(rng.uniform(0, 10), 1)
+        return json.dumps(values)
+
+
+class MockLLMBackend:
+    """
+    Serves mock completions with simulated latency and failures
+
+    Thread-safe: calls arrive from worker threads and server threads.
+    """
+
+    def __init__(self, default_config: Optional[MockLLMConfig] = None):
+        """
+        Initialize backend
+
+        Args:
+            default_config: Configuration for models without overrides
+                (defaults to environment)
+        """
+        self.default_config = default_config or MockLLMConfig.from_env()
+        self.requests = 0
+        self.injected_rate_limits = 0
+        self.injected_errors = 0
+        self.prompt_cache_hits = 0
+        self._attempts: Dict[str, int] = {}
+        self._prompt_prefixes: set = set()
+        self._configs: Dict[str, MockLLMConfig] = {}
+        self._lock = threading.Lock()
+
+    def config_for(self, model: str) -> MockLLMConfig:
+        """
+        Get the configuration for a model string
+
+        Args:
+            model: "mock/<name>[?params]" (or any name, for the HTTP server)
+
+        Returns:
+            MockLLMConfig with the model's overrides applied
+        """
+        with self._lock:
+            config = self._configs.get(model)
+            if config is None:
+                _, _, query = model.partition("?")
+                config = self.default_config.with_params(query)
+                self._configs[model] = config
+            return config
+
+    def complete(
+        self, model: str, messages: List[Dict[str, Any]]
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """
+        Answer one attempt of a chat completion request
+
+        Sleeps for the sampled latency before returning.
+
+        Args:
+            model: Model string
+            messages: Request messages
+
+        Returns:
+            (HTTP status, OpenAI-style response body, response headers)
+        """
+        config = self.config_for(model)
+        key = _digest(model, json.dumps(messages, sort_keys=True))
+        with self._lock:
+            attempt = self._attempts.get(key, 0)
+            self._attempts[key] = attempt + 1
+            self.requests += 1
+
+        rng = random.Random(_digest(config.seed, key, attempt))
+        time.sleep(config.sample_latency(rng))
+
+        roll = rng.random()
+        if roll < config.rate_limit_rate:
+            with self._lock:
+                self.injected_rate_limits += 1
+            return (
+                429,
+                {"error": {"message": "Rate limit exceeded (mock)", "code": 429}},
+                {"Retry-After": f"{config.retry_after:g}"},
+            )
+        if roll < config.rate_limit_rate + config.error_rate:
+            status = rng.choice((500, 502, 503))
+            with self._lock:
+                self.injected_errors += 1
+            return status, {"error": {"message": "Upstream error (mock)", "code": status}}, {}
+
+        content = MockResponseGenerator(config.seed, config.tokens).generate(messages)
+        prompt_tokens = estimate_tokens(messages)
+        completion_tokens = max(1, len(content) // CHARS_PER_TOKEN)
+        cached_tokens = self._cached_prefix_tokens(model, messages)
+        body = {
+            "id": f"mock-{key[:16]}-{attempt}",
+            "object": "chat.completion",
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": cached_tokens},
+            },
+        }
+        return 200, body, {}
+
+    def _cached_prefix_tokens(self, model: str, messages: List[Dict[str, Any]]) -> int:
+        """Tokens of the request prefix if an earlier request shared it"""
+        if len(messages) < 2:
+            return 0
+        prefix = messages[:-1]
+        key = _digest(model, json.dumps(prefix, sort_keys=True))
+        with self._lock:
+            if key not in self._prompt_prefixes:
+                self._prompt_prefixes.add(key)
+                return 0
+            self.prompt_cache_hits += 1
+        return estimate_tokens(prefix)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get backend statistics
+
+        Returns:
+            Dict with request, injected failure and prompt cache hit counts
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "injected_rate_limits": self.injected_rate_limits,
+                "injected_errors": self.injected_errors,
+                "prompt_cache_hits": self.prompt_cache_hits,
+            }
+
+
+def build_http_response(
+    status: int, body: Dict[str, Any], headers: Dict[str, str]
+) -> requests.Response:
+    """
+    Wrap a mock completion in a requests.Response
+
+    Lets api_call_with_retry treat mock failures exactly like provider failures.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode("utf-8")
+    response.headers.update(headers)
+    response.headers["Content-Type"] = "application/json"
+    response.url = "mock://chat/completions"
+    response.reason = "OK" if status == 200 else "Mock Error"
+    return response
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """OpenAI-compatible chat completions handler"""
+
+    backend: MockLLMBackend
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") in ("", "/health"):
+            self._send(200, {"status": "ok", **self.backend.get_stats()}, {})
+        else:
+            self._send(404, {"error": {"message": "Not found"}}, {})
+
+    def do_POST(self) -> None:
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send(404, {"error": {"message": "Not found"}}, {})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            model = str(payload.get("model", "mock/server"))
+            messages = payload["messages"]
+        except (ValueError, KeyError) as e:
+            self._send(400, {"error": {"message": f"Invalid request: {e}"}}, {})
+            return
+
+        status, body, headers = self.backend.complete(model, messages)
+        if payload.get("stream") and status == 200:
+            self._send_stream(body, headers)
+        else:
+            self._send(status, body, headers)
+
+    def _send(self, status: int, body: Dict[str, Any], headers: Dict[str, str]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, body: Dict[str, Any], headers: Dict[str, str]) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            for line in sse_lines(body):
+                self.wfile.write(line.encode("utf-8") + b"\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client stopped reading early
+        self.close_connection = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"Mock LLM server: {format % args}")
+
+
+class MockLLMServer:
+    """Local HTTP stand-in for an OpenAI-compatible provider"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        backend: Optional[MockLLMBackend] = None,
+    ):
+        """
+        Initialize server (binds immediately; port 0 picks a free port)
+
+        Args:
+            host: Interface to bind to
+            port: Port to bind to
+            backend: Backend answering requests (defaults to a new one from environment)
+        """
+        self.backend = backend or MockLLMBackend()
+        handler = type("MockHandler", (_MockHandler,), {"backend": self.backend})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server (use as OLLAMA_BASE_URL)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockLLMServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="mock-llm-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the current thread until interrupted"""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+# Global mock backend instance
+_mock_backend: Optional[MockLLMBackend] = None
+_mock_backend_lock = threading.Lock()
+_mock_all_models: Optional[bool] = None  # None = use SCENARIO_MOCK_ALL_MODELS
+
+
+def get_mock_backend() -> MockLLMBackend:
+    """
+    Get the global mock backend instance
+
+    Returns:
+        MockLLMBackend instance
+    """
+    global _mock_backend
+    with _mock_backend_lock:
+        if _mock_backend is None:
+            _mock_backend = MockLLMBackend()
+        return _mock_backend
+
+
+def set_mock_backend(backend: Optional[MockLLMBackend]) -> None:
+    """
+    Replace the global mock backend (e.g. with a non-default configuration)
+
+    Args:
+        backend: Backend to use (None = recreate from environment on next use)
+    """
+    global _mock_backend
+    with _mock_backend_lock:
+        _mock_backend = backend
+
+
+def mock_all_models() -> bool:
+    """
+    Check whether every model should be answered by the mock backend
+
+    Returns:
+        True if enabled via set_mock_all_models or SCENARIO_MOCK_ALL_MODELS
+    """
+    if _mock_all_models is not None:
+        return _mock_all_models
+    return os.environ.get("SCENARIO_MOCK_ALL_MODELS", "").lower() in ("1", "true", "yes")
+
+
+def set_mock_all_models(enabled: Optional[bool]) -> None:
+    """
+    Route every model to the mock backend, or restore normal routing
+
+    Args:
+        enabled: True/False to override, None to follow SCENARIO_MOCK_ALL_MODELS
+    """
+    global _mock_all_models
+    _mock_all_models = enabled
+
+
+def reset_mock_backend() -> None:
+    """Reset the mock backend (useful for testing)."""
+    global _mock_backend, _mock_all_models
+    with _mock_backend_lock:
+        _mock_backend = None
+        _mock_all_models = None
@@ -44,8 +44,18 @@ MODEL_PRICING: Dict[str, Tuple[float, float]] = {
     "local": (0.00, 0.00),
 }
 
+# Price of prompt-cache reads as a fraction of the input price, by model prefix
+# (used when OpenRouter doesn't report a cache read price for the model)
+CACHED_INPUT_DISCOUNTS: Dict[str, float] = {
+    "anthropic/": 0.10,
+    "openai/": 0.50,
+    "google/": 0.25,
+    "deepseek/": 0.10,
+}
+
 # Cache for dynamically fetched pricing
 _dynamic_pricing_cache: Dict[str, Tuple[float, float]] = {}
+_dynamic_cache_read_pricing: Dict[str, float] = {}
 _cache_loaded: bool = False
 
 
@@ -94,6 +104,10 @@ def fetch_openrouter_models(api_key: Optional[str] = None) -> Dict[str, Tuple[fl
 
             if model_id:
                 _dynamic_pricing_cache[model_id] = (prompt_price, completion_price)
+                if pricing.get("input_cache_read") is not None:
+                    _dynamic_cache_read_pricing[model_id] = (
+                        float(pricing["input_cache_read"]) * 1_000_000
+                    )
 
         _cache_loaded = True
         logger.info(f"Loaded pricing for {len(_dynamic_pricing_cache)} models from OpenRouter")
@@ -195,32 +209,64 @@ def get_popular_models() -> List[Dict[str, any]]:
     return popular
 
 
-def calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+def calculate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cached_input_tokens: int = 0,
+) -> float:
     """
     Calculate cost for an LLM API call
 
     Args:
         model: Model identifier (e.g., "openai/gpt-4o-mini")
-        input_tokens: Number of input tokens
+        input_tokens: Number of input tokens (including cached ones)
         output_tokens: Number of output tokens
+        cached_input_tokens: Input tokens read from the provider's prompt
+            cache, billed at the cache read price
 
     Returns:
         Cost in USD
     """
-    # Handle local models
-    if model.startswith("ollama/") or model.startswith("local/"):
+    # Handle local and mock models
+    if model.startswith(("ollama/", "local/", "mock/")):
         return 0.0
 
     # Try dynamic pricing first, then static
     input_cost_per_1m, output_cost_per_1m = get_model_pricing(model)
 
     # Calculate cost
-    input_cost = (input_tokens / 1_000_000) * input_cost_per_1m
+    cached_input_tokens = min(max(cached_input_tokens, 0), input_tokens)
+    input_cost = ((input_tokens - cached_input_tokens) / 1_000_000) * input_cost_per_1m
+    if cached_input_tokens:
+        input_cost += (cached_input_tokens / 1_000_000) * get_cached_input_pricing(model)
     output_cost = (output_tokens / 1_000_000) * output_cost_per_1m
 
     return input_cost + output_cost
 
 
+def get_cached_input_pricing(model: str) -> float:
+    """
+    Get the price of input tokens read from a provider's prompt cache
+
+    Args:
+        model: Model identifier
+
+    Returns:
+        Cost per 1M cached input tokens (the full input price for models
+        without a known cache discount)
+    """
+    dynamic = fetch_openrouter_models()
+    if model in dynamic and model in _dynamic_cache_read_pricing:
+        return _dynamic_cache_read_pricing[model]
+
+    input_cost_per_1m, _ = get_model_pricing(model)
+    for prefix, discount in CACHED_INPUT_DISCOUNTS.items():
+        if model.startswith(prefix):
+            return input_cost_per_1m * discount
+    return input_cost_per_1m
+
+
 def get_model_pricing(model: str) -> Tuple[float, float]:
     """
     Get pricing information for a model
@@ -231,8 +277,8 @@ def get_model_pricing(model: str) -> Tuple[float, float]:
     Returns:
         Tuple of (input_cost_per_1m, output_cost_per_1m)
     """
-    # Handle local models
-    if model.startswith("ollama/") or model.startswith("local/"):
+    # Handle local and mock models
+    if model.startswith(("ollama/", "local/", "mock/")):
         return (0.0, 0.0)
 
     # Check dynamic cache first
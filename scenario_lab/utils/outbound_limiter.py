@@ -0,0 +1,351 @@
+"""
+Outbound LLM Rate Limiter for Scenario Lab
+
+Every LLM call site (actor decisions, world updates, metrics extraction, batch
+runs) shares one limiter, keyed per provider and model. Each key adapts its
+concurrency with AIMD (additive increase, multiplicative decrease):
+
+- Successful calls raise the concurrency limit by roughly one per round trip
+- A 429 halves the limit and starts a shared cooldown (Retry-After when given,
+  otherwise exponential), so concurrent callers wait together instead of
+  retrying in a storm
+- Latency well above the observed baseline gently lowers the limit
+
+An optional tokens-per-minute budget (token bucket) caps throughput for
+providers that meter tokens rather than requests.
+
+Configuration via environment variables:
+- SCENARIO_LLM_INITIAL_CONCURRENCY: Starting concurrency per model (default: 4)
+- SCENARIO_LLM_MAX_CONCURRENCY: Upper bound on concurrency per model (default: 16)
+- SCENARIO_LLM_TOKENS_PER_MINUTE: Token budget per model, 0 = unlimited (default: 0)
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used to estimate prompt size before a call
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class LimiterConfig:
+    """Tuning parameters for one provider/model limiter."""
+
+    initial_concurrency: float = 4.0
+    min_concurrency: float = 1.0
+    max_concurrency: float = 16.0
+    tokens_per_minute: int = 0
+    decrease_factor: float = 0.5
+    latency_tolerance: float = 3.0
+    max_backoff: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "LimiterConfig":
+        """Create the default configuration from environment variables."""
+        config = cls(
+            initial_concurrency=float(os.environ.get("SCENARIO_LLM_INITIAL_CONCURRENCY", "4")),
+            max_concurrency=float(os.environ.get("SCENARIO_LLM_MAX_CONCURRENCY", "16")),
+            tokens_per_minute=int(os.environ.get("SCENARIO_LLM_TOKENS_PER_MINUTE", "0")),
+        )
+        config.initial_concurrency = min(config.initial_concurrency, config.max_concurrency)
+        return config
+
+
+def estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """
+    Estimate the prompt tokens of a message list.
+
+    Args:
+        messages: List of message dicts with 'content'
+
+    Returns:
+        Approximate token count
+    """
+    chars = sum(len(str(message.get("content", ""))) for message in messages)
+    return max(1, chars // CHARS_PER_TOKEN)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter with a shared cooldown and token budget.
+
+    Thread-safe: LLM calls are synchronous and run on worker threads.
+    """
+
+    def __init__(self, key: str, config: LimiterConfig) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            key: Provider/model key (for logging)
+            config: Tuning parameters
+        """
+        self.key = key
+        self.config = config
+        self.limit = config.initial_concurrency
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self.consecutive_rate_limits = 0
+        self.rate_limited_total = 0
+        self.latency_ewma: Optional[float] = None
+        self.latency_floor: Optional[float] = None
+
+        self._tokens = float(config.tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        tpm = self.config.tokens_per_minute
+        if tpm:
+            self._tokens = min(float(tpm), self._tokens + (now - self._last_refill) * tpm / 60.0)
+        self._last_refill = now
+
+    def _wait_time(self, now: float, estimated_tokens: int) -> Optional[float]:
+        """Seconds to wait before a slot can be taken (None = until notified, 0 = go)."""
+        if self.cooldown_until > now:
+            return self.cooldown_until - now
+        if self.in_flight >= max(1, int(self.limit)):
+            return None
+        tpm = self.config.tokens_per_minute
+        if tpm and estimated_tokens > 0:
+            # Calls larger than the whole budget proceed once the bucket is full
+            needed = min(float(estimated_tokens), float(tpm))
+            if self._tokens < needed:
+                return (needed - self._tokens) * 60.0 / tpm
+        return 0.0
+
+    def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        Block until a call may be made, then take a slot.
+
+        Args:
+            estimated_tokens: Tokens the call is expected to consume
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(now, estimated_tokens)
+                if wait == 0.0:
+                    break
+                self._cond.wait(wait)
+
+            self.in_flight += 1
+            if self.config.tokens_per_minute:
+                self._tokens -= estimated_tokens
+
+        waited = time.monotonic() - start
+        if waited > 1.0:
+            logger.debug("Outbound limiter %s: waited %.1fs for a slot", self.key, waited)
+        return waited
+
+    def release(
+        self,
+        latency: Optional[float] = None,
+        rate_limited: bool = False,
+        retry_after: Optional[float] = None,
+        refund_tokens: int = 0,
+    ) -> None:
+        """
+        Give back a slot and feed the call's outcome into the controller.
+
+        Args:
+            latency: Duration of a successful call (None if it failed)
+            rate_limited: Whether the provider answered 429
+            retry_after: Retry-After seconds sent with the 429, if any
+            refund_tokens: Tokens to return to the budget (failed calls)
+        """
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            if refund_tokens and self.config.tokens_per_minute:
+                self._tokens = min(float(self.config.tokens_per_minute), self._tokens + refund_tokens)
+            if rate_limited:
+                self._on_rate_limited(retry_after)
+            elif latency is not None:
+                self._on_success(latency)
+            self._cond.notify_all()
+
+    def record_tokens(self, delta: int) -> None:
+        """
+        Correct the token budget once the actual usage of a call is known.
+
+        Args:
+            delta: Actual tokens minus the estimate passed to acquire()
+        """
+        if not self.config.tokens_per_minute or not delta:
+            return
+        with self._cond:
+            self._tokens -= delta
+            self._cond.notify_all()
+
+    def _on_success(self, latency: float) -> None:
+        self.consecutive_rate_limits = 0
+
+        # Let the floor drift up slowly so one unusually fast call doesn't pin it
+        if self.latency_floor is None:
+            self.latency_floor = latency
+        else:
+            self.latency_floor = min(latency, self.latency_floor * 1.01)
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma = 0.8 * self.latency_ewma + 0.2 * latency
+
+        if self.latency_ewma > self.config.latency_tolerance * self.latency_floor:
+            # Provider is queueing our requests - back off gently
+            self.limit = max(self.config.min_concurrency, self.limit * 0.9)
+        else:
+            self.limit = min(self.config.max_concurrency, self.limit + 1.0 / self.limit)
+
+    def _on_rate_limited(self, retry_after: Optional[float]) -> None:
+        now = time.monotonic()
+        self.rate_limited_total += 1
+        self.consecutive_rate_limits += 1
+
+        # One burst of 429s from concurrent calls counts as a single signal
+        if now >= self.cooldown_until:
+            self.limit = max(self.config.min_concurrency, self.limit * self.config.decrease_factor)
+
+        if retry_after is not None:
+            backoff = min(retry_after, self.config.max_backoff)
+        else:
+            backoff = min(2.0 ** (self.consecutive_rate_limits - 1), self.config.max_backoff)
+        self.cooldown_until = max(self.cooldown_until, now + backoff)
+
+        logger.warning(
+            f"Outbound limiter {self.key}: rate limited, concurrency now {self.limit:.1f}, "
+            f"cooling down {backoff:.1f}s"
+        )
+
+    def cooldown_remaining(self) -> float:
+        """Seconds until the current cooldown ends (0 if none)."""
+        return max(0.0, self.cooldown_until - time.monotonic())
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the limiter state.
+
+        Returns:
+            Dict with concurrency, in-flight calls, cooldown and 429 count
+        """
+        with self._cond:
+            return {
+                "concurrency_limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "cooldown_remaining": round(self.cooldown_remaining(), 2),
+                "rate_limited_total": self.rate_limited_total,
+                "latency_ewma": round(self.latency_ewma, 3) if self.latency_ewma else None,
+            }
+
+
+class OutboundLimiter:
+    """Registry of adaptive limiters keyed per provider and model."""
+
+    def __init__(self, default_config: Optional[LimiterConfig] = None) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            default_config: Configuration for new keys (defaults to environment)
+        """
+        self.default_config = default_config or LimiterConfig.from_env()
+        self._overrides: Dict[str, Dict[str, Any]] = {}
+        self._limiters: Dict[Tuple[str, str], AdaptiveLimiter] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, model: str, **overrides: Any) -> None:
+        """
+        Override configuration for a model (applies to limiters created afterwards).
+
+        Args:
+            model: Model identifier
+            **overrides: LimiterConfig fields, e.g. tokens_per_minute=100_000
+        """
+        with self._lock:
+            self._overrides.setdefault(model, {}).update(overrides)
+
+    def _config_for(self, model: str) -> LimiterConfig:
+        config = self.default_config
+        if ":free" in model:
+            # Free tiers allow very little concurrency; start there and let AIMD probe
+            config = replace(
+                config,
+                initial_concurrency=1.0,
+                max_concurrency=min(config.max_concurrency, 2.0),
+            )
+        if model in self._overrides:
+            config = replace(config, **self._overrides[model])
+        return config
+
+    def for_model(self, provider: str, model: str) -> AdaptiveLimiter:
+        """
+        Get the limiter for a provider/model pair.
+
+        Args:
+            provider: Backend name (e.g. "openrouter", "ollama")
+            model: Model identifier
+
+        Returns:
+            AdaptiveLimiter shared by all callers of this model
+        """
+        key = (provider, model)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = AdaptiveLimiter(f"{provider}:{model}", self._config_for(model))
+                self._limiters[key] = limiter
+            return limiter
+
+    def cooldown_remaining(self) -> float:
+        """Longest remaining cooldown over all models."""
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return max((limiter.cooldown_remaining() for limiter in limiters), default=0.0)
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get status of every limiter.
+
+        Returns:
+            Dict mapping "provider:model" to limiter status
+        """
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.key: limiter.get_status() for limiter in limiters}
+
+
+# Global outbound limiter instance
+_outbound_limiter: Optional[OutboundLimiter] = None
+_outbound_limiter_lock = threading.Lock()
+
+
+def get_outbound_limiter() -> OutboundLimiter:
+    """
+    Get the global outbound limiter instance.
+
+    Returns:
+        OutboundLimiter instance
+    """
+    global _outbound_limiter
+    with _outbound_limiter_lock:
+        if _outbound_limiter is None:
+            _outbound_limiter = OutboundLimiter()
+        return _outbound_limiter
+
+
+def reset_outbound_limiter() -> None:
+    """Reset the outbound limiter (useful for testing)."""
+    global _outbound_limiter
+    with _outbound_limiter_lock:
+        _outbound_limiter = None
@@ -0,0 +1,271 @@
+"""
+Sampling profiler for scenario phases
+
+PhaseProfiler answers "where did this phase spend its time?" - LLM waits,
+response parsing, serialisation or disk - without instrumenting the code.
+While a phase runs, a background thread samples the Python stack of every
+thread (sys._current_frames) every few milliseconds and counts identical
+stacks. The event loop thread shows up waiting in selectors while LLM calls
+run, and the worker threads show the HTTP client, so samples approximate
+wall-clock time per function.
+
+The orchestrator starts and stops the profiler around each phase
+(ScenarioOrchestrator._execute_phase); without a profiler that is a single
+None check. Results are written in the collapsed-stack format read by
+flamegraph.pl, speedscope (https://www.speedscope.app) and inferno:
+
+    profile/<phase>.collapsed   one file per phase
+    profile/profile.collapsed   all phases, with the phase as root frame
+    profile/summary.json        wall time, samples and hottest functions per phase
+
+Samples are taken across all threads of the process, so when several
+scenarios run in one process (parallel batch runs) their profiles overlap.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Dict, List, Optional
+
+# Default time between samples (seconds)
+DEFAULT_INTERVAL = 0.005
+
+# Deepest stack recorded (outermost frames are dropped beyond this)
+MAX_DEPTH = 128
+
+# Name of the directory the profile files are written to
+PROFILE_DIR = "profile"
+
+_PACKAGE_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+
+
+class PhaseProfiler:
+    """Samples all thread stacks while a phase runs and aggregates them per phase"""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        """
+        Initialize profiler
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.stacks: Dict[str, Counter] = {}
+        self.wall_time: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+
+        self._lock = threading.Lock()
+        self._labels: Dict[CodeType, str] = {}
+        self._phase: Optional[str] = None
+        self._phase_started = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def active(self) -> bool:
+        """Whether a phase is being sampled"""
+        return self._phase is not None
+
+    def start_phase(self, phase: str) -> None:
+        """
+        Start sampling a phase
+
+        Args:
+            phase: Phase name (e.g. "decision")
+        """
+        if self._phase is not None:
+            self.stop_phase()
+        self._phase = phase
+        self._phase_started = time.perf_counter()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="scenario-lab-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop_phase(self) -> None:
+        """Stop sampling the current phase and record its wall time"""
+        if self._phase is None:
+            return
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        phase = self._phase
+        with self._lock:
+            self.wall_time[phase] = (
+                self.wall_time.get(phase, 0.0) + time.perf_counter() - self._phase_started
+            )
+            self.calls[phase] = self.calls.get(phase, 0) + 1
+        self._phase = None
+
+    def _sample_loop(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self._sample(own_id)
+
+    def _sample(self, own_id: int) -> None:
+        phase = self._phase
+        if phase is None:
+            return
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()
+        samples = []
+        for thread_id, frame in frames.items():
+            if thread_id == own_id or _is_idle_worker(frame):
+                continue
+            thread_name = _thread_label(names.get(thread_id, "thread"))
+            samples.append(";".join([thread_name] + self._stack(frame)))
+        del frames
+
+        with self._lock:
+            counter = self.stacks.setdefault(phase, Counter())
+            counter.update(samples)
+
+    def _stack(self, frame: Optional[FrameType]) -> List[str]:
+        labels = []
+        while frame is not None and len(labels) < MAX_DEPTH:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        labels.reverse()
+        return labels
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+            label = label.replace(";", ",")
+            self._labels[code] = label
+        return label
+
+    def merge(self, other: PhaseProfiler) -> None:
+        """
+        Add another profiler's samples and timings to this one
+
+        Args:
+            other: Profiler to merge in (e.g. from another repetition)
+        """
+        with other._lock:
+            stacks = {phase: Counter(counter) for phase, counter in other.stacks.items()}
+            wall_time = dict(other.wall_time)
+            calls = dict(other.calls)
+        with self._lock:
+            for phase, counter in stacks.items():
+                self.stacks.setdefault(phase, Counter()).update(counter)
+            for phase, seconds in wall_time.items():
+                self.wall_time[phase] = self.wall_time.get(phase, 0.0) + seconds
+            for phase, count in calls.items():
+                self.calls[phase] = self.calls.get(phase, 0) + count
+
+    def collapsed(self, phase: Optional[str] = None) -> str:
+        """
+        Render samples in collapsed-stack format ("frame;frame;frame count")
+
+        Args:
+            phase: Only this phase; all phases (rooted at "phase:<name>") when None
+
+        Returns:
+            One stack per line
+        """
+        with self._lock:
+            if phase is not None:
+                items = list(self.stacks.get(phase, Counter()).items())
+            else:
+                items = [
+                    (f"phase:{name};{stack}", count)
+                    for name, counter in self.stacks.items()
+                    for stack, count in counter.items()
+                ]
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(items))
+
+    def summary(self, top: int = 15) -> Dict[str, Any]:
+        """
+        Summarize each phase
+
+        Args:
+            top: Number of hottest functions to list per phase
+
+        Returns:
+            Dict with the sampling interval and, per phase, calls, wall time,
+            samples and the functions with most samples at the top of the stack
+        """
+        with self._lock:
+            phases = sorted(set(self.stacks) | set(self.wall_time))
+            result: Dict[str, Any] = {"interval": self.interval, "phases": {}}
+            for phase in phases:
+                counter = self.stacks.get(phase, Counter())
+                total = sum(counter.values())
+                leaves: Counter = Counter()
+                for stack, count in counter.items():
+                    leaves[stack.rsplit(";", 1)[-1]] += count
+                result["phases"][phase] = {
+                    "calls": self.calls.get(phase, 0),
+                    "wall_seconds": round(self.wall_time.get(phase, 0.0), 6),
+                    "samples": total,
+                    "top_functions": [
+                        {
+                            "function": function,
+                            "samples": count,
+                            "percent": round(100.0 * count / total, 1),
+                        }
+                        for function, count in leaves.most_common(top)
+                    ],
+                }
+        return result
+
+    def save(self, directory: str) -> Path:
+        """
+        Write per-phase and merged collapsed stacks plus a summary
+
+        Args:
+            directory: Run directory (files go into its profile/ subdirectory)
+
+        Returns:
+            Path of the profile directory
+        """
+        profile_dir = Path(directory) / PROFILE_DIR
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            phases = list(self.stacks)
+        for phase in phases:
+            (profile_dir / f"{phase}.collapsed").write_text(self.collapsed(phase))
+        (profile_dir / "profile.collapsed").write_text(self.collapsed())
+        (profile_dir / "summary.json").write_text(json.dumps(self.summary(), indent=2))
+        return profile_dir
+
+
+# Innermost frames of service threads waiting for work: thread-pool
+# workers and the logging QueueListener
+_IDLE_FRAMES = (
+    ("_worker", os.path.join("concurrent", "futures", "thread.py")),
+    ("dequeue", os.path.join("logging", "handlers.py")),
+)
+
+
+def _is_idle_worker(frame: FrameType) -> bool:
+    """Whether a thread is a service thread waiting for work"""
+    code = frame.f_code
+    return any(
+        code.co_name == name and code.co_filename.endswith(filename)
+        for name, filename in _IDLE_FRAMES
+    )
+
+
+def _thread_label(name: str) -> str:
+    """Thread name without pool and worker numbers, so workers aggregate"""
+    return re.sub(r"[-_\d]+$", "", name).replace(";", ",") or "thread"
+
+
+def _short_path(filename: str) -> str:
+    """Path relative to the project for our code, last two components otherwise"""
+    if filename.startswith(_PACKAGE_ROOT):
+        return os.path.relpath(filename, _PACKAGE_ROOT)
+    parts = Path(filename).parts
+    return "/".join(parts[-2:])
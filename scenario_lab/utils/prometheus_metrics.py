@@ -0,0 +1,311 @@
+"""
+Prometheus metrics - counters, gauges and histograms in text exposition format
+
+A minimal, dependency-free implementation of the Prometheus data model and
+text exposition format (version 0.0.4), so the API server can expose
+/metrics without pulling in prometheus_client.
+
+Hot paths (LLM calls, rate limiting, event handlers, database queries)
+update counters and histograms directly: an update is a dict lookup and an
+addition under a lock. Values that already live elsewhere (scenario queue,
+outbound limiter state, cache stats, process memory) are copied into gauges
+when the metrics are scraped (see scenario_lab.api.metrics).
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default histogram buckets (seconds), from fast DB queries to slow LLM calls
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    """Base class for a metric family with a fixed set of label names"""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Initialize metric
+
+        Args:
+            name: Metric name (e.g. "scenario_lab_turns_total")
+            documentation: HELP text
+            labelnames: Names of the labels every sample carries
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} expects labels {self.labelnames}") from e
+
+    @abstractmethod
+    def samples(self) -> List[Tuple[str, LabelValues, Tuple[str, ...], float]]:
+        """Samples as (name suffix, label values, extra label pairs, value)"""
+
+    def render(self) -> List[str]:
+        """Render the metric family as exposition lines"""
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for suffix, values, extra, value in self.samples():
+            names = self.labelnames + extra[::2]
+            all_values = values + extra[1::2]
+            labels = _format_labels(names, all_values)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """
+        Increase the counter
+
+        Args:
+            amount: Non-negative amount to add
+            **labels: Label values
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set(self, value: float, **labels: object) -> None:
+        """
+        Set the counter to a total kept elsewhere (e.g. CacheStats)
+
+        Args:
+            value: Current total; a lower value is read as a counter reset
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def get(self, **labels: object) -> float:
+        """Current value for a label set (0 if never set)"""
+        key = self._key(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def samples(self) -> List[Tuple[str, LabelValues, Tuple[str, ...], float]]:
+        with self._lock:
+            return [("", key, (), value) for key, value in sorted(self._values.items())]
+
+
+class Gauge(Counter):
+    """Value per label set that can go up and down"""
+
+    type_name = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """Increase the gauge (amount may be negative)"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        """Decrease the gauge"""
+        self.inc(-amount, **labels)
+
+    def clear(self) -> None:
+        """Drop all label sets (for gauges rebuilt on every scrape)"""
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count of observations per label set"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Initialize histogram
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            labelnames: Names of the labels every sample carries
+            buckets: Upper bounds of the buckets (+Inf is added)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        # Per label set: [count per bucket (+Inf last), sum]
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        """
+        Record an observation
+
+        Args:
+            value: Observed value (e.g. seconds)
+            **labels: Label values
+        """
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = ([0] * (len(self.buckets) + 1), [0.0])
+                self._values[key] = entry
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, **labels: object) -> int:
+        """Number of observations for a label set"""
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            return sum(entry[0]) if entry else 0
+
+    def samples(self) -> List[Tuple[str, LabelValues, Tuple[str, ...], float]]:
+        samples = []
+        with self._lock:
+            for key, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (math.inf,), counts):
+                    cumulative += count
+                    samples.append(("_bucket", key, ("le", _format_value(bound)), cumulative))
+                samples.append(("_sum", key, (), total[0]))
+                samples.append(("_count", key, (), cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """Metrics by name, rendered together"""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(
+        self, cls: type, name: str, documentation: str, **kwargs: object
+    ) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not cls:
+                raise ValueError(f"Metric {name} is already registered as a {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter"""
+        return self._get_or_create(Counter, name, documentation, labelnames=labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge"""
+        return self._get_or_create(Gauge, name, documentation, labelnames=labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram"""
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames=labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Get a registered metric by name"""
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render every metric
+
+        Returns:
+            Metrics in Prometheus text exposition format
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global metrics registry instance
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the global metrics registry instance
+
+    Returns:
+        MetricsRegistry instance
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+        return _registry
+
+
+def reset_metrics_registry() -> None:
+    """Reset the global metrics registry (useful for testing)"""
+    global _registry
+    with _registry_lock:
+        _registry = None
@@ -13,13 +13,17 @@ Features:
 - Cache statistics (hits, misses, savings)
 - Automatic cache invalidation
 - Content-based cache keys (hash of prompt + model)
+- Run-scoped caches bound to the current execution context
 """
 import hashlib
 import json
 import time
 import os
 import logging
-from typing import Optional, Dict, Any, Tuple, List
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, Any, Tuple, List, Iterator
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
@@ -80,7 +84,8 @@ class ResponseCache:
         cache_dir: Optional[str] = None,
         ttl: int = 3600,  # 1 hour default
         max_memory_entries: int = 1000,
-        enabled: bool = True
+        enabled: bool = True,
+        stats: Optional[CacheStats] = None
     ):
         """
         Initialize response cache
@@ -90,17 +95,19 @@ class ResponseCache:
             ttl: Time-to-live in seconds (0 = no expiration)
             max_memory_entries: Maximum entries in memory cache
             enabled: Whether caching is enabled
+            stats: Statistics object to record into (shared with other caches if given)
         """
         self.cache_dir = cache_dir
         self.ttl = ttl
         self.max_memory_entries = max_memory_entries
         self.enabled = enabled
 
-        # In-memory cache
+        # In-memory cache (writes are locked: LLM calls run on worker threads)
         self.memory_cache: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
 
         # Statistics
-        self.stats = CacheStats()
+        self.stats = stats if stats is not None else CacheStats()
 
         # Setup disk cache
         if cache_dir:
@@ -211,7 +218,7 @@ class ResponseCache:
             if self._is_expired(entry):
                 del self.memory_cache[cache_key]
                 self.stats.cache_misses += 1
-                logger.debug(f"Cache expired for key {cache_key[:8]}...")
+                logger.debug("Cache expired for key %.8s...", cache_key)
                 return None
 
             # Cache hit!
@@ -230,15 +237,14 @@ class ResponseCache:
             self.stats.estimated_cost_saved += cost_saved
 
             logger.debug(
-                f"Cache hit for {model}: {cache_key[:8]}... "
-                f"(hit #{entry.hit_count})"
+                "Cache hit for %s: %.8s... (hit #%d)", model, cache_key, entry.hit_count
             )
 
             return entry
 
         # Cache miss
         self.stats.cache_misses += 1
-        logger.debug(f"Cache miss for {model}: {cache_key[:8]}...")
+        logger.debug("Cache miss for %s: %.8s...", model, cache_key)
         return None
 
     def put(
@@ -278,24 +284,25 @@ class ResponseCache:
             hit_count=0
         )
 
-        # Store in memory
-        self.memory_cache[cache_key] = entry
+        with self._lock:
+            # Store in memory
+            self.memory_cache[cache_key] = entry
 
-        # Enforce max memory entries (LRU-style eviction)
-        if len(self.memory_cache) > self.max_memory_entries:
-            # Remove oldest entry
-            oldest_key = min(
-                self.memory_cache.keys(),
-                key=lambda k: self.memory_cache[k].timestamp
-            )
-            del self.memory_cache[oldest_key]
-            logger.debug(f"Evicted oldest cache entry: {oldest_key[:8]}...")
+            # Enforce max memory entries (LRU-style eviction)
+            if len(self.memory_cache) > self.max_memory_entries:
+                # Remove oldest entry
+                oldest_key = min(
+                    self.memory_cache.keys(),
+                    key=lambda k: self.memory_cache[k].timestamp
+                )
+                del self.memory_cache[oldest_key]
+                logger.debug("Evicted oldest cache entry: %.8s...", oldest_key)
 
-        # Save to disk if enabled
-        if self.cache_dir:
-            self._save_disk_cache()
+            # Save to disk if enabled
+            if self.cache_dir:
+                self._save_disk_cache()
 
-        logger.debug(f"Cached response for {model}: {cache_key[:8]}...")
+        logger.debug("Cached response for %s: %.8s...", model, cache_key)
 
     def clear(self):
         """Clear all cache entries"""
@@ -339,16 +346,38 @@ class ResponseCache:
 # Global cache instance (singleton pattern)
 _global_cache: Optional[ResponseCache] = None
 
+# Cache bound to the current run (set per execution context, see use_run_cache)
+_run_cache: ContextVar[Optional[ResponseCache]] = ContextVar('run_cache', default=None)
+
+
+def _cache_config() -> Tuple[bool, str, int]:
+    """Read (enabled, base_cache_dir, ttl) from environment variables"""
+    enabled = os.environ.get('SCENARIO_CACHE_ENABLED', 'true').lower() == 'true'
+    base_cache_dir = os.environ.get('SCENARIO_CACHE_DIR', '.cache/responses')
+    ttl = int(os.environ.get('SCENARIO_CACHE_TTL', '3600'))
+    return enabled, base_cache_dir, ttl
+
 
 def get_global_cache() -> ResponseCache:
-    """Get or create global cache instance"""
+    """
+    Get the cache for the current execution context
+
+    Returns the run-scoped cache if one is bound (see use_run_cache),
+    otherwise the process-wide cache instance.
+    """
+    run_cache = _run_cache.get()
+    if run_cache is not None:
+        return run_cache
+
+    return _get_process_cache()
+
+
+def _get_process_cache() -> ResponseCache:
+    """Get or create the process-wide cache instance"""
     global _global_cache
 
     if _global_cache is None:
-        # Check environment variables for configuration
-        enabled = os.environ.get('SCENARIO_CACHE_ENABLED', 'true').lower() == 'true'
-        base_cache_dir = os.environ.get('SCENARIO_CACHE_DIR', '.cache/responses')
-        ttl = int(os.environ.get('SCENARIO_CACHE_TTL', '3600'))
+        enabled, base_cache_dir, ttl = _cache_config()
 
         # Support run-scoped cache: Each run gets its own cache directory
         # This prevents different runs from sharing cached responses
@@ -367,6 +396,64 @@ def get_global_cache() -> ResponseCache:
     return _global_cache
 
 
+def get_cache_stats() -> CacheStats:
+    """
+    Get the process-wide cache statistics without creating the cache
+
+    Run-scoped caches record into these stats too (see create_run_cache).
+
+    Returns:
+        CacheStats (empty if no cache has been created yet)
+    """
+    if _global_cache is None:
+        return CacheStats()
+    return _global_cache.stats
+
+
+def create_run_cache(run_id: str) -> ResponseCache:
+    """
+    Create a cache scoped to a single run
+
+    Each run gets its own cache directory, so different runs never share
+    cached responses. Statistics are recorded into the process-wide cache's
+    stats so aggregate hit rates remain available.
+
+    Args:
+        run_id: Unique run identifier (used as cache subdirectory)
+
+    Returns:
+        New ResponseCache instance
+    """
+    enabled, base_cache_dir, ttl = _cache_config()
+    cache_dir = os.path.join(base_cache_dir, run_id)
+
+    return ResponseCache(
+        cache_dir=cache_dir if enabled else None,
+        ttl=ttl,
+        enabled=enabled,
+        stats=_get_process_cache().stats
+    )
+
+
+@contextmanager
+def use_run_cache(cache: Optional[ResponseCache]) -> Iterator[Optional[ResponseCache]]:
+    """
+    Bind a cache to the current execution context
+
+    Calls to get_global_cache() (and therefore make_llm_call) inside the block
+    use this cache. Concurrent runs in separate asyncio tasks or threads each
+    see their own binding.
+
+    Args:
+        cache: Cache to bind (None leaves the process-wide cache in effect)
+    """
+    token = _run_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _run_cache.reset(token)
+
+
 def reset_global_cache():
     """Reset global cache instance (useful for testing)"""
     global _global_cache
@@ -7,11 +7,192 @@ Handles both markdown and JSON response formats.
 import re
 import json
 import logging
-from typing import Dict, Optional, List
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Optional, List, Match, Pattern, Tuple
+
+from scenario_lab.utils.json_response_parser import decode_json, extract_json_from_response
 
 logger = logging.getLogger(__name__)
 
 
+# Section header styles, in the order they are tried. Each has the header
+# prefix (formatted with the escaped section name; the section content starts
+# where it ends) and the markers that end the section content. Markdown
+# headings (## NAME) are neither headers nor section ends: the earlier
+# f-string patterns turned #{2,} into a literal "#(2,)", and responses
+# depend on headings staying part of a section.
+_SECTION_STYLES = (
+    # Bold with colon: **SECTION NAME:**
+    (r"\*\*\s*{name}\s*:\*\*\s*", r"\*\*\s*[\w\s]+\s*:\*\*|^---+\s*$"),
+    # Bold without colon: **SECTION NAME**
+    (r"\*\*\s*{name}\s*\*\*\s*", r"\*\*\s*[\w\s]+\s*\*\*|^---+\s*$"),
+    # Uppercase with colon: SECTION NAME:
+    (r"^{upper}\s*:\s*", r"^[A-Z\s]+:\s*|^---+\s*$"),
+)
+
+# Headers a section is cut at when a next section is given, in order
+_NEXT_SECTION_STYLES = (
+    r"\*\*\s*{name}\s*:\*\*",
+    r"\*\*\s*{name}\s*\*\*",
+    r"^{upper}\s*:",
+)
+
+# Styles whose headers start with "**" (the others start at a line start)
+_BOLD_STYLES = 2
+
+_FLAGS = re.DOTALL | re.MULTILINE | re.IGNORECASE
+
+# Section ends per style (matched at a marker position)
+_SECTION_ENDS = tuple(re.compile(end, _FLAGS) for _, end in _SECTION_STYLES)
+
+# Newlines (a line starts after each) and "**" (overlapping, as in "***"):
+# every header and section end starts at a line start or at "**"
+_MARKERS = re.compile(r"\n|\*(?=\*)")
+
+
+@lru_cache(maxsize=256)
+def _section_headers(section_name: str) -> Tuple[Pattern, ...]:
+    """Header patterns of a section, one per style"""
+    name, upper = re.escape(section_name), re.escape(section_name.upper())
+    # (?=.) keeps at least one character for the content, as the section
+    # body (.+?) of the combined patterns did
+    return tuple(
+        re.compile(header.format(name=name, upper=upper) + "(?=.)", _FLAGS)
+        for header, _ in _SECTION_STYLES
+    )
+
+
+@lru_cache(maxsize=256)
+def _next_section_headers(section_name: str) -> Tuple[Pattern, ...]:
+    """Patterns a section is cut at when section_name follows it"""
+    name, upper = re.escape(section_name), re.escape(section_name.upper())
+    return tuple(
+        re.compile(header.format(name=name, upper=upper), re.MULTILINE | re.IGNORECASE)
+        for header in _NEXT_SECTION_STYLES
+    )
+
+
+class ResponseSections:
+    """
+    Section index of a markdown-style response
+
+    A single scan records where headers and section ends can start (line
+    starts and "**"); extracting a section then only tries the patterns at
+    those positions and slices the content, and the section ends of each
+    header style are found once and shared by all extractions. Parse a
+    response once and call get() for each section:
+
+        sections = ResponseSections(content)
+        reasoning = sections.get("REASONING", "ACTION")
+        action = sections.get("ACTION")
+    """
+
+    def __init__(self, content: str):
+        """
+        Index a response
+
+        Args:
+            content: Full response content
+        """
+        self.content = content
+        self._stars: List[int] = []
+        self._lines: List[int] = [0]
+        for match in _MARKERS.finditer(content):
+            position = match.start()
+            if content[position] == "\n":
+                self._lines.append(position + 1)
+            else:
+                self._stars.append(position)
+        self._ends: Dict[int, List[int]] = {}
+
+    def get(self, section_name: str, next_section: Optional[str] = None) -> str:
+        """
+        Extract a section
+
+        Args:
+            section_name: Name of section to extract (e.g., "GOALS", "REASONING")
+            next_section: Optional next section name to stop at
+
+        Returns:
+            Extracted section content, or empty string if not found
+        """
+        for style, header in enumerate(_section_headers(section_name)):
+            match = self._find(header, self._candidates(style))
+            if match is None:
+                continue
+
+            start = match.end()
+            ends = self._section_ends(style)
+            index = bisect_right(ends, start)
+            end = ends[index] if index < len(ends) else len(self.content)
+            extracted = self.content[start:end].strip()
+
+            # If next_section specified, stop at that section
+            if next_section and extracted:
+                extracted = self._cut_at(extracted, start, next_section)
+
+            logger.debug("Extracted '%s' (%d chars)", section_name, len(extracted))
+            return extracted
+
+        logger.debug("Failed to extract '%s'", section_name)
+        return ""
+
+    def _candidates(self, style: int) -> List[int]:
+        """Positions a header of a style can start at"""
+        return self._stars if style < _BOLD_STYLES else self._lines
+
+    def _find(self, pattern: Pattern, positions: List[int]) -> Optional[Match]:
+        """First match of a pattern at one of the positions"""
+        content = self.content
+        for position in positions:
+            match = pattern.match(content, position)
+            if match:
+                return match
+        return None
+
+    def _section_ends(self, style: int) -> List[int]:
+        """Positions where sections of a style end (found once per style)"""
+        ends = self._ends.get(style)
+        if ends is None:
+            end_pattern = _SECTION_ENDS[style]
+            # Bold sections also end at "**"; all styles can end at line starts
+            positions = (
+                sorted(self._stars + self._lines) if style < _BOLD_STYLES else self._lines
+            )
+            ends = [p for p in positions if end_pattern.match(self.content, p)]
+            self._ends[style] = ends
+        return ends
+
+    def _cut_at(self, extracted: str, offset: int, next_section: str) -> str:
+        """
+        Cut extracted section content at the header of the next section
+
+        Args:
+            extracted: Section content (stripped; starts at offset in the response)
+            offset: Position of the content in the response
+            next_section: Name of the section to stop at
+
+        Returns:
+            Content before the next section's header
+        """
+        limit = offset + len(extracted)
+        stars = [
+            p - offset
+            for p in self._stars[bisect_left(self._stars, offset):bisect_left(self._stars, limit)]
+        ]
+        # The content's first position is a line start for the patterns
+        lines = [0] + [
+            p - offset
+            for p in self._lines[bisect_right(self._lines, offset):bisect_left(self._lines, limit)]
+        ]
+        for style, pattern in enumerate(_next_section_headers(next_section)):
+            for position in (stars if style < _BOLD_STYLES else lines):
+                if pattern.match(extracted, position):
+                    return extracted[:position].strip()
+        return extracted
+
+
 def extract_section(
     content: str,
     section_name: str,
@@ -20,6 +201,9 @@ def extract_section(
     """
     Extract a section from markdown-style content
 
+    To extract several sections of the same response, index it once with
+    ResponseSections instead.
+
     Args:
         content: Full content to parse
         section_name: Name of section to extract (e.g., "GOALS", "REASONING")
@@ -28,42 +212,7 @@ def extract_section(
     Returns:
         Extracted section content, or empty string if not found
     """
-    # Try multiple pattern variations
-    patterns = [
-        # Bold with colon: **SECTION NAME:**
-        rf'\*\*\s*{re.escape(section_name)}\s*:\*\*\s*(.+?)(?=\*\*\s*[\w\s]+\s*:\*\*|^#{2,}\s+[\w\s]+|^---+\s*$|\Z)',
-        # Bold without colon: **SECTION NAME**
-        rf'\*\*\s*{re.escape(section_name)}\s*\*\*\s*(.+?)(?=\*\*\s*[\w\s]+\s*\*\*|^#{2,}\s+[\w\s]+|^---+\s*$|\Z)',
-        # Heading: ## SECTION NAME
-        rf'^#{2,}\s*{re.escape(section_name)}\s*:?\s*$\s*(.+?)(?=^#{2,}\s+[\w\s]+|^---+\s*$|\Z)',
-        # Uppercase with colon: SECTION NAME:
-        rf'^{re.escape(section_name.upper())}\s*:\s*(.+?)(?=^[A-Z\s]+:\s*|^#{2,}\s+|^---+\s*$|\Z)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.DOTALL | re.MULTILINE | re.IGNORECASE)
-        if match:
-            extracted = match.group(1).strip()
-
-            # If next_section specified, stop at that section
-            if next_section:
-                next_patterns = [
-                    rf'\*\*\s*{re.escape(next_section)}\s*:\*\*',
-                    rf'\*\*\s*{re.escape(next_section)}\s*\*\*',
-                    rf'^#{2,}\s*{re.escape(next_section)}\s*:?\s*$',
-                    rf'^{re.escape(next_section.upper())}\s*:',
-                ]
-                for next_pattern in next_patterns:
-                    next_match = re.search(next_pattern, extracted, re.MULTILINE | re.IGNORECASE)
-                    if next_match:
-                        extracted = extracted[:next_match.start()].strip()
-                        break
-
-            logger.debug(f"Extracted '{section_name}' ({len(extracted)} chars)")
-            return extracted
-
-    logger.debug(f"Failed to extract '{section_name}'")
-    return ""
+    return ResponseSections(content).get(section_name, next_section)
 
 
 def parse_decision_markdown(content: str) -> Dict[str, str]:
@@ -94,31 +243,32 @@ def parse_decision_markdown(content: str) -> Dict[str, str]:
         'reasoning': '',
         'action': ''
     }
+    sections = ResponseSections(content)
 
     # Extract goals
     goals_parts = []
 
-    long_term = extract_section(content, "LONG-TERM GOALS", "SHORT-TERM PRIORITIES")
+    long_term = sections.get("LONG-TERM GOALS", "SHORT-TERM PRIORITIES")
     if long_term:
         goals_parts.append(f"**Long-term:**\n{long_term}")
 
-    short_term = extract_section(content, "SHORT-TERM PRIORITIES", "REASONING")
+    short_term = sections.get("SHORT-TERM PRIORITIES", "REASONING")
     if short_term:
         goals_parts.append(f"**Short-term:**\n{short_term}")
 
     # Fallback: try just "GOALS"
     if not goals_parts:
-        goals = extract_section(content, "GOALS", "REASONING")
+        goals = sections.get("GOALS", "REASONING")
         if goals:
             goals_parts.append(goals)
 
     result['goals'] = "\n\n".join(goals_parts)
 
     # Extract reasoning
-    result['reasoning'] = extract_section(content, "REASONING", "ACTION")
+    result['reasoning'] = sections.get("REASONING", "ACTION")
 
     # Extract action
-    result['action'] = extract_section(content, "ACTION")
+    result['action'] = sections.get("ACTION")
 
     # If action is empty, use remaining content after REASONING
     if not result['action'] and result['reasoning']:
@@ -148,22 +298,17 @@ def parse_decision_json(content: str) -> Dict[str, str]:
     Returns:
         Dict with 'goals', 'reasoning', 'action' keys
     """
-    # Try to extract JSON from markdown code blocks
-    json_match = re.search(r'```json\s*(\{.+?\})\s*```', content, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        # Try to find JSON object directly
-        json_match = re.search(r'\{.+\}', content, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(0)
-        else:
-            raise ValueError("No JSON found in response")
+    # Find the JSON object (in a code block or inline) with a linear scan
+    json_str = extract_json_from_response(content)
+    if json_str is None:
+        raise ValueError("No JSON found in response")
 
     try:
-        data = json.loads(json_str)
+        data = decode_json(json_str)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON: {e}")
+    if not isinstance(data, dict):
+        raise ValueError("JSON response is not an object")
 
     result = {
         'goals': '',
@@ -232,23 +377,24 @@ def parse_communication_decision(content: str) -> Dict[str, any]:
         'message': None,
         'reasoning': ''
     }
+    sections = ResponseSections(content)
 
     # Extract initiate decision
-    initiate_text = extract_section(content, "INITIATE_BILATERAL", "TARGET_ACTOR")
+    initiate_text = sections.get("INITIATE_BILATERAL", "TARGET_ACTOR")
     result['initiate_bilateral'] = 'yes' in initiate_text.lower()
 
     # Extract target actor
-    target_text = extract_section(content, "TARGET_ACTOR", "PROPOSED_MESSAGE")
+    target_text = sections.get("TARGET_ACTOR", "PROPOSED_MESSAGE")
     if target_text and target_text.lower() != 'none':
         result['target_actor'] = target_text.strip()
 
     # Extract message
-    message_text = extract_section(content, "PROPOSED_MESSAGE", "REASONING")
+    message_text = sections.get("PROPOSED_MESSAGE", "REASONING")
     if message_text and message_text.lower() != 'none':
         result['message'] = message_text
 
     # Extract reasoning
-    result['reasoning'] = extract_section(content, "REASONING")
+    result['reasoning'] = sections.get("REASONING")
 
     # Only set initiate_bilateral to True if we have both target and message
     result['initiate_bilateral'] = bool(result['target_actor'] and result['message'])
@@ -278,7 +424,8 @@ def parse_bilateral_response(content: str) -> Dict[str, str]:
         'internal_notes': ''
     }
 
-    result['response'] = extract_section(content, "RESPONSE", "INTERNAL_NOTES")
-    result['internal_notes'] = extract_section(content, "INTERNAL_NOTES")
+    sections = ResponseSections(content)
+    result['response'] = sections.get("RESPONSE", "INTERNAL_NOTES")
+    result['internal_notes'] = sections.get("INTERNAL_NOTES")
 
     return result
@@ -0,0 +1,368 @@
+"""
+Span tracing across a scenario run
+
+Spans form the hierarchy scenario -> turn -> phase -> actor -> LLM call ->
+attempt. Each span has a start and end time, attributes and a parent, kept in
+a context variable so nesting follows asyncio tasks and the worker threads of
+make_llm_call_async. Spans are always created (their IDs become the
+correlation_id of events emitted inside them, see EventBus.emit) but only
+kept when a Tracer is bound to the run with use_tracer.
+
+A Tracer exports to two formats:
+- Chrome trace (trace.json): open in https://ui.perfetto.dev or chrome://tracing
+- OTLP JSON (trace-otlp.json): the OpenTelemetry collector's file format,
+  accepted by Jaeger and other OTLP tooling
+
+Tracer.critical_path walks from a span to the child that finished last at
+every level, which points at the phase, actor and call that held up a turn.
+"""
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+TRACE_FORMATS = ("chrome", "otlp")
+
+# File name of the exported trace per format
+TRACE_FILES = {"chrome": "trace.json", "otlp": "trace-otlp.json"}
+
+# Span attribute used to name Chrome trace lanes
+_LANE_ATTRIBUTE = "actor"
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace"""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_ns: int = 0
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    thread_id: int = 0
+    _tracer: Optional[Tracer] = field(default=None, repr=False)
+    _token: Optional[Token] = field(default=None, repr=False)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (0 while the span is open)"""
+        if self.end_ns is None:
+            return 0.0
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute (None values are ignored)"""
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, error: BaseException) -> None:
+        """Mark the span as failed"""
+        self.error = f"{type(error).__name__}: {error}"
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """
+        Close the span and restore its parent as the current span
+
+        Args:
+            error: Exception that ended the span, if any
+        """
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.set_error(error)
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Ended in another context than it was started in
+                pass
+            self._token = None
+        if self._tracer is not None:
+            self._tracer.record(self)
+
+
+class Tracer:
+    """Thread-safe collection of finished spans for one run"""
+
+    def __init__(self, service_name: str = "scenario-lab"):
+        """
+        Initialize tracer
+
+        Args:
+            service_name: service.name resource attribute in OTLP exports
+        """
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        self.spans: List[Span] = []
+
+    def record(self, span: Span) -> None:
+        """Add a finished span"""
+        with self._lock:
+            self.spans.append(span)
+
+    def finished_spans(self, name: Optional[str] = None) -> List[Span]:
+        """
+        Get finished spans in start order
+
+        Args:
+            name: Only spans with this name
+
+        Returns:
+            List of spans
+        """
+        with self._lock:
+            spans = list(self.spans)
+        return sorted(
+            (span for span in spans if name is None or span.name == name),
+            key=lambda span: span.start_ns,
+        )
+
+    def children(self, span: Span) -> List[Span]:
+        """Finished direct children of a span, in start order"""
+        return [s for s in self.finished_spans() if s.parent_id == span.span_id]
+
+    def critical_path(self, span: Span) -> List[Span]:
+        """
+        Follow the child that finished last, level by level
+
+        Args:
+            span: Span to start from (e.g. a slow turn)
+
+        Returns:
+            The span followed by the chain of latest-finishing descendants
+        """
+        by_parent: Dict[str, List[Span]] = {}
+        for s in self.finished_spans():
+            if s.parent_id:
+                by_parent.setdefault(s.parent_id, []).append(s)
+
+        path = [span]
+        while by_parent.get(path[-1].span_id):
+            path.append(max(by_parent[path[-1].span_id], key=lambda s: s.end_ns or 0))
+        return path
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Export as Chrome trace event format
+
+        Concurrent spans are placed on separate lanes (tids): a span only
+        goes on a lane whose innermost open span is one of its ancestors, so
+        nesting on every lane matches the span hierarchy. A lane is named
+        after the first actor seen on it.
+
+        Returns:
+            Dict with traceEvents (complete "X" events plus lane names)
+        """
+        spans = sorted(
+            self.finished_spans(), key=lambda s: (s.start_ns, -(s.end_ns or s.start_ns))
+        )
+        parents = {s.span_id: s.parent_id for s in spans}
+        origin = spans[0].start_ns if spans else 0
+        lanes: List[List[Tuple[int, str]]] = []  # open (end time, span id) stack per lane
+        lane_of: Dict[str, int] = {}
+        lane_names: Dict[int, str] = {}
+        events: List[Dict[str, Any]] = []
+
+        for span in spans:
+            end = span.end_ns or span.start_ns
+            ancestors = set()
+            parent_id = span.parent_id
+            while parent_id and parent_id not in ancestors:
+                ancestors.add(parent_id)
+                parent_id = parents.get(parent_id)
+
+            preferred = lane_of.get(span.parent_id or "")
+            candidates = ([preferred] if preferred is not None else []) + list(range(len(lanes)))
+            lane = None
+            for candidate in candidates:
+                stack = lanes[candidate]
+                while stack and stack[-1][0] <= span.start_ns:
+                    stack.pop()
+                if not stack or (stack[-1][1] in ancestors and stack[-1][0] >= end):
+                    lane = candidate
+                    break
+            if lane is None:
+                lanes.append([])
+                lane = len(lanes) - 1
+            lanes[lane].append((end, span.span_id))
+            lane_of[span.span_id] = lane
+            if _LANE_ATTRIBUTE in span.attributes:
+                lane_names.setdefault(lane, str(span.attributes[_LANE_ATTRIBUTE]))
+
+            args = {**span.attributes, "span_id": span.span_id, "parent_id": span.parent_id}
+            if span.error:
+                args["error"] = span.error
+            label = span.name
+            if span.name == "phase":
+                label = f"phase:{span.attributes.get('phase')}"
+            events.append({
+                "name": label,
+                "cat": span.name,
+                "ph": "X",
+                "ts": (span.start_ns - origin) / 1000,
+                "dur": (end - span.start_ns) / 1000,
+                "pid": 1,
+                "tid": lane,
+                "args": args,
+            })
+
+        for lane in range(len(lanes)):
+            default_name = "orchestrator" if lane == 0 else f"lane {lane}"
+            events.append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": lane,
+                "args": {"name": lane_names.get(lane, default_name)},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """
+        Export as OTLP JSON (ExportTraceServiceRequest)
+
+        Returns:
+            Dict with resourceSpans
+        """
+        spans = []
+        for span in self.finished_spans():
+            entry: Dict[str, Any] = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns or span.start_ns),
+                "attributes": [_otlp_attribute(k, v) for k, v in span.attributes.items()],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            if span.parent_id:
+                entry["parentSpanId"] = span.parent_id
+            spans.append(entry)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{"scope": {"name": "scenario_lab"}, "spans": spans}],
+            }]
+        }
+
+    def save(self, path: str, format: str = "chrome") -> None:
+        """
+        Write the trace to a file
+
+        Args:
+            path: Output file path
+            format: "chrome" or "otlp"
+        """
+        if format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {format} (expected one of {TRACE_FORMATS})")
+        data = self.to_chrome_trace() if format == "chrome" else self.to_otlp()
+        Path(path).write_text(json.dumps(data, default=str))
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+# Innermost open span and the tracer bound to the run (per execution context)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_bound_tracer: ContextVar[Optional[Tracer]] = ContextVar("tracer", default=None)
+
+
+def get_tracer() -> Optional[Tracer]:
+    """
+    Get the tracer bound to the current execution context
+
+    Returns:
+        Tracer, or None when spans are not being kept
+    """
+    return _bound_tracer.get()
+
+
+@contextmanager
+def use_tracer(tracer: Optional[Tracer]) -> Iterator[Optional[Tracer]]:
+    """
+    Bind a tracer to the current execution context
+
+    Args:
+        tracer: Tracer to keep spans in (None disables recording)
+    """
+    token = _bound_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _bound_tracer.reset(token)
+
+
+def current_span() -> Optional[Span]:
+    """Get the innermost open span in the current execution context"""
+    return _current_span.get()
+
+
+def start_span(name: str, **attributes: Any) -> Span:
+    """
+    Open a span as a child of the current span and make it current
+
+    Must be closed with Span.end() in the same execution context; prefer
+    the span() context manager where the code allows it.
+
+    Args:
+        name: Span name (e.g. "turn", "phase", "llm_call")
+        **attributes: Span attributes (None values are skipped)
+
+    Returns:
+        The open span
+    """
+    parent = _current_span.get()
+    new_span = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+        span_id=f"{random.getrandbits(64):016x}",
+        parent_id=parent.span_id if parent else None,
+        start_ns=time.time_ns(),
+        attributes={k: v for k, v in attributes.items() if v is not None},
+        thread_id=threading.get_ident(),
+        _tracer=_bound_tracer.get(),
+    )
+    new_span._token = _current_span.set(new_span)
+    return new_span
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Run a block inside a span
+
+    Args:
+        name: Span name
+        **attributes: Span attributes (None values are skipped)
+
+    Yields:
+        The open span (add attributes with set_attribute)
+    """
+    opened = start_span(name, **attributes)
+    try:
+        yield opened
+    except BaseException as e:
+        opened.end(error=e)
+        raise
+    else:
+        opened.end()
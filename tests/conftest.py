@@ -0,0 +1,38 @@
+"""
+Shared test fixtures
+"""
+import pytest
+
+from scenario_lab.utils.llm_timing import reset_llm_timing_stats
+from scenario_lab.utils.mock_llm import reset_mock_backend
+from scenario_lab.utils.outbound_limiter import reset_outbound_limiter
+from scenario_lab.utils.response_cache import reset_global_cache
+
+MOCK_ENV_VARS = (
+    "SCENARIO_MOCK_ALL_MODELS",
+    "SCENARIO_MOCK_LATENCY",
+    "SCENARIO_MOCK_RATE_LIMIT_RATE",
+    "SCENARIO_MOCK_ERROR_RATE",
+)
+
+
+@pytest.fixture
+def fresh_llm_backend(monkeypatch):
+    """
+    Run a test against a fresh mock LLM backend
+
+    Disables the response cache and resets the mock backend, the outbound
+    limiter and the LLM timing stats before and after the test, so runs on
+    mock models don't share state between tests.
+    """
+    monkeypatch.setenv("SCENARIO_CACHE_ENABLED", "false")
+    for name in MOCK_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    reset_global_cache()
+    reset_llm_timing_stats()
+    reset_mock_backend()
+    reset_outbound_limiter()
+    yield
+    reset_mock_backend()
+    reset_outbound_limiter()
+    reset_global_cache()
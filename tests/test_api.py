@@ -5,6 +5,7 @@ Comprehensive tests for all REST API and WebSocket endpoints in scenario_lab/api
 Uses FastAPI's TestClient for HTTP endpoints and WebSocket testing.
 """
 import os
+import json
 import pytest
 import asyncio
 from datetime import datetime
@@ -240,14 +241,16 @@ class TestRunsEndpoints:
 
     def test_list_runs_returns_runs_with_database(self, client, mock_database):
         """Test that list runs returns runs when database is available"""
-        mock_run = MagicMock()
-        mock_run.id = "run-001"
-        mock_run.scenario_name = "Test Scenario"
-        mock_run.status = "completed"
-        mock_run.total_turns = 5
-        mock_run.total_cost = 0.5
-        mock_run.created = datetime.now()
-        mock_database.list_runs.return_value = [mock_run]
+        row = {
+            "id": "run-001",
+            "scenario_id": "test-scenario",
+            "scenario_name": "Test Scenario",
+            "status": "completed",
+            "total_turns": 5,
+            "total_cost": 0.5,
+            "created": datetime.now(),
+        }
+        mock_database.list_runs_page.return_value = ([row], None)
 
         with patch("scenario_lab.api.app.database", mock_database):
             response = client.get("/api/runs")
@@ -257,15 +260,70 @@ class TestRunsEndpoints:
             assert len(data) == 1
             assert data[0]["run_id"] == "run-001"
             assert data[0]["scenario_name"] == "Test Scenario"
+            assert data[0]["config"] is None
+            assert "X-Next-Cursor" not in response.headers
 
     def test_list_runs_accepts_scenario_filter(self, client, mock_database):
         """Test that list runs accepts scenario filter"""
-        mock_database.list_runs.return_value = []
+        mock_database.list_runs_page.return_value = ([], None)
 
         with patch("scenario_lab.api.app.database", mock_database):
             response = client.get("/api/runs?scenario=test-scenario")
             assert response.status_code == 200
-            mock_database.list_runs.assert_called_once_with(scenario_id="test-scenario")
+            kwargs = mock_database.list_runs_page.call_args.kwargs
+            assert kwargs["scenario_id"] == "test-scenario"
+
+    def test_list_runs_pagination_and_filters(self, client, mock_database):
+        """Test that paging, filters and projection are passed through"""
+        mock_database.list_runs_page.return_value = ([], "next-page")
+
+        with patch("scenario_lab.api.app.database", mock_database):
+            response = client.get(
+                "/api/runs?status=completed&limit=10&cursor=abc&include_config=true"
+                "&created_after=2025-01-01T00:00:00"
+            )
+            assert response.status_code == 200
+            assert response.headers["X-Next-Cursor"] == "next-page"
+            kwargs = mock_database.list_runs_page.call_args.kwargs
+            assert kwargs["status"] == "completed"
+            assert kwargs["limit"] == 10
+            assert kwargs["cursor"] == "abc"
+            assert kwargs["include_config"] is True
+            assert kwargs["created_after"] == datetime(2025, 1, 1)
+
+    def test_list_runs_invalid_cursor(self, client, mock_database):
+        """Test that a malformed cursor is a client error"""
+        mock_database.list_runs_page.side_effect = ValueError("Invalid cursor: x")
+
+        with patch("scenario_lab.api.app.database", mock_database):
+            response = client.get("/api/runs?cursor=x")
+            assert response.status_code == 400
+
+    def test_export_runs_streams_ndjson(self, client, mock_database):
+        """Test that export walks all pages and emits one JSON object per line"""
+        def row(run_id):
+            return {
+                "id": run_id,
+                "scenario_id": "s",
+                "scenario_name": "S",
+                "status": "completed",
+                "total_turns": 1,
+                "total_cost": 0.0,
+                "created": datetime.now(),
+            }
+
+        mock_database.list_runs_page.side_effect = [
+            ([row("run-002"), row("run-001")], "cursor-1"),
+            ([row("run-000")], None),
+        ]
+
+        with patch("scenario_lab.api.app.database", mock_database):
+            response = client.get("/api/runs/export?page_size=2")
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            assert [line["run_id"] for line in lines] == ["run-002", "run-001", "run-000"]
+            assert mock_database.list_runs_page.call_args.kwargs["cursor"] == "cursor-1"
 
     def test_get_run_returns_503_without_database(self, client):
         """Test that get run returns 503 when database is not configured"""
@@ -386,6 +444,96 @@ class TestMetricsAggregateEndpoint:
             )
 
 
+class TestMetricRollupEndpoints:
+    """Tests for the rollup-backed metric endpoints"""
+
+    def test_bands_require_scenario(self, client, mock_database):
+        """Test that bands are always scoped to a scenario"""
+        with patch("scenario_lab.api.app.database", mock_database):
+            response = client.get("/api/metrics/tension/bands")
+            assert response.status_code == 422
+
+    def test_bands_returns_turns(self, client, mock_database):
+        """Test that bands returns per-turn statistics"""
+        mock_database.metric_turn_bands.return_value = [
+            {"turn": 1, "count": 3, "mean": 0.4, "stdev": 0.2, "min": 0.2, "max": 0.6,
+             "lower": 0.2, "upper": 0.6},
+        ]
+
+        with patch("scenario_lab.api.app.database", mock_database):
+            response = client.get("/api/metrics/tension/bands?scenario=crisis&actor=A")
+            assert response.status_code == 200
+            data = response.json()
+            assert data["turns"][0]["mean"] == 0.4
+            mock_database.metric_turn_bands.assert_called_once_with(
+                "tension", "crisis", actor="A"
+            )
+
+    def test_runs_returns_summaries(self, client, mock_database):
+        """Test that per-run summaries are returned"""
+        mock_database.run_metric_summaries.return_value = [
+            {"run_id": "run-001", "actor": None, "final_turn": 3, "final_value": 0.4,
+             "min": 0.2, "max": 0.5, "count": 3},
+        ]
+
+        with patch("scenario_lab.api.app.database", mock_database):
+            response = client.get("/api/metrics/tension/runs?scenario=crisis")
+            assert response.status_code == 200
+            assert response.json()["runs"][0]["final_value"] == 0.4
+            mock_database.run_metric_summaries.assert_called_once_with(
+                "tension", scenario="crisis", actor=None
+            )
+
+
+class TestSearchEndpoint:
+    """Tests for the full-text search endpoint"""
+
+    def test_search_returns_503_without_database(self, client):
+        """Test that search returns 503 when database not configured"""
+        with patch("scenario_lab.api.app.database", None):
+            response = client.get("/api/search?q=blockade")
+            assert response.status_code == 503
+
+    def test_search_returns_ranked_results(self, client, mock_database):
+        """Test that search returns results with snippets"""
+        mock_database.search.return_value = [
+            {
+                "run_id": "run-001",
+                "scenario_id": "strait",
+                "turn": 2,
+                "kind": "decision",
+                "actor": "Navy",
+                "ref_id": None,
+                "rank": -1.5,
+                "snippet": "Escalate the [blockade]",
+            }
+        ]
+
+        with patch("scenario_lab.api.app.database", mock_database):
+            response = client.get("/api/search?q=blockade&scenario=strait&kind=decision&limit=5")
+            assert response.status_code == 200
+            data = response.json()
+            assert data[0]["snippet"] == "Escalate the [blockade]"
+            mock_database.search.assert_called_once_with(
+                "blockade", scenario_id="strait", run_id=None, kind="decision", limit=5, offset=0
+            )
+
+    def test_search_requires_query(self, client, mock_database):
+        """Test that an empty query is rejected"""
+        with patch("scenario_lab.api.app.database", mock_database):
+            assert client.get("/api/search").status_code == 422
+            assert client.get("/api/search?q=").status_code == 422
+            assert client.get("/api/search?q=x&kind=metric").status_code == 422
+
+    def test_search_unavailable_returns_503(self, client, mock_database):
+        """Test that a database without search support returns 503"""
+        mock_database.search.side_effect = RuntimeError("Full-text search is not available")
+
+        with patch("scenario_lab.api.app.database", mock_database):
+            response = client.get("/api/search?q=blockade")
+            assert response.status_code == 503
+
+
 class TestPauseResumeEndpoints:
     """Tests for the pause and resume endpoints"""
 
@@ -1135,7 +1283,7 @@ class TestRunsEmptyDatabase:
 
     def test_list_runs_returns_empty_list(self, client, mock_database):
         """Test that list runs returns empty list when no runs exist"""
-        mock_database.list_runs.return_value = []
+        mock_database.list_runs_page.return_value = ([], None)
 
         with patch("scenario_lab.api.app.database", mock_database):
             response = client.get("/api/runs")
@@ -1288,23 +1436,24 @@ class TestMultipleRuns:
 
     def test_list_multiple_runs(self, client, mock_database):
         """Test listing multiple runs"""
-        mock_run1 = MagicMock()
-        mock_run1.id = "run-001"
-        mock_run1.scenario_name = "Scenario A"
-        mock_run1.status = "completed"
-        mock_run1.total_turns = 5
-        mock_run1.total_cost = 0.5
-        mock_run1.created = datetime.now()
-
-        mock_run2 = MagicMock()
-        mock_run2.id = "run-002"
-        mock_run2.scenario_name = "Scenario B"
-        mock_run2.status = "halted"
-        mock_run2.total_turns = 3
-        mock_run2.total_cost = 0.3
-        mock_run2.created = datetime.now()
-
-        mock_database.list_runs.return_value = [mock_run1, mock_run2]
+        row1 = {
+            "id": "run-001",
+            "scenario_name": "Scenario A",
+            "status": "completed",
+            "total_turns": 5,
+            "total_cost": 0.5,
+            "created": datetime.now(),
+        }
+        row2 = {
+            "id": "run-002",
+            "scenario_name": "Scenario B",
+            "status": "halted",
+            "total_turns": 3,
+            "total_cost": 0.3,
+            "created": datetime.now(),
+        }
+
+        mock_database.list_runs_page.return_value = ([row1, row2], None)
 
         with patch("scenario_lab.api.app.database", mock_database):
             response = client.get("/api/runs")
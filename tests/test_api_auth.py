@@ -13,6 +13,9 @@ from scenario_lab.api.settings import APISettings, get_settings, reset_settings
 from scenario_lab.api.auth import verify_api_key, optional_api_key
 from scenario_lab.api.rate_limit import (
     RateLimiter,
+    MemoryRateLimitStore,
+    SQLiteRateLimitStore,
+    create_rate_limit_store,
     get_rate_limiter,
     reset_rate_limiter,
 )
@@ -406,6 +409,126 @@ class TestRateLimiter:
         assert allowed is True
 
 
+class TestRateLimitStores:
+    """Tests for GCRA state stores"""
+
+    def setup_method(self):
+        """Enable rate limiting with a small limit"""
+        reset_rate_limiter()
+        reset_settings()
+        os.environ["SCENARIO_LAB_RATE_LIMIT_ENABLED"] = "true"
+        os.environ["SCENARIO_LAB_RATE_LIMIT_REQUESTS"] = "2"
+        os.environ["SCENARIO_LAB_RATE_LIMIT_WINDOW"] = "60"
+
+    def teardown_method(self):
+        """Clean up after each test"""
+        reset_rate_limiter()
+        reset_settings()
+        for key in [
+            "SCENARIO_LAB_RATE_LIMIT_ENABLED",
+            "SCENARIO_LAB_RATE_LIMIT_REQUESTS",
+            "SCENARIO_LAB_RATE_LIMIT_WINDOW",
+            "SCENARIO_LAB_RATE_LIMIT_BACKEND",
+            "SCENARIO_LAB_RATE_LIMIT_DB",
+        ]:
+            os.environ.pop(key, None)
+
+    @staticmethod
+    def _request(host="127.0.0.1"):
+        mock_request = Mock()
+        mock_request.headers = {}
+        mock_request.client = Mock()
+        mock_request.client.host = host
+        return mock_request
+
+    def test_state_is_constant_per_client(self):
+        """Test that a client's state doesn't grow with its request count"""
+        store = MemoryRateLimitStore()
+        limiter = RateLimiter(store=store)
+
+        for _ in range(50):
+            limiter.check_rate_limit(self._request())
+
+        assert len(store) == 1
+
+    def test_reset_seconds_reflects_emission_interval(self):
+        """Test that a blocked client is told when its next request is allowed"""
+        limiter = RateLimiter(store=MemoryRateLimitStore())
+        limiter.check_rate_limit(self._request())
+        limiter.check_rate_limit(self._request())
+
+        allowed, remaining, reset = limiter.check_rate_limit(self._request())
+        assert allowed is False
+        assert remaining == 0
+        # 2 requests per 60s: one request frees up every 30s
+        assert 29 <= reset <= 30
+
+    def test_idle_clients_are_evicted(self):
+        """Test that clients whose burst has fully refilled are evicted"""
+        os.environ["SCENARIO_LAB_RATE_LIMIT_WINDOW"] = "1"
+        store = MemoryRateLimitStore()
+        limiter = RateLimiter(store=store)
+
+        limiter.check_rate_limit(self._request("10.0.0.1"))
+        limiter.check_rate_limit(self._request("10.0.0.2"))
+        assert len(store) == 2
+
+        time.sleep(0.6)
+        limiter.check_rate_limit(self._request("10.0.0.3"))
+
+        assert len(store) == 1
+
+    def test_memory_store_caps_clients(self):
+        """Test that the memory store never tracks more than max_clients"""
+        store = MemoryRateLimitStore(max_clients=3)
+        limiter = RateLimiter(store=store)
+
+        for i in range(10):
+            limiter.check_rate_limit(self._request(f"10.0.0.{i}"))
+
+        assert len(store) == 3
+
+    def test_sqlite_store_is_shared_between_limiters(self, tmp_path):
+        """Test that limiters on the same SQLite file enforce one limit"""
+        db_path = str(tmp_path / "ratelimit.db")
+        worker_1 = RateLimiter(store=SQLiteRateLimitStore(db_path))
+        worker_2 = RateLimiter(store=SQLiteRateLimitStore(db_path))
+
+        assert worker_1.check_rate_limit(self._request())[0] is True
+        assert worker_2.check_rate_limit(self._request())[0] is True
+
+        # Limit of 2 is used up across both workers
+        assert worker_1.check_rate_limit(self._request())[0] is False
+        assert worker_2.check_rate_limit(self._request())[0] is False
+
+    def test_sqlite_store_purges_idle_entries(self, tmp_path):
+        """Test that the SQLite store periodically deletes idle entries"""
+        os.environ["SCENARIO_LAB_RATE_LIMIT_WINDOW"] = "1"
+        store = SQLiteRateLimitStore(str(tmp_path / "ratelimit.db"), cleanup_every=2)
+        limiter = RateLimiter(store=store)
+
+        limiter.check_rate_limit(self._request("10.0.0.1"))
+        time.sleep(0.6)
+        limiter.check_rate_limit(self._request("10.0.0.2"))
+
+        assert len(store) == 1
+
+    def test_backend_from_settings(self, tmp_path):
+        """Test that the default store follows SCENARIO_LAB_RATE_LIMIT_BACKEND"""
+        os.environ["SCENARIO_LAB_RATE_LIMIT_BACKEND"] = "sqlite"
+        os.environ["SCENARIO_LAB_RATE_LIMIT_DB"] = str(tmp_path / "shared.db")
+
+        limiter = get_rate_limiter()
+
+        assert isinstance(limiter.store, SQLiteRateLimitStore)
+        assert limiter.store.path == str(tmp_path / "shared.db")
+
+    def test_unknown_backend_raises(self):
+        """Test that an unknown backend name is rejected"""
+        with pytest.raises(ValueError, match="Unknown rate limit backend"):
+            create_rate_limit_store("redis")
+
+
 class TestAPIEndpointsAuth:
     """Integration tests for API authentication on endpoints"""
 
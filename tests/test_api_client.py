@@ -16,6 +16,7 @@ from scenario_lab.utils.api_client import (
     make_openrouter_call,
     make_llm_call,
     make_llm_call_async,
+    with_cache_control,
 )
 
 
@@ -298,6 +299,67 @@ class TestMakeOpenrouterCall:
         assert call_kwargs['headers']['Authorization'] == 'Bearer my-api-key'
 
 
+class TestPromptCaching:
+    """Tests for cache-control hints and cached token accounting"""
+
+    MESSAGES = [
+        {"role": "system", "content": "System"},
+        {"role": "user", "content": "Instructions"},
+        {"role": "user", "content": "This turn"},
+    ]
+
+    def test_breakpoint_on_last_stable_message(self):
+        """Test that explicit-cache models get a breakpoint before the last message"""
+        marked = with_cache_control("anthropic/claude-sonnet-4", self.MESSAGES)
+
+        assert marked[1]['content'] == [
+            {"type": "text", "text": "Instructions", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert marked[0] == self.MESSAGES[0] and marked[2] == self.MESSAGES[2]
+        assert self.MESSAGES[1]['content'] == "Instructions"  # original untouched
+
+    def test_automatic_cache_models_unchanged(self):
+        """Test that models with automatic prefix caching get plain messages"""
+        assert with_cache_control("openai/gpt-4o", self.MESSAGES) is self.MESSAGES
+        single = [{"role": "user", "content": "Hi"}]
+        assert with_cache_control("anthropic/claude-sonnet-4", single) is single
+
+    @patch('scenario_lab.utils.api_client.get_http_session')
+    def test_openrouter_payload_has_hint(self, mock_get_session):
+        """Test that the OpenRouter payload carries the hint"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.json.return_value = {'choices': [{'message': {'content': 'Hi'}}]}
+        mock_response.raise_for_status.return_value = None
+        mock_session.post.return_value = mock_response
+        mock_get_session.return_value = mock_session
+
+        make_openrouter_call("anthropic/claude-sonnet-4", self.MESSAGES, "key")
+
+        payload = mock_session.post.call_args[1]['json']
+        assert payload['messages'][1]['content'][0]['cache_control'] == {"type": "ephemeral"}
+
+    @patch('scenario_lab.utils.api_client.make_openrouter_call')
+    def test_cached_tokens_recorded(self, mock_openrouter):
+        """Test that cached prompt tokens reported by the provider are kept"""
+        mock_openrouter.return_value = {
+            'choices': [{'message': {'content': 'Answer'}}],
+            'usage': {
+                'prompt_tokens': 1000,
+                'completion_tokens': 50,
+                'total_tokens': 1050,
+                'prompt_tokens_details': {'cached_tokens': 800},
+            },
+        }
+
+        response = make_llm_call(
+            "anthropic/claude-sonnet-4", self.MESSAGES, api_key="key", use_cache=False
+        )
+
+        assert response.input_tokens == 1000
+        assert response.cached_input_tokens == 800
+
+
 class TestMakeLLMCall:
     """Tests for make_llm_call function"""
 
@@ -0,0 +1,222 @@
+"""
+Tests for the API scenario execution service
+
+Tests bounded concurrency, priority queueing, per-API-key quotas and
+TTL eviction of finished run status entries.
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from scenario_lab.api.execution import (
+    ExecutionService,
+    QueueFullError,
+    QuotaExceededError,
+    reset_execution_service,
+)
+from scenario_lab.api.rate_limit import reset_rate_limiter
+from scenario_lab.api.settings import reset_settings
+
+
+async def _noop():
+    pass
+
+
+class TestExecutionService:
+    """Tests for ExecutionService admission control"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrent runs execute at once"""
+        service = ExecutionService(max_concurrent=2, per_key_limit=0)
+        running = 0
+        peak = 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        for _ in range(6):
+            scenario_id = service.new_scenario_id()
+            service.submit(scenario_id, job)
+
+        await asyncio.gather(*[service.drain() for _ in range(6)])
+
+        assert peak == 2
+        assert service.active_count == 0
+        assert service.queued_count == 0
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """Test that queued runs start in priority order, FIFO within a priority"""
+        service = ExecutionService(max_concurrent=1, per_key_limit=0)
+        order = []
+
+        def make_job(name):
+            async def job():
+                order.append(name)
+            return job
+
+        for name, priority in [("low", 0), ("high", 10), ("mid", 5), ("high2", 10)]:
+            service.submit(service.new_scenario_id(), make_job(name), priority=priority)
+
+        await service.drain()
+
+        assert order == ["high", "high2", "mid", "low"]
+
+    def test_second_run_is_queued_when_slots_busy(self):
+        """Test that submissions beyond the slot count report queued status"""
+        service = ExecutionService(max_concurrent=1, per_key_limit=0)
+        service._active = 1  # Simulate a busy worker
+
+        first = service.new_scenario_id()
+        entry = service.submit(first, _noop)
+        second = service.new_scenario_id()
+        service.submit(second, _noop)
+
+        assert entry["status"] == "queued"
+        assert service.queue_position(first) == 1
+        assert service.queue_position(second) == 2
+
+    def test_per_key_quota(self):
+        """Test that an API key can't exceed its queued + active quota"""
+        service = ExecutionService(max_concurrent=1, per_key_limit=2)
+        service.submit(service.new_scenario_id(), _noop, api_key="key-a")
+        service.submit(service.new_scenario_id(), _noop, api_key="key-a")
+
+        rejected_id = service.new_scenario_id()
+        with pytest.raises(QuotaExceededError):
+            service.submit(rejected_id, _noop, api_key="key-a")
+
+        # Rejected ID is released, other keys are unaffected
+        assert rejected_id not in service.runs
+        service.submit(service.new_scenario_id(), _noop, api_key="key-b")
+
+    @pytest.mark.asyncio
+    async def test_quota_released_after_completion(self):
+        """Test that finished runs no longer count against the quota"""
+        service = ExecutionService(max_concurrent=1, per_key_limit=1)
+        service.submit(service.new_scenario_id(), _noop, api_key="key-a")
+        await service.drain()
+
+        service.submit(service.new_scenario_id(), _noop, api_key="key-a")
+
+    def test_burst_reports_queued_beyond_free_slots(self):
+        """Test that a burst of submissions reports only max_concurrent as starting"""
+        service = ExecutionService(max_concurrent=2, per_key_limit=0)
+
+        entries = [service.submit(service.new_scenario_id(), _noop) for _ in range(4)]
+
+        assert [e["status"] for e in entries] == [
+            "initializing", "initializing", "queued", "queued"
+        ]
+
+    def test_queue_full(self):
+        """Test that submissions are rejected when the queue is full"""
+        service = ExecutionService(max_concurrent=1, max_queued=1, per_key_limit=0)
+        # The first run takes the free slot and doesn't count as waiting
+        service.submit(service.new_scenario_id(), _noop)
+        service.submit(service.new_scenario_id(), _noop)
+
+        with pytest.raises(QueueFullError):
+            service.submit(service.new_scenario_id(), _noop)
+
+    @pytest.mark.asyncio
+    async def test_failing_job_marks_run_failed(self):
+        """Test that an exception escaping a job marks the run failed"""
+        service = ExecutionService(per_key_limit=0)
+
+        async def job():
+            raise RuntimeError("boom")
+
+        scenario_id = service.new_scenario_id()
+        service.submit(scenario_id, job)
+        await service.drain()
+
+        assert service.runs[scenario_id]["status"] == "failed"
+        assert service.runs[scenario_id]["error"] == "boom"
+        assert service.active_count == 0
+
+    def test_unique_ids_within_same_second(self):
+        """Test that IDs generated in the same second don't collide"""
+        service = ExecutionService()
+        now = datetime(2025, 1, 1, 12, 0, 0)
+
+        first = service.new_scenario_id(now)
+        second = service.new_scenario_id(now)
+
+        assert first == "scenario-20250101-120000"
+        assert second == "scenario-20250101-120001"
+
+    def test_evict_expired_entries(self):
+        """Test that only finished entries older than the TTL are evicted"""
+        service = ExecutionService(status_ttl=60)
+        old = datetime.now() - timedelta(seconds=120)
+        service.runs.update({
+            "old-done": {"status": "completed", "completed_at": old},
+            "old-failed": {"status": "failed", "completed_at": old},
+            "recent": {"status": "completed", "completed_at": datetime.now()},
+            "running": {"status": "running", "completed_at": None},
+        })
+
+        assert service.evict_expired() == 2
+        assert set(service.runs) == {"recent", "running"}
+
+    def test_ttl_zero_keeps_entries(self):
+        """Test that a TTL of 0 disables eviction"""
+        service = ExecutionService(status_ttl=0)
+        service.runs["old"] = {
+            "status": "completed",
+            "completed_at": datetime.now() - timedelta(days=1),
+        }
+
+        assert service.evict_expired() == 0
+        assert "old" in service.runs
+
+
+class TestExecuteEndpointLimits:
+    """Tests for admission control on the execute endpoint"""
+
+    @pytest.fixture(autouse=True)
+    def reset_state(self):
+        reset_settings()
+        reset_rate_limiter()
+        reset_execution_service()
+        os.environ["SCENARIO_LAB_DEV_MODE"] = "true"
+        yield
+        for key in ["SCENARIO_LAB_DEV_MODE", "SCENARIO_LAB_RUNS_PER_API_KEY"]:
+            os.environ.pop(key, None)
+        reset_settings()
+        reset_rate_limiter()
+        reset_execution_service()
+
+    def test_execute_rejects_over_quota(self, tmp_path):
+        """Test that execute returns 429 when the submitter's quota is used up"""
+        os.environ["SCENARIO_LAB_RUNS_PER_API_KEY"] = "1"
+        from scenario_lab.api.app import app, get_executor
+
+        # Occupy the anonymous quota without running anything
+        get_executor().submit(get_executor().new_scenario_id(), _noop)
+
+        client = TestClient(app)
+        response = client.post(
+            "/api/scenarios/execute",
+            json={"scenario_path": str(tmp_path)},
+        )
+        assert response.status_code == 429
+        assert "quota" in response.json()["detail"]
+
+    def test_health_reports_queue(self):
+        """Test that health reports active and queued scenario counts"""
+        from scenario_lab.api.app import app
+
+        client = TestClient(app)
+        data = client.get("/api/health").json()
+        assert data["active_scenarios"] == 0
+        assert data["queued_scenarios"] == 0
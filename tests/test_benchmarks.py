@@ -0,0 +1,319 @@
+"""
+Tests for the benchmark suite
+"""
+import csv
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from scenario_lab.batch.batch_analyzer import BatchAnalyzer
+from scenario_lab.benchmarks import (
+    SCALES,
+    ScenarioBenchmark,
+    build_batch_output,
+    build_state,
+    compare_reports,
+    generate_scenario,
+    get_benchmarks,
+    load_report,
+    measure,
+    run_suite,
+    save_report,
+    write_csv,
+)
+from scenario_lab.benchmarks.scenario import percentile, summarize
+from scenario_lab.interfaces.cli import cli
+from scenario_lab.loaders.exogenous_events_loader import load_exogenous_events
+from scenario_lab.schemas.loader import validate_scenario_directory
+from scenario_lab.utils.mock_llm import mock_all_models
+from scenario_lab.utils.response_parser import parse_decision
+
+MINIMAL_SCENARIO = Path(__file__).parent.parent / "scenarios" / "example-minimal-template"
+
+
+def _report(**medians):
+    return {"results": [
+        {"name": name, "group": "g", "scale": None, "loops": 1, "times": [median], "median": median}
+        for name, median in medians.items()
+    ]}
+
+
+class TestFixtures:
+    """Tests for synthetic fixtures"""
+
+    def test_state_at_scale(self):
+        state = build_state(turns=10, actors=5)
+
+        assert state.turn == 10
+        assert len(state.actors) == 5
+        assert len(state.decisions) == 5
+        assert len(state.communications) == 50
+        assert len(state.costs) == 10 * 6
+        assert all(len(a.recent_decisions) == 5 for a in state.actors.values())
+        assert json.dumps(state.to_dict())
+
+    def test_deterministic(self):
+        first = build_state(3, 2, seed=1).to_dict()
+        assert build_state(3, 2, seed=1).to_dict() == first
+        assert build_state(3, 2, seed=2).to_dict() != first
+
+    def test_decision_response_parses(self):
+        from random import Random
+
+        from scenario_lab.benchmarks.fixtures import synthetic_decision_response
+
+        parsed = parse_decision(synthetic_decision_response(Random(0)))
+        assert parsed["goals"] and parsed["reasoning"] and parsed["action"]
+
+    def test_batch_output_is_analyzable(self, tmp_path):
+        batch_dir = build_batch_output(tmp_path / "batch", variations=3, runs_per_variation=4)
+
+        analyzer = BatchAnalyzer(str(batch_dir))
+        analyzer.collect_run_data()
+
+        assert len(analyzer.run_data) == 12
+        assert len(analyzer.calculate_variation_statistics()) == 3
+
+
+class TestSuite:
+    """Tests for running the suite"""
+
+    def test_measure_calibrates_loops(self):
+        calls = []
+        loops, samples = measure(lambda: calls.append(1), repeat=3, min_time=0.001)
+
+        assert loops > 1
+        assert len(samples) == 3
+        assert len(calls) == 1 + loops * 3
+
+    def test_filters(self):
+        names = [case.name for case in get_benchmarks(["parser"])]
+        assert names == [
+            "parser.parse_decision", "parser.parse_decision_json", "parser.extract_section",
+        ]
+        assert [c.name for c in get_benchmarks(["state.to_*"])] == ["state.to_dict", "state.to_json"]
+
+    def test_every_benchmark_runs_at_smallest_scale(self):
+        report = run_suite(scales=["t10-a5"], repeat=1, min_time=0)
+
+        keys = [result["key"] for result in report["results"]]
+        assert len(keys) == len(get_benchmarks())
+        assert "state.with_decision[t10-a5]" in keys
+        assert "parser.parse_decision" in keys
+        assert all(result["median"] > 0 for result in report["results"])
+        assert report["environment"]["python"]
+
+    def test_unknown_scale(self):
+        with pytest.raises(ValueError):
+            run_suite(scales=["t5-a5"])
+
+    def test_scales_cover_requested_sizes(self):
+        assert {(s.turns, s.actors) for s in SCALES.values()} >= {(10, 5), (1000, 50)}
+
+
+class TestCompare:
+    """Tests for baseline comparison"""
+
+    def test_statuses(self):
+        baseline = _report(slower=1.0, faster=1.0, same=1.0, removed=1.0)
+        current = _report(slower=1.2, faster=0.5, same=1.05, added=1.0)
+
+        statuses = {c.key: c.status for c in compare_reports(current, baseline, threshold=0.1)}
+
+        assert statuses == {
+            "slower": "regression",
+            "faster": "improvement",
+            "same": "unchanged",
+            "added": "new",
+            "removed": "missing",
+        }
+
+    def test_save_and_load(self, tmp_path):
+        path = tmp_path / "out" / "bench.json"
+        save_report(_report(a=1.0), str(path))
+
+        assert load_report(str(path))["results"][0]["name"] == "a"
+
+        (tmp_path / "other.json").write_text("[]")
+        with pytest.raises(ValueError):
+            load_report(str(tmp_path / "other.json"))
+
+
+class TestBenchCommand:
+    """Tests for scenario-lab bench"""
+
+    def test_list(self):
+        result = CliRunner().invoke(cli, ["bench", "--list"])
+
+        assert result.exit_code == 0
+        assert "state.with_decision" in result.output
+        assert "t1000-a50" in result.output
+
+    def test_output_and_baseline(self, tmp_path):
+        output = tmp_path / "bench.json"
+        args = ["bench", "-k", "parser.extract_section", "--repeat", "1", "--min-time", "0"]
+
+        result = CliRunner().invoke(cli, args + ["-o", str(output)])
+        assert result.exit_code == 0
+        assert load_report(str(output))["results"][0]["name"] == "parser.extract_section"
+
+        baseline = tmp_path / "baseline.json"
+        save_report(_report(**{"parser.extract_section": 1e-12}), str(baseline))
+        result = CliRunner().invoke(cli, args + ["--baseline", str(baseline)])
+        assert result.exit_code == 1
+        assert "regression" in result.output
+
+    def test_unknown_scale(self):
+        result = CliRunner().invoke(cli, ["bench", "--scale", "huge"])
+        assert result.exit_code == 1
+
+
+@pytest.fixture
+def mock_scenario(tmp_path, fresh_llm_backend):
+    path = tmp_path / "scenario"
+    shutil.copytree(MINIMAL_SCENARIO, path)
+    return str(path)
+
+
+class TestStatistics:
+    """Tests for percentile and summarize"""
+
+    def test_percentile_interpolates(self):
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+        assert percentile([5.0], 95) == 5.0
+        assert percentile([3.0, 1.0, 2.0], 100) == 3.0
+
+    def test_summarize(self):
+        stats = summarize([1.0, 2.0, 3.0])
+
+        assert stats["count"] == 3
+        assert stats["mean"] == 2.0
+        assert stats["p50"] == 2.0
+        assert summarize([]) == {"count": 0}
+
+
+class TestScenarioBenchmark:
+    """Tests for whole-scenario benchmarks on the mock backend"""
+
+    def test_invalid_backend(self, mock_scenario):
+        with pytest.raises(ValueError):
+            ScenarioBenchmark(mock_scenario, backend="remote")
+        with pytest.raises(ValueError):
+            ScenarioBenchmark(mock_scenario, backend="replay")
+
+    def test_mock_run(self, mock_scenario):
+        seen = []
+        bench = ScenarioBenchmark(
+            mock_scenario, turns=2, repetitions=2, warmup=1, backend="mock", trace_memory=True
+        )
+
+        report = bench.run(progress=seen.append)
+
+        assert [(m.repetition, m.warmup) for m in seen] == [(1, True), (1, False), (2, False)]
+        assert len(report["runs"]) == 2
+        summary = report["summary"]
+        assert summary["turn"]["count"] == 4
+        assert {"decision", "world_update", "persistence"} <= set(summary["phases"])
+        assert summary["llm"]["calls"] > 0
+        assert summary["llm"]["network"]["mean"] > 0
+        assert summary["memory_peak"]["max"] > 0
+        # The override is restored after the run
+        assert not mock_all_models()
+
+    def test_csv_appends(self, mock_scenario, tmp_path):
+        report = ScenarioBenchmark(mock_scenario, turns=1, backend="mock").run()
+        path = tmp_path / "bench.csv"
+
+        write_csv(report, str(path))
+        write_csv(report, str(path))
+
+        with open(path) as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 2
+        assert rows[0]["backend"] == "mock"
+        assert float(rows[0]["turn_mean"]) > 0
+
+
+class TestBenchmarkCommandOutput:
+    """Tests for machine-readable scenario-lab benchmark output"""
+
+    def test_json_report(self, mock_scenario, tmp_path):
+        output = tmp_path / "report.json"
+        result = CliRunner().invoke(cli, [
+            "benchmark", mock_scenario, "--backend", "mock", "--turns", "1",
+            "--format", "json", "-o", str(output),
+        ])
+
+        assert result.exit_code == 0, result.output
+        report = json.loads(output.read_text())
+        assert report["backend"] == "mock"
+        assert report["summary"]["turn"]["count"] == 1
+
+    def test_replay_requires_cassette(self, mock_scenario):
+        result = CliRunner().invoke(cli, ["benchmark", mock_scenario, "--backend", "replay"])
+        assert result.exit_code == 1
+
+
+class TestScenarioGenerator:
+    """Tests for the synthetic scenario generator"""
+
+    def test_generates_valid_scenario(self, tmp_path):
+        generated = generate_scenario(
+            str(tmp_path / "large"), actors=12, turns=40, metrics=6, event_density=0.5
+        )
+
+        assert len(list((generated.path / "actors").glob("*.yaml"))) == 12
+        results = validate_scenario_directory(generated.path)
+        assert set(results) == {"scenario", "actors", "metrics"}
+        assert all(result.success for result in results.values())
+
+        manager = load_exogenous_events(generated.path)
+        assert len(manager.events) == generated.total_events
+        assert generated.events["conditional"] > 0
+
+    def test_deterministic(self, tmp_path):
+        first = generate_scenario(str(tmp_path / "a"), actors=3, turns=5, seed=7)
+        second = generate_scenario(str(tmp_path / "b"), actors=3, turns=5, seed=7)
+
+        for name in ("scenario.yaml", "metrics.yaml", "actors/actor-002.yaml"):
+            assert (first.path / name).read_text() == (second.path / name).read_text()
+
+    def test_refuses_to_overwrite(self, tmp_path):
+        generate_scenario(str(tmp_path / "s"), actors=2, turns=2)
+
+        with pytest.raises(FileExistsError):
+            generate_scenario(str(tmp_path / "s"), actors=2, turns=2)
+        assert generate_scenario(str(tmp_path / "s"), actors=3, turns=2, overwrite=True).actors == 3
+        with pytest.raises(ValueError):
+            generate_scenario(str(tmp_path / "t"), actors=0)
+
+    def test_runs_on_mock_models(self, tmp_path, fresh_llm_backend):
+        path = generate_scenario(str(tmp_path / "s"), actors=4, turns=2, metrics=3).path
+
+        # Actors use mock models, so no backend override is needed
+        report = ScenarioBenchmark(str(path), turns=2).run()
+
+        assert report["runs"][0]["turns_completed"] == 2
+        assert report["summary"]["llm"]["calls"] >= 2 * 5
+
+    def test_runner_uses_scenario_turns(self, tmp_path):
+        from scenario_lab.runners import SyncRunner
+
+        path = generate_scenario(str(tmp_path / "s"), actors=2, turns=7).path
+        runner = SyncRunner(str(path), output_path=str(tmp_path / "out"))
+        runner.setup()
+
+        assert runner.orchestrator.end_turn == 7
+
+    def test_cli(self, tmp_path):
+        output = tmp_path / "s"
+        args = ["generate-scenario", str(output), "--actors", "3", "--turns", "4"]
+
+        result = CliRunner().invoke(cli, args)
+        assert result.exit_code == 0, result.output
+        assert "Exogenous events" in result.output
+        assert CliRunner().invoke(cli, args).exit_code == 1
+        assert CliRunner().invoke(cli, args + ["--force"]).exit_code == 0
@@ -254,6 +254,56 @@ class TestRunCommand(TestCLIBase):
             self.assertEqual(call_kwargs['end_turn'], 5)
             self.assertEqual(call_kwargs['credit_limit'], 10.0)
 
+    def test_run_rejects_record_with_replay(self):
+        """Test that --record and --replay cannot be combined"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scenario_dir = self.create_minimal_scenario(tmpdir)
+            cassette = Path(tmpdir) / 'calls.jsonl'
+            cassette.write_text('')
+
+            result = self.runner.invoke(cli, [
+                'run', str(scenario_dir),
+                '--record', str(Path(tmpdir) / 'new.jsonl'),
+                '--replay', str(cassette),
+            ])
+
+            self.assertNotEqual(result.exit_code, 0)
+
+    @patch('scenario_lab.runners.SyncRunner')
+    def test_run_with_replay_activates_cassette(self, mock_runner_class):
+        """Test that --replay serves LLM calls from the cassette during the run"""
+        from scenario_lab.utils.llm_cassette import get_cassette, reset_cassette
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scenario_dir = self.create_minimal_scenario(tmpdir)
+            cassette_path = Path(tmpdir) / 'calls.jsonl'
+            cassette_path.write_text('')
+
+            mock_runner = MagicMock()
+            mock_runner.output_path = str(scenario_dir / 'runs' / 'run-001')
+            mock_state = MagicMock()
+            mock_state.turn = 1
+            mock_state.total_cost.return_value = 0.0
+
+            seen = {}
+
+            async def run():
+                seen['cassette'] = get_cassette()
+                return mock_state
+
+            mock_runner.run = run
+            mock_runner_class.return_value = mock_runner
+
+            try:
+                result = self.runner.invoke(cli, [
+                    'run', str(scenario_dir), '--replay', str(cassette_path)
+                ])
+                self.assertEqual(result.exit_code, 0, result.output)
+                self.assertEqual(seen['cassette'].mode, 'replay')
+                self.assertIn('Cassette: 0 recorded, 0 replayed', result.output)
+            finally:
+                reset_cassette()
+
 
 class TestServeCommand(TestCLIBase):
     """Tests for serve command"""
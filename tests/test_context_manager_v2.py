@@ -1,10 +1,15 @@
 """
 Unit tests for ContextManagerV2
 
-Tests V2 context manager parameter validation.
+Tests V2 context manager parameter validation, turn history and rolling
+summarization.
 """
 import pytest
+from scenario_lab.core import context_manager as context_manager_module
 from scenario_lab.core.context_manager import ContextManagerV2
+from scenario_lab.core.turn_history import TurnHistory, TurnRecord
+from scenario_lab.models.state import ActorState, Decision, ScenarioState, WorldState
+from scenario_lab.utils.api_client import LLMResponse
 
 
 class TestContextManagerV2Validation:
@@ -66,5 +71,158 @@ class TestContextManagerV2Validation:
         assert manager.window_size == 1
 
 
+def make_state(turn: int, run_id: str = "run-1") -> ScenarioState:
+    """State at the start of a turn, as produced by the previous turns"""
+    decisions = [
+        Decision(actor="Alpha", turn=t, goals=[], reasoning="", action=f"alpha acts {t}")
+        for t in range(max(1, turn - 5), turn)
+    ]
+    return ScenarioState(
+        scenario_id="scenario",
+        scenario_name="Scenario",
+        run_id=run_id,
+        turn=turn,
+        world_state=WorldState(turn=turn - 1, content=f"world after turn {turn - 1}"),
+        actors={
+            "Alpha": ActorState(
+                name="Alpha", short_name="alpha", model="m", recent_decisions=decisions
+            )
+        },
+    )
+
+
+class SummaryPrompts(list):
+    """Prompts sent for summarization, with the turn ranges set to fail"""
+
+    failing: set
+
+
+@pytest.fixture
+def summarizer(monkeypatch):
+    """Replace the summarization LLM call and record its prompts"""
+    prompts = SummaryPrompts()
+    failing = set()
+
+    async def fake_call(model, messages, **kwargs):
+        prompts.append(messages[-1]["content"])
+        turns = kwargs["context"]["turns"]
+        if turns in failing:
+            raise RuntimeError("provider unavailable")
+        return LLMResponse(content=f"summary {turns}", tokens_used=10, input_tokens=8, output_tokens=2)
+
+    monkeypatch.setattr(context_manager_module, "make_llm_call_async", fake_call)
+    prompts.failing = failing
+    return prompts
+
+
+class TestTurnHistory:
+    """Test recording turns from successive states"""
+
+    def test_record_previous_turn(self):
+        history = TurnHistory()
+
+        assert history.record_previous_turn(make_state(1))
+        assert history.record_previous_turn(make_state(2))
+        assert not history.record_previous_turn(make_state(2))
+
+        assert history.get(0) == TurnRecord(turn=0, world_state="world after turn 0")
+        assert history.get(1).actions == {"Alpha": "alpha acts 1"}
+        assert [r.turn for r in history.range(0, 5)] == [0, 1]
+        assert history.latest_turn == 1
+
+
+class TestRollingSummary:
+    """Test rolling summarization and the summary cache"""
+
+    @pytest.mark.asyncio
+    async def test_full_history_within_window(self, summarizer):
+        manager = ContextManagerV2(window_size=3)
+
+        for turn in (1, 2, 3):
+            context, _ = await manager.get_context_for_actor("Alpha", make_state(turn))
+
+        assert "### Turn 0 (Initial State)\n\nworld after turn 0" in context
+        assert "- **Alpha:** alpha acts 2" in context
+        assert "### Turn 3 (Current)" in context
+        assert summarizer == []
+
+    @pytest.mark.asyncio
+    async def test_one_fold_per_turn(self, summarizer):
+        manager = ContextManagerV2(window_size=3)
+
+        for turn in range(1, 5):
+            await manager.get_context_for_actor("Alpha", make_state(turn))
+        # First windowed turn summarizes turns 0 and 1
+        assert len(summarizer) == 2
+
+        calls = []
+        for turn in range(5, 20):
+            context, _ = await manager.get_context_for_actor("Alpha", make_state(turn))
+            await manager.get_context_for_actor("Beta", make_state(turn))
+            calls.append(len(summarizer))
+
+        assert calls == list(range(3, 18))
+        assert f"summary 0-{19 - 3}" in context
+        assert "### Turn 17\n" in context and "### Turn 16\n" not in context
+        # Each fold sees the previous summary and one turn, not the whole run
+        assert "summary 0-15" in summarizer[-1]
+        assert "world after turn 16" in summarizer[-1]
+        assert "world after turn 15" not in summarizer[-1]
+        assert len(summarizer[-1]) < 2 * len(summarizer[3])
+
+    @pytest.mark.asyncio
+    async def test_cache_is_lru(self, summarizer):
+        manager = ContextManagerV2(window_size=1, max_cache_size=2)
+
+        for turn in range(1, 5):
+            await manager.get_context_for_actor("Alpha", make_state(turn))
+
+        assert list(manager.summaries_cache) == [
+            ("scenario", "run-1", 2), ("scenario", "run-1", 3)
+        ]
+        manager._get_cached_summary(("scenario", "run-1", 2))
+        manager._cache_summary(("scenario", "run-1", 9), "x")
+        assert ("scenario", "run-1", 3) not in manager.summaries_cache
+
+    @pytest.mark.asyncio
+    async def test_summary_responses_returned_once(self, summarizer):
+        manager = ContextManagerV2(window_size=3)
+        for turn in range(1, 4):
+            await manager.get_context_for_actor("Alpha", make_state(turn))
+
+        _, alpha = await manager.get_context_for_actor("Alpha", make_state(4))
+        _, beta = await manager.get_context_for_actor("Beta", make_state(4))
+
+        assert [r.content for r in alpha] == ["summary 0-0", "summary 0-1"]
+        assert beta == []
+
+    @pytest.mark.asyncio
+    async def test_failed_fold_not_cached(self, summarizer):
+        manager = ContextManagerV2(window_size=1)
+        for turn in range(1, 4):
+            await manager.get_context_for_actor("Alpha", make_state(turn))
+        summarizer.failing.add("0-3")
+
+        context, responses = await manager.get_context_for_actor("Alpha", make_state(4))
+
+        assert "summary 0-2" in context and responses == []
+        assert ("scenario", "run-1", 3) not in manager.summaries_cache
+
+        summarizer.failing.clear()
+        context, responses = await manager.get_context_for_actor("Alpha", make_state(5))
+
+        assert "summary 0-4" in context
+        assert [r.content for r in responses] == ["summary 0-3", "summary 0-4"]
+
+    @pytest.mark.asyncio
+    async def test_missing_history_falls_back(self, summarizer):
+        manager = ContextManagerV2(window_size=3)
+
+        context, _ = await manager.get_context_for_actor("Alpha", make_state(10, run_id="resumed"))
+
+        assert "running for 8 turns" in context
+        assert summarizer == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
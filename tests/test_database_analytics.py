@@ -3,13 +3,17 @@ Integration tests for database analytics
 
 Tests database persistence and query functionality.
 """
+import asyncio
+import threading
+import time
 import pytest
 import tempfile
 import os
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import patch
 
-from scenario_lab.database import Database
+from scenario_lab.database import Database, AsyncDatabase
 from scenario_lab.database.models import (
     Run,
     Turn,
@@ -310,5 +314,401 @@ class TestDatabaseAnalytics:
         assert abs(agg["max"] - 4.0) < 0.01
 
 
+class TestRunPagination:
+    """Test keyset pagination and projection of runs"""
+
+    @pytest.fixture
+    def runs_db(self, test_db):
+        """Database with 25 runs, some sharing a creation time"""
+        from datetime import timedelta
+
+        base = datetime(2025, 1, 1, 12, 0, 0)
+        session = test_db.get_session()
+        try:
+            for i in range(25):
+                session.add(Run(
+                    id=f"run-{i:03d}",
+                    scenario_id="paging" if i % 2 == 0 else "other",
+                    scenario_name="Paging",
+                    # Pairs of runs share a timestamp to exercise the id tiebreak
+                    created=base + timedelta(minutes=i // 2),
+                    status="completed" if i % 3 else "failed",
+                    total_turns=i,
+                    total_cost=0.1,
+                    config={"big": "x" * 100},
+                ))
+            session.commit()
+        finally:
+            session.close()
+        return test_db
+
+    def test_pages_cover_all_runs_in_order(self, runs_db):
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = runs_db.list_runs_page(limit=7, cursor=cursor)
+            seen.extend(row["id"] for row in page)
+            if cursor is None:
+                break
+
+        expected = [r.id for r in sorted(
+            runs_db.list_runs(), key=lambda r: (r.created, r.id), reverse=True
+        )]
+        assert seen == expected
+        assert len(seen) == 25
+
+    def test_config_only_loaded_on_request(self, runs_db):
+        page, _ = runs_db.list_runs_page(limit=1)
+        assert "config" not in page[0]
+
+        page, _ = runs_db.list_runs_page(limit=1, include_config=True)
+        assert page[0]["config"] == {"big": "x" * 100}
+
+    def test_filters(self, runs_db):
+        page, cursor = runs_db.list_runs_page(scenario_id="paging", status="failed", limit=100)
+        assert cursor is None
+        assert {row["id"] for row in page} == {"run-000", "run-006", "run-012", "run-018", "run-024"}
+
+        page, _ = runs_db.list_runs_page(
+            created_after=datetime(2025, 1, 1, 12, 10),
+            created_before=datetime(2025, 1, 1, 12, 12),
+            limit=100,
+        )
+        assert {row["id"] for row in page} == {"run-020", "run-021", "run-022", "run-023"}
+
+    def test_iter_runs_streams_everything(self, runs_db):
+        ids = [row["id"] for row in runs_db.iter_runs(page_size=4, scenario_id="other")]
+        assert len(ids) == 12
+        assert len(set(ids)) == 12
+
+    def test_invalid_cursor(self, runs_db):
+        with pytest.raises(ValueError):
+            runs_db.list_runs_page(cursor="not-a-cursor")
+
+
+class TestAsyncDatabase:
+    """Test the async access layer"""
+
+    @pytest.fixture
+    def async_db(self, test_db):
+        """Async wrapper over a database with one run"""
+        test_db.save_run(Run(
+            id="async-run-001",
+            scenario_id="async-scenario",
+            scenario_name="Async Test",
+            created=datetime.now(),
+            status="completed",
+            total_turns=1,
+            total_cost=0.25,
+        ))
+        db = AsyncDatabase(test_db, max_workers=2)
+        yield db
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_queries_match_sync_methods(self, async_db):
+        runs = await async_db.list_runs(scenario_id="async-scenario")
+        assert [r.id for r in runs] == ["async-run-001"]
+
+        run = await async_db.get_run("async-run-001")
+        assert run.scenario_name == "Async Test"
+
+        stats = await async_db.get_run_statistics("async-run-001")
+        assert stats == async_db.database.get_run_statistics("async-run-001")
+
+        comparison = await async_db.compare_runs(["async-run-001"])
+        assert len(comparison["runs"]) == 1
+
+        agg = await async_db.aggregate_metrics("missing", scenario="async-scenario")
+        assert agg["count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queries_run_off_the_event_loop(self, async_db):
+        loop_thread = threading.get_ident()
+        query_thread = await async_db.run(threading.get_ident)
+
+        assert query_thread != loop_thread
+
+        # A slow query doesn't stop other coroutines from running
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(async_db.run(time.sleep, 0.2), ticker())
+        assert len(ticks) == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, async_db):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def query():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*[async_db.run(query) for _ in range(6)])
+        assert peak == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestSearch:
+    """Test full-text search over run texts"""
+
+    @pytest.fixture
+    def search_db(self, test_db):
+        """Database with two runs of indexed texts"""
+        for run_id, scenario_id in [("search-run-1", "strait"), ("search-run-2", "summit")]:
+            test_db.save_run(Run(
+                id=run_id,
+                scenario_id=scenario_id,
+                scenario_name=scenario_id.title(),
+                created=datetime.now(),
+                status="completed",
+                total_turns=1,
+                total_cost=0.0,
+            ))
+
+        session = test_db.get_session()
+        try:
+            test_db.index_search_entries(session, [
+                {"content": "A naval blockade of the strait cuts oil exports.",
+                 "run_id": "search-run-1", "turn_num": 1, "kind": "world_state"},
+                {"content": "Escalate the blockade. Blockade all tankers; the blockade holds.",
+                 "run_id": "search-run-1", "turn_num": 2, "kind": "decision", "actor": "Navy"},
+                {"content": "We propose lifting the blockade in exchange for talks.",
+                 "run_id": "search-run-2", "turn_num": 1, "kind": "communication",
+                 "actor": "Envoy", "ref_id": "comm-1"},
+                {"content": "", "run_id": "search-run-2", "turn_num": 1, "kind": "world_state"},
+            ])
+            session.commit()
+        finally:
+            session.close()
+
+        return test_db
+
+    def test_search_enabled_for_sqlite(self, test_db):
+        assert test_db.search_enabled
+
+    def test_results_ranked_with_snippets(self, search_db):
+        results = search_db.search("blockade")
+
+        assert len(results) == 3
+        assert results[0]["run_id"] == "search-run-1"
+        assert results[0]["kind"] == "decision"
+        assert results[0]["actor"] == "Navy"
+        assert [r["rank"] for r in results] == sorted(r["rank"] for r in results)
+        assert all("[blockade]" in r["snippet"].lower() for r in results)
+
+    def test_stemming(self, search_db):
+        results = search_db.search("exporting")
+        assert [r["kind"] for r in results] == ["world_state"]
+
+    def test_filters(self, search_db):
+        assert len(search_db.search("blockade", scenario_id="summit")) == 1
+        assert len(search_db.search("blockade", run_id="search-run-1")) == 2
+
+        comms = search_db.search("blockade", kind="communication")
+        assert comms[0]["ref_id"] == "comm-1"
+        assert comms[0]["scenario_id"] == "summit"
+
+    def test_pagination(self, search_db):
+        first = search_db.search("blockade", limit=2)
+        rest = search_db.search("blockade", limit=2, offset=2)
+        assert len(first) == 2 and len(rest) == 1
+
+    def test_invalid_syntax_falls_back_to_terms(self, search_db):
+        results = search_db.search('blockade "oil')
+        assert [r["kind"] for r in results] == ["world_state"]
+
+    def test_rebuild_from_turns(self, test_db):
+        test_db.save_run(Run(
+            id="rebuild-run",
+            scenario_id="rebuild",
+            scenario_name="Rebuild",
+            created=datetime.now(),
+            status="completed",
+            total_turns=1,
+            total_cost=0.0,
+        ))
+        session = test_db.get_session()
+        try:
+            turn = Turn(run_id="rebuild-run", turn_num=1, timestamp=datetime.now(),
+                        world_state="Ceasefire talks begin")
+            session.add(turn)
+            session.flush()
+            session.add(Decision(turn_id=turn.id, actor="A", goals=[], reasoning="Hold the line",
+                                 action="Reject the ceasefire", timestamp=datetime.now()))
+            session.commit()
+        finally:
+            session.close()
+
+        assert test_db.search("ceasefire") == []
+        assert test_db.rebuild_search_index() == 2
+        assert len(test_db.search("ceasefire")) == 2
+        # Rebuilding again replaces rather than duplicates
+        assert test_db.rebuild_search_index() == 2
+        assert len(test_db.search("ceasefire")) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_search(self, search_db):
+        async_db = AsyncDatabase(search_db, max_workers=1)
+        try:
+            results = await async_db.search("talks")
+        finally:
+            async_db.close()
+        assert results[0]["actor"] == "Envoy"
+
+
+class TestMetricRollups:
+    """Test pre-aggregated metric rollups"""
+
+    VALUES = {
+        # run_id: [(turn, value), ...] for metric "tension", scenario "crisis"
+        "rollup-run-1": [(1, 0.2), (2, 0.5), (3, 0.4)],
+        "rollup-run-2": [(1, 0.4), (2, 0.9)],
+        "rollup-run-3": [(1, 0.6), (2, 0.7), (3, 0.8)],
+    }
+
+    @pytest.fixture
+    def rollup_db(self, test_db):
+        """Database with raw metrics and rollups written turn by turn"""
+        for run_id, values in self.VALUES.items():
+            test_db.save_run(Run(
+                id=run_id,
+                scenario_id="crisis",
+                scenario_name="Crisis",
+                created=datetime.now(),
+                status="completed",
+                total_turns=len(values),
+                total_cost=0.0,
+            ))
+            for turn_num, value in values:
+                session = test_db.get_session()
+                try:
+                    turn = Turn(run_id=run_id, turn_num=turn_num, timestamp=datetime.now())
+                    session.add(turn)
+                    session.flush()
+                    session.add(Metric(turn_id=turn.id, name="tension", value=value,
+                                       timestamp=datetime.now()))
+                    session.add(Metric(turn_id=turn.id, name="trust", value=1.0,
+                                       actor="A", timestamp=datetime.now()))
+                    test_db.update_metric_rollups(session, "crisis", run_id, turn_num, [
+                        ("tension", None, value),
+                        ("trust", "A", 1.0),
+                    ])
+                    session.commit()
+                finally:
+                    session.close()
+        return test_db
+
+    def test_turn_bands_match_raw_values(self, rollup_db):
+        bands = rollup_db.metric_turn_bands("tension", "crisis")
+
+        assert [b["turn"] for b in bands] == [1, 2, 3]
+        turn1 = bands[0]
+        assert turn1["count"] == 3
+        assert turn1["mean"] == pytest.approx(0.4)
+        assert turn1["stdev"] == pytest.approx(0.2)
+        assert turn1["min"] == pytest.approx(0.2)
+        assert turn1["max"] == pytest.approx(0.6)
+        assert turn1["lower"] == pytest.approx(0.2)
+        assert turn1["upper"] == pytest.approx(0.6)
+        assert bands[2]["count"] == 2
+
+    def test_actor_filter(self, rollup_db):
+        trust = rollup_db.metric_turn_bands("trust", "crisis", actor="A")
+        assert trust[0]["count"] == 3
+        assert trust[0]["stdev"] == pytest.approx(0.0)
+
+        assert rollup_db.metric_turn_bands("trust", "crisis", actor="B") == []
+        assert rollup_db.metric_turn_bands("tension", "crisis", actor="")[0]["count"] == 3
+
+    def test_single_value_has_no_stdev(self, rollup_db):
+        session = rollup_db.get_session()
+        try:
+            rollup_db.update_metric_rollups(session, "other", "rollup-run-1", 1, [
+                ("tension", None, 0.3),
+            ])
+            session.commit()
+        finally:
+            session.close()
+
+        (band,) = rollup_db.metric_turn_bands("tension", "other")
+        assert band["stdev"] is None
+        assert band["lower"] == band["upper"] == band["mean"]
+
+    def test_run_summaries(self, rollup_db):
+        summaries = {
+            s["run_id"]: s for s in rollup_db.run_metric_summaries("tension", scenario="crisis")
+        }
+
+        assert summaries["rollup-run-1"]["final_turn"] == 3
+        assert summaries["rollup-run-1"]["final_value"] == pytest.approx(0.4)
+        assert summaries["rollup-run-1"]["max"] == pytest.approx(0.5)
+        assert summaries["rollup-run-2"]["final_value"] == pytest.approx(0.9)
+        assert summaries["rollup-run-3"]["min"] == pytest.approx(0.6)
+        assert summaries["rollup-run-1"]["actor"] is None
+
+    def test_out_of_order_turn_keeps_final_value(self, rollup_db):
+        session = rollup_db.get_session()
+        try:
+            rollup_db.update_metric_rollups(session, "crisis", "rollup-run-1", 1, [
+                ("tension", None, 0.0),
+            ])
+            session.commit()
+        finally:
+            session.close()
+
+        summaries = {s["run_id"]: s for s in rollup_db.run_metric_summaries("tension")}
+        assert summaries["rollup-run-1"]["final_value"] == pytest.approx(0.4)
+        assert summaries["rollup-run-1"]["min"] == pytest.approx(0.0)
+
+    def test_rebuild_matches_incremental(self, rollup_db):
+        before = rollup_db.metric_turn_bands("tension", "crisis")
+        runs_before = rollup_db.run_metric_summaries("tension")
+
+        assert rollup_db.rebuild_metric_rollups() == 16
+
+        assert rollup_db.metric_turn_bands("tension", "crisis") == pytest.approx(before)
+        assert rollup_db.run_metric_summaries("tension") == runs_before
+
+    def test_read_modify_write_fallback(self, test_db):
+        test_db.save_run(Run(
+            id="fallback-run",
+            scenario_id="fallback",
+            scenario_name="Fallback",
+            created=datetime.now(),
+            status="completed",
+            total_turns=1,
+            total_cost=0.0,
+        ))
+        with patch("scenario_lab.database.models._rollup_insert", return_value=None):
+            for value in (1.0, 3.0):
+                session = test_db.get_session()
+                try:
+                    test_db.update_metric_rollups(session, "fallback", "fallback-run", 1, [
+                        ("m", None, value),
+                    ])
+                    session.commit()
+                finally:
+                    session.close()
+
+        (band,) = test_db.metric_turn_bands("m", "fallback")
+        assert band["count"] == 2
+        assert band["mean"] == pytest.approx(2.0)
+        assert band["min"] == pytest.approx(1.0)
+        assert band["max"] == pytest.approx(3.0)
+        (summary,) = test_db.run_metric_summaries("m")
+        assert summary["final_value"] == pytest.approx(3.0)
@@ -3,11 +3,15 @@ Tests for JSON Response Parser module
 
 Tests JSON extraction, parsing, validation, and fallback behavior.
 """
+import json
+
 import pytest
 from pydantic import ValidationError
 
+from scenario_lab.utils import json_response_parser
 from scenario_lab.utils.json_response_parser import (
     ActorDecisionJSON,
+    decode_json,
     extract_json_from_response,
     parse_json_decision,
     json_to_markdown,
@@ -453,3 +457,51 @@ class TestEdgeCases:
         result = extract_json_from_response(content)
         assert result is not None
         assert '"goals"' in result
+
+
+class TestJsonLocator:
+    """The bracket- and string-aware scan finds the outermost value"""
+
+    def test_deeply_nested_object(self):
+        value = {"a": {"b": {"c": {"d": {"e": [1, {"f": 2}]}}}}}
+        content = "Decision: " + json.dumps(value) + " Done."
+
+        assert json.loads(extract_json_from_response(content)) == value
+
+    def test_brackets_inside_strings(self):
+        value = {"reasoning": 'Use } and { and "quotes" \\ freely', "action": "[not a list]"}
+        content = "Here: " + json.dumps(value)
+
+        assert json.loads(extract_json_from_response(content)) == value
+
+    def test_unclosed_brace_before_object(self):
+        content = 'The set {a, b is open. {"action": "Go"}'
+
+        assert extract_json_from_response(content) == '{"action": "Go"}'
+
+    def test_array_in_code_block(self):
+        content = 'See [1].\n```json\n[{"a": 1}, {"b": 2}]\n```'
+
+        assert json.loads(extract_json_from_response(content)) == [{"a": 1}, {"b": 2}]
+
+    def test_object_preferred_over_earlier_array_outside_code_block(self):
+        content = 'Per [1], {"action": "Go"}'
+
+        assert extract_json_from_response(content) == '{"action": "Go"}'
+
+    def test_large_non_json_response(self):
+        content = "{ [ " * 50000 + "no JSON here"
+
+        assert extract_json_from_response(content) is None
+
+    def test_decode_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(json_response_parser, "ORJSON_AVAILABLE", False)
+
+        assert decode_json('{"a": [1, 2]}') == {"a": [1, 2]}
+        with pytest.raises(json.JSONDecodeError):
+            decode_json("{bad")
+
+    def test_validation_reports_invalid_json(self):
+        data, error = parse_json_decision('{"goals": {}, "reasoning": oops}')
+
+        assert data is None and error.startswith("Invalid JSON")
@@ -0,0 +1,172 @@
+"""
+Tests for latency histograms and per-call timing
+"""
+import json
+import random
+import statistics
+
+import pytest
+
+from scenario_lab.benchmarks import generate_scenario
+from scenario_lab.runners import SyncRunner
+from scenario_lab.utils.api_client import make_llm_call, make_llm_call_async
+from scenario_lab.utils.latency_histogram import (
+    LatencyHistogram,
+    LatencyRecorder,
+    get_latency_recorder,
+    use_latency_recorder,
+)
+from scenario_lab.utils.llm_timing import CallTiming
+from scenario_lab.utils.logging_config import clear_context, set_context
+
+MESSAGES = [{"role": "user", "content": "Summarize"}]
+
+
+pytestmark = pytest.mark.usefixtures("fresh_llm_backend")
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram"""
+
+    def test_percentiles_within_precision(self):
+        rng = random.Random(0)
+        values = [rng.lognormvariate(-3, 1.5) for _ in range(5000)]
+        histogram = LatencyHistogram(significant_digits=2)
+        for value in values:
+            histogram.record(value)
+
+        ordered = sorted(values)
+        for q in (50, 90, 99):
+            exact = ordered[int(q / 100 * len(ordered)) - 1]
+            assert histogram.percentile(q) == pytest.approx(exact, rel=0.01)
+        assert histogram.count == 5000
+        assert histogram.mean == pytest.approx(statistics.mean(values))
+        assert histogram.percentile(100) == max(values)
+
+    def test_zero_and_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) == 0.0
+        assert histogram.to_dict()["min"] == 0.0
+
+        histogram.record(0.0)
+        histogram.record(-1.0)
+        histogram.record(2.0)
+        assert histogram.percentile(50) == 0.0
+        assert histogram.percentile(100) == 2.0
+
+    def test_merge(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.1)
+        second.record(0.3, count=3)
+
+        first.merge(second)
+
+        assert first.count == 4
+        assert first.max == 0.3
+        assert first.percentile(50) == pytest.approx(0.3, rel=0.01)
+        with pytest.raises(ValueError):
+            first.merge(LatencyHistogram(significant_digits=3))
+
+    def test_to_dict(self):
+        histogram = LatencyHistogram()
+        for value in (0.001, 0.002, 0.004):
+            histogram.record(value)
+
+        data = histogram.to_dict()
+
+        assert set(data) >= {"count", "min", "max", "mean", "p50", "p99", "p99.9", "buckets"}
+        assert sum(count for _, count in data["buckets"]) == 3
+        assert "buckets" not in histogram.to_dict(include_buckets=False)
+
+
+class TestLatencyRecorder:
+    """Tests for LatencyRecorder"""
+
+    def test_breakdowns(self):
+        recorder = LatencyRecorder()
+        recorder.record_call(CallTiming(wall=0.5, network=0.4, attempts=2, ttfb=0.3),
+                             "mock/a", phase="decision", actor="A")
+        recorder.record_call(CallTiming(wall=0.01), "mock/a", phase="decision", source="cache")
+
+        data = recorder.to_dict(include_buckets=False)
+
+        assert data["llm_wall"]["all"]["count"] == 2
+        assert data["llm_wall"]["by_actor"]["A"]["count"] == 1
+        assert data["llm_network"]["all"]["count"] == 1
+        assert data["llm_ttfb"]["by_model"]["mock/a"]["max"] == 0.3
+        assert data["llm_calls"]["by_phase"]["decision"] == {
+            "calls": 2, "retries": 1, "network": 1, "cache": 1, "replay": 0
+        }
+        assert recorder.histogram("llm_wall", "phase", "decision").count == 2
+        assert recorder.histogram("llm_wall", "phase", "other") is None
+
+    def test_binding(self):
+        recorder = LatencyRecorder()
+        assert get_latency_recorder() is None
+        with use_latency_recorder(recorder):
+            assert get_latency_recorder() is recorder
+        assert get_latency_recorder() is None
+
+
+class TestCallTiming:
+    """LLM calls report their timing"""
+
+    def test_response_carries_timing(self):
+        response = make_llm_call("mock/t?latency=0.02", MESSAGES, use_cache=False)
+
+        assert response.timing is not None
+        assert response.timing.attempts == 1
+        assert response.timing.retries == 0
+        assert response.timing.ttfb >= 0.02
+        assert response.timing.wall >= response.timing.network >= response.timing.ttfb
+
+    def test_retries_are_counted(self):
+        timings = [
+            make_llm_call(
+                "mock/t?rate_limit_rate=0.5&retry_after=0",
+                [{"role": "user", "content": f"Prompt {i}"}],
+                max_retries=20,
+                use_cache=False,
+            ).timing
+            for i in range(10)
+        ]
+
+        assert sum(timing.retries for timing in timings) > 0
+        assert all(timing.attempts == timing.retries + 1 for timing in timings)
+
+    @pytest.mark.asyncio
+    async def test_calls_recorded_with_labels(self):
+        recorder = LatencyRecorder()
+        set_context(phase="world_update")
+        try:
+            with use_latency_recorder(recorder):
+                await make_llm_call_async("mock/t", MESSAGES, context={"actor": "A"})
+                make_llm_call("mock/t", MESSAGES, context={"phase": "decision"})
+        finally:
+            clear_context()
+
+        assert recorder.histogram("llm_wall").count == 2
+        assert recorder.histogram("llm_wall", "actor", "A").count == 1
+        assert recorder.histogram("llm_wall", "phase", "world_update").count == 1
+        assert recorder.histogram("llm_wall", "phase", "decision").count == 1
+
+
+class TestRunnerExport:
+    """SyncRunner records phase, turn and call histograms per run"""
+
+    @pytest.mark.asyncio
+    async def test_run_exports_histograms(self, tmp_path):
+        path = generate_scenario(str(tmp_path / "s"), actors=3, turns=2, metrics=0).path
+        output = tmp_path / "out"
+        runner = SyncRunner(str(path), output_path=str(output))
+        runner.setup()
+
+        await runner.run()
+
+        assert runner.latency.histogram("turn").count == 2
+        assert runner.latency.histogram("phase", "phase", "decision").count == 2
+        assert runner.latency.histogram("llm_wall", "actor", "Actor 001").count == 2
+
+        exported = json.loads((output / "latency-histograms.json").read_text())
+        assert exported["llm_calls"]["all"]["calls"] == 2 * 4
+        assert exported["phase"]["by_phase"]["world_update"]["count"] == 2
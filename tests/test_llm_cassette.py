@@ -0,0 +1,190 @@
+"""
+Tests for LLM cassette record/replay
+"""
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from scenario_lab.utils.api_client import make_llm_call, make_llm_call_async
+from scenario_lab.utils.llm_cassette import (
+    CassetteMissError,
+    LLMCassette,
+    get_cassette,
+    request_key,
+    reset_cassette,
+    set_cassette,
+)
+from scenario_lab.utils.response_cache import reset_global_cache
+
+MESSAGES = [{"role": "user", "content": "What do you do?"}]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cassette():
+    reset_cassette()
+    yield
+    reset_cassette()
+
+
+def _mock_session(*contents):
+    """HTTP session whose posts return the given contents in order"""
+    responses = []
+    for content in contents:
+        response = Mock()
+        response.json.return_value = {
+            "choices": [{"message": {"content": content}}],
+            "usage": {"total_tokens": 30, "prompt_tokens": 20, "completion_tokens": 10},
+        }
+        responses.append(response)
+    session = Mock()
+    session.post.side_effect = responses
+    return session
+
+
+class TestRecord:
+    """Tests for record mode"""
+
+    @patch("scenario_lab.utils.api_client.get_http_session")
+    def test_records_every_call(self, mock_get_session, tmp_path):
+        mock_get_session.return_value = _mock_session("First", "Second")
+        path = tmp_path / "run.jsonl"
+        set_cassette(LLMCassette(str(path), mode="record"))
+
+        make_llm_call("openai/gpt-4o-mini", MESSAGES, api_key="key", use_cache=False,
+                      context={"actor": "A", "turn": 1})
+        make_llm_call("openai/gpt-4o-mini", MESSAGES, api_key="key", use_cache=False)
+        get_cassette().close()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["content"] for line in lines] == ["First", "Second"]
+        assert lines[0]["key"] == request_key("openai/gpt-4o-mini", MESSAGES)
+        assert lines[0]["input_tokens"] == 20
+        assert lines[0]["messages"] == MESSAGES
+        assert lines[0]["context"]["actor"] == "A"
+        assert lines[0]["latency"] >= 0
+
+    @patch("scenario_lab.utils.api_client.get_http_session")
+    def test_records_cache_hits(self, mock_get_session, tmp_path, monkeypatch):
+        monkeypatch.setenv("SCENARIO_CACHE_DIR", str(tmp_path / "cache"))
+        reset_global_cache()
+        mock_get_session.return_value = _mock_session("Only")
+        path = tmp_path / "run.jsonl"
+        set_cassette(LLMCassette(str(path), mode="record"))
+
+        try:
+            make_llm_call("openai/gpt-4o-mini", MESSAGES, api_key="key")
+            make_llm_call("openai/gpt-4o-mini", MESSAGES, api_key="key")
+        finally:
+            reset_global_cache()
+
+        assert get_cassette().recorded == 2
+
+    def test_gzip_round_trip(self, tmp_path):
+        path = tmp_path / "run.jsonl.gz"
+        cassette = LLMCassette(str(path), mode="record", store_requests=False)
+        cassette.record("m", MESSAGES, "Compressed", 3, 2, 1, latency=0.5)
+        cassette.close()
+
+        replay = LLMCassette(str(path), mode="replay")
+        entry = replay.replay("m", MESSAGES)
+        assert entry.content == "Compressed"
+        assert entry.messages is None
+
+
+class TestReplay:
+    """Tests for replay mode"""
+
+    @pytest.fixture
+    def cassette_path(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        cassette = LLMCassette(str(path), mode="record")
+        cassette.record("openai/gpt-4o-mini", MESSAGES, "First", 30, 20, 10, latency=0.2)
+        cassette.record("openai/gpt-4o-mini", MESSAGES, "Second", 30, 20, 10, latency=0.2)
+        cassette.close()
+        return path
+
+    @patch("scenario_lab.utils.api_client.get_http_session")
+    def test_replay_serves_in_order_without_network(self, mock_get_session, cassette_path,
+                                                    monkeypatch):
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        set_cassette(LLMCassette(str(cassette_path), mode="replay"))
+
+        contents = [
+            make_llm_call("openai/gpt-4o-mini", MESSAGES).content
+            for _ in range(3)
+        ]
+
+        assert contents == ["First", "Second", "Second"]
+        mock_get_session.assert_not_called()
+        assert get_cassette().get_stats()["replayed"] == 3
+
+    def test_strict_miss_raises(self, cassette_path):
+        set_cassette(LLMCassette(str(cassette_path), mode="replay"))
+
+        with pytest.raises(CassetteMissError):
+            make_llm_call("openai/gpt-4o-mini", [{"role": "user", "content": "New prompt"}])
+
+    @patch("scenario_lab.utils.api_client.get_http_session")
+    def test_non_strict_miss_falls_through(self, mock_get_session, cassette_path):
+        mock_get_session.return_value = _mock_session("Live")
+        set_cassette(LLMCassette(str(cassette_path), mode="replay", strict=False))
+
+        response = make_llm_call(
+            "openai/gpt-4o-mini", [{"role": "user", "content": "New prompt"}],
+            api_key="key", use_cache=False,
+        )
+
+        assert response.content == "Live"
+        assert get_cassette().misses == 1
+
+    def test_latency_scale(self, cassette_path):
+        cassette = LLMCassette(str(cassette_path), mode="replay", latency_scale=0.5)
+
+        start = time.monotonic()
+        cassette.replay("openai/gpt-4o-mini", MESSAGES)
+        assert time.monotonic() - start >= 0.09
+
+        instant = LLMCassette(str(cassette_path), mode="replay")
+        start = time.monotonic()
+        instant.replay("openai/gpt-4o-mini", MESSAGES)
+        assert time.monotonic() - start < 0.05
+
+    def test_truncated_line_skipped(self, cassette_path):
+        with open(cassette_path, "a") as f:
+            f.write('{"key": "abc", "model"')
+
+        cassette = LLMCassette(str(cassette_path), mode="replay")
+        assert cassette.get_stats()["unique_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_calls_replay(self, cassette_path):
+        set_cassette(LLMCassette(str(cassette_path), mode="replay"))
+
+        response = await make_llm_call_async("openai/gpt-4o-mini", MESSAGES)
+        assert response.content == "First"
+
+
+class TestConfiguration:
+    """Tests for cassette configuration"""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("SCENARIO_LLM_CASSETTE", raising=False)
+        assert get_cassette() is None
+
+    def test_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SCENARIO_LLM_CASSETTE", str(tmp_path / "env.jsonl"))
+        monkeypatch.setenv("SCENARIO_LLM_CASSETTE_MODE", "record")
+
+        cassette = get_cassette()
+        assert cassette.mode == "record"
+        assert get_cassette() is cassette
+
+    def test_invalid_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            LLMCassette(str(tmp_path / "x.jsonl"), mode="rewind")
+
+    def test_replay_requires_existing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            LLMCassette(str(tmp_path / "missing.jsonl"), mode="replay")
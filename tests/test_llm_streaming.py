@@ -0,0 +1,258 @@
+"""
+Tests for streamed LLM responses
+"""
+import asyncio
+import io
+import json
+
+import pytest
+import requests
+
+from scenario_lab.benchmarks import generate_scenario
+from scenario_lab.core.events import EventType
+from scenario_lab.runners import SyncRunner
+from scenario_lab.utils import api_client
+from scenario_lab.utils.api_client import make_llm_call, make_openrouter_call
+from scenario_lab.utils.llm_streaming import (
+    STOP_ACTION_COMPLETE,
+    STOP_MAX_CHARS,
+    IncrementalSectionParser,
+    LLMStream,
+    sse_lines,
+)
+from scenario_lab.utils.llm_timing import CallTiming
+from scenario_lab.utils.mock_llm import MockLLMServer
+from scenario_lab.utils.response_cache import reset_global_cache
+
+DECISION = (
+    "**LONG-TERM GOALS:**\n- Win\n\n"
+    "**REASONING:**\nIt is time.\n\n"
+    "**ACTION:** Open talks\nwith the neighbours.\n\n"
+    "**NOTES:**\n" + "padding " * 200
+)
+
+
+pytestmark = pytest.mark.usefixtures("fresh_llm_backend")
+
+
+def completion(content, usage=None):
+    return {
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}],
+        "usage": usage or {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
+    }
+
+
+def feed_in_chunks(stream, text, size=7):
+    for start in range(0, len(text), size):
+        if not stream.feed(text[start:start + size]):
+            break
+    stream.finish()
+
+
+class TestIncrementalSectionParser:
+    """Sections are recognized line by line as they arrive"""
+
+    def test_action_complete_at_next_section(self):
+        parser = IncrementalSectionParser()
+
+        parser.feed("**REASONING:**\nbecause\n**ACTION:** Go")
+        assert not parser.action_complete
+        parser.feed(" now\nand then\n\n**NOTES:**\n")
+
+        assert parser.action_complete
+        assert parser.final_text == "Go now\nand then"
+        assert parser.sections == ["REASONING", "ACTION", "NOTES"]
+
+    def test_action_complete_at_end(self):
+        parser = IncrementalSectionParser()
+        parser.feed("**ACTION:**\nGo now")
+
+        parser.finish()
+
+        assert parser.final_text == "Go now"
+
+    def test_horizontal_rule_ends_section(self):
+        parser = IncrementalSectionParser()
+
+        parser.feed("**ACTION:** Go\n---\n")
+
+        assert parser.final_text == "Go" and parser.current_section is None
+
+    def test_only_parser_section_ends_end_the_action(self):
+        parser = IncrementalSectionParser()
+
+        parser.feed("**ACTION:** Go\n## Phase 1\n**Step one**\n**FOLLOW-UP:** later\nmore\n")
+
+        # extract_section keeps headings, bold text and hyphenated headers
+        assert not parser.action_complete
+        parser.finish()
+        assert parser.final_text.endswith("**FOLLOW-UP:** later\nmore")
+
+
+class TestLLMStream:
+    """Reading SSE and NDJSON bodies and stop conditions"""
+
+    def test_sse_round_trip(self):
+        stream = LLMStream()
+
+        stream.consume(sse_lines(completion(DECISION), chunk_chars=5))
+
+        result = stream.result()
+        assert result["choices"][0]["message"]["content"] == DECISION
+        assert result["usage"]["total_tokens"] == 30
+        assert stream.first_token_delay is not None and stream.stop_reason is None
+
+    def test_ndjson(self):
+        lines = [
+            json.dumps({"message": {"content": "**ACTION:** "}, "done": False}),
+            json.dumps({"message": {"content": "Go"}, "done": False}),
+            json.dumps({"message": {"content": ""}, "done": True,
+                        "prompt_eval_count": 4, "eval_count": 2}),
+        ]
+        stream = LLMStream()
+
+        stream.consume(line.encode("utf-8") for line in lines)
+
+        assert stream.text == "**ACTION:** Go"
+        assert stream.result()["usage"] == {
+            "prompt_tokens": 4, "completion_tokens": 2, "total_tokens": 6,
+        }
+        assert stream.parser.final_text == "Go"
+
+    def test_stops_after_action(self):
+        stream = LLMStream(stop_after_action=True)
+
+        feed_in_chunks(stream, DECISION)
+
+        assert stream.stop_reason == STOP_ACTION_COMPLETE
+        assert len(stream.text) < len(DECISION)
+        assert stream.parser.final_text == "Open talks\nwith the neighbours."
+
+    def test_max_chars(self):
+        stream = LLMStream(max_chars=50)
+
+        feed_in_chunks(stream, DECISION)
+
+        assert stream.stop_reason == STOP_MAX_CHARS
+        assert 50 <= stream.chars < 57
+        assert stream.result(estimated_prompt_tokens=5)["choices"][0]["finish_reason"] == "length"
+
+    def test_progress_throttled(self):
+        calls = []
+        stream = LLMStream(on_progress=lambda s: calls.append(s.chars), progress_interval=3600)
+
+        feed_in_chunks(stream, DECISION)
+
+        # The first chunk and the end
+        assert calls == [7, len(DECISION)]
+
+    def test_provider_error(self):
+        stream = LLMStream()
+
+        with pytest.raises(ValueError, match="overloaded"):
+            stream.consume(['data: {"error": {"message": "overloaded"}}'])
+
+
+class FakeSession:
+    """Session returning one streamed response"""
+
+    def __init__(self, body):
+        self.body = body
+        self.payloads = []
+        self.response = None
+
+    def post(self, url, headers=None, json=None, timeout=None, stream=False):
+        self.payloads.append(json)
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(self.body)
+        response.url = url
+        self.response = response
+        return response
+
+
+class TestProviderStreaming:
+    """Providers are asked to stream and stopped early"""
+
+    def test_openrouter_stops_reading_after_action(self, monkeypatch):
+        body = "\n\n".join(sse_lines(completion(DECISION), chunk_chars=8)).encode("utf-8")
+        session = FakeSession(body)
+        monkeypatch.setattr(api_client, "get_http_session", lambda: session)
+        stream = LLMStream(stop_after_action=True)
+        timing = CallTiming()
+
+        result = make_openrouter_call(
+            "openai/gpt-4o-mini", [{"role": "user", "content": "hi"}], "key",
+            max_retries=0, timing=timing, stream=stream,
+        )
+
+        assert session.payloads[0]["stream"] is True
+        assert session.payloads[0]["stream_options"] == {"include_usage": True}
+        assert stream.stop_reason == STOP_ACTION_COMPLETE
+        assert session.response.raw.closed
+        content = result["choices"][0]["message"]["content"]
+        assert content.startswith(DECISION[:60]) and len(content) < len(DECISION)
+        assert timing.ttft >= timing.ttfb
+
+    def test_mock_server_streams_over_http(self, monkeypatch):
+        server = MockLLMServer().start()
+        try:
+            monkeypatch.setenv("OLLAMA_BASE_URL", server.url)
+            chunks = []
+            stream = LLMStream(on_progress=lambda s: chunks.append(s.chars), progress_interval=0)
+
+            response = make_llm_call(
+                "ollama/mock", [{"role": "user", "content": "hello"}],
+                use_cache=False, stream=stream,
+            )
+        finally:
+            server.stop()
+
+        assert response.content and response.content == stream.text
+        assert len(chunks) > 1 and response.output_tokens > 0
+        assert response.timing.ttft > 0
+
+    def test_cached_response_fed_whole(self, monkeypatch):
+        monkeypatch.setenv("SCENARIO_CACHE_ENABLED", "true")
+        reset_global_cache()
+        messages = [{"role": "user", "content": "**REASONING:** cache me"}]
+        first = make_llm_call("mock/a", messages)
+        stream = LLMStream()
+
+        second = make_llm_call("mock/a", messages, stream=stream)
+
+        assert second.cached and stream.text == first.content and stream.done
+
+
+class TestDecisionEvents:
+    """Streamed decisions emit progress events"""
+
+    def test_run_emits_progress_and_completion(self, tmp_path):
+        path = generate_scenario(str(tmp_path / "s"), actors=2, turns=1, metrics=0).path
+        runner = SyncRunner(str(path), output_path=str(tmp_path / "out"), stream=True)
+        runner.setup()
+        events = []
+
+        async def record(event):
+            events.append(event)
+
+        runner.event_bus.on("*", record)
+        asyncio.run(runner.run())
+
+        decision_events = [e for e in events if e.source == "decision_phase"]
+        kinds = [e.type for e in decision_events]
+        assert kinds.count(EventType.ACTOR_DECISION_STARTED) == 2
+        assert kinds.count(EventType.ACTOR_DECISION_COMPLETED) == 2
+        assert EventType.ACTOR_DECISION_PROGRESS in kinds
+
+        for actor in {e.data["actor"] for e in decision_events}:
+            actor_events = [e for e in decision_events if e.data["actor"] == actor]
+            assert actor_events[0].type == EventType.ACTOR_DECISION_STARTED
+            assert actor_events[-1].type == EventType.ACTOR_DECISION_COMPLETED
+            progress = [
+                e for e in actor_events if e.type == EventType.ACTOR_DECISION_PROGRESS
+            ]
+            assert progress[-1].data["action_complete"]
+            assert progress[-1].data["action"] == actor_events[-1].data["action"]
+            streamed = "".join(e.data["delta"] for e in progress)
+            assert len(streamed) == progress[-1].data["chars"]
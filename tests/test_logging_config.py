@@ -0,0 +1,135 @@
+"""
+Tests for the queue-based logging pipeline
+"""
+import io
+import json
+import logging
+import threading
+
+import pytest
+
+from scenario_lab.utils import logging_config
+from scenario_lab.utils.logging_config import (
+    JSONFormatter,
+    SamplingFilter,
+    clear_context,
+    set_context,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    shutdown_logging()
+    clear_context()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class RecordingFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(message)s")
+        self.threads = []
+
+    def format(self, record):
+        self.threads.append(threading.current_thread().name)
+        return super().format(record)
+
+
+class TestQueuePipeline:
+    """Records are formatted and written on the listener thread"""
+
+    def test_formatting_off_the_logging_thread(self):
+        stream = io.StringIO()
+        setup_logging(level="INFO", format_type="message", stream=stream)
+        formatter = RecordingFormatter()
+        handler = logging.getLogger().handlers[0]
+        # The queue handler feeds the listener, which owns the stream handler
+        logging_config._listener.handlers[0].setFormatter(formatter)
+
+        items = ["a"]
+        logging.getLogger("test").info("items: %s", items)
+        items.append("b")  # later changes don't reach the message
+        shutdown_logging()
+
+        assert type(handler).__name__ == "ContextQueueHandler"
+        assert stream.getvalue() == "items: ['a']\n"
+        assert formatter.threads and "MainThread" not in formatter.threads
+
+    def test_context_captured_on_logging_thread(self):
+        stream = io.StringIO()
+        setup_logging(level="INFO", format_type="json", stream=stream)
+        set_context(scenario="s1", turn=3, actor="A")
+
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            logging.getLogger("test").exception("failed")
+        shutdown_logging()
+
+        data = json.loads(stream.getvalue())
+        assert data["message"] == "failed"
+        assert (data["scenario"], data["turn"], data["actor"]) == ("s1", 3, "A")
+        assert "ValueError: bad" in data["exception"]
+        assert data["timestamp"].endswith("Z")
+
+    def test_records_after_shutdown_still_written(self):
+        stream = io.StringIO()
+        setup_logging(level="INFO", format_type="message", stream=stream)
+        shutdown_logging()
+
+        logging.getLogger("test").info("late")
+
+        assert stream.getvalue() == "late\n"
+
+    def test_synchronous_mode(self):
+        stream = io.StringIO()
+        setup_logging(level="INFO", format_type="message", stream=stream, use_queue=False)
+
+        logging.getLogger("test").info("now")
+
+        assert stream.getvalue() == "now\n"
+
+
+class TestSampling:
+    """Hot-path debug records are sampled per call site"""
+
+    def test_sampling_filter(self):
+        sampler = SamplingFilter(burst=2, every=5)
+        logger = logging.getLogger("test.sampling")
+
+        def record(level=logging.DEBUG):
+            return logger.makeRecord(logger.name, level, "hot.py", 10, "msg", (), None)
+
+        passed = [r for r in (record() for _ in range(22)) if sampler.filter(r)]
+
+        # 2 from the burst, then records 7, 12, 17, 22
+        assert len(passed) == 6
+        assert [getattr(r, "sampled", None) for r in passed] == [None, None, 5, 5, 5, 5]
+        assert sampler.filter(record(logging.INFO))
+
+    def test_debug_logs_sampled_in_pipeline(self):
+        stream = io.StringIO()
+        setup_logging(
+            level="DEBUG", format_type="message", stream=stream,
+            debug_burst=3, debug_sample_every=10,
+        )
+        logger = logging.getLogger("test")
+
+        for i in range(33):
+            logger.debug("lookup %d", i)
+        logger.info("done")
+        shutdown_logging()
+
+        assert stream.getvalue().splitlines() == [
+            "lookup 0", "lookup 1", "lookup 2", "lookup 12", "lookup 22", "lookup 32", "done",
+        ]
+
+    def test_json_marks_sampled_records(self):
+        record = logging.makeLogRecord({"msg": "hit", "levelno": logging.DEBUG, "sampled": 100})
+
+        assert json.loads(JSONFormatter().format(record))["sampled"] == 100
@@ -10,6 +10,11 @@ from unittest.mock import AsyncMock, patch
 
 from scenario_lab.schemas.metrics import MetricsConfig, MetricConfig, MetricExtraction
 from scenario_lab.core.metrics_tracker_v2 import MetricsTrackerV2
+from scenario_lab.core.metric_matcher import (
+    AHOCORASICK_AVAILABLE,
+    CompiledMetrics,
+    KeywordMatcher,
+)
 from scenario_lab.loaders.metrics_loader import load_metrics_config
 from scenario_lab.models.state import ScenarioState, WorldState, Decision, MetricRecord
 from scenario_lab.utils.api_client import LLMResponse
@@ -227,6 +232,221 @@ class TestMetricsTrackerV2:
         assert "summary_statistics" in summary
 
 
+@pytest.fixture
+def llm_metrics_config():
+    """MetricsConfig with several LLM metrics"""
+    return MetricsConfig(
+        metrics=[
+            MetricConfig(
+                name="tension",
+                description="Tension level",
+                type="continuous",
+                range=(0, 10),
+                extraction=MetricExtraction(type="llm", prompt="Rate tension 0-10"),
+            ),
+            MetricConfig(
+                name="stance",
+                description="Overall stance",
+                type="categorical",
+                categories=["hostile", "neutral", "friendly"],
+                extraction=MetricExtraction(type="llm", prompt="Classify the stance"),
+            ),
+            MetricConfig(
+                name="deal_made",
+                description="Whether a deal was made",
+                type="boolean",
+                extraction=MetricExtraction(type="llm", prompt="Was a deal made?"),
+            ),
+        ],
+    )
+
+
+def _llm_response(content):
+    return LLMResponse(content=content, tokens_used=10)
+
+
+class TestBatchedLLMExtraction:
+    """Test batched extraction of LLM metrics"""
+
+    @pytest.mark.asyncio
+    async def test_one_call_per_text(self, llm_metrics_config):
+        tracker = MetricsTrackerV2(llm_metrics_config, api_key="test-key")
+        mock_call = AsyncMock(return_value=_llm_response(
+            '{"tension": 7, "stance": "friendly", "deal_made": true}'
+        ))
+
+        with patch("scenario_lab.core.metrics_tracker_v2.make_llm_call_async", mock_call):
+            records = await tracker.extract_metrics_from_text(turn=2, text="Some text")
+
+        assert mock_call.call_count == 1
+        assert [r.name for r in records] == ["tension", "stance", "deal_made"]
+        assert [r.value for r in records] == [7.0, 2.0, 1.0]
+        assert all(r.turn == 2 for r in records)
+        assert records[0].metadata["extraction_type"] == "llm"
+        assert records[0].metadata["batch_size"] == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_metric_falls_back_to_single_call(self, llm_metrics_config):
+        tracker = MetricsTrackerV2(llm_metrics_config, api_key="test-key")
+        mock_call = AsyncMock(side_effect=[
+            _llm_response('```json\n{"tension": 4, "stance": "neutral"}\n```'),
+            _llm_response("false"),
+        ])
+
+        with patch("scenario_lab.core.metrics_tracker_v2.make_llm_call_async", mock_call):
+            records = await tracker.extract_metrics_from_text(turn=1, text="Some text")
+
+        assert mock_call.call_count == 2
+        assert {r.name: r.value for r in records} == {"tension": 4.0, "stance": 1.0, "deal_made": 0.0}
+        assert "batch_size" not in records[2].metadata
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_falls_back(self, llm_metrics_config):
+        tracker = MetricsTrackerV2(llm_metrics_config, api_key="test-key")
+        mock_call = AsyncMock(side_effect=[
+            _llm_response("I cannot answer in JSON"),
+            _llm_response("5"),
+            _llm_response("hostile"),
+            _llm_response("yes"),
+        ])
+
+        with patch("scenario_lab.core.metrics_tracker_v2.make_llm_call_async", mock_call):
+            records = await tracker.extract_metrics_from_text(turn=1, text="Some text")
+
+        assert mock_call.call_count == 4
+        assert {r.name: r.value for r in records} == {"tension": 5.0, "stance": 0.0, "deal_made": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_call_falls_back(self, llm_metrics_config):
+        tracker = MetricsTrackerV2(llm_metrics_config, api_key="test-key")
+        mock_call = AsyncMock(side_effect=[
+            RuntimeError("provider unavailable"),
+            _llm_response("5"),
+            RuntimeError("provider unavailable"),
+            _llm_response("yes"),
+        ])
+
+        with patch("scenario_lab.core.metrics_tracker_v2.make_llm_call_async", mock_call):
+            records = await tracker.extract_metrics_from_text(turn=1, text="Some text")
+
+        # Each metric now fails on its own
+        assert mock_call.call_count == 4
+        assert {r.name: r.value for r in records} == {"tension": 5.0, "deal_made": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_batching_disabled(self, llm_metrics_config):
+        llm_metrics_config.batch_llm_extraction = False
+        tracker = MetricsTrackerV2(llm_metrics_config, api_key="test-key")
+        mock_call = AsyncMock(return_value=_llm_response("1"))
+
+        with patch("scenario_lab.core.metrics_tracker_v2.make_llm_call_async", mock_call):
+            records = await tracker.extract_metrics_from_text(turn=1, text="Some text")
+
+        assert mock_call.call_count == 3
+        assert len(records) == 3
+
+    @pytest.mark.asyncio
+    async def test_groups_by_model(self, llm_metrics_config):
+        llm_metrics_config.metrics[2].extraction.model = "other/model"
+        tracker = MetricsTrackerV2(llm_metrics_config, api_key="test-key")
+
+        async def fake_call(model, messages, **kwargs):
+            if model == "other/model":
+                return _llm_response("true")
+            return _llm_response('{"tension": 3, "stance": "hostile"}')
+
+        mock_call = AsyncMock(side_effect=fake_call)
+        with patch("scenario_lab.core.metrics_tracker_v2.make_llm_call_async", mock_call):
+            records = await tracker.extract_metrics_from_text(turn=1, text="Some text")
+
+        assert mock_call.call_count == 2
+        assert {r.name: r.value for r in records} == {"tension": 3.0, "stance": 0.0, "deal_made": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_decisions_keep_actor_order(self, llm_metrics_config, sample_state):
+        for metric in llm_metrics_config.metrics:
+            metric.actor_specific = True
+        tracker = MetricsTrackerV2(llm_metrics_config, api_key="test-key")
+        state = sample_state.with_decision("actor-b", Decision(
+            actor="Actor B",
+            turn=1,
+            goals=[],
+            reasoning="Reasoning B",
+            action="Action B",
+            timestamp=datetime.now(),
+        ))
+        mock_call = AsyncMock(return_value=_llm_response(
+            '{"tension": 1, "stance": "neutral", "deal_made": false}'
+        ))
+
+        with patch("scenario_lab.core.metrics_tracker_v2.make_llm_call_async", mock_call):
+            records = await tracker.extract_metrics_from_decisions(state)
+
+        # One call per text: two actors x (reasoning, action)
+        assert mock_call.call_count == 4
+        actors = [r.metadata["actor"] for r in records]
+        assert actors == ["actor-a"] * 6 + ["actor-b"] * 6
+
+
+class TestCompiledMatcher:
+    """Test the precompiled keyword/pattern engine"""
+
+    TEXT = (
+        "Deal signed after the deal talks. Collaboration and collaborate; "
+        "aaaa banana DEAL. collaborationcollaboration"
+    )
+    KEYWORDS = ["deal", "deal signed", "collaboration", "collaborate", "aa", "ana", "Deal"]
+
+    @pytest.mark.parametrize("use_automaton", [False, True])
+    def test_counts_match_str_count(self, use_automaton):
+        if use_automaton and not AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+        matcher = KeywordMatcher(self.KEYWORDS, use_automaton=use_automaton)
+        text_lower = self.TEXT.lower()
+
+        counts = matcher.count(text_lower)
+
+        expected = {k.lower(): text_lower.count(k.lower()) for k in self.KEYWORDS}
+        assert counts == {k: v for k, v in expected.items() if v}
+
+    def test_empty_keyword_list(self):
+        assert KeywordMatcher([]).count("anything") == {}
+
+    def test_invalid_pattern_reported_at_compile_time(self):
+        config = MetricsConfig(metrics=[
+            MetricConfig(
+                name="broken",
+                description="Broken pattern",
+                type="continuous",
+                range=(0, 10),
+                extraction=MetricExtraction(type="pattern", pattern="value: ((\\d+)"),
+            ),
+        ])
+        compiled = CompiledMetrics(config.metrics)
+
+        assert "broken" in compiled.invalid_patterns
+        assert "broken" not in compiled.patterns
+
+    @pytest.mark.asyncio
+    async def test_text_scanned_once_for_all_keyword_metrics(self, metrics_tracker):
+        text = "agreement reached; collaboration and collaborate"
+        original = metrics_tracker.compiled.keyword_matcher.count
+        calls = []
+
+        def counting(text_lower):
+            calls.append(text_lower)
+            return original(text_lower)
+
+        with patch.object(metrics_tracker.compiled.keyword_matcher, "count", side_effect=counting):
+            records = await metrics_tracker.extract_metrics_from_text(turn=1, text=text)
+
+        assert len(calls) == 1
+        values = {r.name: r.value for r in records}
+        assert values == {"agreement_reached": 1.0, "collaboration_count": 2.0}
+        collab = next(r for r in records if r.name == "collaboration_count")
+        assert collab.metadata["matches"] == ["collaboration", "collaborate"]
+
+
 class TestMetricsLoader:
     """Test metrics loader functionality"""
 
@@ -0,0 +1,294 @@
+"""
+Tests for the mock LLM backend
+"""
+import random
+import statistics
+
+import pytest
+import requests
+
+from scenario_lab.core.metrics_tracker_v2 import MetricsTrackerV2
+from scenario_lab.core.prompt_builder import (
+    build_bilateral_response_prompt,
+    build_communication_decision_prompt,
+    build_decision_prompt,
+    build_messages_for_llm,
+)
+from scenario_lab.core.qa_validator import QAValidator
+from scenario_lab.core.world_synthesizer import WorldSynthesizer
+from scenario_lab.schemas.metrics import MetricConfig, MetricExtraction, MetricsConfig
+from scenario_lab.utils.api_client import make_llm_call, make_llm_call_async
+from scenario_lab.utils.llm_timing import get_llm_timing_stats
+from scenario_lab.utils.mock_llm import (
+    MockLLMBackend,
+    MockLLMConfig,
+    MockLLMServer,
+    MockResponseGenerator,
+    get_mock_backend,
+    mock_all_models,
+    set_mock_all_models,
+)
+from scenario_lab.utils.model_pricing import calculate_cost
+from scenario_lab.utils.response_parser import parse_communication_decision, parse_decision
+
+pytestmark = pytest.mark.usefixtures("fresh_llm_backend")
+
+
+def _generate(system_prompt, user_prompt, tokens=150):
+    messages = build_messages_for_llm(system_prompt, user_prompt)
+    return MockResponseGenerator(seed=1, tokens=tokens).generate(messages)
+
+
+class TestResponseFormats:
+    """Generated responses parse with the pipeline's own parsers"""
+
+    def test_markdown_decision(self):
+        content = _generate(*build_decision_prompt("The world", 1, 3, actor_name="A"))
+        parsed = parse_decision(content)
+
+        assert parsed["goals"]
+        assert parsed["reasoning"]
+        assert parsed["action"]
+
+    def test_json_decision(self):
+        content = _generate(*build_decision_prompt("The world", 1, 3, json_mode=True))
+        parsed = parse_decision(content, json_mode=True)
+
+        assert parsed["reasoning"]
+        assert parsed["action"]
+
+    def test_world_update(self):
+        synthesizer = WorldSynthesizer(model="mock/world")
+        user_prompt = synthesizer.build_user_prompt(
+            "Current state", 1, 3, {"A": {"action": "Act", "reasoning": "Because"}}
+        )
+        parsed = synthesizer.parse_world_update_response(
+            _generate(synthesizer.build_system_prompt(), user_prompt)
+        )
+
+        assert parsed["updated_state"]
+        assert "**KEY CHANGES:**" not in parsed["updated_state"]
+        assert len(parsed["key_changes"]) == 3
+        assert len(parsed["consequences"]) == 2
+
+    def test_communication_decision(self):
+        content = _generate(*build_communication_decision_prompt("World", 1, 3, ["B"]))
+        parsed = parse_communication_decision(content)
+
+        assert parsed["initiate_bilateral"] is False
+
+    def test_bilateral_response(self):
+        content = _generate(*build_bilateral_response_prompt("World", 1, 3, "B", "Deal?"))
+        assert "**RESPONSE:**" in content
+        assert "**INTERNAL_NOTES:**" in content
+
+    def test_validation(self):
+        validator = QAValidator()
+        prompt = validator._build_validation_prompt("world_state_coherence", {})
+        result = validator._parse_validation_result(
+            "world_state_coherence", _generate("", prompt), tokens_used=10
+        )
+
+        assert result.passed is True
+
+    @pytest.mark.asyncio
+    async def test_batched_metrics_end_to_end(self):
+        config = MetricsConfig(metrics=[
+            MetricConfig(name="tension", description="Tension", type="continuous",
+                         range=(0, 10),
+                         extraction=MetricExtraction(type="llm", prompt="Rate tension",
+                                                     model="mock/metrics")),
+            MetricConfig(name="stance", description="Stance", type="categorical",
+                         categories=["hostile", "neutral", "friendly"],
+                         extraction=MetricExtraction(type="llm", prompt="Classify",
+                                                     model="mock/metrics")),
+            MetricConfig(name="deal", description="Deal", type="boolean",
+                         extraction=MetricExtraction(type="llm", prompt="Deal made?",
+                                                     model="mock/metrics")),
+        ])
+        tracker = MetricsTrackerV2(config)
+
+        records = await tracker.extract_metrics_from_text(turn=1, text="Some text")
+
+        assert [r.name for r in records] == ["tension", "stance", "deal"]
+        assert all(r.metadata.get("batch_size") == 3 for r in records)
+        assert get_mock_backend().get_stats()["requests"] == 1
+
+    @pytest.mark.parametrize("tokens", [200, 800])
+    def test_token_target(self, tokens):
+        decision = _generate(*build_decision_prompt("World", 1, 3), tokens=tokens)
+        synthesizer = WorldSynthesizer()
+        world = _generate(
+            synthesizer.build_system_prompt(),
+            synthesizer.build_user_prompt("World", 1, 3, {}),
+            tokens=tokens,
+        )
+
+        for content in (decision, world):
+            assert len(content) / 4 == pytest.approx(tokens, rel=0.3)
+
+
+class TestDeterminism:
+    """Same seed and request give the same response"""
+
+    def test_same_request_same_content(self):
+        messages = [{"role": "user", "content": "Summarize"}]
+        first = MockResponseGenerator(seed=3).generate(messages)
+
+        assert MockResponseGenerator(seed=3).generate(messages) == first
+        assert MockResponseGenerator(seed=4).generate(messages) != first
+
+    def test_make_llm_call_routes_to_mock(self, monkeypatch):
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        messages = [{"role": "user", "content": "Summarize"}]
+
+        response = make_llm_call("mock/test", messages, use_cache=False)
+
+        assert response.content == MockResponseGenerator().generate(messages)
+        assert response.input_tokens > 0
+        assert response.tokens_used == response.input_tokens + response.output_tokens
+        assert calculate_cost("mock/test", 1000, 1000) == 0.0
+
+    def test_prompt_cache_simulated(self):
+        stable = build_messages_for_llm("System", "Instructions\nTurn 1", "Instructions\n")
+        later = build_messages_for_llm("System", "Instructions\nTurn 2", "Instructions\n")
+
+        first = make_llm_call("mock/test", stable, use_cache=False)
+        second = make_llm_call("mock/test", later, use_cache=False)
+
+        assert first.cached_input_tokens == 0
+        assert 0 < second.cached_input_tokens < second.input_tokens
+        assert get_mock_backend().get_stats()["prompt_cache_hits"] == 1
+
+    def test_mock_all_models(self, monkeypatch):
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        messages = [{"role": "user", "content": "Summarize"}]
+        assert not mock_all_models()
+
+        monkeypatch.setenv("SCENARIO_MOCK_ALL_MODELS", "true")
+        assert mock_all_models()
+        set_mock_all_models(False)
+        assert not mock_all_models()
+        set_mock_all_models(True)
+
+        response = make_llm_call("openai/gpt-4o-mini", messages, use_cache=False)
+
+        assert response.content == MockResponseGenerator().generate(messages)
+        assert response.model == "openai/gpt-4o-mini"
+
+    def test_call_timing_is_recorded(self):
+        messages = [{"role": "user", "content": "Summarize"}]
+
+        make_llm_call("mock/test?latency=0.02", messages, use_cache=False)
+
+        stats = get_llm_timing_stats().snapshot()
+        assert stats["calls"]["network"] == 1
+        assert stats["attempts"] == 1
+        assert stats["retries"] == 0
+        assert stats["network"] >= 0.02
+        assert stats["wall"] >= stats["network"] + stats["queue_wait"]
+
+
+class TestLatencyAndFailures:
+    """Configurable latency and injected failures"""
+
+    @pytest.mark.parametrize(
+        "distribution", ["fixed", "uniform", "normal", "lognormal", "exponential"]
+    )
+    def test_distribution_mean(self, distribution):
+        config = MockLLMConfig(latency=0.2, distribution=distribution, stddev=0.05)
+        rng = random.Random(0)
+        samples = [config.sample_latency(rng) for _ in range(2000)]
+
+        assert statistics.mean(samples) == pytest.approx(0.2, rel=0.1)
+        assert min(samples) >= 0
+
+    def test_model_params_override_defaults(self):
+        backend = MockLLMBackend(MockLLMConfig(tokens=100))
+        config = backend.config_for("mock/x?latency=0.5&distribution=lognormal&seed=9")
+
+        assert config.latency == 0.5
+        assert config.distribution == "lognormal"
+        assert config.seed == 9
+        assert config.tokens == 100
+
+    def test_invalid_params(self):
+        with pytest.raises(ValueError):
+            MockLLMConfig().with_params("latencyy=1")
+        with pytest.raises(ValueError):
+            MockLLMConfig().with_params("distribution=pareto")
+
+    def test_injected_rate_limits_are_retried(self, monkeypatch):
+        monkeypatch.setattr("scenario_lab.utils.api_client.time.sleep", lambda s: None)
+        model = "mock/flaky?rate_limit_rate=0.5&retry_after=0.01"
+
+        for i in range(10):
+            response = make_llm_call(
+                model, [{"role": "user", "content": f"Question {i}"}], max_retries=10,
+                use_cache=False,
+            )
+            assert response.content
+
+        stats = get_mock_backend().get_stats()
+        assert stats["injected_rate_limits"] > 0
+        assert stats["requests"] == 10 + stats["injected_rate_limits"]
+
+    def test_persistent_errors_surface(self, monkeypatch):
+        monkeypatch.setattr("scenario_lab.utils.api_client.time.sleep", lambda s: None)
+
+        with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+            make_llm_call("mock/down?error_rate=1", [{"role": "user", "content": "Hi"}],
+                          max_retries=2, use_cache=False)
+
+        assert exc_info.value.response.status_code in (500, 502, 503)
+        assert get_mock_backend().get_stats()["injected_errors"] == 3
+
+    @pytest.mark.asyncio
+    async def test_latency_overlaps_across_threads(self):
+        import asyncio
+        import time
+
+        model = "mock/slow?latency=0.2"
+        start = time.monotonic()
+        await asyncio.gather(*[
+            make_llm_call_async(model, [{"role": "user", "content": f"Q{i}"}], use_cache=False)
+            for i in range(4)
+        ])
+        elapsed = time.monotonic() - start
+
+        assert 0.2 <= elapsed < 0.6
+
+
+class TestMockServer:
+    """Tests for the HTTP stand-in server"""
+
+    @pytest.fixture
+    def server(self):
+        server = MockLLMServer(backend=MockLLMBackend(MockLLMConfig(seed=5))).start()
+        yield server
+        server.stop()
+
+    def test_serves_chat_completions(self, server, monkeypatch):
+        monkeypatch.setenv("OLLAMA_BASE_URL", server.url)
+        messages = [{"role": "user", "content": "Summarize"}]
+
+        response = make_llm_call("ollama/anything", messages, use_cache=False)
+
+        assert response.content == MockResponseGenerator(seed=5).generate(messages)
+        assert server.backend.get_stats()["requests"] == 1
+
+    def test_rate_limit_over_http(self, server):
+        body = {
+            "model": "x?rate_limit_rate=1&retry_after=2",
+            "messages": [{"role": "user", "content": "Hi"}],
+        }
+        response = requests.post(f"{server.url}/v1/chat/completions", json=body, timeout=5)
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+
+    def test_health_and_bad_requests(self, server):
+        assert requests.get(f"{server.url}/health", timeout=5).json()["status"] == "ok"
+        bad = requests.post(f"{server.url}/v1/chat/completions", data=b"{}", timeout=5)
+        assert bad.status_code == 400
+        assert requests.post(f"{server.url}/v1/other", json={}, timeout=5).status_code == 404
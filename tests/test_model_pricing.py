@@ -65,6 +65,20 @@ class TestCalculateCost:
         expected = 0.15 + 0.60  # Default pricing
         assert abs(cost - expected) < 0.01
 
+    def test_calculate_cost_cached_input_discounted(self):
+        """Test that prompt-cache reads are billed at the cache read price"""
+        # Claude Sonnet 4: $3 input, cache reads at 10%
+        cost = calculate_cost("anthropic/claude-sonnet-4", 10_000, 0, cached_input_tokens=8_000)
+
+        expected = (2_000 / 1_000_000) * 3.00 + (8_000 / 1_000_000) * 0.30
+        assert abs(cost - expected) < 0.0000001
+        assert cost < calculate_cost("anthropic/claude-sonnet-4", 10_000, 0)
+
+    def test_calculate_cost_cached_input_capped(self):
+        """Test that cached tokens beyond the input tokens are ignored"""
+        capped = calculate_cost("openai/gpt-4o", 1_000, 0, cached_input_tokens=5_000)
+        assert capped == calculate_cost("openai/gpt-4o", 1_000, 0, cached_input_tokens=1_000)
+
 
 class TestGetModelPricing:
     """Tests for get_model_pricing function"""
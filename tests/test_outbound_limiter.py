@@ -0,0 +1,206 @@
+"""
+Tests for the shared outbound LLM limiter
+"""
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from scenario_lab.utils.api_client import api_call_with_retry, make_llm_call
+from scenario_lab.utils.outbound_limiter import (
+    AdaptiveLimiter,
+    LimiterConfig,
+    OutboundLimiter,
+    estimate_tokens,
+    get_outbound_limiter,
+    reset_outbound_limiter,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter():
+    reset_outbound_limiter()
+    yield
+    reset_outbound_limiter()
+
+
+def _http_error(status_code, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = ""
+    return requests.exceptions.HTTPError(response=response)
+
+
+class TestAdaptiveLimiter:
+    """Tests for AIMD concurrency control"""
+
+    def test_concurrency_bounded_by_limit(self):
+        limiter = AdaptiveLimiter("test", LimiterConfig(initial_concurrency=2))
+        limiter.acquire()
+        limiter.acquire()
+
+        acquired = threading.Event()
+
+        def third():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=third)
+        thread.start()
+        assert not acquired.wait(0.1)
+
+        limiter.release(latency=0.01)
+        assert acquired.wait(1.0)
+        thread.join()
+
+    def test_success_increases_limit_additively(self):
+        limiter = AdaptiveLimiter("test", LimiterConfig(initial_concurrency=2, max_concurrency=3))
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(latency=0.1)
+
+        assert limiter.limit == 3
+
+    def test_rate_limit_halves_limit_and_starts_cooldown(self):
+        limiter = AdaptiveLimiter("test", LimiterConfig(initial_concurrency=8))
+        limiter.acquire()
+        limiter.release(rate_limited=True, retry_after=5)
+
+        assert limiter.limit == 4
+        assert 4 < limiter.cooldown_remaining() <= 5
+
+    def test_burst_of_429s_decreases_once(self):
+        limiter = AdaptiveLimiter("test", LimiterConfig(initial_concurrency=8))
+        for _ in range(3):
+            limiter.acquire()
+        for _ in range(3):
+            limiter.release(rate_limited=True, retry_after=1)
+
+        assert limiter.limit == 4
+        assert limiter.rate_limited_total == 3
+
+    def test_cooldown_delays_acquire(self):
+        limiter = AdaptiveLimiter("test", LimiterConfig())
+        limiter.acquire()
+        limiter.release(rate_limited=True, retry_after=0.1)
+
+        waited = limiter.acquire()
+        assert waited >= 0.05
+
+    def test_latency_increase_lowers_limit(self):
+        limiter = AdaptiveLimiter("test", LimiterConfig(initial_concurrency=8, latency_tolerance=2.0))
+        limiter.acquire()
+        limiter.release(latency=0.1)
+        before = limiter.limit
+
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(latency=2.0)
+
+        assert limiter.limit < before
+
+    def test_token_budget_blocks_until_refilled(self):
+        limiter = AdaptiveLimiter("test", LimiterConfig(tokens_per_minute=6000))
+        limiter.acquire(estimated_tokens=6000)
+        limiter.release(latency=0.1)
+
+        start = time.monotonic()
+        limiter.acquire(estimated_tokens=10)  # 100 tokens/s refill
+        assert time.monotonic() - start >= 0.05
+
+    def test_record_tokens_charges_actual_usage(self):
+        limiter = AdaptiveLimiter("test", LimiterConfig(tokens_per_minute=1000))
+        limiter.acquire(estimated_tokens=100)
+        limiter.record_tokens(400)
+        limiter.release(latency=0.1)
+
+        assert limiter._tokens <= 500
+
+
+class TestOutboundLimiter:
+    """Tests for the provider/model registry"""
+
+    def test_shared_per_provider_and_model(self):
+        registry = OutboundLimiter(LimiterConfig())
+        a = registry.for_model("openrouter", "openai/gpt-4o-mini")
+
+        assert registry.for_model("openrouter", "openai/gpt-4o-mini") is a
+        assert registry.for_model("openrouter", "anthropic/claude-3-haiku") is not a
+        assert registry.for_model("ollama", "openai/gpt-4o-mini") is not a
+
+    def test_free_models_start_conservative(self):
+        registry = OutboundLimiter(LimiterConfig(initial_concurrency=4))
+        limiter = registry.for_model("openrouter", "meta-llama/llama-3-8b:free")
+
+        assert limiter.limit == 1
+        assert limiter.config.max_concurrency == 2
+
+    def test_configure_overrides(self):
+        registry = OutboundLimiter(LimiterConfig())
+        registry.configure("openai/gpt-4o", tokens_per_minute=50_000)
+
+        assert registry.for_model("openrouter", "openai/gpt-4o").config.tokens_per_minute == 50_000
+
+    def test_config_from_env(self, monkeypatch):
+        monkeypatch.setenv("SCENARIO_LLM_MAX_CONCURRENCY", "6")
+        monkeypatch.setenv("SCENARIO_LLM_TOKENS_PER_MINUTE", "90000")
+        config = LimiterConfig.from_env()
+
+        assert config.max_concurrency == 6
+        assert config.initial_concurrency == 4
+        assert config.tokens_per_minute == 90000
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens([{"role": "user", "content": "x" * 400}]) == 100
+
+
+class TestLimiterIntegration:
+    """Tests for the limiter hooks in api_client"""
+
+    def test_429_feeds_shared_limiter(self):
+        limiter = AdaptiveLimiter("test", LimiterConfig(initial_concurrency=4))
+        api_func = Mock(side_effect=[_http_error(429, {"Retry-After": "0.05"}), "ok"])
+
+        with patch("scenario_lab.utils.api_client.time.sleep") as mock_sleep:
+            result = api_call_with_retry(api_func, max_retries=2, limiter=limiter)
+
+        assert result == "ok"
+        assert limiter.rate_limited_total == 1
+        assert 2 <= limiter.limit < 4  # halved, then one additive step
+        assert limiter.in_flight == 0
+        # The wait happens on the shared cooldown, not a per-call sleep
+        mock_sleep.assert_not_called()
+
+    def test_slot_released_on_final_failure(self):
+        limiter = AdaptiveLimiter("test", LimiterConfig())
+        api_func = Mock(side_effect=_http_error(400))
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            api_call_with_retry(api_func, max_retries=2, limiter=limiter)
+
+        assert limiter.in_flight == 0
+
+    @patch("scenario_lab.utils.api_client.get_http_session")
+    def test_make_llm_call_uses_model_limiter(self, mock_get_session):
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "Hi"}}],
+            "usage": {"total_tokens": 10},
+        }
+        mock_get_session.return_value.post.return_value = mock_response
+
+        with patch("scenario_lab.utils.api_client.time.sleep") as mock_sleep:
+            response = make_llm_call(
+                "vendor/model:free",
+                [{"role": "user", "content": "Hello"}],
+                api_key="key",
+                use_cache=False,
+            )
+
+        assert response.content == "Hi"
+        mock_sleep.assert_not_called()  # no fixed delay for free models
+        status = get_outbound_limiter().get_status()
+        assert status["openrouter:vendor/model:free"]["in_flight"] == 0
@@ -0,0 +1,137 @@
+"""
+Tests for the per-phase sampling profiler
+"""
+import asyncio
+import json
+import time
+
+import pytest
+
+from scenario_lab.benchmarks import generate_scenario
+from scenario_lab.benchmarks.scenario import ScenarioBenchmark
+from scenario_lab.core.orchestrator import ScenarioOrchestrator
+from scenario_lab.models.state import PhaseType, ScenarioState
+from scenario_lab.runners import SyncRunner
+from scenario_lab.utils.profiler import PhaseProfiler
+
+pytestmark = pytest.mark.usefixtures("fresh_llm_backend")
+
+
+def busy_work(seconds):
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+class TestPhaseProfiler:
+    """Tests for sampling and output formats"""
+
+    def test_samples_attributed_to_phase(self):
+        profiler = PhaseProfiler(interval=0.001)
+
+        profiler.start_phase("decision")
+        busy_work(0.1)
+        profiler.stop_phase()
+        profiler.start_phase("world_update")
+        profiler.stop_phase()
+
+        assert not profiler.active
+        assert profiler.calls == {"decision": 1, "world_update": 1}
+        assert profiler.wall_time["decision"] >= 0.1
+        stacks = profiler.stacks["decision"]
+        assert sum(stacks.values()) > 10
+        hot = [stack for stack in stacks if "busy_work (tests/test_profiler.py:" in stack]
+        assert hot and all(stack.startswith("MainThread;") for stack in hot)
+        assert not any("_sample_loop" in stack for stack in stacks)
+
+    def test_collapsed_and_summary(self):
+        profiler = PhaseProfiler(interval=0.001)
+        profiler.start_phase("decision")
+        busy_work(0.05)
+        profiler.stop_phase()
+
+        per_phase = profiler.collapsed("decision").splitlines()
+        merged = profiler.collapsed().splitlines()
+
+        assert per_phase and all(line.rsplit(" ", 1)[1].isdigit() for line in per_phase)
+        assert all(line.startswith("phase:decision;") for line in merged)
+        assert any(line.startswith("phase:decision;MainThread;") for line in merged)
+        summary = profiler.summary()["phases"]["decision"]
+        assert summary["calls"] == 1
+        assert summary["samples"] == sum(profiler.stacks["decision"].values())
+        assert summary["top_functions"][0]["percent"] > 0
+
+    def test_merge_and_save(self, tmp_path):
+        first, second = PhaseProfiler(interval=0.001), PhaseProfiler(interval=0.001)
+        for profiler in (first, second):
+            profiler.start_phase("decision")
+            busy_work(0.02)
+            profiler.stop_phase()
+        samples = sum(first.stacks["decision"].values()) + sum(second.stacks["decision"].values())
+
+        first.merge(second)
+        profile_dir = first.save(str(tmp_path))
+
+        assert first.calls["decision"] == 2
+        assert sum(first.stacks["decision"].values()) == samples
+        assert profile_dir == tmp_path / "profile"
+        assert (profile_dir / "decision.collapsed").read_text()
+        assert (profile_dir / "profile.collapsed").read_text().startswith("phase:decision;")
+        assert "decision" in json.loads((profile_dir / "summary.json").read_text())["phases"]
+
+    def test_orchestrator_stops_profiler_on_failure(self):
+        class FailingPhase:
+            async def execute(self, state):
+                raise RuntimeError("boom")
+
+        profiler = PhaseProfiler()
+        orchestrator = ScenarioOrchestrator(profiler=profiler)
+        orchestrator.register_phase(PhaseType.DECISION, FailingPhase())
+        state = ScenarioState(scenario_id="s", scenario_name="S", run_id="r")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(orchestrator._execute_phase(PhaseType.DECISION, state))
+
+        assert not profiler.active
+        assert profiler.calls == {"decision": 1}
+
+
+class TestProfiledRuns:
+    """Runs and benchmarks write their profiles"""
+
+    def test_run_writes_profiles(self, tmp_path):
+        path = generate_scenario(str(tmp_path / "s"), actors=2, turns=2, metrics=0).path
+        output = tmp_path / "out"
+        runner = SyncRunner(str(path), output_path=str(output), profile=True)
+        runner.setup()
+
+        asyncio.run(runner.run())
+
+        assert runner.orchestrator.profiler is runner.profiler
+        assert runner.profiler.calls["decision"] == 2
+        summary = json.loads((output / "profile" / "summary.json").read_text())
+        assert set(summary["phases"]) == set(runner.profiler.calls)
+        assert (output / "profile" / "profile.collapsed").exists()
+
+    def test_no_profiler_by_default(self, tmp_path):
+        path = generate_scenario(str(tmp_path / "s"), actors=1, turns=1, metrics=0).path
+        output = tmp_path / "out"
+        runner = SyncRunner(str(path), output_path=str(output))
+        runner.setup()
+
+        asyncio.run(runner.run())
+
+        assert runner.orchestrator.profiler is None
+        assert not (output / "profile").exists()
+
+    def test_benchmark_profiles_measured_runs(self, tmp_path):
+        path = generate_scenario(str(tmp_path / "s"), actors=1, turns=1, metrics=0).path
+        bench = ScenarioBenchmark(
+            str(path), turns=1, repetitions=2, warmup=1, backend="mock", profile=True
+        )
+
+        bench.run()
+
+        assert bench.profiler.calls["decision"] == 2
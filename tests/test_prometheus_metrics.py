@@ -0,0 +1,181 @@
+"""
+Tests for Prometheus metrics and the API /metrics endpoint
+"""
+import asyncio
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from scenario_lab.api.metrics import (
+    instrument_database,
+    render_metrics,
+    reset_api_metrics,
+    track_runner,
+)
+from scenario_lab.api.rate_limit import reset_rate_limiter
+from scenario_lab.api.settings import reset_settings
+from scenario_lab.core.events import EventBus, EventType
+from scenario_lab.database import Database
+from scenario_lab.utils.api_client import make_llm_call
+from scenario_lab.utils.prometheus_metrics import (
+    CONTENT_TYPE,
+    MetricsRegistry,
+    get_metrics_registry,
+    reset_metrics_registry,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics(fresh_llm_backend):
+    reset_metrics_registry()
+    reset_api_metrics()
+    yield
+    reset_metrics_registry()
+    reset_api_metrics()
+
+
+class FakeExecutor:
+    active_count = 2
+    queued_count = 5
+
+
+class FakeRunner:
+    def __init__(self):
+        self.event_bus = EventBus()
+
+
+class TestRegistry:
+    """Tests for the metric types and text rendering"""
+
+    def test_counter_and_gauge(self):
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls", ("model",))
+        calls.inc(model="a")
+        calls.inc(2, model='b"x')
+        registry.gauge("depth", "Depth").set(3)
+
+        text = registry.render()
+
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{model="a"} 1' in text
+        assert 'calls_total{model="b\\"x"} 2' in text
+        assert "# TYPE depth gauge\ndepth 3" in text
+        assert registry.counter("calls_total", "Calls", ("model",)) is calls
+        with pytest.raises(ValueError):
+            calls.inc(-1, model="a")
+        with pytest.raises(ValueError):
+            calls.inc(other="a")
+        with pytest.raises(ValueError):
+            registry.gauge("calls_total", "Calls")
+
+    def test_histogram(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        text = registry.render()
+
+        assert 'latency_seconds_bucket{le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{le="1"} 3' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+        assert "latency_seconds_sum 3.65" in text
+        assert "latency_seconds_count 4" in text
+        assert histogram.count() == 4
+
+
+class TestHooks:
+    """Counters fed by LLM calls, turns and database queries"""
+
+    def test_llm_calls_counted(self):
+        make_llm_call("mock/m", [{"role": "user", "content": "Hi"}], use_cache=False)
+
+        registry = get_metrics_registry()
+        calls = registry.get("scenario_lab_llm_calls_total")
+        assert calls.get(model="mock/m", source="network") == 1
+        assert registry.get("scenario_lab_llm_call_duration_seconds").count(model="mock/m") == 1
+
+    def test_turns_counted(self):
+        runner = FakeRunner()
+        track_runner(runner)
+
+        for turn in (1, 2):
+            asyncio.run(runner.event_bus.emit(
+                EventType.TURN_COMPLETED, data={"turn": turn, "duration": 2.0}
+            ))
+
+        text = render_metrics(FakeExecutor(), {})
+        assert "scenario_lab_turns_total 2" in text
+        assert "scenario_lab_turn_duration_seconds_count 2" in text
+        assert "scenario_lab_turns_per_second 0.0333" in text
+
+    def test_database_queries_timed(self):
+        database = Database("sqlite:///:memory:")
+        instrument_database(database)
+        instrument_database(database)
+
+        database.list_runs()
+
+        histogram = get_metrics_registry().get("scenario_lab_db_query_duration_seconds")
+        assert histogram.count(operation="SELECT") >= 1
+
+    def test_event_bus_queue_depth(self):
+        runner = FakeRunner()
+        depths = []
+
+        async def handler(event):
+            depths.append(render_metrics(FakeExecutor(), {"s": {"runner": runner}}))
+
+        runner.event_bus.on("ping", handler)
+        asyncio.run(runner.event_bus.emit("ping"))
+
+        assert "scenario_lab_event_bus_pending_handlers 1" in depths[0]
+        assert runner.event_bus.pending == 0
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics"""
+
+    @pytest.fixture
+    def client(self):
+        reset_settings()
+        reset_rate_limiter()
+        os.environ["SCENARIO_LAB_DEV_MODE"] = "true"
+        from scenario_lab.api.app import app
+        yield TestClient(app)
+        os.environ.pop("SCENARIO_LAB_DEV_MODE", None)
+        reset_settings()
+        reset_rate_limiter()
+
+    def test_exposition(self, client):
+        make_llm_call("mock/m", [{"role": "user", "content": "Hi"}], use_cache=False)
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        text = response.text
+        for name in (
+            "scenario_lab_scenarios_active",
+            "scenario_lab_scenarios_queued",
+            "scenario_lab_turns_per_second",
+            "scenario_lab_event_bus_pending_handlers",
+            "scenario_lab_cache_hit_ratio",
+            "scenario_lab_llm_rate_limited_total",
+        ):
+            assert f"# TYPE {name}" in text
+        assert 'scenario_lab_llm_in_flight{model="mock:mock/m"} 0' in text
+
+    def test_rate_limit_rejections_counted(self, client, monkeypatch):
+        monkeypatch.setenv("SCENARIO_LAB_DEV_MODE", "false")
+        monkeypatch.setenv("SCENARIO_LAB_AUTH_ENABLED", "false")
+        monkeypatch.setenv("SCENARIO_LAB_RATE_LIMIT_ENABLED", "true")
+        monkeypatch.setenv("SCENARIO_LAB_RATE_LIMIT_REQUESTS", "1")
+        reset_settings()
+        reset_rate_limiter()
+
+        statuses = [client.get("/api/runs").status_code for _ in range(3)]
+
+        assert statuses.count(429) == 2
+        assert "scenario_lab_api_rate_limited_total 2" in client.get("/metrics").text
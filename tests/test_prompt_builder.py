@@ -7,11 +7,13 @@ import pytest
 
 from scenario_lab.core.prompt_builder import (
     build_actor_system_prompt,
+    build_decision_instructions,
     build_decision_prompt,
     build_communication_decision_prompt,
     build_bilateral_response_prompt,
     build_messages_for_llm,
 )
+from scenario_lab.core.world_synthesizer import WorldSynthesizer
 
 
 class TestBuildActorSystemPrompt:
@@ -304,6 +306,59 @@ class TestBuildMessagesForLLM:
         assert len(messages) == 1
         assert messages[0]['role'] == 'user'
 
+    def test_cacheable_prefix_sent_as_own_message(self):
+        """Test that a stable prompt prefix becomes its own user message"""
+        _, user_prompt = build_decision_prompt(world_state="Calm.", turn=2, total_turns=5)
+
+        messages = build_messages_for_llm(
+            "System", user_prompt, cacheable_prefix=build_decision_instructions()
+        )
+
+        assert [m['role'] for m in messages] == ['system', 'user', 'user']
+        assert messages[1]['content'] == build_decision_instructions()
+        assert messages[1]['content'] + messages[2]['content'] == user_prompt
+
+    def test_prefix_not_matching_is_ignored(self):
+        """Test that a prefix the prompt doesn't start with is ignored"""
+        messages = build_messages_for_llm("System", "Hello", cacheable_prefix="Other")
+
+        assert len(messages) == 2
+        assert messages[1]['content'] == "Hello"
+
+
+class TestPromptCacheLayout:
+    """Stable content comes before per-turn content"""
+
+    def test_decision_prompt_starts_with_instructions(self):
+        """Test that instructions precede the situation and stay the same per turn"""
+        _, first = build_decision_prompt(world_state="Turn one world.", turn=1, total_turns=5,
+                                         recent_goals="Goal A")
+        _, second = build_decision_prompt(world_state="Turn two world.", turn=2, total_turns=5,
+                                          communications_context="A message")
+
+        for json_mode in (False, True):
+            instructions = build_decision_instructions(json_mode)
+            _, prompt = build_decision_prompt("World.", 3, 5, json_mode=json_mode)
+            assert prompt.startswith(instructions)
+            assert "Turn 3" not in instructions and "turn 3" not in instructions
+        assert first.index("**ACTION:**") < first.index("Turn one world.")
+        prefix = build_decision_instructions()
+        assert first.startswith(prefix) and second.startswith(prefix)
+        assert first.index("Turn one world.") < first.index("Goal A")
+
+    def test_world_update_prompt_starts_with_instructions(self):
+        """Test that the world update task precedes the state and actions"""
+        synthesizer = WorldSynthesizer(scenario_name="Test")
+
+        prompt = synthesizer.build_user_prompt(
+            current_state="Old state.", turn=2, total_turns=4,
+            actor_decisions={"USA": {"action": "Negotiate"}},
+        )
+
+        assert prompt.startswith(synthesizer.build_task_instructions())
+        assert prompt.index("**UPDATED STATE:**") < prompt.index("Old state.")
+        assert prompt.index("Old state.") < prompt.index("Negotiate")
+
 
 class TestPromptBuilderIntegration:
     """Integration tests for prompt builder"""
@@ -15,6 +15,8 @@ from scenario_lab.utils.response_cache import (
     CacheStats,
     get_global_cache,
     reset_global_cache,
+    create_run_cache,
+    use_run_cache,
 )
 
 
@@ -370,6 +372,57 @@ class TestGlobalCache:
         reset_global_cache()  # Clean up
 
 
+class TestRunScopedCache:
+    """Tests for run-scoped caches bound to the execution context"""
+
+    def test_use_run_cache_overrides_global(self):
+        """Test that a bound run cache is returned by get_global_cache"""
+        reset_global_cache()
+        run_cache = ResponseCache()
+
+        with use_run_cache(run_cache):
+            assert get_global_cache() is run_cache
+
+        assert get_global_cache() is not run_cache
+        reset_global_cache()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_keep_their_own_cache(self):
+        """Test that concurrent tasks don't see each other's run cache"""
+        import asyncio
+
+        seen = {}
+
+        async def run(name):
+            cache = ResponseCache()
+            with use_run_cache(cache):
+                await asyncio.sleep(0.01)
+                seen[name] = get_global_cache() is cache
+
+        await asyncio.gather(run("a"), run("b"), run("c"))
+        assert seen == {"a": True, "b": True, "c": True}
+
+    @patch.dict(os.environ, {'SCENARIO_CACHE_ENABLED': 'false'})
+    def test_create_run_cache_shares_stats(self):
+        """Test that run caches record into the process-wide statistics"""
+        reset_global_cache()
+        run_cache = create_run_cache("run-1")
+
+        run_cache.enabled = True
+        run_cache.get("model", [{"role": "user", "content": "x"}])
+
+        assert get_global_cache().stats.total_requests == 1
+        reset_global_cache()
+
+    @patch.dict(os.environ, {'SCENARIO_CACHE_ENABLED': 'false'})
+    def test_create_run_cache_does_not_touch_environment(self):
+        """Test that creating a run cache leaves SCENARIO_RUN_ID alone"""
+        os.environ.pop('SCENARIO_RUN_ID', None)
+        create_run_cache("run-2")
+        assert 'SCENARIO_RUN_ID' not in os.environ
+        reset_global_cache()
+
+
 class TestCacheIntegration:
     """Integration tests for cache with model pricing"""
 
@@ -6,9 +6,13 @@ Comprehensive robustness tests for:
 2. Malformed response handling
 3. Fallback behavior
 """
+import random
+import re
+
 import pytest
 
 from scenario_lab.utils.response_parser import (
+    ResponseSections,
     extract_section,
     parse_decision_markdown,
     parse_decision_json,
@@ -984,3 +988,78 @@ Visit ftp://files.example.net/docs"""
         result = parse_decision_markdown(content)
 
         assert result["action"] == "X"
+
+
+def regex_extract_section(content, section_name, next_section=None):
+    """The per-call regex implementation the section index replaced (reference)"""
+    name = re.escape(section_name)
+    patterns = [
+        r"\*\*\s*" + name + r"\s*:\*\*\s*(.+?)(?=\*\*\s*[\w\s]+\s*:\*\*|^---+\s*$|\Z)",
+        r"\*\*\s*" + name + r"\s*\*\*\s*(.+?)(?=\*\*\s*[\w\s]+\s*\*\*|^---+\s*$|\Z)",
+        "^" + re.escape(section_name.upper()) + r"\s*:\s*(.+?)(?=^[A-Z\s]+:\s*|^---+\s*$|\Z)",
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, content, re.DOTALL | re.MULTILINE | re.IGNORECASE)
+        if match:
+            extracted = match.group(1).strip()
+            if next_section:
+                next_name = re.escape(next_section)
+                for next_pattern in (
+                    r"\*\*\s*" + next_name + r"\s*:\*\*",
+                    r"\*\*\s*" + next_name + r"\s*\*\*",
+                    "^" + re.escape(next_section.upper()) + r"\s*:",
+                ):
+                    next_match = re.search(next_pattern, extracted, re.MULTILINE | re.IGNORECASE)
+                    if next_match:
+                        extracted = extracted[:next_match.start()].strip()
+                        break
+            return extracted
+    return ""
+
+
+class TestResponseSections:
+    """The section index extracts exactly what the regex patterns did"""
+
+    def test_sections_of_one_response(self):
+        content = (
+            "**LONG-TERM GOALS:**\nWin\n\n**SHORT-TERM PRIORITIES:**\nTalk\n\n"
+            "**REASONING:**\nBecause\n\n**ACTION:**\nGo\n---\nSignature"
+        )
+        sections = ResponseSections(content)
+
+        assert sections.get("LONG-TERM GOALS", "SHORT-TERM PRIORITIES") == "Win"
+        assert sections.get("REASONING", "ACTION") == "Because"
+        assert sections.get("ACTION") == "Go"
+        assert sections.get("MISSING") == ""
+
+    def test_overlapping_asterisks(self):
+        content = "***ACTION:** Go ***NOTE:** x"
+
+        assert extract_section(content, "ACTION") == "Go *"
+
+    def test_empty_section_takes_following_text(self):
+        # The section body needs at least one character, so an empty section
+        # runs into the next header, as with the regex patterns
+        content = "**ACTION:**\n**NOTES:** later"
+
+        assert extract_section(content, "ACTION") == "**NOTES:** later"
+
+    def test_matches_regex_implementation(self):
+        pieces = [
+            "**ACTION:**", "**ACTION**", "ACTION:", "action:", "**REASONING:**", "REASONING:",
+            "**LONG-TERM GOALS:**", "**  GOALS  :**", "## ACTION", "---", "----  ", "**bold** ",
+            "**Note:**", "*", "**", "***", " ", "\n", "\n\n", "word ", "Note: x", "- item",
+            ":", "\t", "**\nfoo:**",
+        ]
+        names = [
+            ("ACTION", None), ("REASONING", "ACTION"), ("GOALS", "REASONING"),
+            ("LONG-TERM GOALS", "SHORT-TERM PRIORITIES"), ("ACTION", "NOTE"),
+        ]
+        rng = random.Random(0)
+
+        for _ in range(3000):
+            content = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 14)))
+            section_name, next_section = rng.choice(names)
+            assert extract_section(content, section_name, next_section) == regex_extract_section(
+                content, section_name, next_section
+            ), (content, section_name, next_section)
@@ -0,0 +1,196 @@
+"""
+Tests for span tracing and trace export
+"""
+import asyncio
+import json
+
+import pytest
+
+from scenario_lab.benchmarks import generate_scenario
+from scenario_lab.core.events import EventBus
+from scenario_lab.runners import SyncRunner
+from scenario_lab.utils.api_client import make_llm_call_async
+from scenario_lab.utils.tracing import (
+    Tracer,
+    current_span,
+    get_tracer,
+    span,
+    use_tracer,
+)
+
+MESSAGES = [{"role": "user", "content": "Summarize"}]
+
+
+pytestmark = pytest.mark.usefixtures("fresh_llm_backend")
+
+
+class TestSpans:
+    """Tests for span nesting and recording"""
+
+    def test_nesting_and_binding(self):
+        tracer = Tracer()
+        with use_tracer(tracer):
+            assert get_tracer() is tracer
+            with span("turn", turn=1) as turn:
+                with span("phase", phase="decision", skipped=None) as phase:
+                    assert current_span() is phase
+                assert current_span() is turn
+        assert current_span() is None
+        assert get_tracer() is None
+
+        assert [s.name for s in tracer.finished_spans()] == ["turn", "phase"]
+        assert phase.parent_id == turn.span_id
+        assert phase.trace_id == turn.trace_id
+        assert phase.attributes == {"phase": "decision"}
+        assert turn.duration >= phase.duration > 0
+
+    def test_errors_are_recorded(self):
+        tracer = Tracer()
+        with use_tracer(tracer), pytest.raises(RuntimeError):
+            with span("phase"):
+                raise RuntimeError("boom")
+
+        assert tracer.spans[0].error == "RuntimeError: boom"
+        assert tracer.to_otlp()["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["status"] == {
+            "code": 2, "message": "RuntimeError: boom"
+        }
+
+    def test_spans_not_kept_without_tracer(self):
+        with span("turn") as turn:
+            assert current_span() is turn
+        assert turn.end_ns is not None
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_nest_across_threads(self):
+        tracer = Tracer()
+        with use_tracer(tracer):
+            with span("phase") as phase:
+                await asyncio.gather(*[
+                    make_llm_call_async("mock/t", MESSAGES, context={"actor": actor})
+                    for actor in ("A", "B")
+                ])
+
+        calls = tracer.finished_spans("llm_call")
+        assert {c.attributes["actor"] for c in calls} == {"A", "B"}
+        assert all(c.parent_id == phase.span_id for c in calls)
+        assert all(c.attributes["source"] == "network" for c in calls)
+        attempts = tracer.finished_spans("llm_attempt")
+        assert {a.parent_id for a in attempts} == {c.span_id for c in calls}
+        assert all(a.attributes["status_code"] == 200 for a in attempts)
+
+    @pytest.mark.asyncio
+    async def test_events_carry_span_id(self):
+        bus = EventBus(keep_history=True)
+        with span("turn") as turn:
+            await bus.emit("ping")
+        await bus.emit("pong", correlation_id="explicit")
+
+        assert bus.history[0].correlation_id == turn.span_id
+        assert bus.history[1].correlation_id == "explicit"
+
+
+class TestExport:
+    """Tests for Chrome trace and OTLP export"""
+
+    def _tracer(self):
+        tracer = Tracer()
+        with use_tracer(tracer):
+            with span("turn", turn=1):
+                with span("actor", actor="A"):
+                    pass
+                with span("actor", actor="B"):
+                    with span("llm_call", model="m"):
+                        pass
+        return tracer
+
+    def test_chrome_trace(self):
+        data = self._tracer().to_chrome_trace()
+
+        complete = [e for e in data["traceEvents"] if e["ph"] == "X"]
+        assert [e["name"] for e in complete] == ["turn", "actor", "actor", "llm_call"]
+        assert complete[0]["ts"] == 0
+        assert all(e["dur"] >= 0 for e in complete)
+        assert complete[3]["args"]["parent_id"] == complete[2]["args"]["span_id"]
+
+    def test_chrome_trace_lanes_nest(self):
+        tracer = Tracer()
+
+        async def actor(name, delay):
+            with span("actor", actor=name):
+                await asyncio.sleep(delay)
+
+        async def turn():
+            with span("turn"):
+                await asyncio.gather(actor("A", 0.02), actor("B", 0.01))
+
+        with use_tracer(tracer):
+            asyncio.run(turn())
+
+        events = [e for e in tracer.to_chrome_trace()["traceEvents"] if e["ph"] == "X"]
+        by_lane = {}
+        for event in events:
+            by_lane.setdefault(event["tid"], []).append(event)
+        # Overlapping actors are split over lanes, each lane strictly nested
+        assert len(by_lane) == 2
+        for lane_events in by_lane.values():
+            for outer, inner in zip(lane_events, lane_events[1:]):
+                assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1e-3
+
+    def test_otlp(self):
+        data = self._tracer().to_otlp()
+
+        resource = data["resourceSpans"][0]
+        assert resource["resource"]["attributes"][0] == {
+            "key": "service.name", "value": {"stringValue": "scenario-lab"}
+        }
+        spans = resource["scopeSpans"][0]["spans"]
+        assert len(spans) == 4
+        assert "parentSpanId" not in spans[0]
+        assert len(spans[0]["traceId"]) == 32 and len(spans[0]["spanId"]) == 16
+        assert {"key": "turn", "value": {"intValue": "1"}} in spans[0]["attributes"]
+        assert int(spans[0]["endTimeUnixNano"]) >= int(spans[0]["startTimeUnixNano"])
+
+    def test_critical_path(self):
+        tracer = self._tracer()
+        turn = tracer.finished_spans("turn")[0]
+
+        path = tracer.critical_path(turn)
+
+        assert [s.name for s in path] == ["turn", "actor", "llm_call"]
+        assert path[1].attributes["actor"] == "B"
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            Tracer().save(str(tmp_path / "t.json"), format="zipkin")
+
+
+class TestRunnerTrace:
+    """SyncRunner exports a run's spans"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("trace_format,filename", [
+        ("chrome", "trace.json"), ("otlp", "trace-otlp.json"),
+    ])
+    async def test_run_exports_trace(self, tmp_path, trace_format, filename):
+        path = generate_scenario(str(tmp_path / "s"), actors=2, turns=2, metrics=0).path
+        output = tmp_path / "out"
+        runner = SyncRunner(str(path), output_path=str(output), trace=trace_format)
+        runner.setup()
+
+        await runner.run()
+
+        tracer = runner.tracer
+        scenario = tracer.finished_spans("scenario")[0]
+        turns = tracer.finished_spans("turn")
+        assert len(turns) == 2
+        assert all(t.parent_id == scenario.span_id for t in turns)
+        actors = tracer.finished_spans("actor")
+        assert len(actors) == 4
+        assert {a.parent_id for a in actors} <= {p.span_id for p in tracer.finished_spans("phase")}
+        assert len(tracer.finished_spans("llm_call")) == 2 * 3
+        assert (output / filename).exists()
+        json.loads((output / filename).read_text())
+
+    def test_invalid_trace_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            SyncRunner(str(tmp_path), output_path=str(tmp_path / "out"), trace="zipkin")
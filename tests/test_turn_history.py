@@ -0,0 +1,167 @@
+"""
+Tests for the disk-backed turn history store
+"""
+import asyncio
+
+import pytest
+from click.testing import CliRunner
+
+from scenario_lab.benchmarks import generate_scenario
+from scenario_lab.core.turn_history import DiskTurnHistory, TurnRecord
+from scenario_lab.interfaces.cli import cli
+from scenario_lab.runners import SyncRunner
+
+pytestmark = pytest.mark.usefixtures("fresh_llm_backend")
+
+
+def make_record(turn):
+    return TurnRecord(
+        turn=turn,
+        world_state=f"World after turn {turn}",
+        actions={"A": f"act {turn}"},
+        decisions={"A": {"goals": ["win"], "reasoning": "because", "action": f"act {turn}"}},
+        communications=[{"id": f"c{turn}", "type": "public", "sender": "A",
+                         "recipients": [], "content": "hello", "timestamp": "t"}],
+    )
+
+
+class TestDiskTurnHistory:
+    """Tests for the append-only store"""
+
+    def test_record_and_get(self, tmp_path):
+        history = DiskTurnHistory(str(tmp_path / "history"))
+
+        assert history.record(make_record(0))
+        assert history.record(make_record(1))
+        assert not history.record(make_record(1))
+
+        assert history.get(1) == make_record(1)
+        assert history.get(2) is None
+        assert len(history) == 2 and history.latest_turn == 1
+        assert [r.turn for r in history] == [0, 1]
+
+    def test_reopen(self, tmp_path):
+        first = DiskTurnHistory(str(tmp_path))
+        for turn in range(3):
+            first.record(make_record(turn))
+
+        reopened = DiskTurnHistory(str(tmp_path), recover=True)
+
+        assert len(reopened) == 3
+        assert reopened.get(2) == make_record(2)
+        assert reopened.record(make_record(3))
+        assert [r.turn for r in reopened.range(1, 3)] == [1, 2, 3]
+
+    def test_gaps(self, tmp_path):
+        history = DiskTurnHistory(str(tmp_path))
+        history.record(make_record(2))
+        history.record(make_record(0))
+
+        reopened = DiskTurnHistory(str(tmp_path))
+
+        assert 1 not in reopened and 0 in reopened and 2 in reopened
+        assert len(reopened) == 2 and reopened.latest_turn == 2
+        assert reopened.get(0).world_state == "World after turn 0"
+
+    def test_partial_write_truncated_on_open(self, tmp_path):
+        history = DiskTurnHistory(str(tmp_path))
+        history.record(make_record(0))
+        history.record(make_record(1))
+        size = history.data_path.stat().st_size
+        # Crash while writing turn 2: data half written, index entry missing
+        with open(history.data_path, "ab") as f:
+            f.write(b'{"turn": 2, "world_')
+
+        reopened = DiskTurnHistory(str(tmp_path), recover=True)
+
+        assert reopened.data_path.stat().st_size == size
+        assert reopened.latest_turn == 1
+        assert reopened.record(make_record(2))
+        assert DiskTurnHistory(str(tmp_path)).get(2) == make_record(2)
+
+    def test_reader_leaves_live_writer_alone(self, tmp_path):
+        writer = DiskTurnHistory(str(tmp_path), recover=True)
+        writer.record(make_record(0))
+        # The writer is mid-record: data appended, index entry not yet written
+        with open(writer.data_path, "ab") as f:
+            f.write(b'{"turn": 1}\n')
+        size = writer.data_path.stat().st_size
+
+        reader = DiskTurnHistory(str(tmp_path))
+
+        assert writer.data_path.stat().st_size == size
+        assert len(reader) == 1 and reader.latest_turn == 0 and reader.get(1) is None
+
+    def test_reader_skips_entries_past_data(self, tmp_path):
+        history = DiskTurnHistory(str(tmp_path))
+        history.record(make_record(0))
+        history.record(make_record(1))
+        with open(history.data_path, "r+b") as f:
+            f.truncate(f.seek(0, 2) - 5)
+        size = history.data_path.stat().st_size
+
+        reader = DiskTurnHistory(str(tmp_path))
+
+        assert reader.latest_turn == 0 and reader.get(0) == make_record(0)
+        assert history.get(1) is None
+        assert history.data_path.stat().st_size == size
+
+    def test_clear(self, tmp_path):
+        history = DiskTurnHistory(str(tmp_path))
+        history.record(make_record(0))
+
+        history.clear()
+
+        assert len(history) == 0 and history.get(0) is None
+        assert len(DiskTurnHistory(str(tmp_path))) == 0
+
+
+class TestRunHistory:
+    """Runs write their history and branches and compare read it"""
+
+    def run(self, path, output, **kwargs):
+        runner = SyncRunner(str(path), output_path=str(output), **kwargs)
+        runner.setup()
+        return asyncio.run(runner.run())
+
+    def test_run_records_every_turn(self, tmp_path):
+        path = generate_scenario(str(tmp_path / "s"), actors=2, turns=3, metrics=0).path
+        output = tmp_path / "out"
+
+        final_state = self.run(path, output)
+
+        history = DiskTurnHistory.for_run(str(output))
+        assert [r.turn for r in history] == [0, 1, 2, 3]
+        last = history.get(3)
+        assert last.world_state == final_state.world_state.content
+        assert set(last.decisions) == set(last.actions) and len(last.actions) == 2
+        assert all(d["reasoning"] for d in last.decisions.values())
+        assert history.get(0).actions == {}
+
+    def test_branch_starts_from_world_state_at_branch_turn(self, tmp_path):
+        path = generate_scenario(str(tmp_path / "s"), actors=1, turns=3, metrics=0).path
+        source = tmp_path / "source"
+        self.run(path, source)
+        source_history = DiskTurnHistory.for_run(str(source))
+
+        branch = SyncRunner(
+            str(path), output_path=str(tmp_path / "branch"),
+            branch_from=str(source), branch_at_turn=1,
+        )
+        branch.setup()
+
+        assert branch.initial_state.world_state.content == source_history.get(1).world_state
+        assert [r.turn for r in branch.history] == [0, 1]
+
+    def test_compare_reads_history(self, tmp_path):
+        path = generate_scenario(str(tmp_path / "s"), actors=1, turns=2, metrics=0).path
+        self.run(path, tmp_path / "a")
+        self.run(path, tmp_path / "b")
+
+        result = CliRunner().invoke(
+            cli, ["compare", str(tmp_path / "a"), str(tmp_path / "b"), "--turn", "1"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Divergence" in result.output
+        assert "World state:" in result.output
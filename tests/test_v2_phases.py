@@ -18,8 +18,11 @@ from scenario_lab.models.state import (
     Decision,
     Communication,
     CostRecord,
+    MetricRecord,
 )
 from scenario_lab.services.persistence_phase import PersistencePhase
+from scenario_lab.services.database_persistence_phase import DatabasePersistencePhase
+from scenario_lab.database.models import Database
 from scenario_lab.services.decision_phase_v2 import DecisionPhaseV2
 from scenario_lab.services.world_update_phase_v2 import WorldUpdatePhaseV2
 from scenario_lab.services.communication_phase import CommunicationPhase
@@ -221,6 +224,56 @@ class TestPersistencePhase:
             shutil.rmtree(temp_dir)
 
 
+class TestDatabasePersistencePhase:
+    """Tests for DatabasePersistencePhase"""
+
+    @pytest.mark.asyncio
+    async def test_persists_turn_and_indexes_texts(self, sample_state):
+        """Test that a turn is stored and its texts become searchable"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            database = Database(f"sqlite:///{temp_dir}/test.db")
+            phase = DatabasePersistencePhase(database=database)
+
+            await phase.execute(sample_state)
+
+            stats = database.get_run_statistics("test-run-001")
+            assert stats["turns"] == 1
+            assert stats["decisions"] == 2
+
+            kinds = sorted(r["kind"] for r in database.search("test"))
+            assert kinds == ["communication", "decision", "decision", "world_state"]
+            comm = database.search("communication", kind="communication")[0]
+            assert comm["ref_id"] == "comm-001"
+            assert comm["actor"] == "actor1"
+            assert database.search("key points")[0]["kind"] == "world_state"
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_updates_metric_rollups_per_turn(self, sample_state):
+        """Test that each persisted turn is folded into the metric rollups"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            database = Database(f"sqlite:///{temp_dir}/test.db")
+            phase = DatabasePersistencePhase(database=database)
+
+            state = sample_state.with_metric(MetricRecord(name="tension", value=0.4, turn=1))
+            await phase.execute(state)
+            state = state.with_turn(2).with_metric(MetricRecord(name="tension", value=0.8, turn=2))
+            await phase.execute(state)
+
+            bands = database.metric_turn_bands("tension", "test-scenario")
+            assert [(b["turn"], b["mean"]) for b in bands] == [(1, 0.4), (2, 0.8)]
+
+            (summary,) = database.run_metric_summaries("tension")
+            assert summary["final_turn"] == 2
+            assert summary["final_value"] == 0.8
+            assert summary["min"] == 0.4
+        finally:
+            shutil.rmtree(temp_dir)
+
+
 class TestStatePersistence:
     """Test the state persistence utility"""
 
@@ -560,6 +613,38 @@ class TestDecisionPhase:
         assert "Previous turn goal" in goals
         assert "Current turn goal" not in goals
 
+    @pytest.mark.asyncio
+    async def test_context_summary_calls_are_costed(self, sample_state):
+        """Test that summarization calls made for the context are added to the costs"""
+        from scenario_lab.utils.api_client import LLMResponse
+
+        phase = DecisionPhaseV2(
+            actor_configs={"actor1": {"name": "Test Actor 1", "llm_model": "test/model"}},
+            scenario_system_prompt="",
+            summarization_model="openai/gpt-4o-mini",
+        )
+        summary = LLMResponse(
+            content="summary", tokens_used=1200, input_tokens=1000, output_tokens=200
+        )
+        phase.context_manager.get_context_for_actor = AsyncMock(
+            return_value=("context", [summary])
+        )
+        decision = LLMResponse(
+            content="**ACTION:** Wait", tokens_used=15, input_tokens=10, output_tokens=5
+        )
+
+        with patch(
+            "scenario_lab.services.decision_phase_v2.make_llm_call_async",
+            AsyncMock(return_value=decision),
+        ):
+            state = await phase.execute(sample_state)
+
+        summary_costs = [c for c in state.costs if c.phase == "context_summary"]
+        assert len(summary_costs) == 1
+        assert summary_costs[0].model == "openai/gpt-4o-mini"
+        assert summary_costs[0].input_tokens == 1000 and summary_costs[0].cost > 0
+        assert state.phase_cost("context_summary") == summary_costs[0].cost
+
 
 class TestWorldUpdatePhase:
     """Test the world update phase service"""